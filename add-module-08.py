@@ -1,6 +1,10 @@
-import json
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+
+from pipeline.json_splice import SpliceError, upsert_module
+
 # Modül 8 için 20 ders içeriği
 module_08_lessons = [
     # Faz 1: API Temelleri ve RESTful İlkeler (5 ders)
@@ -153,26 +157,24 @@ module_08_lessons = [
     }
 ]
 
-# JSON dosyasını oku
-with open('data/lesson-contents/dotnet-core-lessons.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-# Modül 8'i ekle
+# Modül 8
 module_08 = {
     "moduleId": "module-08",
     "moduleTitle": "API Geliştirme (RESTful API – Minimal API / Controller Based)",
     "lessons": module_08_lessons
 }
 
-# Modül 8'i modules array'ine ekle
-data['modules'].append(module_08)
-
-# totalLessons'ı güncelle
-data['totalLessons'] = data['totalLessons'] + len(module_08_lessons)
-
-# JSON dosyasını yaz
-with open('data/lesson-contents/dotnet-core-lessons.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-
-print(f"Modül 8 başarıyla eklendi! {len(module_08_lessons)} ders eklendi.")
+# Modül 8'i ekle veya güncelle: dosyanın geri kalanı yeniden yazılmaz,
+# totalLessons modüllerden yeniden hesaplanır. Tekrar çalıştırmak güvenlidir.
+try:
+    changed, action = upsert_module('data/lesson-contents/dotnet-core-lessons.json', module_08)
+except SpliceError as e:
+    print(f"Hata: {e}", file=sys.stderr)
+    sys.exit(1)
 
+if not changed:
+    print("Modül 8 zaten güncel, dosya değiştirilmedi.")
+elif action == "replaced":
+    print(f"Modül 8 güncellendi! {len(module_08_lessons)} ders.")
+else:
+    print(f"Modül 8 başarıyla eklendi! {len(module_08_lessons)} ders eklendi.")
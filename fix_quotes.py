@@ -3,81 +3,401 @@
 """
 SQL dosyasındaki kesme işaretlerini düzeltir.
 SQL'de string içindeki kesme işaretleri '' (iki tane) ile escape edilmelidir.
+
+Dosya satır satır değil, sabit boyutlu parçalar halinde okunur. String
+literal durumu satır ve parça sınırları boyunca korunur; böylece
+generate_tests.py'nin ürettiği çok satırlı '...'::jsonb gövdeleri de
+doğru işlenir. Karakter karakter dolaşmak yerine bir sonraki kesme
+işaretine (veya yorum başlangıcına) doğrudan atlanır.
+
+Kullanım:
+    python fix_quotes.py                         # database-seed.sql
+    python fix_quotes.py "*.sql" "DB-Scripts/*.sql"
+    python fix_quotes.py --check --workers 1 profile-seed-data.sql
+
+Dosyalar ifade (statement) sınırlarından parçalara bölünür ve parçalar
+tüm çekirdeklerde paralel düzeltilir. Çıktı seri çalıştırmayla bayt bayt
+aynıdır ve geçici dosya + rename ile atomik olarak yazılır.
 """
 
+import argparse
+import glob
+import os
 import re
+import shutil
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Okuma parça boyutu (karakter)
+CHUNK_SIZE = 1 << 20
+
+# Paralel işlemede bir iş parçasının yaklaşık boyutu (karakter)
+PIECE_SIZE = 256 * 1024
+
+# İfade sınırı: satır sonunda biten noktalı virgül
+_STATEMENT_END = ";\n"
+
+# Tokenizer durumları
+STATE_CODE = 0
+STATE_STRING = 1
+STATE_LINE_COMMENT = 2
+STATE_BLOCK_COMMENT = 3
+
+# String içindeki bir kesme işaretinden sonra gelirse string'i bitiren karakterler
+_TERMINATORS = frozenset([",", ")", "}", "]", " ", "\t", "\n", "\r"])
+
+# String dışındayken ilgilendiğimiz tek şeyler: string ve yorum başlangıçları
+_CODE_TOKEN_RE = re.compile(r"'|--|/\*")
+
+
+class SqlQuoteFixer:
+    """
+    Akış (streaming) tabanlı SQL string literal düzelticisi.
+
+    feed() ile parça parça metin verilir, düzeltilmiş metin parça parça
+    döner; finish() elde kalan son karakterleri boşaltır. Bir kesme
+    işaretinin string sonu olup olmadığına karar vermek için en fazla iki
+    karakter ileriye bakılır, bu yüzden parça sonundaki birkaç karakter
+    bir sonraki feed() çağrısına kadar bekletilir.
+    """
+
+    def __init__(self, state=STATE_CODE):
+        self.state = state
+        self._pending = ""
+
+    def feed(self, chunk):
+        buf = self._pending + chunk
+        out, pos = self._scan(buf, final=False)
+        self._pending = buf[pos:]
+        return out
+
+    def finish(self):
+        buf = self._pending
+        self._pending = ""
+        out, _ = self._scan(buf, final=True)
+        # Satır yorumu dosya sonunda biter
+        if self.state == STATE_LINE_COMMENT:
+            self.state = STATE_CODE
+        return out
+
+    def _scan(self, buf, final):
+        out = []
+        pos = 0
+        n = len(buf)
+
+        while pos < n:
+            state = self.state
+
+            if state == STATE_CODE:
+                m = _CODE_TOKEN_RE.search(buf, pos)
+                if m is None:
+                    end = n
+                    # "--" veya "/*" parça sınırında bölünmüş olabilir
+                    if not final and buf[-1] in "-/":
+                        end -= 1
+                    out.append(buf[pos:end])
+                    pos = end
+                    break
+                token = m.group()
+                out.append(buf[pos:m.end()])
+                pos = m.end()
+                if token == "'":
+                    self.state = STATE_STRING
+                elif token == "--":
+                    self.state = STATE_LINE_COMMENT
+                else:
+                    self.state = STATE_BLOCK_COMMENT
+
+            elif state == STATE_LINE_COMMENT:
+                j = buf.find("\n", pos)
+                if j < 0:
+                    out.append(buf[pos:])
+                    pos = n
+                    break
+                out.append(buf[pos:j + 1])
+                pos = j + 1
+                self.state = STATE_CODE
+
+            elif state == STATE_BLOCK_COMMENT:
+                j = buf.find("*/", pos)
+                if j < 0:
+                    end = n
+                    if not final and buf[-1] == "*":
+                        end -= 1
+                    out.append(buf[pos:end])
+                    pos = end
+                    break
+                out.append(buf[pos:j + 2])
+                pos = j + 2
+                self.state = STATE_CODE
+
+            else:  # STATE_STRING
+                j = buf.find("'", pos)
+                if j < 0:
+                    out.append(buf[pos:])
+                    pos = n
+                    break
+                # Karar için iki karakter ileriye bakmamız gerekiyor
+                if not final and j + 2 >= n:
+                    out.append(buf[pos:j])
+                    pos = j
+                    break
+
+                next_char = buf[j + 1] if j + 1 < n else ""
+                after_next = buf[j + 2] if j + 2 < n else ""
+
+                if next_char == "'":
+                    # Zaten escape edilmiş
+                    out.append(buf[pos:j + 2])
+                    pos = j + 2
+                elif (
+                    next_char == ""
+                    or next_char in _TERMINATORS
+                    or (next_char == ":" and after_next == ":")
+                    or after_next in ("", "\n")
+                ):
+                    # String sonu: ayraç, ::tip dönüşümü ya da satırın son karakteri
+                    out.append(buf[pos:j + 1])
+                    pos = j + 1
+                    self.state = STATE_CODE
+                else:
+                    # String içinde kesme işareti - escape et
+                    out.append(buf[pos:j])
+                    out.append("''")
+                    pos = j + 1
+
+        return "".join(out), pos
+
+
+def fix_sql_quotes_stream(src, dst, chunk_size=CHUNK_SIZE):
+    """
+    src dosya nesnesinden okuyup düzeltilmiş içeriği dst'ye parça parça yazar.
+    """
+    fixer = SqlQuoteFixer()
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        dst.write(fixer.feed(chunk))
+    dst.write(fixer.finish())
+
 
 def fix_sql_quotes(content):
     """
     SQL string literal içindeki kesme işaretlerini düzeltir.
     SQL'de ' karakteri '' ile escape edilmelidir.
     """
-    lines = content.split('\n')
-    fixed_lines = []
-    
-    for line in lines:
-        # SQL string literal'larını bul ve içindeki kesme işaretlerini düzelt
-        # Basit yaklaşım: ' ile başlayan ve ' ile biten string'leri bul
-        # Ancak içinde kesme işareti varsa, onu '' ile değiştir
-        
-        # State machine ile string literal'ları işle
-        result = []
-        i = 0
-        in_string = False
-        
-        while i < len(line):
-            char = line[i]
-            
-            if char == "'":
-                if not in_string:
-                    # String başlangıcı
-                    in_string = True
-                    result.append(char)
-                    i += 1
-                else:
-                    # String içindeyiz, bir sonraki karaktere bak
-                    if i + 1 < len(line):
-                        next_char = line[i+1]
-                        # Eğer sonraki karakter de ' ise, zaten escape edilmiş
-                        if next_char == "'":
-                            result.append("''")
-                            i += 2
-                        # Eğer sonraki karakter string sonu işareti ise (virgül, parantez, boşluk, vb.)
-                        elif next_char in [",", ")", "}", "]", " ", "\t", "\n"] or i + 1 == len(line) - 1:
-                            # String sonu
-                            in_string = False
-                            result.append(char)
-                            i += 1
-                        else:
-                            # String içinde kesme işareti - escape et
-                            result.append("''")
-                            i += 1
-                    else:
-                        # Satır sonu, string sonu
-                        in_string = False
-                        result.append(char)
-                        i += 1
-            else:
-                result.append(char)
-                i += 1
-        
-        fixed_line = ''.join(result)
-        fixed_lines.append(fixed_line)
-    
-    return '\n'.join(fixed_lines)
-
-# Dosyayı oku
-print("Dosya okunuyor...")
-with open('database-seed.sql', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-print("Kesme işaretleri düzeltiliyor...")
-# Düzelt
-fixed_content = fix_sql_quotes(content)
-
-# Dosyaya yaz
-print("Dosyaya yazılıyor...")
-with open('database-seed.sql', 'w', encoding='utf-8') as f:
-    f.write(fixed_content)
-
-print("Kesme işaretleri başarıyla düzeltildi!")
+    fixer = SqlQuoteFixer()
+    return fixer.feed(content) + fixer.finish()
+
+
+def fix_piece(text, state=STATE_CODE):
+    """
+    Bağımsız bir dosya parçasını verilen başlangıç durumuyla düzeltir.
+    (düzeltilmiş metin, bitiş durumu) döner.
+    """
+    fixer = SqlQuoteFixer(state)
+    out = fixer.feed(text) + fixer.finish()
+    return out, fixer.state
+
+
+def iter_statement_pieces(src, piece_size=PIECE_SIZE, chunk_size=CHUNK_SIZE):
+    """
+    Dosyayı yaklaşık piece_size boyutlu, ";\\n" ile biten parçalara böler.
+
+    Sınırın bir string literal içine denk gelip gelmediği burada bilinmez;
+    bu durum birleştirme sırasında fix_files() tarafından yakalanır.
+    """
+    buf = ""
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        buf += chunk
+        while len(buf) >= piece_size:
+            cut = buf.find(_STATEMENT_END, piece_size - len(_STATEMENT_END))
+            if cut < 0:
+                break
+            cut += len(_STATEMENT_END)
+            yield buf[:cut]
+            buf = buf[cut:]
+    if buf:
+        yield buf
+
+
+class _AtomicOutput:
+    """Hedef dosyanın yanında geçici dosyaya yazar, commit() ile yerine taşır."""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, self.tmp_path = tempfile.mkstemp(
+            prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory
+        )
+        self.file = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        self.changed = False
+
+    def commit(self, check_only=False):
+        self.file.close()
+        if check_only:
+            os.unlink(self.tmp_path)
+            return
+        shutil.copymode(self.path, self.tmp_path)
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        self.file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class _SerialExecutor:
+    """--workers 1 için ProcessPoolExecutor ile aynı arayüz."""
+
+    class _Done:
+        def __init__(self, value):
+            self._value = value
+
+        def result(self):
+            return self._value
+
+    def submit(self, fn, *args):
+        return self._Done(fn(*args))
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def fix_files(paths, workers=None, piece_size=PIECE_SIZE, check_only=False):
+    """
+    Dosyaları parçalara bölüp paralel düzeltir ve atomik olarak yazar.
+
+    Her parça string dışında başladığı varsayımıyla işlenir. Bir önceki
+    parça string içinde bittiyse (sınır bir literal'in içine düştüyse)
+    parça doğru başlangıç durumuyla seri olarak yeniden işlenir; böylece
+    sonuç her zaman seri çalıştırmayla aynıdır. Değişen dosyaların
+    listesini döner.
+    """
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(workers) if workers > 1 else _SerialExecutor()
+    window = max(2, workers * 4)
+    changed = []
+
+    def jobs():
+        for path in paths:
+            with open(path, "r", encoding="utf-8", newline="") as src:
+                for piece in iter_statement_pieces(src, piece_size):
+                    yield path, piece
+            yield path, None  # dosya sonu işareti
+
+    outputs = {}
+    states = {}
+    in_flight = deque()
+
+    def drain_one():
+        path, piece, future = in_flight.popleft()
+        output = outputs[path]
+        if piece is None:
+            del outputs[path]
+            del states[path]
+            output.commit(check_only=check_only or not output.changed)
+            if output.changed:
+                changed.append(path)
+            return
+        fixed, end_state = future.result()
+        if states[path] != STATE_CODE:
+            fixed, end_state = fix_piece(piece, states[path])
+        states[path] = end_state
+        if fixed != piece:
+            output.changed = True
+        output.file.write(fixed)
+
+    try:
+        for path, piece in jobs():
+            if path not in outputs:
+                outputs[path] = _AtomicOutput(path)
+                states[path] = STATE_CODE
+            future = executor.submit(fix_piece, piece) if piece is not None else None
+            in_flight.append((path, piece, future))
+            while len(in_flight) >= window:
+                drain_one()
+        while in_flight:
+            drain_one()
+    finally:
+        executor.shutdown(wait=True)
+        for output in outputs.values():
+            output.abort()
+
+    return changed
+
+
+def expand_patterns(patterns):
+    """Glob desenlerini sıralı ve tekrarsız dosya listesine çevirir."""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or (
+            [pattern] if os.path.isfile(pattern) else []
+        )
+        for path in matches:
+            key = os.path.abspath(path)
+            if os.path.isfile(path) and key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def fix_file(path, chunk_size=CHUNK_SIZE):
+    """Tek dosyayı seri olarak, geçici dosya üzerinden akış halinde düzeltir."""
+    output = _AtomicOutput(path)
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as src:
+            fix_sql_quotes_stream(src, output.file, chunk_size)
+    except BaseException:
+        output.abort()
+        raise
+    output.commit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="SQL seed dosyalarındaki string literal kesme işaretlerini düzeltir."
+    )
+    parser.add_argument(
+        "patterns", nargs="*", default=["database-seed.sql"],
+        help="Dosya yolları veya glob desenleri (varsayılan: database-seed.sql)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="İşçi süreç sayısı (varsayılan: çekirdek sayısı, 1 = seri)",
+    )
+    parser.add_argument(
+        "--piece-size", type=int, default=PIECE_SIZE,
+        help="Paralel iş parçası boyutu (karakter)",
+    )
+    parser.add_argument(
+        "--check", action="store_true",
+        help="Dosyaları yazma, sadece değişecek olanları listele (değişiklik varsa çıkış kodu 1)",
+    )
+    args = parser.parse_args(argv)
+
+    paths = expand_patterns(args.patterns)
+    if not paths:
+        print("Eşleşen dosya bulunamadı.", file=sys.stderr)
+        return 2
+
+    print(f"{len(paths)} dosyada kesme işaretleri düzeltiliyor...")
+    changed = fix_files(paths, args.workers, args.piece_size, check_only=args.check)
+    for path in changed:
+        print(f"  {'değişecek' if args.check else 'düzeltildi'}: {path}")
+
+    if args.check:
+        return 1 if changed else 0
+    print(f"Kesme işaretleri başarıyla düzeltildi! ({len(changed)}/{len(paths)} dosya değişti)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,52 @@
 # -*- coding: utf-8 -*-
 """
 .NET Core Kapsamlı Test Serisi - 54 test, 540 soru oluşturma scripti
+
+Sorular soru bankasından (scripts/pipeline/question_bank.py) çekilir:
+her modül, lessonSlug'ı modülün ders yollarından biriyle başlayan
+çoktan seçmeli sorulardan beslenir. Yakın kopyalar (aynı MinHash
+kümesi) tüm seride en fazla bir kez kullanılır; bankada yeterli soru
+olmayan testler placeholder sorularla tamamlanır.
+
+--stacks ile data/test-modules/*.json'daki kurslar için de test serisi
+üretilir (bkz. scripts/pipeline/test_suites.py): her kurs bir süreç
+havuzunda işlenir ve --out-dir altına kurs başına bir shard (SQL veya
+COPY) ile sayıları ve hash'leri içeren manifest.json yazılır. Çıktı
+--workers değerinden bağımsız olarak bayt bayt aynıdır.
+
+Kullanım:
+    python generate_tests.py
+    python generate_tests.py --stacks all --workers 4
+    python generate_tests.py --stacks go,react --format copy --out-dir /tmp/test-suites
 """
 
+import argparse
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+
+from pipeline import REPO_ROOT, pg_copy, question_bank, sql_rows, stacks, test_suites, topic_render
+from pipeline.build_cache import BuildCache
+from pipeline.pg_copy import (
+    DEFAULT_BATCH_SIZE,
+    QUIZ_COLUMNS,
+    CopyLoader,
+    connect,
+    database_url_from_env,
+    write_copy_script,
+)
+
+# Soru bankasını üreten pipeline modülleri; iki yolun da build cache kaynağı
+BANK_MODULES = (question_bank, sql_rows, stacks)
+# --stacks yolunun ek olarak kullandığı modüller
+STACK_MODULES = (test_suites, topic_render, pg_copy)
+
+def add_sources(cache, modules=()):
+    """Betik, verilen modüller ve soru bankası kaynaklarını cache girdisi yapar."""
+    cache.add_source(__file__, *(module.__file__ for module in BANK_MODULES + tuple(modules)))
+    cache.add_source(*(os.path.join(REPO_ROOT, p) for p in question_bank.source_paths()))
 
 # Modül listesi
 modules = [
@@ -28,6 +71,24 @@ modules = [
     ("18-docker-k8s", "Docker ve Kubernetes", "advanced"),
 ]
 
+# Modül -> soru bankasında eşleşen lessonSlug ön ekleri (/education/lessons/ altında)
+module_lessons = {
+    "01-csharp": ["csharp/"],
+    "02-architecture": ["dotnet/", "architecture/solid/"],
+    "03-project-structure": ["architecture/di/"],
+    "04-aspnet-mvc": ["aspnet-mvc/"],
+    "05-web-api": ["web-api/"],
+    "06-middleware": ["middleware/"],
+    "07-auth": ["authentication/", "authorization/"],
+    "08-logging": ["logging/"],
+    "09-configuration": ["configuration/"],
+    "10-testing": ["testing/"],
+    "11-performance": ["performance/"],
+    "12-async": ["async/"],
+}
+
+QUESTIONS_PER_TEST = 10
+
 # Her modül için soru şablonları (her test için 10 soru)
 questions_templates = {
     "01-csharp": [
@@ -79,46 +140,179 @@ def generate_test_insert(module_id, module_title, test_num, level, questions):
         CURRENT_TIMESTAMP
     )"""
 
-# Tüm testleri oluştur
-all_inserts = []
-for module_id, module_title, level in modules:
-    # Her modül için 3 test oluştur
-    for test_num in range(1, 4):
-        # Her test için 10 soru oluştur (şimdilik placeholder)
-        # Gerçek uygulamada her modül için uygun sorular oluşturulmalı
-        questions = [
-            {
-                "id": f"q{i+1}",
-                "question": f"{module_title} - Test {test_num} - Soru {i+1}",
-                "options": ["Seçenek A", "Seçenek B", "Seçenek C", "Seçenek D"],
-                "correctAnswer": i % 4,
-                "explanation": f"Açıklama {i+1}"
-            }
-            for i in range(10)
-        ]
-        insert = generate_test_insert(module_id, module_title, test_num, level, questions)
-        all_inserts.append(insert)
+def placeholder_question(module_title, test_num, i):
+    return {
+        "id": f"q{i+1}",
+        "question": f"{module_title} - Test {test_num} - Soru {i+1}",
+        "options": ["Seçenek A", "Seçenek B", "Seçenek C", "Seçenek D"],
+        "correctAnswer": i % 4,
+        "explanation": f"Açıklama {i+1}"
+    }
+
+def bank_candidates(bank, module_id):
+    """Modülün ders yollarına düşen, cevabı belli çoktan seçmeli sorular (banka sırasıyla)"""
+    prefixes = tuple("/education/lessons/" + p for p in module_lessons.get(module_id, ()))
+    if not prefixes:
+        return []
+    return [
+        i for i in range(len(bank))
+        if bank.kind[i] == question_bank.MCQ
+        and bank.answer[i] >= 0
+        and len(bank.options[i]) >= 2
+        and bank.lesson[i].startswith(prefixes)
+    ]
+
+def iter_tests(bank, stats=None):
+    """Her modül için 3 test: (module_id, module_title, test_num, level, questions)"""
+    used_clusters = set()
+    for module_id, module_title, level in modules:
+        # Elle yazılmış şablonlar önce; bankadaki kopyaları tekrar kullanılmaz
+        templates = questions_templates.get(module_id, [])
+        for test in templates:
+            for q in test:
+                used_clusters.update(bank.cluster[i] for _, i in bank.near_duplicates(q["question"]))
+        candidates = iter(bank_candidates(bank, module_id))
+
+        # Her modül için 3 test oluştur
+        for test_num in range(1, 4):
+            questions = [dict(q) for q in templates[test_num - 1]] if test_num <= len(templates) else []
+            picked = bank.draw(candidates, QUESTIONS_PER_TEST - len(questions), used_clusters)
+            for i in picked:
+                questions.append({
+                    "id": f"q{len(questions)+1}",
+                    "question": bank.text[i],
+                    "options": bank.options[i],
+                    "correctAnswer": bank.answer[i],
+                    "explanation": bank.explanation[i]
+                })
+            if stats is not None:
+                stats["bank"] += len(picked)
+                stats["placeholder"] += QUESTIONS_PER_TEST - len(questions)
+            # Bankada yeterli soru yoksa placeholder ile tamamla
+            questions.extend(
+                placeholder_question(module_title, test_num, i)
+                for i in range(len(questions), QUESTIONS_PER_TEST)
+            )
+            yield module_id, module_title, test_num, level, questions
+
+def test_row(module_id, module_title, test_num, level, questions):
+    """Bir test için QUIZ_COLUMNS sırasında COPY satırı oluştur"""
+    return (
+        f"test-module-{module_id}-test-{test_num}",
+        "course-dotnet-roadmap",
+        f"{module_title} - Test {test_num}",
+        f".NET Core Kapsamlı Test Serisi - {module_title} modülü için kapsamlı test",
+        ".NET Core",
+        "TEST",
+        level,
+        questions,
+        70,
+        None,
+    )
+
+def load_with_copy(args):
+    """Testleri INSERT yerine COPY ile yükle veya --copy ile COPY dosyası yaz"""
+    bank = question_bank.load_or_build()
+    rows = (test_row(*test) for test in iter_tests(bank))
 
-# SQL dosyasına yaz
-with open("test-inserts.sql", "w", encoding="utf-8") as f:
-    f.write("-- .NET Core Kapsamlı Test Serisi - 18 modül × 3 test = 54 test, 540 soru\n")
-    f.write("-- Bu INSERT statement'ları database-seed.sql dosyasına eklenecek\n\n")
-    f.write(",\n".join(all_inserts))
-    f.write(";\n")
+    if args.copy:
+        count = write_copy_script(args.copy, "quizzes", QUIZ_COLUMNS, rows, args.batch_size)
+        print(f"{count} test COPY dosyasına yazıldı: {args.copy}")
+        return 0
 
-print(f"54 test için INSERT statement'ları oluşturuldu!")
-print(f"Toplam {len(all_inserts)} test, {len(all_inserts) * 10} soru")
+    url = args.database_url or database_url_from_env()
+    if not url:
+        print("Veritabanı adresi yok: --database-url veya POSTGRES_URL_NON_POOLING", file=sys.stderr)
+        return 1
+    conn = connect(url)
+    try:
+        loader = CopyLoader(conn, "quizzes", QUIZ_COLUMNS, args.batch_size, upsert=args.upsert)
+        count = loader.load(rows)
+    finally:
+        conn.close()
+    print(f"{count} test COPY ile yüklendi ({args.batch_size} satırlık batch'ler, tek transaction)")
+    return 0
 
+def generate_stacks(args):
+    """--stacks: kurs başına shard'lar + birleşik manifest"""
+    try:
+        paths = stacks.select_stacks(args.stacks)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
 
+    cache = BuildCache("generate_tests-stacks", force=args.force or None)
+    add_sources(cache, STACK_MODULES)
+    cache.add_data(args.stacks, args.format, args.batch_size, os.path.abspath(args.out_dir))
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
 
+    bank = question_bank.load_or_build()
+    jobs = test_suites.build_jobs(bank, paths, args.format, args.batch_size)
+    results = test_suites.render_suites(jobs, workers=args.workers)
 
+    os.makedirs(args.out_dir, exist_ok=True)
+    for result in results:
+        cache.write_bytes(os.path.join(args.out_dir, result["file"]), result["data"])
+    manifest = test_suites.suite_manifest(results, args.format)
+    cache.write_json(os.path.join(args.out_dir, "manifest.json"), manifest, indent=2, sort_keys=True)
+    cache.commit()
+    cache.report()
 
+    totals = manifest["totals"]
+    print(f"{totals['stacks']} kurs, {totals['tests']} test, {totals['questions']} soru")
+    print(f"Bankadan {totals['bankQuestions']} soru, {totals['placeholders']} placeholder")
+    return 0
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=".NET Core test serisini üretir.")
+    parser.add_argument("--copy", metavar="DOSYA", help="Dry-run: COPY bloklarını psql dosyasına yaz")
+    parser.add_argument("--load", action="store_true", help="Testleri doğrudan veritabanına COPY ile yükle")
+    parser.add_argument("--database-url", help="PostgreSQL adresi (varsayılan: ortam değişkenleri)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="COPY batch boyutu")
+    parser.add_argument("--upsert", action="store_true", help="Var olan testleri güncelle (ON CONFLICT)")
+    parser.add_argument("--force", action="store_true", help="Build cache'i yok say")
+    parser.add_argument("--stacks", help='data/test-modules kursları: "all" veya go,react,...')
+    parser.add_argument("--format", choices=test_suites.FORMATS, default="sql",
+                        help="--stacks shard biçimi (varsayılan: sql)")
+    parser.add_argument("--out-dir", default="test-suites", help="--stacks çıktı dizini")
+    parser.add_argument("--workers", type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    args = parser.parse_args(argv)
 
+    if args.stacks:
+        return generate_stacks(args)
 
+    if args.copy or args.load or args.database_url:
+        return load_with_copy(args)
 
+    cache = BuildCache("generate_tests")
+    add_sources(cache)
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
 
+    # Tüm testleri oluştur (sorular bankadan, yakın kopyasız)
+    bank = question_bank.load_or_build()
+    stats = {"bank": 0, "placeholder": 0}
+    all_inserts = [generate_test_insert(*test) for test in iter_tests(bank, stats)]
 
+    # SQL dosyasına yaz (içerik aynıysa dosyaya dokunulmaz)
+    sql = (
+        "-- .NET Core Kapsamlı Test Serisi - 18 modül × 3 test = 54 test, 540 soru\n"
+        "-- Bu INSERT statement'ları database-seed.sql dosyasına eklenecek\n\n"
+        + ",\n".join(all_inserts)
+        + ";\n"
+    )
+    cache.write_text("test-inserts.sql", sql)
+    cache.commit()
+    cache.report()
 
+    print(f"54 test için INSERT statement'ları oluşturuldu!")
+    print(f"Toplam {len(all_inserts)} test, {len(all_inserts) * QUESTIONS_PER_TEST} soru")
+    print(f"Bankadan {stats['bank']} soru, {stats['placeholder']} placeholder")
+    return 0
 
 
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+badges.json'daki rozetleri hak eden ama henüz almamış kullanıcılar için
+user_badges COPY betiği yazar (yeni bir rozet seti eklendikten sonra).
+
+Kullanım:
+    python scripts/backfill-badges.py -o /tmp/badge-backfill.copy.sql
+    python scripts/backfill-badges.py /tmp/profile-seed.copy.sql -o /tmp/backfill.copy.sql --with-points
+    python scripts/backfill-badges.py database-seed.sql data/seed-data/seed-data-for-profile.json \\
+        --badges public/data/badges.json --now 2025-11-16T00:00:00Z -o /tmp/backfill.copy.sql
+
+Girdi profil seed JSON'u, COPY betikleri veya INSERT'li seed SQL'leridir
+(varsayılan: data/seed-data/seed-data-for-profile.json). Girdideki
+user_badges satırları kazanılmış sayılır ve yeniden yazılmaz; betik
+veritabanındaki güncel rozetlerle aynı girdiden üretilmelidir. Kriterler
+bütün kullanıcılar için vektörel değerlendirilir (bkz.
+pipeline/badge_backfill.py).
+"""
+
+import argparse
+import collections
+import datetime
+import sys
+import time
+
+from pipeline.badge_backfill import UserMetrics, backfill, iter_copy_script, read_tables
+from pipeline.build_cache import write_chunks_if_changed
+from pipeline.population import BADGES_PATH, PROFILE_SEED_PATH, load_badges
+
+
+def _timestamp(text):
+    if text is None:
+        return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    value = datetime.datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hak edilmiş ama verilmemiş rozetleri toplu hesaplar.")
+    parser.add_argument("inputs", nargs="*", help="Profil seed JSON'u, COPY betiği veya seed SQL (varsayılan: profil seed'i)")
+    parser.add_argument("-o", "--output", required=True, help="COPY betiği")
+    parser.add_argument("--badges", default=BADGES_PATH, help="Rozet kataloğu")
+    parser.add_argument("--now", help="earnedAt (ISO 8601, UTC; varsayılan: şimdi)")
+    parser.add_argument("--with-points", action="store_true",
+                        help="Rozet puanları için user_earned_points (BADGE) satırlarını da yaz")
+    args = parser.parse_args(argv)
+
+    try:
+        earned_at = _timestamp(args.now)
+        started = time.perf_counter()
+        badges = load_badges(args.badges)
+        tables = read_tables(args.inputs or [PROFILE_SEED_PATH],
+                             warn=lambda m: print(f"Uyarı: {m}", file=sys.stderr))
+        loaded = time.perf_counter()
+        metrics = UserMetrics(tables)
+        users, awarded, unsupported = backfill(badges, metrics, tables["user_badges"])
+        evaluated = time.perf_counter()
+        header = (
+            f"{len(users)} yeni rozet, {len(set(users.tolist()))} kullanıcı "
+            f"(backfill-badges.py; earnedAt = {earned_at})",
+        )
+        write_chunks_if_changed(
+            args.output,
+            iter_copy_script(metrics, badges, users, awarded, earned_at, args.with_points, header),
+            snapshot=False,
+        )
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    counts = collections.Counter(awarded.tolist())
+    for b, count in counts.most_common(10):
+        print(f"  {badges[b]['id']:<12} {badges[b]['name']:<24} {count:>8,}")
+    if unsupported:
+        print(f"Değerlendirilemeyen {len(unsupported)} rozet atlandı: {', '.join(unsupported[:10])}"
+              + (" ..." if len(unsupported) > 10 else ""))
+    print(
+        f"✅ {len(badges)} rozet × {metrics.size:,} kullanıcı: {len(users):,} yeni rozet -> {args.output} "
+        f"(okuma {loaded - started:.2f} sn, değerlendirme {evaluated - loaded:.2f} sn)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
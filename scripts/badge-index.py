@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Var olan bir badges.json için değerlendirme index'i oluşturur, doğrular
+veya sorgular (generate-200-badges.py index'i kendisi de üretir).
+
+Kullanım:
+    python scripts/badge-index.py build                         # public/data/badges.json
+    python scripts/badge-index.py verify
+    python scripts/badge-index.py query test_count 4 12         # 4 -> 12 ile yeni kazanılanlar
+"""
+
+import argparse
+import json
+import sys
+
+from pipeline.badge_index import (
+    build_index,
+    check_version,
+    dumps_index,
+    newly_qualified,
+    verify_index,
+)
+from pipeline.build_cache import write_if_changed
+
+DEFAULT_BADGES = "public/data/badges.json"
+DEFAULT_INDEX = "public/data/badges-index.json"
+
+
+def _load_badges(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return json.loads(data.decode("utf-8"))["badges"], data
+
+
+def _load_index(path):
+    with open(path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    check_version(index)
+    return index
+
+
+def cmd_build(args):
+    badges, data = _load_badges(args.badges)
+    index = build_index(badges, data)
+    problems = verify_index(index, badges)
+    if problems:
+        for problem in problems[:20]:
+            print(f"Index hatası: {problem}", file=sys.stderr)
+        return 1
+    changed = write_if_changed(args.index, dumps_index(index).encode("utf-8"))
+    print(
+        f"{args.index}: {'yazıldı' if changed else 'değişmedi'} "
+        f"({len(index['metrics'])} metrik, {len(index['events'])} olay, {len(index['unindexed'])} indexlenmemiş)"
+    )
+    return 0
+
+
+def cmd_verify(args):
+    badges, _ = _load_badges(args.badges)
+    problems = verify_index(_load_index(args.index), badges)
+    for problem in problems:
+        print(problem)
+    if problems:
+        return 1
+    print("Index tam taramayla uyuşuyor.")
+    return 0
+
+
+def cmd_query(args):
+    index = _load_index(args.index)
+    for badge_id in newly_qualified(index, args.metric, args.old, args.new):
+        print(badge_id)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rozet değerlendirme index'i.")
+    parser.add_argument("--badges", default=DEFAULT_BADGES, help="Rozet JSON dosyası")
+    parser.add_argument("--index", default=DEFAULT_INDEX, help="Index JSON dosyası")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Index'i oluştur ve doğrula").set_defaults(func=cmd_build)
+    sub.add_parser("verify", help="Index'i tam taramayla karşılaştır").set_defaults(func=cmd_verify)
+    query = sub.add_parser("query", help="Metrik old -> new değişiminde yeni kazanılan rozetler")
+    query.add_argument("metric", help='Metrik adı, ör. "score:ortalama" veya test_count')
+    query.add_argument("old", type=float)
+    query.add_argument("new", type=float)
+    query.set_defaults(func=cmd_query)
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Python üreticileri için benchmark ve regresyon takibi.
+
+Her üretici 1×/10×/100× ölçekli sentetik girdilerle çalıştırılır (ör.
+100× ≈ 95 MB seed SQL, 1500 modüllük ders JSON'u). Süre, MB/s ve tepe
+RSS (isteğe bağlı tracemalloc) JSON'a kaydedilir ve --baseline ile
+verilen sonuçlarla karşılaştırılır; eşiği aşan regresyon varsa çıkış
+kodu 1'dir. Süreler makineye bağlı olduğundan baseline repoda tutulmaz;
+yolu her zaman açıkça verilir (ör. ana dalda kaydedilip değişiklikten
+sonra karşılaştırılır).
+
+Kullanım:
+    python scripts/benchmark-generators.py --save-baseline /tmp/bench-main.json
+    python scripts/benchmark-generators.py --baseline /tmp/bench-main.json   # karşılaştır
+    python scripts/benchmark-generators.py --cases fix_quotes --scales 1,10 --tracemalloc
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from pipeline import REPO_ROOT
+from pipeline.bench import (
+    BenchmarkCase,
+    compare,
+    load_results,
+    measure,
+    run_in_subprocess,
+    save_results,
+)
+from pipeline.course_json import iter_course_json
+
+sys.path.insert(0, REPO_ROOT)
+
+BENCH_DIR = os.path.join(REPO_ROOT, ".content-cache", "bench")
+DEFAULT_RESULTS = os.path.join(BENCH_DIR, "results.json")
+DEFAULT_SCALES = (1, 10, 100)
+
+
+def _load_script(relative_path):
+    """Tireli dosya adına sahip scriptleri modül olarak yükler (main() çalışmaz)."""
+    path = os.path.join(REPO_ROOT, relative_path)
+    name = "bench_" + os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _scaled_ids(items, scale, key):
+    """Listeyi scale kez çoğaltır; tekrarların key alanına -sN eki verir."""
+    out = []
+    for n in range(scale):
+        for item in items:
+            item = copy.copy(item)
+            if n:
+                item[key] = f"{item[key]}-s{n}"
+            out.append(item)
+    return out
+
+
+# -- fix_quotes.py ----------------------------------------------------------
+
+def prepare_fix_quotes(workdir, scale):
+    with open(os.path.join(REPO_ROOT, "profile-seed-data.sql"), "r", encoding="utf-8") as f:
+        base = f.read()
+    with open(os.path.join(workdir, "seed.sql"), "w", encoding="utf-8") as f:
+        for _ in range(scale):
+            f.write(base)
+
+
+def run_fix_quotes(workdir, scale):
+    import fix_quotes
+
+    src_path = os.path.join(workdir, "seed.sql")
+    with open(src_path, "r", encoding="utf-8", newline="") as src, \
+            open(os.path.join(workdir, "seed.out.sql"), "w", encoding="utf-8", newline="") as dst:
+        fix_quotes.fix_sql_quotes_stream(src, dst)
+    return os.path.getsize(src_path)
+
+
+def run_fix_quotes_parallel(workdir, scale):
+    import fix_quotes
+
+    src_path = os.path.join(workdir, "seed.sql")
+    fix_quotes.fix_files([src_path])
+    return os.path.getsize(src_path)
+
+
+# -- generate_tests.py ------------------------------------------------------
+
+def run_generate_tests(workdir, scale):
+    generate_tests = _load_script("generate_tests.py")
+    generate_tests.modules = [
+        (f"{module_id}-s{n}" if n else module_id, title, level)
+        for n in range(scale)
+        for module_id, title, level in generate_tests.modules
+    ]
+    bank = generate_tests.question_bank.load_or_build()
+    inserts = [generate_tests.generate_test_insert(*test) for test in generate_tests.iter_tests(bank)]
+    return len(",\n".join(inserts).encode("utf-8"))
+
+
+def run_test_suites(workdir, scale):
+    from pipeline import question_bank, stacks, test_suites
+
+    jobs = test_suites.build_jobs(question_bank.load_or_build(), stacks.select_stacks("all"))
+    jobs = [
+        (f"{stack}-s{n}" if n else stack, path, candidates, fmt, batch_size)
+        for n in range(scale)
+        for stack, path, candidates, fmt, batch_size in jobs
+    ]
+    return sum(len(result["data"]) for result in test_suites.render_suites(jobs))
+
+
+# -- add-module-08.py / upsert-module.py ------------------------------------
+
+def prepare_upsert_module(workdir, scale):
+    with open(os.path.join(REPO_ROOT, "data/lesson-contents/mssql-course.json"), "r", encoding="utf-8") as f:
+        course = json.load(f)
+    course["modules"] = _scaled_ids(course["modules"], scale, "moduleId")
+    with open(os.path.join(workdir, "course.json"), "w", encoding="utf-8") as f:
+        json.dump(course, f, ensure_ascii=False, indent=2)
+    shutil.copy(
+        os.path.join(REPO_ROOT, "data/lesson-contents/module-08-content.json"),
+        os.path.join(workdir, "module.json"),
+    )
+
+
+def run_upsert_module(workdir, scale):
+    from pipeline.json_splice import upsert_module
+
+    course_path = os.path.join(workdir, "course.json")
+    with open(os.path.join(workdir, "module.json"), "r", encoding="utf-8") as f:
+        module = json.load(f)
+    # Her çalıştırmada modül içeriği değişsin ki dosya gerçekten yeniden yazılsın
+    module["moduleTitle"] += f" ({os.getpid()})"
+    upsert_module(course_path, module)
+    return os.path.getsize(course_path)
+
+
+# -- pipeline/json_index.py -------------------------------------------------
+
+def prepare_json_path(workdir, scale):
+    prepare_upsert_module(workdir, scale)
+    # İndeks burada kurulur; ölçülen, önbellekten açılış + tek modül okuma
+    from pipeline.json_index import load_index
+
+    load_index(os.path.join(workdir, "course.json"))
+
+
+def run_json_path(workdir, scale):
+    from pipeline.json_index import LazyJson
+
+    course_path = os.path.join(workdir, "course.json")
+    with LazyJson(course_path) as doc:
+        module_id = doc.field_values("modules", "moduleId")[-1]
+        module = doc.get(f'modules[moduleId == "{module_id}"]')
+    return len(json.dumps(module, ensure_ascii=False).encode("utf-8"))
+
+
+# -- scripts/generate-*.py --------------------------------------------------
+
+def run_badges(workdir, scale):
+    badges_script = _load_script("scripts/generate-200-badges.py")
+    badges = []
+    for _ in range(scale):
+        badges.extend(badges_script.build_badges())
+    text = json.dumps({"totalBadges": len(badges), "badges": badges}, ensure_ascii=False, indent=2)
+    return len(text.encode("utf-8"))
+
+
+def run_mssql_course(workdir, scale):
+    course_script = _load_script("scripts/generate-mssql-course-json.py")
+    syllabus = course_script.build_syllabus()
+    syllabus["modules"] = syllabus["modules"] * scale
+    return sum(len(chunk.encode("utf-8")) for chunk in iter_course_json(syllabus))
+
+
+def run_topic_lessons(workdir, scale):
+    topics_script = _load_script("scripts/generate-topic-lessons.py")
+    modules = []
+    for module_data in _scaled_ids(topics_script.modules_data, scale, "moduleId"):
+        topics = [
+            topics_script.create_topic_structure(
+                module_data["moduleId"], t["title"], t["slug"], t["desc"], module_data["moduleTitle"]
+            )
+            for t in module_data["topics"]
+        ]
+        modules.append({"moduleId": module_data["moduleId"], "moduleTitle": module_data["moduleTitle"], "topics": topics})
+    text = json.dumps({"modules": modules}, ensure_ascii=False, indent=2)
+    return len(text.encode("utf-8"))
+
+
+def run_profile_seed(workdir, scale):
+    from pipeline import population
+
+    pop = population.Population(
+        1000 * scale,
+        population.load_quizzes(),
+        population.load_badges(),
+        now_ms=1_763_251_200_000,
+        images=population.load_profile_images(),
+    )
+    return sum(len(chunk.encode("utf-8")) for chunk in pop.iter_copy_script())
+
+
+def prepare_badge_backfill(workdir, scale):
+    from pipeline import population
+
+    pop = population.Population(
+        1000 * scale,
+        population.load_quizzes(),
+        population.load_badges(),
+        now_ms=1_763_251_200_000,
+    )
+    with open(os.path.join(workdir, "profile.copy.sql"), "w", encoding="utf-8") as f:
+        f.writelines(pop.iter_copy_script())
+
+
+def run_badge_backfill(workdir, scale):
+    from pipeline import badge_backfill, population
+
+    path = os.path.join(workdir, "profile.copy.sql")
+    badges = population.load_badges()
+    tables = badge_backfill.read_tables([path])
+    metrics = badge_backfill.UserMetrics(tables)
+    users, awarded, _ = badge_backfill.backfill(badges, metrics, tables["user_badges"])
+    script = badge_backfill.iter_copy_script(metrics, badges, users, awarded, "2025-11-16T00:00:00.000Z")
+    sum(len(chunk) for chunk in script)
+    return os.path.getsize(path)
+
+
+def _iter_hello_lines(size):
+    """size bayta kadar 'Hello World N' satırları (live coding beklenen çıktıları gibi)."""
+    total = n = 0
+    while total < size:
+        n += 1
+        line = f"Hello World {n}\n"
+        total += len(line)
+        yield line
+
+
+def prepare_output_compare(workdir, scale):
+    for name, transform in (
+        ("expected.txt", None),
+        ("actual-crlf.txt", lambda line: line[:-1] + "\r\n"),
+        ("actual-trailing.txt", lambda line: line[:-1] + "  \n"),
+    ):
+        lines = _iter_hello_lines(scale << 20)
+        with open(os.path.join(workdir, name), "w", encoding="utf-8", newline="") as f:
+            f.writelines(map(transform, lines) if transform else lines)
+
+
+def _run_output_compare(workdir, actual_name):
+    from pipeline.output_compare import compare
+
+    expected_path = os.path.join(workdir, "expected.txt")
+    actual_path = os.path.join(workdir, actual_name)
+    with open(expected_path, "rb") as expected, open(actual_path, "rb") as actual:
+        if compare(expected, actual) is not None:
+            raise RuntimeError(f"{actual_name} eşleşmedi")
+    return os.path.getsize(expected_path) + os.path.getsize(actual_path)
+
+
+def run_output_compare(workdir, scale):
+    return _run_output_compare(workdir, "actual-crlf.txt")
+
+
+def run_output_compare_trailing(workdir, scale):
+    return _run_output_compare(workdir, "actual-trailing.txt")
+
+
+def run_output_compare_small(workdir, scale):
+    from pipeline.output_compare import LIVE_CODING, compare
+
+    expected = "".join(_iter_hello_lines(1024))
+    actual = expected.replace("\n", " \n")
+    mismatched = expected.replace("World 42", "World 24")
+    processed = 0
+    for n in range(1000 * scale):
+        other = mismatched if n % 10 == 0 else actual
+        compare(expected, other, LIVE_CODING)
+        processed += len(expected) + len(other)
+    return processed
+
+
+def _no_prepare(workdir, scale):
+    pass
+
+
+CASES = [
+    BenchmarkCase("fix_quotes", prepare_fix_quotes, run_fix_quotes, "seed SQL kesme işareti düzeltme (seri akış)"),
+    BenchmarkCase("fix_quotes_parallel", prepare_fix_quotes, run_fix_quotes_parallel, "seed SQL kesme işareti düzeltme (süreç havuzu)"),
+    BenchmarkCase("generate_tests", _no_prepare, run_generate_tests, "test INSERT üretimi"),
+    BenchmarkCase("test_suites", _no_prepare, run_test_suites, "tüm kurslar için test shard'ları (süreç havuzu)"),
+    BenchmarkCase("upsert_module", prepare_upsert_module, run_upsert_module, "büyük ders JSON'una modül upsert"),
+    BenchmarkCase("json_path", prepare_json_path, run_json_path, "büyük ders JSON'undan tek modül okuma"),
+    BenchmarkCase("badges", _no_prepare, run_badges, "rozet kataloğu üretimi"),
+    BenchmarkCase("mssql_course", _no_prepare, run_mssql_course, "MSSQL kurs JSON üretimi"),
+    BenchmarkCase("profile_seed", _no_prepare, run_profile_seed, "sentetik profil seed (COPY)"),
+    BenchmarkCase("badge_backfill", prepare_badge_backfill, run_badge_backfill, "tüm kullanıcılar için rozet backfill (COPY girdi)"),
+    BenchmarkCase("output_compare", prepare_output_compare, run_output_compare, "çıktı karşılaştırma, scale MB (CRLF, hızlı yol)"),
+    BenchmarkCase("output_compare_trailing", prepare_output_compare, run_output_compare_trailing, "çıktı karşılaştırma, scale MB (her satırda fark, satır yolu)"),
+    BenchmarkCase("output_compare_small", _no_prepare, run_output_compare_small, "scale×1000 adet 1 KB çıktı karşılaştırma"),
+    BenchmarkCase("topic_lessons", _no_prepare, run_topic_lessons, "konu anlatımı JSON üretimi"),
+]
+CASES_BY_NAME = {case.name: case for case in CASES}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Python üreticileri için benchmark.")
+    parser.add_argument("--cases", help="Virgülle ayrılmış case adları (varsayılan: hepsi)")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="Ölçekler, ör. 1,10,100")
+    parser.add_argument("--output", default=DEFAULT_RESULTS, help="Sonuç JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak baseline JSON")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Sonuçları bu dosyaya baseline olarak da kaydet")
+    parser.add_argument("--threshold", type=float, default=0.25, help="İzin verilen göreli yavaşlama (0.25 = %%25)")
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçüm kaç kez tekrarlansın (en hızlısı alınır)")
+    parser.add_argument("--tracemalloc", action="store_true", help="tracemalloc ile tepe Python belleğini de ölç")
+    # Alt süreç modu
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--scale", type=int, default=1, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        result = measure(CASES_BY_NAME[args.run_case], args.workdir, args.scale, args.tracemalloc)
+        print(json.dumps(result))
+        return 0
+
+    names = args.cases.split(",") if args.cases else [case.name for case in CASES]
+    unknown = [name for name in names if name not in CASES_BY_NAME]
+    if unknown:
+        parser.error(f"bilinmeyen case: {', '.join(unknown)}")
+    scales = [int(s) for s in args.scales.split(",")]
+    if args.baseline and not os.path.exists(args.baseline):
+        print(f"Hata: baseline bulunamadı: {args.baseline}", file=sys.stderr)
+        return 1
+
+    results = []
+    for name in names:
+        case = CASES_BY_NAME[name]
+        for scale in scales:
+            with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+                case.prepare(workdir, scale)
+                # Gürültüyü azaltmak için en hızlı tekrar alınır
+                result = min(
+                    (
+                        run_in_subprocess(os.path.abspath(__file__), name, scale, workdir, args.tracemalloc)
+                        for _ in range(max(1, args.repeat))
+                    ),
+                    key=lambda r: r["wallSeconds"],
+                )
+            results.append(result)
+            extra = f", tracemalloc {result['peakTracemallocMb']} MB" if "peakTracemallocMb" in result else ""
+            print(
+                f"{name:<22} {scale:>4}×  {result['wallSeconds']:8.3f} s  "
+                f"{result['mbPerSecond'] or 0:8.2f} MB/s  RSS {result['peakRssMb']:7.1f} MB{extra}"
+            )
+
+    save_results(args.output, results)
+    print(f"Sonuçlar: {os.path.relpath(args.output)}")
+
+    if args.save_baseline:
+        save_results(args.save_baseline, results)
+        print(f"Baseline kaydedildi: {os.path.relpath(args.save_baseline)}")
+
+    if not args.baseline:
+        if not args.save_baseline:
+            print("Baseline verilmedi; karşılaştırma atlandı (--baseline PATH).")
+        return 0
+
+    regressions = compare(results, load_results(args.baseline), args.threshold)
+    for line in regressions:
+        print(f"REGRESYON {line}")
+    if regressions:
+        return 1
+    print(f"Regresyon yok (eşik %{args.threshold * 100:.0f}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Beklenen ve gerçek program çıktısını akış halinde karşılaştırır; ilk
+farkın satır/sütununu ve kısa bir diff yazar.
+
+Kullanım:
+    python scripts/compare-output.py expected.txt actual.txt
+    dotnet run | python scripts/compare-output.py expected.txt - --live
+    python scripts/compare-output.py expected.txt actual.txt --float-tolerance 1e-6 --blank-lines ignore
+    python scripts/compare-output.py expected.txt actual.txt --unordered
+
+Dosyalar bloklarla okunur, çok büyük çıktılar belleğe alınmaz (bkz.
+pipeline/output_compare.py). --live, live coding değerlendirmesindeki
+normalizeOutput() kurallarını kullanır. Çıkış kodu diff(1) gibidir:
+0 eşleşti, 1 fark var, 2 hata.
+"""
+
+import argparse
+import sys
+
+from pipeline.output_compare import (
+    BLANK_LINE_MODES, DEFAULT_CONTEXT, LIVE_CODING, CompareOptions, compare,
+)
+
+
+def _open(path):
+    return sys.stdin.buffer if path == "-" else open(path, "rb")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İki çıktıyı normalize ederek satır satır karşılaştırır.")
+    parser.add_argument("expected", help="Beklenen çıktı ('-': stdin)")
+    parser.add_argument("actual", help="Gerçek çıktı ('-': stdin)")
+    parser.add_argument("--live", action="store_true", help="Live coding kuralları (diğer seçenekleri geçersiz kılar)")
+    parser.add_argument("--keep-cr", action="store_true", help="\\r\\n ve \\r'yi satır sonu sayma")
+    parser.add_argument("--keep-trailing", action="store_true", help="Satır sonu boşluklarını karşılaştır")
+    parser.add_argument("--strip", action="store_true", help="Satır başı boşluklarını da at")
+    parser.add_argument("--collapse-spaces", action="store_true", help="Boşluk dizilerini tek boşluk say")
+    parser.add_argument("--blank-lines", choices=BLANK_LINE_MODES, default="keep", help="Boş satırlar")
+    parser.add_argument("--keep-blank-edges", action="store_true", help="Baştaki/sondaki boş satırları karşılaştır")
+    parser.add_argument("--float-tolerance", type=float, help="Sayılar için mutlak/göreli tolerans")
+    parser.add_argument("--unordered", action="store_true", help="Satır sırasını yok say")
+    parser.add_argument("--context", type=int, default=DEFAULT_CONTEXT, help="Diff'te farkın çevresindeki satır")
+    args = parser.parse_args(argv)
+
+    if args.expected == "-" and args.actual == "-":
+        print("Hata: stdin yalnızca bir taraf için kullanılabilir", file=sys.stderr)
+        return 2
+    options = LIVE_CODING if args.live else CompareOptions(
+        crlf=not args.keep_cr,
+        rstrip=not args.keep_trailing,
+        strip=args.strip,
+        collapse_spaces=args.collapse_spaces,
+        blank_lines=args.blank_lines,
+        trim_blank_edges=not args.keep_blank_edges,
+        float_tolerance=args.float_tolerance,
+        unordered=args.unordered,
+    )
+    try:
+        with _open(args.expected) as expected, _open(args.actual) as actual:
+            mismatch = compare(expected, actual, options, context=args.context)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+
+    if mismatch is None:
+        print("✅ Çıktılar eşleşiyor")
+        return 0
+    where = f"satır {mismatch.line}" if mismatch.line else f"gerçek satır {mismatch.actual_line}"
+    if mismatch.column:
+        where += f", sütun {mismatch.column}"
+    print(f"❌ İlk fark: {where}")
+    print(mismatch.diff)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
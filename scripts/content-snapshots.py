@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Üretilen dosyaların snapshot deposunu yönetir (.content-cache/snapshots).
+
+Üreticiler üzerine yazmadan önce otomatik snapshot alır; bu komut
+elle snapshot almak, listelemek, geri yüklemek ve karşılaştırmak içindir.
+
+Kullanım:
+    python scripts/content-snapshots.py take public/data/badges.json
+    python scripts/content-snapshots.py list data/lesson-contents/mssql-course.json
+    python scripts/content-snapshots.py diff public/data/badges.json 00001      # şu anki dosyayla
+    python scripts/content-snapshots.py restore public/data/badges.json 00001 --to /tmp/badges.json
+    python scripts/content-snapshots.py import-backups --delete   # *.backup* dosyalarını depoya al
+    python scripts/content-snapshots.py prune --keep 10 && python scripts/content-snapshots.py gc
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+from pipeline import REPO_ROOT
+from pipeline.snapshots import SnapshotError, SnapshotStore
+
+BACKUP_PATTERNS = ("data/**/*.backup*", "public/data/**/*.backup*")
+
+
+def _size(n):
+    return f"{n / 1024:.1f} KB" if n < 1024 * 1024 else f"{n / (1024 * 1024):.2f} MB"
+
+
+def cmd_take(store, args):
+    for path in args.paths:
+        manifest, new_bytes = store.snapshot(path, label=args.label)
+        print(f"{manifest['path']}: {manifest['id']} ({len(manifest['trees'])} grup, yeni {_size(new_bytes)})")
+    return 0
+
+
+def cmd_list(store, args):
+    for manifest in store.list(args.path):
+        label = f"  {manifest['label']}" if manifest.get("label") else ""
+        print(
+            f"{manifest['path']}  {manifest['id']}  {manifest['createdAt']}  "
+            f"{_size(manifest['size'])}  {len(manifest['trees'])} grup{label}"
+        )
+    print(f"Depo boyutu: {_size(store.disk_usage())}")
+    return 0
+
+
+def cmd_restore(store, args):
+    manifest = store.get(args.path, args.id)
+    dest = store.restore(manifest, args.to or args.path)
+    print(f"{manifest['path']} @ {manifest['id']} -> {os.path.relpath(dest)}")
+    return 0
+
+
+def cmd_diff(store, args):
+    old = store.get(args.path, args.old)
+    new = store.get(args.path, args.new) if args.new else store.describe(args.path)
+    changes = store.diff(old, new)
+    for op, label, old_size, new_size in changes:
+        print(f"{op:<8} {label}  {_size(old_size)} -> {_size(new_size)}")
+    if not changes:
+        print("Fark yok.")
+    return 0
+
+
+def cmd_import_backups(store, args):
+    """Dosyaların yanındaki .backup/.backup2 kopyalarını asıl dosyanın geçmişine ekler."""
+    backups = sorted(
+        {p for pattern in args.patterns for p in glob.glob(os.path.join(REPO_ROOT, pattern), recursive=True)},
+        key=os.path.getmtime,
+    )
+    for path in backups:
+        original = path[:path.index(".backup")]
+        manifest, new_bytes = store.snapshot(
+            path, key=os.path.relpath(original, REPO_ROOT).replace(os.sep, "/"), label=os.path.basename(path)
+        )
+        print(f"{os.path.relpath(path, REPO_ROOT)} -> {manifest['id']} (yeni {_size(new_bytes)})")
+        if args.delete:
+            store.read(manifest)  # silmeden önce geri okunabildiğini doğrula
+            os.unlink(path)
+    print(f"Depo boyutu: {_size(store.disk_usage())}")
+    return 0
+
+
+def cmd_prune(store, args):
+    removed = store.prune(args.path, keep=args.keep)
+    print(f"{removed} snapshot silindi (kullanılmayan nesneler için 'gc' çalıştırın)")
+    return 0
+
+
+def cmd_gc(store, args):
+    removed, freed = store.gc()
+    print(f"{removed} nesne silindi, {_size(freed)} boşaldı")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İçerik snapshot deposu.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("take", help="Dosyaların snapshot'ını al")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--label", help="Snapshot açıklaması")
+    p.set_defaults(func=cmd_take)
+
+    p = sub.add_parser("list", help="Snapshot'ları listele")
+    p.add_argument("path", nargs="?")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("restore", help="Snapshot'ı geri yükle")
+    p.add_argument("path")
+    p.add_argument("id", nargs="?", help="Snapshot id (ön eki); varsayılan en sonuncusu")
+    p.add_argument("--to", help="Asıl dosya yerine bu yola yaz")
+    p.set_defaults(func=cmd_restore)
+
+    p = sub.add_parser("diff", help="İki snapshot'ı (veya snapshot ile şu anki dosyayı) karşılaştır")
+    p.add_argument("path")
+    p.add_argument("old", help="Eski snapshot id")
+    p.add_argument("new", nargs="?", help="Yeni snapshot id; verilmezse şu anki dosya")
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser("import-backups", help="*.backup* kopyalarını depoya al")
+    p.add_argument("patterns", nargs="*", default=list(BACKUP_PATTERNS))
+    p.add_argument("--delete", action="store_true", help="Depoya alınan kopyaları sil")
+    p.set_defaults(func=cmd_import_backups)
+
+    p = sub.add_parser("prune", help="Dosya başına son N snapshot'ı bırak")
+    p.add_argument("path", nargs="?")
+    p.add_argument("--keep", type=int, default=10)
+    p.set_defaults(func=cmd_prune)
+
+    p = sub.add_parser("gc", help="Kullanılmayan nesneleri sil")
+    p.set_defaults(func=cmd_gc)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(SnapshotStore(), args)
+    except (SnapshotError, OSError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
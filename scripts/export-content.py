@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İçerik JSON dosyalarının girintisiz, NDJSON ve sıkıştırılmış
+(gzip/brotli) kopyalarını yazar; boyut ve ayrıştırma süresi raporu basar.
+
+Kullanım:
+    python scripts/export-content.py                              # varsayılan içerik
+    python scripts/export-content.py public/data/badges.json
+    python scripts/export-content.py "data/test-modules/*.json" --report /tmp/export-report.json
+
+Kopyalar kaynağın yanına yazılır (badges.json -> badges.min.json,
+badges.ndjson, badges.min.json.gz, badges.min.json.br; bkz.
+pipeline/content_export.py). Üreticiler aynı aşamayı --export ile
+kendi çıktıları için çalıştırır.
+"""
+
+import argparse
+import glob
+import json
+import sys
+
+from pipeline import content_export
+from pipeline.build_cache import BuildCache
+from pipeline.content_export import export_json, format_report, has_brotli, is_export
+
+DEFAULT_PATTERNS = (
+    "public/data/badges.json",
+    "data/test-modules/*-test-modules.json",
+    "data/lesson-contents/*.json",
+    "data/topic-lessons/*.json",
+)
+
+
+def collect(patterns):
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            if path.endswith(".json") and not is_export(path) and path not in paths:
+                paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İçerik JSON dosyalarının hızlı okunan kopyalarını yazar.")
+    parser.add_argument("patterns", nargs="*", help="Dosya veya glob desenleri (varsayılan: badges, test modülleri, dersler)")
+    parser.add_argument("--report", help="Raporu ayrıca JSON olarak bu dosyaya yaz")
+    parser.add_argument("--force", action="store_true", help="Cache'i yok say")
+    args = parser.parse_args(argv)
+
+    paths = collect(args.patterns or DEFAULT_PATTERNS)
+    if not paths:
+        print("Hata: dışa aktarılacak JSON dosyası bulunamadı", file=sys.stderr)
+        return 1
+
+    cache = BuildCache("export-content", force=args.force or None)
+    cache.add_source(__file__, content_export.__file__, *paths)
+    cache.add_data(has_brotli())
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
+
+    report = []
+    for path in paths:
+        try:
+            rows = export_json(path, cache=cache)
+        except ValueError as e:
+            # Bozuk JSON (ör. elle düzenlenirken kırılmış ders dosyası) atlanır
+            print(f"Uyarı: {path} atlandı: {e}", file=sys.stderr)
+            continue
+        print(format_report(rows))
+        report.append(rows)
+    cache.commit()
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    source = sum(rows[0]["bytes"] for rows in report)
+    smallest = sum(min(row["bytes"] for row in rows) for rows in report)
+    print(f"✅ {len(report)}/{len(paths)} dosya: {source:,} B -> en küçük kopyalar {smallest:,} B")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
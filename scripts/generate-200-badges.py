@@ -1,4 +1,11 @@
+import argparse
 import json
+import sys
+
+from pipeline import badge_catalog, badge_index, content_export
+from pipeline.badge_index import dumps_index, index_from_classified, verify_index
+from pipeline.build_cache import BuildCache
+from pipeline.content_export import export_stage
 
 # Kategori çarpanları
 category_multipliers = {
@@ -52,215 +59,205 @@ emojis = [
     "🖖", "👌", "🤏", "✌️", "🤞", "🤟", "🤘", "🤙", "👈", "👉"
 ]
 
-# Kategori isimleri ve açıklamaları
-category_info = {
-    "daily_activities": {
-        "name": "Günlük Aktiviteler",
-        "description": "Günlük test, kurs, canlı kod ve bugfix aktiviteleriniz için rozetler"
+# Renk kodları (tier'a göre)
+color_map = {
+    "bronze": ["#CD7F32", "#B87333", "#A0522D", "#8B4513", "#654321", "#5C4033", "#4A3728", "#3D2817", "#2F1F14", "#1F140D"],
+    "silver": ["#C0C0C0", "#A8A8A8", "#909090", "#787878", "#606060", "#484848", "#303030", "#181818", "#101010", "#080808"],
+    "gold": ["#FFD700", "#FFC125", "#FFB347", "#FFA500", "#FF8C00", "#FF7F50", "#FF6347", "#FF4500", "#FF1493", "#FF00FF"],
+    "platinum": ["#E5E4E2", "#D3D3D3", "#C0C0C0", "#A9A9A9", "#808080", "#696969", "#555555", "#404040", "#2F2F2F", "#1C1C1C"]
+}
+
+# Rozet spec tablosu: kategori başına alt türler, eşik merdivenleri ve isim şablonları.
+# Şablonlarda {sub} alt tür, {Sub} baş harfi büyük alt tür, {word} alt türün
+# ikinci kelimesi (yoksa kendisi), {t} eşik değeridir.
+categories = [
+    {
+        "id": "daily_activities",
+        "criteria_type": "daily_activity",
+        "sub_field": "activity_type",
+        "sub_types": ["test", "kurs", "canlı kod", "bugfix", "ders", "quiz", "canlı kodlama", "hata düzeltme", "eğitim", "pratik"],
+        "threshold_field": "count",
+        "criteria_extra": {"daily": True},
+        "ladders": {
+            "bronze": [1, 2, 3, 1, 2, 3, 1, 2, 3, 1],
+            "silver": [5, 6, 7, 5, 6, 7, 5, 6, 7, 5],
+            "gold": [10, 12, 15, 10, 12, 15, 10, 12, 15, 10],
+            "platinum": [20, 25, 30, 20, 25, 30, 20, 25, 30, 20]
+        },
+        "templates": {
+            "bronze": {"name": "{t} {Sub}", "name_when_one": "İlk {Sub}", "description": "Bir günde {t} {sub} tamamla"},
+            "silver": {"name": "{t} {Sub} Ustası", "description": "Bir günde {t} {sub} tamamla"},
+            "gold": {"name": "{t} {Sub} Uzmanı", "description": "Bir günde {t} {sub} tamamla"},
+            "platinum": {"name": "{t} {Sub} Efsanesi", "description": "Bir günde {t} {sub} tamamla"}
+        }
     },
-    "score": {
-        "name": "Toplam Başarılar",
-        "description": "Toplam başarılarınız için rozetler"
+    {
+        "id": "score",
+        "criteria_type": "score",
+        "sub_field": "score_type",
+        "sub_types": ["tek test", "ortalama", "toplam", "mükemmel", "yüksek", "tutarlı", "başarılı", "harika", "mükemmel", "efsanevi"],
+        "threshold_field": "min_score",
+        "ladders": {
+            "bronze": [60, 65, 70, 60, 65, 70, 60, 65, 70, 60],
+            "silver": [80, 82, 85, 80, 82, 85, 80, 82, 85, 80],
+            "gold": [90, 92, 95, 90, 92, 95, 90, 92, 95, 90],
+            "platinum": [100]
+        },
+        "templates": {
+            "bronze": {"name": "{Sub} {t}", "description": "{Sub} skorunuz {t} ve üzeri olsun"},
+            "silver": {"name": "{Sub} {t}", "description": "{Sub} skorunuz {t} ve üzeri olsun"},
+            "gold": {"name": "{Sub} {t}", "description": "{Sub} skorunuz {t} ve üzeri olsun"},
+            "platinum": {"name": "{Sub} Mükemmel", "description": "{Sub} skorunuz {t} olsun"}
+        }
     },
-    "social_interaction": {
-        "name": "Sosyal Etkileşim",
-        "description": "Sosyal aktiviteleriniz için rozetler"
+    {
+        "id": "social_interaction",
+        "criteria_type": "social_interaction",
+        "sub_field": "interaction_type",
+        "sub_types": ["post", "beğeni", "yorum", "story", "arkadaş", "takipçi", "paylaşım", "etkileşim", "sosyal", "topluluk"],
+        "threshold_field": "count",
+        "ladders": {
+            "bronze": [10, 15, 20, 10, 15, 20, 10, 15, 20, 10],
+            "silver": [50, 75, 100, 50, 75, 100, 50, 75, 100, 50],
+            "gold": [200, 300, 500, 200, 300, 500, 200, 300, 500, 200],
+            "platinum": [1000, 1500, 2000, 1000, 1500, 2000, 1000, 1500, 2000, 1000]
+        },
+        "templates": {
+            "bronze": {"name": "İlk {t} {Sub}", "description": "Toplam {t} {sub} yap"},
+            "silver": {"name": "{t} {Sub}", "description": "Toplam {t} {sub} yap"},
+            "gold": {"name": "{t} {Sub} Ustası", "description": "Toplam {t} {sub} yap"},
+            "platinum": {"name": "{t} {Sub} Efsanesi", "description": "Toplam {t} {sub} yap"}
+        }
     },
-    "streak": {
-        "name": "Süreklilik ve Disiplin",
-        "description": "Süreklilik ve disiplin rozetleri"
+    {
+        "id": "streak",
+        "criteria_type": "streak",
+        "sub_field": "streak_type",
+        "sub_types": ["günlük aktivite", "test çözme", "kurs tamamlama", "login", "aktif", "disiplin", "süreklilik", "düzen", "alışkanlık", "ritim"],
+        "threshold_field": "days",
+        "ladders": {
+            "bronze": [3, 5, 7, 3, 5, 7, 3, 5, 7, 3],
+            "silver": [14, 21, 30, 14, 21, 30, 14, 21, 30, 14],
+            "gold": [60, 75, 100, 60, 75, 100, 60, 75, 100, 60],
+            "platinum": [365, 500, 730, 365, 500, 730, 365, 500, 730, 365]
+        },
+        "templates": {
+            "bronze": {"name": "{t} Günlük {Sub}", "description": "{t} gün üst üste {sub} yap"},
+            "silver": {"name": "{t} Günlük {Sub}", "description": "{t} gün üst üste {sub} yap"},
+            "gold": {"name": "{t} Günlük {Sub}", "description": "{t} gün üst üste {sub} yap"},
+            "platinum": {"name": "{t} Günlük {Sub} Efsanesi", "description": "{t} gün üst üste {sub} yap"}
+        }
     },
-    "special": {
-        "name": "Özel Başarılar",
-        "description": "Özel başarılarınız için rozetler"
+    {
+        "id": "special",
+        "criteria_type": "special",
+        "sub_field": "special_type",
+        "sub_types": ["ilk test", "ilk kurs", "ilk post", "hızlı tamamlama", "mükemmel performans", "özel kombinasyon", "nadir başarı", "efsanevi an", "tarihi başarı", "benzersiz başarı"],
+        "threshold_field": None,
+        "templates": {
+            "bronze": {"name": "İlk {word}", "description": "{Sub} başarısını elde et"},
+            "silver": {"name": "Hızlı {word}", "description": "24 saat içinde {sub} başarısını elde et"},
+            "gold": {"name": "Mükemmel {word}", "description": "{Sub} mükemmel performansı göster"},
+            "platinum": {"name": "Efsanevi {word}", "description": "{Sub} efsanevi başarısını elde et"}
+        }
     }
-}
+]
 
-# Tier isimleri
-tier_names = {
-    "bronze": "Başlangıç Seviye",
-    "silver": "Orta Seviye",
-    "gold": "İleri Seviye",
-    "platinum": "Efsanevi"
-}
 
-badges = []
-emoji_index = 0
+def build_spec():
+    """Modüldeki tablolardan BadgeCatalog spec'ini oluşturur."""
+    return {
+        "tiers": {
+            tier: {"points": tier_base_points[tier], "rarity": tier_rarity[tier], "colors": color_map[tier]}
+            for tier in ["bronze", "silver", "gold", "platinum"]
+        },
+        "categories": [dict(category, multiplier=category_multipliers[category["id"]]) for category in categories],
+        "emojis": emojis
+    }
 
-# Her kategori için
-for cat_idx, category in enumerate(["daily_activities", "score", "social_interaction", "streak", "special"]):
-    # Her tier için
-    for tier_idx, tier in enumerate(["bronze", "silver", "gold", "platinum"]):
-        # Her tier'de 10 rozet
-        for badge_idx in range(10):
-            badge_num = cat_idx * 40 + tier_idx * 10 + badge_idx + 1
-            badge_id = f"badge-{badge_num:03d}"
-            badge_key = f"{category}_{tier}_{badge_idx + 1}"
-            
-            # Puan hesaplama
-            base_points = tier_base_points[tier]
-            multiplier = category_multipliers[category]
-            points = int(base_points * multiplier)
-            
-            # Rozet isimleri ve açıklamaları
-            if category == "daily_activities":
-                activity_types = ["test", "kurs", "canlı kod", "bugfix", "ders", "quiz", "canlı kodlama", "hata düzeltme", "eğitim", "pratik"]
-                activity_type = activity_types[badge_idx % len(activity_types)]
-                if tier == "bronze":
-                    count = [1, 2, 3, 1, 2, 3, 1, 2, 3, 1][badge_idx]
-                    name = f"İlk {activity_type.capitalize()}" if count == 1 else f"{count} {activity_type.capitalize()}"
-                    description = f"Bir günde {count} {activity_type} tamamla"
-                elif tier == "silver":
-                    count = [5, 6, 7, 5, 6, 7, 5, 6, 7, 5][badge_idx]
-                    name = f"{count} {activity_type.capitalize()} Ustası"
-                    description = f"Bir günde {count} {activity_type} tamamla"
-                elif tier == "gold":
-                    count = [10, 12, 15, 10, 12, 15, 10, 12, 15, 10][badge_idx]
-                    name = f"{count} {activity_type.capitalize()} Uzmanı"
-                    description = f"Bir günde {count} {activity_type} tamamla"
-                else:  # platinum
-                    count = [20, 25, 30, 20, 25, 30, 20, 25, 30, 20][badge_idx]
-                    name = f"{count} {activity_type.capitalize()} Efsanesi"
-                    description = f"Bir günde {count} {activity_type} tamamla"
-                criteria = {
-                    "type": "daily_activity",
-                    "activity_type": activity_type,
-                    "count": count,
-                    "daily": True
-                }
-            elif category == "score":
-                score_types = ["tek test", "ortalama", "toplam", "mükemmel", "yüksek", "tutarlı", "başarılı", "harika", "mükemmel", "efsanevi"]
-                score_type = score_types[badge_idx % len(score_types)]
-                if tier == "bronze":
-                    score_range = [60, 65, 70, 60, 65, 70, 60, 65, 70, 60][badge_idx]
-                    name = f"{score_type.capitalize()} {score_range}"
-                    description = f"{score_type.capitalize()} skorunuz {score_range} ve üzeri olsun"
-                elif tier == "silver":
-                    score_range = [80, 82, 85, 80, 82, 85, 80, 82, 85, 80][badge_idx]
-                    name = f"{score_type.capitalize()} {score_range}"
-                    description = f"{score_type.capitalize()} skorunuz {score_range} ve üzeri olsun"
-                elif tier == "gold":
-                    score_range = [90, 92, 95, 90, 92, 95, 90, 92, 95, 90][badge_idx]
-                    name = f"{score_type.capitalize()} {score_range}"
-                    description = f"{score_type.capitalize()} skorunuz {score_range} ve üzeri olsun"
-                else:  # platinum
-                    score_range = 100
-                    name = f"{score_type.capitalize()} Mükemmel"
-                    description = f"{score_type.capitalize()} skorunuz {score_range} olsun"
-                criteria = {
-                    "type": "score",
-                    "score_type": score_type,
-                    "min_score": score_range
-                }
-            elif category == "social_interaction":
-                social_types = ["post", "beğeni", "yorum", "story", "arkadaş", "takipçi", "paylaşım", "etkileşim", "sosyal", "topluluk"]
-                social_type = social_types[badge_idx % len(social_types)]
-                if tier == "bronze":
-                    count = [10, 15, 20, 10, 15, 20, 10, 15, 20, 10][badge_idx]
-                    name = f"İlk {count} {social_type.capitalize()}"
-                    description = f"Toplam {count} {social_type} yap"
-                elif tier == "silver":
-                    count = [50, 75, 100, 50, 75, 100, 50, 75, 100, 50][badge_idx]
-                    name = f"{count} {social_type.capitalize()}"
-                    description = f"Toplam {count} {social_type} yap"
-                elif tier == "gold":
-                    count = [200, 300, 500, 200, 300, 500, 200, 300, 500, 200][badge_idx]
-                    name = f"{count} {social_type.capitalize()} Ustası"
-                    description = f"Toplam {count} {social_type} yap"
-                else:  # platinum
-                    count = [1000, 1500, 2000, 1000, 1500, 2000, 1000, 1500, 2000, 1000][badge_idx]
-                    name = f"{count} {social_type.capitalize()} Efsanesi"
-                    description = f"Toplam {count} {social_type} yap"
-                criteria = {
-                    "type": "social_interaction",
-                    "interaction_type": social_type,
-                    "count": count
-                }
-            elif category == "streak":
-                streak_types = ["günlük aktivite", "test çözme", "kurs tamamlama", "login", "aktif", "disiplin", "süreklilik", "düzen", "alışkanlık", "ritim"]
-                streak_type = streak_types[badge_idx % len(streak_types)]
-                if tier == "bronze":
-                    days = [3, 5, 7, 3, 5, 7, 3, 5, 7, 3][badge_idx]
-                    name = f"{days} Günlük {streak_type.capitalize()}"
-                    description = f"{days} gün üst üste {streak_type} yap"
-                elif tier == "silver":
-                    days = [14, 21, 30, 14, 21, 30, 14, 21, 30, 14][badge_idx]
-                    name = f"{days} Günlük {streak_type.capitalize()}"
-                    description = f"{days} gün üst üste {streak_type} yap"
-                elif tier == "gold":
-                    days = [60, 75, 100, 60, 75, 100, 60, 75, 100, 60][badge_idx]
-                    name = f"{days} Günlük {streak_type.capitalize()}"
-                    description = f"{days} gün üst üste {streak_type} yap"
-                else:  # platinum
-                    days = [365, 500, 730, 365, 500, 730, 365, 500, 730, 365][badge_idx]
-                    name = f"{days} Günlük {streak_type.capitalize()} Efsanesi"
-                    description = f"{days} gün üst üste {streak_type} yap"
-                criteria = {
-                    "type": "streak",
-                    "streak_type": streak_type,
-                    "days": days
-                }
-            else:  # special
-                special_types = ["ilk test", "ilk kurs", "ilk post", "hızlı tamamlama", "mükemmel performans", "özel kombinasyon", "nadir başarı", "efsanevi an", "tarihi başarı", "benzersiz başarı"]
-                special_type = special_types[badge_idx % len(special_types)]
-                if tier == "bronze":
-                    name = f"İlk {special_type.split()[1] if len(special_type.split()) > 1 else special_type}"
-                    description = f"{special_type.capitalize()} başarısını elde et"
-                elif tier == "silver":
-                    name = f"Hızlı {special_type.split()[1] if len(special_type.split()) > 1 else special_type}"
-                    description = f"24 saat içinde {special_type} başarısını elde et"
-                elif tier == "gold":
-                    name = f"Mükemmel {special_type.split()[1] if len(special_type.split()) > 1 else special_type}"
-                    description = f"{special_type.capitalize()} mükemmel performansı göster"
-                else:  # platinum
-                    name = f"Efsanevi {special_type.split()[1] if len(special_type.split()) > 1 else special_type}"
-                    description = f"{special_type.capitalize()} efsanevi başarısını elde et"
-                criteria = {
-                    "type": "special",
-                    "special_type": special_type
-                }
-            
-            # Renk kodları (tier'a göre)
-            color_map = {
-                "bronze": ["#CD7F32", "#B87333", "#A0522D", "#8B4513", "#654321", "#5C4033", "#4A3728", "#3D2817", "#2F1F14", "#1F140D"],
-                "silver": ["#C0C0C0", "#A8A8A8", "#909090", "#787878", "#606060", "#484848", "#303030", "#181818", "#101010", "#080808"],
-                "gold": ["#FFD700", "#FFC125", "#FFB347", "#FFA500", "#FF8C00", "#FF7F50", "#FF6347", "#FF4500", "#FF1493", "#FF00FF"],
-                "platinum": ["#E5E4E2", "#D3D3D3", "#C0C0C0", "#A9A9A9", "#808080", "#696969", "#555555", "#404040", "#2F2F2F", "#1C1C1C"]
-            }
-            color = color_map[tier][badge_idx % 10]
-            
-            # Emoji seçimi
-            icon = emojis[emoji_index % len(emojis)]
-            emoji_index += 1
-            
-            badge = {
-                "id": badge_id,
-                "key": badge_key,
-                "name": name,
-                "description": description,
-                "icon": icon,
-                "color": color,
-                "category": category,
-                "tier": tier,
-                "rarity": tier_rarity[tier],
-                "points": points,
-                "criteria": criteria
-            }
-            badges.append(badge)
 
-# JSON dosyasını oluştur
-output = {
-    "totalBadges": 200,
-    "badges": badges
-}
+def load_sets(count=0, sets_file=None):
+    """
+    Rozet setleri: --sets N için "season-01".."season-N", --sets-file için
+    [{"id": "...", "title": "..."}] listesi. Set yoksa None (klasik 200 rozet).
+    """
+    if sets_file:
+        with open(sets_file, "r", encoding="utf-8") as f:
+            return [(item["id"], item.get("title", item["id"])) for item in json.load(f)]
+    if count:
+        width = max(2, len(str(count)))
+        return [(f"season-{n:0{width}d}", f"Sezon {n}") for n in range(1, count + 1)]
+    return None
+
+
+def build_catalog(sets=None, per_tier=10, id_width=None):
+    return badge_catalog.BadgeCatalog(build_spec(), sets=sets, per_tier=per_tier, id_width=id_width)
+
+
+def build_badges(sets=None, per_tier=10):
+    """Tüm set × kategori × tier kombinasyonları için rozet listesini oluşturur."""
+    return list(build_catalog(sets, per_tier).iter_badges())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rozet kataloğunu spec tablosundan üretir.")
+    parser.add_argument("--sets", type=int, default=0, help="N sezonluk rozet seti üret (season-01..)")
+    parser.add_argument("--sets-file", help='Set listesi JSON dosyası: [{"id": ..., "title": ...}]')
+    parser.add_argument("--per-tier", type=int, default=10, help="Kategori × tier başına rozet sayısı")
+    parser.add_argument("--id-width", type=int, help="badge-NNN id genişliği (varsayılan: set'siz 3, set'li en az 5)")
+    parser.add_argument("--output", default="public/data/badges.json")
+    parser.add_argument("--ndjson", help="Ayrıca satır başına bir rozet içeren NDJSON dosyası yaz")
+    parser.add_argument("--index", default="public/data/badges-index.json", help="Değerlendirme index'i ('' ile kapatılır)")
+    parser.add_argument("--verify", action="store_true", help="Index'i tam taramayla doğrula (yavaş; badge-index.py verify ile aynı)")
+    parser.add_argument("--export", action="store_true", help="Çıktının .min.json/.ndjson/.gz/.br kopyalarını da yaz")
+    parser.add_argument("--force", action="store_true", help="Cache'i yok say")
+    args = parser.parse_args(argv)
+
+    sets = load_sets(args.sets, args.sets_file)
+
+    cache = BuildCache("generate-200-badges", force=args.force or None)
+    cache.add_source(__file__, badge_catalog.__file__, badge_index.__file__, content_export.__file__)
+    if args.sets_file:
+        cache.add_source(args.sets_file)
+    cache.add_data(args.sets, args.per_tier, args.id_width, args.output, args.ndjson, args.index, args.export)
+    if cache.is_fresh() and not args.verify:
+        cache.skip_message()
+        return
+
+    catalog = build_catalog(sets, args.per_tier, args.id_width)
+
+    # Değerlendirme index'i katalog sütunlarından kurulur. Tam tarama rozet
+    # dict'lerini gerektirir ve yavaştır; yalnızca --verify ile çalışır,
+    # uyuşmazsa hiçbir şey yazılmaz.
+    index = None
+    if args.index:
+        index = index_from_classified(catalog.iter_classified(), len(catalog))
+        if args.verify:
+            problems = verify_index(index, list(catalog.iter_badges()))
+            if problems:
+                for problem in problems[:20]:
+                    print(f"Index hatası: {problem}", file=sys.stderr)
+                sys.exit(1)
+
+    # Dosyaya yaz (içerik aynıysa dosyaya dokunulmaz)
+    cache.write_chunks(args.output, catalog.iter_json())
+    if args.ndjson:
+        cache.write_chunks(args.ndjson, catalog.iter_ndjson())
+    if index is not None:
+        cache.write_text(args.index, dumps_index(index))
+    if args.export:
+        export_stage([args.output], cache)
+    cache.commit()
+    cache.report()
 
-# Dosyaya yaz
-with open("public/data/badges.json", "w", encoding="utf-8") as f:
-    json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"Success: {len(catalog)} badges created!")
+    if index is not None:
+        print(f"Index: {len(index['metrics'])} metrics, {len(index['events'])} events, {len(index['unindexed'])} unindexed")
+    print(f"Category distribution:")
+    per_category = len(catalog) // len(categories)
+    for category in categories:
+        print(f"   - {category['id']}: {per_category} badges")
 
-print(f"Success: {len(badges)} badges created!")
-print(f"Category distribution:")
-for category in ["daily_activities", "score", "social_interaction", "streak", "special"]:
-    count = len([b for b in badges if b["category"] == category])
-    print(f"   - {category}: {count} badges")
 
+if __name__ == "__main__":
+    main()
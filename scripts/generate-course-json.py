@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Syllabus tanımından kurs JSON dosyası oluşturucu.
+
+Kullanım:
+    python scripts/generate-course-json.py --stacks all              # data/test-modules/* -> *-course.json
+    python scripts/generate-course-json.py --stacks go,python --compact
+    python scripts/generate-course-json.py --syllabus syllabus.json -o data/lesson-contents/x-course.json
+
+--stacks ile her kursun syllabus'u test modüllerindeki modül başlıkları
+ve relatedTests listesinden türetilip
+data/lesson-contents/<kurs>-course.json dosyasına yazılır. Ders gövdeleri
+üretildikçe dosyaya akıtılır (bkz. pipeline/course_json.py); --compact
+girintisiz, yaklaşık üçte bir daha küçük çıktı verir.
+"""
+
+import argparse
+import json
+import sys
+
+from pipeline import content_export, course_json, json_stream, stacks, topic_render
+from pipeline.build_cache import BuildCache
+from pipeline.content_export import export_stage
+from pipeline.course_json import iter_course_json, total_lessons
+from pipeline.stacks import (
+    STACK_COURSES,
+    STACK_LANGUAGES,
+    lesson_title,
+    load_test_modules,
+    module_title,
+    select_stacks,
+    stack_name,
+)
+
+STACK_COURSE_PATH = "data/lesson-contents/{stack}-course.json"
+
+# Kurs JSON'u başka yoldan gelen kurslar: mssql kendi syllabus'uyla
+# generate-mssql-course-json.py'den, ai-for-developers elle yazılmış
+CURATED_COURSES = {"mssql", "ai-for-developers"}
+
+
+def stack_syllabus(path):
+    """Test modülü dosyasından syllabus; ders href/açıklamaları testlerden alınır."""
+    stack = stack_name(path)
+    data = load_test_modules(path)
+    course_id, course_title = STACK_COURSES.get(stack, (f"course-{stack}-roadmap", f"{stack} Kursu"))
+    return {
+        "courseId": course_id,
+        "courseTitle": course_title,
+        "description": data["overview"]["description"],
+        "hrefBase": f"/education/lessons/{stack}",
+        "subject": course_title[:-len(" Kursu")] if course_title.endswith(" Kursu") else course_title,
+        "language": STACK_LANGUAGES.get(stack, "text"),
+        "modules": [
+            {
+                "id": module["id"],
+                "title": module_title(module["title"]),
+                "lessons": [
+                    {
+                        "title": lesson_title(test["title"]),
+                        "href": test.get("href"),
+                        "description": test.get("description"),
+                    }
+                    for test in module.get("relatedTests") or []
+                ],
+            }
+            for module in data["modules"]
+        ],
+    }
+
+
+def load_syllabus(path):
+    with open(path, "r", encoding="utf-8") as f:
+        syllabus = json.load(f)
+    missing = [key for key in ("courseId", "courseTitle", "description", "hrefBase", "subject", "modules")
+               if key not in syllabus]
+    if missing:
+        raise ValueError(f"{path}: syllabus alanları eksik: {', '.join(missing)}")
+    return syllabus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Syllabus'tan kurs JSON dosyaları üretir.")
+    parser.add_argument("--stacks", help='Test modüllerinden kurs üretilecek kurslar: "all" veya go,python,...')
+    parser.add_argument("--syllabus", help="Syllabus JSON dosyası (--output ile)")
+    parser.add_argument("-o", "--output", help="--syllabus için çıktı dosyası")
+    parser.add_argument("--compact", action="store_true", help="Girintisiz JSON yaz")
+    parser.add_argument("--export", action="store_true", help="Çıktının .min.json/.ndjson/.gz/.br kopyalarını da yaz")
+    parser.add_argument("--force", action="store_true", help="Cache'i yok say")
+    args = parser.parse_args(argv)
+
+    if bool(args.syllabus) != bool(args.output):
+        print("Hata: --syllabus ve --output birlikte verilmeli", file=sys.stderr)
+        return 1
+    try:
+        stack_paths = select_stacks(args.stacks, exclude=CURATED_COURSES)
+        # (çıktı, syllabus yükleyici, kaynak dosya)
+        targets = [(STACK_COURSE_PATH.format(stack=stack_name(p)), stack_syllabus, p) for p in stack_paths]
+        if args.syllabus:
+            targets.append((args.output, load_syllabus, args.syllabus))
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    if not targets:
+        print("Hata: --stacks veya --syllabus gerekli", file=sys.stderr)
+        return 1
+
+    cache = BuildCache("generate-course-json", force=args.force or None)
+    cache.add_source(__file__, content_export.__file__, course_json.__file__, json_stream.__file__, stacks.__file__, topic_render.__file__)
+    cache.add_source(*(source for _, _, source in targets))
+    cache.add_data([output for output, _, _ in targets], args.compact, args.export)
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
+
+    for output, loader, source in targets:
+        try:
+            syllabus = loader(source)
+        except (OSError, ValueError) as e:
+            print(f"Hata: {e}", file=sys.stderr)
+            return 1
+        cache.write_chunks(output, iter_course_json(syllabus, compact=args.compact))
+        print(f"✅ {output}: {len(syllabus['modules'])} modül, {total_lessons(syllabus)} ders")
+
+    if args.export:
+        export_stage([output for output, _, _ in targets], cache)
+    cache.commit()
+    cache.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,23 @@
-import json
-import os
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MSSQL kursu JSON dosyası oluşturucu (data/lesson-contents/mssql-course.json)
+
+Kullanım:
+    python scripts/generate-mssql-course-json.py
+    python scripts/generate-mssql-course-json.py --compact   # girintisiz, daha küçük çıktı
+
+Ders gövdeleri pipeline/course_json.py motoru tarafından aşağıdaki
+syllabus'tan üretilir; diğer kurslar için bkz. generate-course-json.py.
+"""
+
+import argparse
+import sys
+
+from pipeline import content_export, course_json, json_stream, topic_render
+from pipeline.build_cache import BuildCache
+from pipeline.content_export import export_stage
+from pipeline.course_json import iter_course_json, total_lessons
 
 # Modül başlıkları
 modules = [
@@ -20,7 +38,7 @@ modules = [
     'Backup, Recovery ve Maintenance'
 ]
 
-# Her modül için ders başlıkları (her modülde 15 ders)
+# Her modül için ders başlıkları
 lesson_templates = {
     1: ['MSSQL Nedir?', 'MSSQL Kurulumu', 'SQL Server Management Studio (SSMS)', 'Veritabanı Oluşturma', 'SQL Sözdizimi Temelleri', 'Veritabanı Yapısını Anlama', 'T-SQL\'e Giriş', 'Veritabanı Dosya Yapısı', 'Sistem Veritabanları', 'Veritabanı Yedekleme Temelleri', 'Güvenlik Temelleri', 'Veritabanı Özellikleri', 'Sorgu Penceresi Kullanımı', 'Hata Ayıklama Temelleri', 'Modül Özeti ve Değerlendirme'],
     2: ['Veri Tipleri Nedir?', 'Sayısal Veri Tipleri', 'Karakter Veri Tipleri', 'Tarih ve Zaman Veri Tipleri', 'Binary ve Diğer Veri Tipleri', 'NULL Değerler', 'Tablo Oluşturma (CREATE TABLE)', 'Sütun Özellikleri', 'Primary Key Tanımlama', 'Foreign Key Tanımlama', 'CHECK Constraint', 'UNIQUE Constraint', 'DEFAULT Constraint', 'Tablo Değiştirme (ALTER TABLE)', 'Modül Özeti'],
@@ -39,81 +57,57 @@ lesson_templates = {
     15: ['Backup Türleri', 'Full Backup', 'Differential Backup', 'Transaction Log Backup', 'Backup Stratejileri', 'Restore İşlemleri', 'Point-in-Time Recovery', 'Database Maintenance Plans', 'Index Maintenance', 'Statistics Update', 'Database Consistency Check', 'Automated Maintenance', 'Monitoring ve Alerting', 'Disaster Recovery', 'Modül Özeti']
 }
 
-# JSON yapısını oluştur
-course_data = {
-    'version': '1.0',
-    'totalLessons': 225,
-    'courseId': 'course-mssql-roadmap',
-    'courseTitle': 'MSSQL Kursu',
-    'description': 'Microsoft SQL Server veritabanı yönetimi ve geliştirme konularında kapsamlı bir kurs. SQL temellerinden ileri seviye konulara kadar her şeyi öğreneceksiniz.',
-    'modules': []
-}
+OUTPUT_PATH = 'data/lesson-contents/mssql-course.json'
+
 
-for module_num in range(1, 16):
-    module_id = f'module-{module_num:02d}'
-    module_title = modules[module_num - 1]
-    lessons = []
-    
-    for lesson_num in range(1, 16):
-        lesson_label = f'Ders {lesson_num}: {lesson_templates[module_num][lesson_num - 1]}'
-        lesson_href = f'/education/lessons/mssql/{module_id}/lesson-{lesson_num:02d}'
-        lesson_title = lesson_templates[module_num][lesson_num - 1]
-        
-        # Seviye belirleme
-        if module_num <= 5:
-            level = 'Başlangıç'
-        elif module_num <= 10:
-            level = 'Orta'
-        else:
-            level = 'İleri'
-        
-        lesson = {
-            'label': lesson_label,
-            'href': lesson_href,
-            'description': f'{lesson_title} konusunda detaylı bilgi ve uygulamalar.',
-            'estimatedDurationMinutes': 30,
-            'level': level,
-            'keyTakeaways': [
-                f'{lesson_title} konusunu öğreneceksin',
-                'Pratik örnekler ile konuyu pekiştireceksin',
-                'Best practices ve yaygın hataları öğreneceksin'
-            ],
-            'sections': [
-                {
-                    'id': f'{module_id}-lesson-{lesson_num:02d}-intro',
-                    'title': 'Giriş',
-                    'summary': f'{lesson_title} konusuna giriş.',
-                    'content': [
-                        {
-                            'type': 'text',
-                            'body': f'{lesson_title} konusu MSSQL veritabanı yönetimi ve geliştirme için önemli bir konudur. Bu derste bu konuyu detaylı olarak öğreneceksin.'
-                        },
-                        {
-                            'type': 'code',
-                            'language': 'sql',
-                            'code': f'-- {lesson_title} örnek kodu\nSELECT * FROM INFORMATION_SCHEMA.TABLES;',
-                            'explanation': f'{lesson_title} için temel örnek kod.'
-                        }
-                    ]
-                }
-            ]
-        }
-        lessons.append(lesson)
-    
-    module = {
-        'moduleId': module_id,
-        'moduleTitle': module_title,
-        'lessons': lessons
+def build_syllabus():
+    """Modül ve ders başlıklarından kurs syllabus'u."""
+    return {
+        'courseId': 'course-mssql-roadmap',
+        'courseTitle': 'MSSQL Kursu',
+        'description': 'Microsoft SQL Server veritabanı yönetimi ve geliştirme konularında kapsamlı bir kurs. SQL temellerinden ileri seviye konulara kadar her şeyi öğreneceksiniz.',
+        'hrefBase': '/education/lessons/mssql',
+        'subject': 'MSSQL veritabanı yönetimi ve geliştirme',
+        'language': 'sql',
+        'codeSample': 'SELECT * FROM INFORMATION_SCHEMA.TABLES;',
+        'lessonMinutes': 30,
+        'modules': [
+            {'title': title, 'lessons': lesson_templates[number]}
+            for number, title in enumerate(modules, 1)
+        ]
     }
-    course_data['modules'].append(module)
 
-# JSON dosyasına yaz
-output_path = os.path.join('data', 'lesson-contents', 'mssql-course.json')
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(course_data, f, ensure_ascii=False, indent=2)
 
-print('MSSQL kursu JSON dosyası başarıyla oluşturuldu!')
-print(f'Toplam modül: {len(course_data["modules"])}')
-print(f'Toplam ders: {course_data["totalLessons"]}')
-print(f'Dosya yolu: {output_path}')
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='MSSQL kursu JSON dosyasını üretir.')
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    parser.add_argument('--compact', action='store_true', help='Girintisiz JSON yaz')
+    parser.add_argument('--export', action='store_true', help='Çıktının .min.json/.ndjson/.gz/.br kopyalarını da yaz')
+    parser.add_argument('--force', action='store_true', help="Cache'i yok say")
+    args = parser.parse_args(argv)
+
+    syllabus = build_syllabus()
+
+    cache = BuildCache('generate-mssql-course-json', force=args.force or None)
+    cache.add_source(__file__, content_export.__file__, course_json.__file__, json_stream.__file__, topic_render.__file__)
+    cache.add_data(args.output, args.compact, args.export)
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
+
+    # Dersler üretildikçe dosyaya akıtılır (içerik aynıysa dosyaya dokunulmaz)
+    cache.write_chunks(args.output, iter_course_json(syllabus, compact=args.compact))
+    if args.export:
+        export_stage([args.output], cache)
+    cache.commit()
+    cache.report()
+
+    print('MSSQL kursu JSON dosyası başarıyla oluşturuldu!')
+    print(f'Toplam modül: {len(syllabus["modules"])}')
+    print(f'Toplam ders: {total_lessons(syllabus)}')
+    print(f'Dosya yolu: {args.output}')
+    return 0
+
 
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yük testleri için sentetik profil seed verisi (kullanıcılar, rozetler,
+quiz denemeleri, bakiye ve streak'ler) üretir.
+
+Kullanım:
+    python scripts/generate-profile-seed.py --users 100000 -o /tmp/profile-seed.copy.sql
+    python scripts/generate-profile-seed.py --users 80 --format json -o /tmp/seed-data-for-profile.json
+    python scripts/generate-profile-seed.py --users 100000 --attempts 8-12 --seed 7 --now 2025-11-16 -o seed.sql
+
+--format copy (varsayılan) psql -f ile yüklenen COPY (FORMAT csv)
+blokları, --format json data/seed-data/seed-data-for-profile.json
+biçimini yazar (json-to-sql-seed.ts girdisi). Veriler NumPy ile sütun
+sütun üretilir ve dosyaya parça parça akıtılır (bkz.
+pipeline/population.py). Aynı --seed, --users ve --now ile çıktı aynıdır.
+"""
+
+import argparse
+import datetime
+import sys
+import time
+
+from pipeline.build_cache import write_chunks_if_changed
+from pipeline.content_export import export_stage
+from pipeline.population import (
+    DEFAULT_ATTEMPTS,
+    DEFAULT_CHUNK_ROWS,
+    Population,
+    load_badges,
+    load_profile_images,
+    load_quizzes,
+)
+
+
+def _attempt_range(text):
+    low, sep, high = text.partition("-")
+    try:
+        return int(low), int(high if sep else low)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz aralık: {text} (ör. 3-6)") from None
+
+
+def _now_ms(text):
+    if text:
+        try:
+            moment = datetime.datetime.fromisoformat(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"geçersiz tarih: {text}") from None
+    else:
+        moment = datetime.datetime.now(datetime.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik profil seed verisi üretir.")
+    parser.add_argument("--users", type=int, default=80, help="Kullanıcı sayısı")
+    parser.add_argument("--attempts", type=_attempt_range, default=DEFAULT_ATTEMPTS,
+                        help="Kullanıcı başına quiz denemesi aralığı (varsayılan: 3-6)")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgele sayı üreteci tohumu")
+    parser.add_argument("--now", help="Referans zaman (ISO 8601, UTC; varsayılan: bugün 00:00)")
+    parser.add_argument("--days", type=int, default=30, help="Kayıt tarihlerinin yayıldığı gün sayısı")
+    parser.add_argument("--format", choices=("copy", "json"), default="copy", help="Çıktı biçimi")
+    parser.add_argument("-o", "--output", required=True, help="Çıktı dosyası")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Parça başına satır")
+    parser.add_argument("--export", action="store_true", help="--format json çıktısının .min.json/.ndjson/.gz/.br kopyalarını da yaz")
+    args = parser.parse_args(argv)
+
+    # Quiz kataloğu okunurken bozuk seed dosyaları atlanır; yalnızca özetlenir
+    warnings = []
+
+    started = time.perf_counter()
+    try:
+        now_ms = _now_ms(args.now)
+        population = Population(
+            args.users,
+            load_quizzes(warn=warnings.append),
+            load_badges(),
+            seed=args.seed,
+            now_ms=now_ms,
+            attempts=args.attempts,
+            images=load_profile_images(),
+            days=args.days,
+        )
+    except (OSError, ValueError, RuntimeError, argparse.ArgumentTypeError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    generated = time.perf_counter()
+    if warnings:
+        print(f"Uyarı: quiz kataloğu okunurken {len(warnings)} sorun atlandı "
+              f"({len(population.quizzes)} quiz; ayrıntı: scripts/question-bank.py build)", file=sys.stderr)
+
+    counts = population.counts()
+    now_text = datetime.datetime.fromtimestamp(now_ms / 1000, datetime.timezone.utc).isoformat()
+    if args.format == "copy":
+        chunks = population.iter_copy_script(args.chunk_rows, header=(
+            "Sentetik profil seed verisi (scripts/generate-profile-seed.py)",
+            f"users={args.users} seed={args.seed} now={now_text}",
+            "psql -f ile çalıştırın",
+        ))
+    else:
+        meta = {
+            "generatedAt": now_text,
+            "users": args.users,
+            "seed": args.seed,
+            "notes": "Synthetic users generated column-wise; badges follow public/data/badges.json criteria.",
+        }
+        chunks = population.iter_seed_json(meta, args.chunk_rows)
+    write_chunks_if_changed(args.output, chunks, snapshot=False)
+    finished = time.perf_counter()
+
+    for table, rows in counts.items():
+        print(f"  {table:<14} {rows:>10} satır")
+    print(f"✅ {args.output}: üretim {generated - started:.2f} s, yazma {finished - generated:.2f} s "
+          f"({counts['quiz_attempts'] / max(finished - started, 1e-9):,.0f} deneme/s)")
+    if args.export and args.format == "json":
+        export_stage([args.output])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
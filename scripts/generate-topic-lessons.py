@@ -2,9 +2,64 @@
 # -*- coding: utf-8 -*-
 """
 .NET Core 90 konu anlatımı JSON dosyası oluşturucu
+
+Kullanım:
+    python scripts/generate-topic-lessons.py                  # yalnızca .NET Core
+    python scripts/generate-topic-lessons.py --stacks all     # + data/test-modules/*.json
+    python scripts/generate-topic-lessons.py --stacks go,python --workers 4
+
+.NET Core modülleri dotnet-core-topics.json'a moduleId ile eklenir; dosyada
+zaten olan (elle zenginleştirilmiş) modüllere --replace verilmedikçe
+dokunulmaz. Diğer kurslar için konu ağaçları test modüllerindeki
+relatedTests listesinden türetilip data/topic-lessons/<kurs>-topics.json
+dosyalarına yazılır.
 """
 
-import json
+import argparse
+import sys
+
+from pipeline import content_export, stacks, topic_render
+from pipeline.build_cache import BuildCache
+from pipeline.content_export import export_stage
+from pipeline.json_index import JsonPathError, LazyJson
+from pipeline.json_splice import SpliceError, upsert_module
+from pipeline.stacks import (
+    STACK_LANGUAGES,
+    lesson_title,
+    load_test_modules,
+    module_title,
+    select_stacks,
+    stack_name,
+)
+from pipeline.topic_render import ModuleTemplate, level_for_position, module_prefix, render_modules
+
+DOTNET_TOPICS_PATH = "data/topic-lessons/dotnet-core-topics.json"
+STACK_TOPICS_PATH = "data/topic-lessons/{stack}-topics.json"
+
+# Konu ağacı modules_data'dan üretilen (test modüllerinden türetilmeyen) kurslar
+CURATED_STACKS = {"dotnet-core"}
+
+# .NET Core modül seviyeleri
+level_map = {
+    "module-01": "Başlangıç",
+    "module-02": "Orta",
+    "module-03": "Orta",
+    "module-04": "Orta",
+    "module-05": "Orta",
+    "module-06": "Orta",
+    "module-07": "Orta",
+    "module-08": "Orta",
+    "module-09": "Orta",
+    "module-10": "Orta",
+    "module-11": "İleri",
+    "module-12": "Orta",
+    "module-13": "Orta",
+    "module-14": "İleri",
+    "module-15": "İleri",
+    "module-16": "Orta",
+    "module-17": "İleri",
+    "module-18": "İleri"
+}
 
 # Modül listesi ve konuları
 modules_data = [
@@ -186,122 +241,126 @@ modules_data = [
     }
 ]
 
-def create_topic_structure(module_id, topic_title, topic_slug, description, module_title):
-    """Bir konu için temel yapı oluştur"""
-    level_map = {
-        "module-01": "Başlangıç",
-        "module-02": "Orta",
-        "module-03": "Orta",
-        "module-04": "Orta",
-        "module-05": "Orta",
-        "module-06": "Orta",
-        "module-07": "Orta",
-        "module-08": "Orta",
-        "module-09": "Orta",
-        "module-10": "Orta",
-        "module-11": "İleri",
-        "module-12": "Orta",
-        "module-13": "Orta",
-        "module-14": "İleri",
-        "module-15": "İleri",
-        "module-16": "Orta",
-        "module-17": "İleri",
-        "module-18": "İleri"
-    }
-    
-    module_prefix = module_id.split("-")[0] + "-" + module_id.split("-")[1]
-    level = level_map.get(module_prefix, "Orta")
-    
-    # Slug oluştur
-    if "dotnet-core" in topic_slug or "architecture" in topic_slug:
-        href = f"/education/lessons/{topic_slug}"
-    else:
-        # Modül slug'ından path oluştur
-        module_slug = module_id.replace("module-", "").replace("-", "/")
-        href = f"/education/lessons/{module_slug}/{topic_slug}"
-    
+def _dotnet_template_args(module_id, module_title):
     return {
-        "label": f"{topic_title} Nedir?" if "Nedir" not in topic_title else topic_title,
-        "href": href,
-        "description": description,
-        "estimatedDurationMinutes": 35,
-        "level": level,
-        "keyTakeaways": [
-            f"{topic_title} kavramını ve temel kullanımını öğreneceksin.",
-            f"{module_title} modülünde {topic_title} önemli bir rol oynar.",
-            "Pratik örneklerle konuyu pekiştireceksin."
-        ],
-        "sections": [
-            {
-                "id": f"{topic_slug}-overview",
-                "title": f"{topic_title} Temelleri",
-                "summary": f"{topic_title} kavramını ve temel kullanımını öğren.",
-                "content": [
-                    {
-                        "type": "text",
-                        "body": f"{description} Bu konu, {module_title} modülünün önemli bir parçasıdır ve gerçek dünya uygulamalarında sıklıkla kullanılır."
-                    },
-                    {
-                        "type": "code",
-                        "language": "csharp",
-                        "code": f"// {topic_title} örnek kullanımı\npublic class Example\n{{\n    // Örnek kod buraya gelecek\n}}",
-                        "explanation": f"{topic_title} kullanımına dair temel örnek."
-                    },
-                    {
-                        "type": "callout",
-                        "variant": "tip",
-                        "title": "İpucu",
-                        "body": f"{topic_title} konusunda dikkat edilmesi gereken önemli noktalar."
-                    }
-                ]
-            }
-        ],
-        "checkpoints": [
-            {
-                "id": f"checkpoint-{topic_slug}",
-                "question": f"{topic_title} ile ilgili temel soru?",
-                "options": ["Seçenek 1", "Seçenek 2", "Seçenek 3", "Seçenek 4"],
-                "answer": "Seçenek 1",
-                "rationale": "Açıklama buraya gelecek."
-            }
-        ],
-        "resources": [],
-        "practice": []
+        "module_id": module_id,
+        "module_title": module_title,
+        "level": level_map.get(module_prefix(module_id), "Orta"),
     }
 
-# Mevcut JSON'u oku
-with open('data/topic-lessons/dotnet-core-topics.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
 
-# Yeni modülleri ekle
-for module_data in modules_data:
-    topics = []
-    for topic_data in module_data["topics"]:
-        topic = create_topic_structure(
-            module_data["moduleId"],
-            topic_data["title"],
-            topic_data["slug"],
-            topic_data["desc"],
-            module_data["moduleTitle"]
+def create_topic_structure(module_id, topic_title, topic_slug, description, module_title):
+    """Bir konu için temel yapı oluştur"""
+    template = ModuleTemplate(**_dotnet_template_args(module_id, module_title))
+    return template.render_topic(topic_title, topic_slug, description)
+
+
+def dotnet_jobs():
+    """modules_data -> render_modules() işleri"""
+    return [
+        (
+            _dotnet_template_args(module_data["moduleId"], module_data["moduleTitle"]),
+            [(t["title"], t["slug"], t["desc"], None) for t in module_data["topics"]],
         )
-        topics.append(topic)
-    
-    new_module = {
-        "moduleId": module_data["moduleId"],
-        "moduleTitle": module_data["moduleTitle"],
-        "topics": topics
-    }
-    
-    data["modules"].append(new_module)
+        for module_data in modules_data
+    ]
+
+
+def stack_jobs(path):
+    """Bir test modülü dosyasındaki her modül için render_modules() işi."""
+    stack = stack_name(path)
+    modules = load_test_modules(path)["modules"]
+    jobs = []
+    for index, module in enumerate(modules):
+        topics = []
+        for test in module.get("relatedTests") or []:
+            href = test.get("href")
+            slug = href.rstrip("/").rsplit("/", 1)[-1] if href else test["id"]
+            topics.append((lesson_title(test["title"]), slug, test.get("description", ""), href))
+        jobs.append((
+            {
+                "module_id": module["id"],
+                "module_title": module_title(module["title"]),
+                "level": level_for_position(index, len(modules)),
+                "language": STACK_LANGUAGES.get(stack, "text"),
+            },
+            topics,
+        ))
+    return jobs
+
+
+def merge_dotnet_modules(modules, replace=False):
+    """
+    Modülleri dotnet-core-topics.json'a moduleId ile ekler. replace=False
+    ise dosyada zaten olan modüller (elle düzenlenmiş olabilir) atlanır.
+    Eklenen/güncellenen modül sayısını döner.
+    """
+    # moduleId'ler bayt aralığı indeksinden okunur; modüller çözülmez
+    with LazyJson(DOTNET_TOPICS_PATH) as doc:
+        existing = set(doc.field_values("modules", "moduleId"))
+    changed = 0
+    for module in modules:
+        if module["moduleId"] in existing and not replace:
+            continue
+        written, _ = upsert_module(DOTNET_TOPICS_PATH, module, items_key="topics", total_key="totalTopics")
+        changed += written
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konu anlatımı JSON dosyalarını üretir.")
+    parser.add_argument("--stacks", help='Test modüllerinden konu ağacı üretilecek kurslar: "all" veya go,python,...')
+    parser.add_argument("--workers", type=int, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--replace", action="store_true", help="dotnet-core-topics.json'daki mevcut modülleri de yeniden yaz")
+    parser.add_argument("--export", action="store_true", help="Çıktının .min.json/.ndjson/.gz/.br kopyalarını da yaz")
+    parser.add_argument("--force", action="store_true", help="Cache'i yok say")
+    args = parser.parse_args(argv)
+
+    try:
+        stack_paths = select_stacks(args.stacks, exclude=CURATED_STACKS)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    # Script, motor ve girdiler değişmediyse ve çıktılar son çalıştırmadaki halindeyse iş yok
+    cache = BuildCache("generate-topic-lessons", force=args.force or None)
+    cache.add_source(__file__, content_export.__file__, topic_render.__file__, stacks.__file__, *stack_paths)
+    cache.add_data(args.stacks, args.replace, args.export)
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
+
+    jobs = dotnet_jobs()
+    spans = [(None, 0, len(jobs))]
+    for path in stack_paths:
+        stack_job_list = stack_jobs(path)
+        spans.append((stack_name(path), len(jobs), len(jobs) + len(stack_job_list)))
+        jobs.extend(stack_job_list)
+
+    # Tüm modüller tek havuzda; sonuçlar jobs sırasında döner
+    rendered = render_modules(jobs, workers=args.workers)
+
+    try:
+        merged = merge_dotnet_modules(rendered[:spans[0][2]], replace=args.replace)
+    except (JsonPathError, SpliceError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    cache.track_output(DOTNET_TOPICS_PATH)
+    print(f"✅ .NET Core: {len(modules_data)} modülden {merged} tanesi eklendi/güncellendi")
 
-# Toplam konu sayısını güncelle
-total_topics = sum(len(m["topics"]) for m in data["modules"])
-data["totalTopics"] = total_topics
+    for stack, start, end in spans[1:]:
+        modules = rendered[start:end]
+        total_topics = sum(len(m["topics"]) for m in modules)
+        data = {"version": "1.0", "totalTopics": total_topics, "modules": modules}
+        cache.write_json(STACK_TOPICS_PATH.format(stack=stack), data, indent=2)
+        print(f"✅ {stack}: {len(modules)} modül, {total_topics} konu")
 
-# JSON'u yaz
-with open('data/topic-lessons/dotnet-core-topics.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+    if args.export:
+        export_stage([DOTNET_TOPICS_PATH] + [STACK_TOPICS_PATH.format(stack=stack) for stack, _, _ in spans[1:]], cache)
+    cache.commit()
+    cache.report()
+    return 0
 
-print(f"✅ {len(modules_data)} modül eklendi!")
-print(f"✅ Toplam {total_topics} konu oluşturuldu!")
 
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Büyük JSON dosyasından tek bir alt ağacı tüm dosyayı ayrıştırmadan okur.
+
+Kullanım:
+    python scripts/json-path.py data/topic-lessons/dotnet-core-topics.json 'modules[moduleId == "module-08-logging"]'
+    python scripts/json-path.py data/lesson-contents/mssql-course.json "modules[3].lessons[0].label"
+    python scripts/json-path.py data/lesson-contents/mssql-course.json modules --field moduleId
+
+İlk erişimde dosyanın bayt aralığı indeksi .content-cache/json-index/
+altına yazılır; dosya değişmedikçe sonraki erişimler yalnızca istenen
+aralığı okur (bkz. pipeline/json_index.py).
+"""
+
+import argparse
+import json
+import sys
+
+from pipeline.json_index import JsonPathError, LazyJson
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON dosyasından yol ile değer okur.")
+    parser.add_argument("file", help="JSON dosyası")
+    parser.add_argument("path", nargs="?", default="", help='Yol, ör. modules[moduleId == "module-08-logging"].topics[0]')
+    parser.add_argument("--field", help="path bir kök dizisiyse her elemanın bu alanını listele (eleman çözülmez)")
+    parser.add_argument("--compact", action="store_true", help="Girintisiz JSON yaz")
+    args = parser.parse_args(argv)
+
+    try:
+        with LazyJson(args.file) as doc:
+            if args.field:
+                for value in doc.field_values(args.path, args.field):
+                    print(value if value is not None else "")
+                return 0
+            value = doc.get(args.path)
+    except (OSError, JsonPathError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    if args.compact:
+        print(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+    else:
+        print(json.dumps(value, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
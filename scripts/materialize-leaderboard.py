@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Günlük/haftalık/aylık liderlik tablosunu deneme verilerinden önceden
+hesaplayıp leaderboard_entries için COPY betiği yazar.
+
+Kullanım:
+    python scripts/materialize-leaderboard.py -o /tmp/leaderboard.copy.sql
+    python scripts/materialize-leaderboard.py /tmp/profile-seed.copy.sql -o /tmp/leaderboard.copy.sql
+    python scripts/materialize-leaderboard.py yeni-gun.json -o /tmp/delta.copy.sql   # artımlı
+    python scripts/materialize-leaderboard.py --rebuild -o /tmp/leaderboard.copy.sql
+
+Girdi seed-data-for-profile.json biçiminde JSON ya da COPY betiğidir
+(varsayılan: data/seed-data/seed-data-for-profile.json). Kısmi toplamlar
+.content-cache/leaderboard/state.npz'de tutulur; sonraki çalıştırmalar
+yalnızca yeni denemeleri ekler ve betik yalnızca değişen dönemlerin
+satırlarını silip yeniden yükler (bkz. pipeline/leaderboard.py).
+Puanlar user_earned_points akışından, yoksa rozetlerin badges.json
+puanlarından hesaplanır.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from pipeline.build_cache import write_chunks_if_changed
+from pipeline.leaderboard import (
+    DEFAULT_TOP, STATE_PATH, Rollup, bucket_label, iter_copy_script, load_catalog, read_streams,
+)
+from pipeline.pg_copy import DEFAULT_BATCH_SIZE
+from pipeline.population import PROFILE_SEED_PATH, load_badges
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="leaderboard_entries satırlarını toplu hesaplar.")
+    parser.add_argument("inputs", nargs="*", help="Seed JSON veya COPY betikleri (varsayılan: profil seed'i)")
+    parser.add_argument("-o", "--output", required=True, help="COPY betiği")
+    parser.add_argument("--state", default=STATE_PATH, help="Kısmi toplamların durum dosyası")
+    parser.add_argument("--rebuild", action="store_true", help="Durumu yok say, baştan hesapla")
+    parser.add_argument("--all", action="store_true", help="Yalnızca değişen değil tüm dönemleri yaz")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Dönem başına satır (0: hepsi)")
+    parser.add_argument("--total-courses", type=int, help="topicCompletion paydası (varsayılan: seed'deki kurslar)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="COPY bloğu başına satır")
+    args = parser.parse_args(argv)
+
+    inputs = args.inputs or [PROFILE_SEED_PATH]
+    warnings = []
+    try:
+        started = time.perf_counter()
+        rollup = Rollup() if args.rebuild or not os.path.exists(args.state) else Rollup.load(args.state)
+        streams = read_streams(inputs)
+        quiz_courses, total_courses = load_catalog(warn=warnings.append)
+        badge_points = {b["id"]: b.get("points") or 0 for b in load_badges()}
+        touched, added = rollup.fold(streams, quiz_courses, badge_points)
+        buckets = rollup.buckets() if args.all else touched
+        total_courses = args.total_courses or total_courses
+        rows = list(rollup.iter_entries(buckets, total_courses, args.top))
+        header = (
+            f"leaderboard_entries: {len(rows)} satır, {len(buckets)} dönem "
+            f"(materialize-leaderboard.py; updatedAt = {rollup.as_of()})",
+        )
+        write_chunks_if_changed(args.output, iter_copy_script(rows, buckets, args.batch_size, header),
+                                snapshot=False)
+        rollup.save(args.state)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - started
+    if warnings:
+        print(f"Uyarı: kurs kataloğu okunurken {len(warnings)} sorun atlandı "
+              f"(ayrıntı: scripts/question-bank.py build)", file=sys.stderr)
+    print("Eklenen satırlar: " + ", ".join(f"{k} {v}" for k, v in added.items()))
+    for bucket in buckets[:10].tolist():
+        print("  {} {}".format(*bucket_label(bucket)))
+    if len(buckets) > 10:
+        print(f"  ... {len(buckets) - 10} dönem daha")
+    print(f"✅ {len(rows)} satır, {len(buckets)} dönem ({total_courses} kurs) -> {args.output} ({elapsed:.2f} sn)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
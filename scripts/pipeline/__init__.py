@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+İçerik üretim scriptleri (generate_tests.py, scripts/generate-*.py vb.)
+için ortak yardımcılar.
+
+Scriptler depo kök dizininden çalıştırılır; dosya yolları köke göredir.
+"""
+
+import os
+
+# Depo kök dizini (scripts/pipeline/ -> kök)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
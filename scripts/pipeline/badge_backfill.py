@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""
+badges.json kriterlerinin tüm kullanıcılar üzerinde toplu değerlendirilmesi
+(rozet backfill).
+
+badge-service.ts rozetleri kullanıcı başına, bir deneme ya da istek
+geldiğinde verir; generate-200-badges.py ile yeni bir set eklendiğinde
+zaten hak eden kullanıcılar bir sonraki kontrole kadar rozeti alamaz. Bu
+motor kullanıcı metriklerini sütun dizilerine yükler ve her rozetin
+kriterini tüm kullanıcılar için tek bir maske olarak hesaplar:
+
+    UserMetrics   kullanıcı başına quiz sayısı/toplam/en yüksek/ortalama,
+                  tam puan sayısı, en hızlı süre, ders/live coding sayıları,
+                  streak'ler, sosyal sayılar ve günlük etkinlik tepe değerleri
+    backfill()    badge_index metrikleri üzerinden eşik başına value >= eşik,
+                  special olaylar için maske; kazanılmışlar çıkarılır
+
+Değerler checkAllUserBadges ile aynı kaynaklardan gelir (ör. test_count,
+quiz_count ve bugfix_count quiz denemelerini sayar; streak rozetleri
+currentStreak'e bakar; sosyal türler post/beğeni/yorum/story/arkadaşlık
+sayılarının route'taki toplamlarıdır). Günlük etkinlik rozetlerinde
+"bugün" yerine kullanıcının en yoğun günü kullanılır: rozet deneme
+anında kontrol edildiği için o gün kazanılmış olmalıydı.
+
+Değerlendirilemeyen kriterler (topic_complete, set'li kataloglar,
+tanınmayan special türleri) atlanır ve unsupported listesinde döner.
+
+Girdi profil seed JSON'u (seed-data-for-profile.json), COPY betikleri
+(generate-profile-seed --format copy) ya da INSERT'li seed SQL'leri
+olabilir; mevcut user_badges satırları da girdiden okunur.
+
+NumPy isteğe bağlıdır; yalnızca bu motor için gerekir.
+"""
+
+import json
+
+from .badge_index import build_index
+from .leaderboard import parse_ms, safe_number
+from .pg_copy import copy_statement, iter_batches, iter_copy_rows
+from .sql_rows import SqlParseError, read_rows
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DAY_MS = 86_400_000
+
+# Tablo: (profil seed JSON anahtarı, okunan sütunlar)
+TABLES = {
+    "app_users": ("users", ("id",)),
+    "quiz_attempts": ("quizAttempts", ("userId", "score", "duration", "completedAt")),
+    "live_coding_attempts": ("liveCodingAttempts", ("userId", "completedAt")),
+    "lesson_completions": ("lessonCompletions", ("userId", "lessonSlug", "completedAt")),
+    "user_streaks": ("userStreaks", ("userId", "currentStreak", "longestStreak", "totalDaysActive")),
+    "user_badges": ("userBadges", ("userId", "badgeId")),
+    "posts": ("posts", ("userId",)),
+    "post_likes": ("postLikes", ("userId",)),
+    "post_comments": ("postComments", ("userId",)),
+    "chat_messages": ("chatMessages", ("userId",)),
+    "stories": ("stories", ("userId",)),
+    "friendships": ("friendships", ("requesterId", "addresseeId", "status")),
+}
+
+USER_BADGE_COLUMNS = ("id", "userId", "badgeId", "earnedAt", "isDisplayed", "featuredOrder")
+EARNED_POINT_COLUMNS = ("id", "userId", "points", "source", "sourceId", "earnedAt")
+
+# social_interaction.interaction_type -> toplanan sayılar (badge-service.ts)
+SOCIAL_SUMS = {
+    "post": ("posts",),
+    "beğeni": ("likes",),
+    "yorum": ("comments",),
+    "mesaj": ("messages",),
+    "story": ("stories",),
+    "arkadaş": ("friends",),
+    "takipçi": ("friends",),
+    "paylaşım": ("posts", "likes", "comments"),
+    "etkileşim": ("posts", "likes", "comments"),
+    "topluluk": ("posts", "likes", "comments", "stories"),
+    "sosyal_etkileşim": ("posts", "likes", "comments", "stories", "friends"),
+    "sosyal": ("posts", "likes", "comments", "stories", "friends"),
+}
+
+# daily_activity.activity_type -> aynı günde sayılan akışlar
+DAILY_SOURCES = {
+    "test": ("quiz",),
+    "quiz": ("quiz",),
+    "canlı kod": ("liveCoding",),
+    "canlı kodlama": ("liveCoding",),
+    "ders": ("lesson",),
+    "eğitim faaliyeti": ("quiz", "lesson", "liveCoding"),
+}
+
+_MAX_SCORE_TYPES = frozenset(["tek test", "efsanevi", "yüksek", "başarılı", "harika"])
+_AVERAGE_SCORE_TYPES = frozenset(["ortalama", "tutarlı"])
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("rozet backfill motoru için NumPy gerekli: pip install numpy")
+
+
+def read_tables(paths, warn=None):
+    """
+    Girdilerden {tablo: [satır sözlüğü]}. .json profil seed biçimidir;
+    diğer dosyalarda önce COPY blokları, yoksa INSERT'ler okunur.
+    """
+    tables = {name: [] for name in TABLES}
+    by_key = {key: name for name, (key, _) in TABLES.items()}
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+            for key, name in by_key.items():
+                tables[name].extend(doc.get(key) or [])
+            continue
+        found = False
+        for table, row in iter_copy_rows(path, TABLES, {name: columns for name, (_, columns) in TABLES.items()}):
+            tables[table].append(row)
+            found = True
+        if found:
+            continue
+
+        def on_error(error, path=path):
+            if warn:
+                warn(f"{path}: {error}")
+
+        try:
+            for table, row in read_rows(path, tables=list(TABLES), on_error=on_error):
+                tables[table].append(row)
+        except SqlParseError as e:
+            on_error(e)
+    return tables
+
+
+def numbers(values, missing=0):
+    """safeNumber dizisi; None -> missing. Metinler (COPY) NumPy'de toplu çevrilir."""
+    values = [missing if v is None else v for v in values]
+    try:
+        return np.array(values, np.float64)
+    except (TypeError, ValueError):
+        return np.array([safe_number(v) for v in values], np.float64)
+
+
+class UserMetrics:
+    """Kullanıcı başına metrik dizileri; users[i] i. kullanıcının id'si."""
+
+    def __init__(self, tables):
+        require_numpy()
+        self.users, self._index = [], {}
+        for row in tables.get("app_users") or []:
+            self._user(row.get("id"))
+
+        quiz = tables.get("quiz_attempts") or []
+        q_user = self._users(quiz)
+        score = numbers([r.get("score") for r in quiz])
+        duration = numbers([r.get("duration") for r in quiz], missing=np.inf)
+        live = tables.get("live_coding_attempts") or []
+        live_user = self._users(live)
+        lessons = tables.get("lesson_completions") or []
+        lesson_user = self._users(lessons)
+        posts, likes, comments, messages, stories = (
+            self._users(tables.get(t) or [])
+            for t in ("posts", "post_likes", "post_comments", "chat_messages", "stories")
+        )
+        accepted = [r for r in tables.get("friendships") or [] if r.get("status") == "accepted"]
+        friends = np.concatenate([
+            self._users(accepted, "requesterId"), self._users(accepted, "addresseeId"),
+        ])
+        streaks = tables.get("user_streaks") or []
+        streak_user = self._users(streaks)
+
+        n = self.size = len(self.users)
+        self.quiz_count = np.bincount(q_user, minlength=n)
+        self.total_score = np.bincount(q_user, weights=score, minlength=n)
+        self.average_score = np.divide(self.total_score, self.quiz_count,
+                                       out=np.zeros(n), where=self.quiz_count > 0)
+        self.max_score = np.zeros(n)
+        np.maximum.at(self.max_score, q_user, score)
+        self.perfect_count = np.bincount(q_user, weights=score == 100, minlength=n).astype(np.int64)
+        self.fastest = np.full(n, np.inf)
+        np.minimum.at(self.fastest, q_user, duration)
+        self.live_count = np.bincount(live_user, minlength=n)
+        self.lesson_count = np.bincount(lesson_user, minlength=n)
+        # "ilk ders": lessonSlug'a göre tekil tamamlama sayısı
+        slugs = self._codes(lessons, "lessonSlug")
+        pairs = np.unique(lesson_user * (int(slugs.max(initial=0)) + 1) + slugs)
+        self.lesson_distinct = np.bincount(pairs // (int(slugs.max(initial=0)) + 1), minlength=n)
+
+        self.social = {
+            name: np.bincount(users, minlength=n)
+            for name, users in (("posts", posts), ("likes", likes), ("comments", comments),
+                                ("messages", messages), ("stories", stories), ("friends", friends))
+        }
+        self.streak = {}
+        for field in ("currentStreak", "longestStreak", "totalDaysActive"):
+            values = np.zeros(n)
+            # Kullanıcı başına tek satır; tekrar varsa en büyüğü
+            np.maximum.at(values, streak_user, numbers([r.get(field) for r in streaks]))
+            self.streak[field] = values
+
+        self.daily = {}
+        events = {"quiz": (quiz, q_user), "liveCoding": (live, live_user), "lesson": (lessons, lesson_user)}
+        for sources in DAILY_SOURCES.values():
+            if sources not in self.daily:
+                self.daily[sources] = self._busiest_day(events[s] for s in sources)
+
+    def _user(self, user_id):
+        i = self._index.get(user_id)
+        if i is None:
+            i = self._index[user_id] = len(self.users)
+            self.users.append(user_id)
+        return i
+
+    def _users(self, rows, field="userId"):
+        return np.fromiter((self._user(r.get(field)) for r in rows), np.int64, len(rows))
+
+    def user_indices(self, ids):
+        """Kimliklerin kullanıcı indeksleri (bilinmeyenler -1)."""
+        return np.fromiter((self._index.get(u, -1) for u in ids), np.int64)
+
+    def _codes(self, rows, field):
+        codes = {}
+        return np.fromiter((codes.setdefault(r.get(field), len(codes)) for r in rows), np.int64, len(rows))
+
+    def _busiest_day(self, streams):
+        """Kullanıcı başına, akışların toplam olay sayısının en yüksek olduğu gün."""
+        users, days = [np.zeros(0, np.int64)], [np.zeros(0, np.int64)]
+        for rows, user in streams:
+            timed = [i for i, r in enumerate(rows) if r.get("completedAt")]
+            if timed:
+                users.append(user[timed])
+                days.append(parse_ms([rows[i]["completedAt"] for i in timed]) // DAY_MS)
+        user, day = np.concatenate(users), np.concatenate(days)
+        busiest = np.zeros(len(self.users), np.int64)
+        if len(user):
+            first, span = int(day.min()), int(day.max() - day.min()) + 1
+            keys = np.sort(user * span + (day - first))
+            # Sıralı anahtarlarda (kullanıcı, gün) koşularının uzunlukları
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            counts = np.diff(np.r_[starts, len(keys)])
+            np.maximum.at(busiest, keys[starts] // span, counts)
+        return busiest
+
+    def value(self, type_, sub_type=None):
+        """badge_index metriğinin kullanıcı başına değeri; bilinmiyorsa None."""
+        if type_ in ("test_count", "quiz_count", "bugfix_count", "total_quizzes"):
+            values = self.quiz_count
+        elif type_ in ("perfect_score_count", "perfect_scores"):
+            values = self.perfect_count
+        elif type_ == "total_score":
+            values = self.total_score
+        elif type_ == "lesson_count":
+            values = self.lesson_count
+        elif type_ == "live_coding_count":
+            values = self.live_count
+        elif type_ == "average_score":
+            values = self.average_score
+        elif type_ == "single_score":
+            values = self.max_score
+        elif type_ == "score":
+            if sub_type in _MAX_SCORE_TYPES:
+                values = self.max_score
+            elif sub_type in _AVERAGE_SCORE_TYPES:
+                values = self.average_score
+            elif sub_type == "toplam":
+                values = self.total_score
+            elif sub_type == "mükemmel":
+                # max >= min_score || tam puan sayısı > 0
+                values = np.where(self.perfect_count > 0, np.inf, self.max_score)
+            else:
+                return None
+        elif type_ in ("streak", "current_streak"):
+            values = self.streak["currentStreak"]
+        elif type_ == "longest_streak":
+            values = self.streak["longestStreak"]
+        elif type_ == "total_days_active":
+            values = self.streak["totalDaysActive"]
+        elif type_ == "social_interaction" and sub_type in SOCIAL_SUMS:
+            values = sum(self.social[name] for name in SOCIAL_SUMS[sub_type])
+        elif type_ == "daily_activity" and sub_type in DAILY_SOURCES:
+            values = self.daily[DAILY_SOURCES[sub_type]]
+        else:
+            return None
+        return values
+
+    def event(self, special_type):
+        """special rozetinin maskesi (checkAllUserBadges); bilinmiyorsa None."""
+        best, fastest = self.max_score, self.fastest
+        perfect = best == 100
+        first_lesson = self.lesson_distinct == 1
+        masks = {
+            "ilk test": self.quiz_count == 1,
+            "ilk kurs": first_lesson,
+            "ilk ders": first_lesson,
+            "ilk post": self.social["posts"] == 1,
+            "hızlı tamamlama": fastest <= 300,
+            "mükemmel performans": perfect,
+            "nadir başarı": perfect,
+            "özel kombinasyon": (best >= 90) & (fastest <= 600),
+            "efsanevi an": perfect & (fastest <= 300),
+            "tarihi başarı": perfect & (self.perfect_count == 1),
+            "benzersiz başarı": best >= 95,
+        }
+        return masks.get(special_type)
+
+
+def backfill(badges, metrics, earned_rows=()):
+    """
+    Kazanılmış olması gereken ama earned_rows'ta olmayan rozetler.
+    (kullanıcı indeksleri, rozet indeksleri, atlanan rozet id'leri) döner;
+    çiftler kullanıcıya, sonra badges sırasına göre sıralıdır.
+    """
+    position = {b["id"]: i for i, b in enumerate(badges)}
+    index = build_index(badges)
+    winners, awarded, unsupported = [], [], list(index["unindexed"])
+
+    def award(mask, ids):
+        users = np.flatnonzero(mask)
+        for badge_id in ids:
+            winners.append(users)
+            awarded.append(np.full(len(users), position[badge_id], np.int64))
+
+    for metric, entry in index["metrics"].items():
+        values = None if "scope" in entry else metrics.value(entry["type"], entry["subType"])
+        if values is None:
+            unsupported.extend(b for ids in entry["badges"] for b in ids)
+            continue
+        for threshold, ids in zip(entry["thresholds"], entry["badges"]):
+            award(values >= threshold, ids)
+    for metric, ids in index["events"].items():
+        base, _, scope = metric.partition("@")
+        mask = None if scope else metrics.event(base.partition(":")[2])
+        if mask is None:
+            unsupported.extend(ids)
+            continue
+        award(mask, ids)
+
+    user = np.concatenate(winners) if winners else np.zeros(0, np.int64)
+    badge = np.concatenate(awarded) if awarded else np.zeros(0, np.int64)
+    # Aynı rozet id'si katalogda iki kez geçerse çift tekilleşir
+    codes = np.sort(user * len(badges) + badge)
+    codes = codes[np.r_[True, codes[1:] != codes[:-1]]] if len(codes) else codes
+    earned_user = metrics.user_indices(r.get("userId") for r in earned_rows)
+    earned_badge = np.fromiter((position.get(r.get("badgeId"), -1) for r in earned_rows), np.int64)
+    known = (earned_user >= 0) & (earned_badge >= 0)
+    earned = np.sort(earned_user[known] * len(badges) + earned_badge[known])
+    if len(earned):
+        pos = np.minimum(np.searchsorted(earned, codes), len(earned) - 1)
+        codes = codes[earned[pos] != codes]
+    return codes // len(badges), codes % len(badges), sorted(set(unsupported))
+
+
+def user_handle(user_id):
+    """"user-ayse-kaya-3" -> "ayse-kaya-3" (userbadge-<handle>-<rozet> id'leri için)."""
+    return user_id[len("user-"):] if user_id.startswith("user-") else user_id
+
+
+def iter_copy_script(metrics, badges, users, awarded, earned_at, with_points=False, header=()):
+    """
+    Yeni user_badges satırları (ve with_points ile saveUserBadge'in
+    eklediği BADGE kaynaklı user_earned_points satırları) için COPY betiği.
+    """
+    for line in header:
+        yield f"-- {line}\n"
+    yield "BEGIN;\n\n"
+    rows = [
+        (metrics.users[u], badges[b]) for u, b in zip(users.tolist(), awarded.tolist())
+    ]
+    yield copy_statement("user_badges", USER_BADGE_COLUMNS) + ";\n"
+    for _, text in iter_batches(
+        (f"userbadge-{user_handle(u)}-{b['id']}", u, b["id"], earned_at, False, None) for u, b in rows
+    ):
+        yield text
+    yield "\\.\n\n"
+    if with_points:
+        yield copy_statement("user_earned_points", EARNED_POINT_COLUMNS) + ";\n"
+        for _, text in iter_batches(
+            (f"earnedpoint-{user_handle(u)}-{b['id']}", u, b["points"], "BADGE", b["id"], earned_at)
+            for u, b in rows if (b.get("points") or 0) > 0
+        ):
+            yield text
+        yield "\\.\n\n"
+    yield "COMMIT;\n"
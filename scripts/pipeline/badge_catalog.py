@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Bildirimsel (declarative) rozet kataloğu üretimi.
+
+Rozetler iç içe döngüler ve kategori başına if/elif blokları yerine bir
+spec tablosundan üretilir: kategoriler, tier'lar, çarpanlar, eşik
+merdivenleri ve isim şablonları. Katalog "set" (sezon, kurs...) × kategori
+× tier × slot ızgarasıdır; bir rozetin tüm alanları bu dört indeksten
+hesaplanır. Set'ten bağımsız kısımlar (isim, açıklama, puan, kriter
+metni) kategori × tier × slot başına bir kez hesaplanıp önceden
+JSON'a kodlanır; set'e göre değişen alanlar (id, key, ikon, scope) bu
+parçalara eklenir. Böylece 50.000 rozetlik bir katalog json.dumps'a hiç
+dict vermeden, satır satır akıtılarak saniyenin çok altında yazılır.
+
+Çıktılar:
+    iter_json()        json.dump(..., indent=2, ensure_ascii=False) ile aynı baytlar
+    iter_ndjson()      her satırda bir rozet (kompakt JSON)
+    iter_classified()  badges-index.json için kriter sınıflandırması
+"""
+
+import json
+from array import array
+from json.encoder import encode_basestring as _quote
+
+from .badge_index import classify
+
+
+def _format(template, sub_type, threshold):
+    words = sub_type.split()
+    return template.format(
+        sub=sub_type,
+        Sub=sub_type.capitalize(),
+        word=words[1] if len(words) > 1 else sub_type,
+        t=threshold,
+    )
+
+
+def _indent(text, prefix):
+    return text.replace("\n", "\n" + prefix)
+
+
+class BadgeCatalog:
+    """
+    spec:   {"tiers": {...}, "categories": [...], "emojis": [...]}
+    sets:   [(set_id, başlık)] veya None (tek, set'siz katalog)
+    """
+
+    def __init__(self, spec, sets=None, per_tier=10, id_width=None):
+        self.spec = spec
+        self.sets = list(sets) if sets else [(None, None)]
+        self.per_tier = per_tier
+        self.emojis = spec["emojis"]
+        self.tier_names = list(spec["tiers"])
+        self.cores = []
+        self._expand()
+        total = len(self)
+        if id_width is None:
+            id_width = max(3 if sets is None else 5, len(str(total)))
+        self.id_width = id_width
+
+    def __len__(self):
+        return len(self.sets) * len(self.cores)
+
+    # -- Sütun sütun genişletme -----------------------------------------------
+
+    def _expand(self):
+        """
+        Kategori × tier × slot ızgarasını sütunlara açar. Her "core", bir
+        set içindeki tek bir rozetin set'ten bağımsız alanlarıdır.
+        """
+        tiers = self.spec["tiers"]
+        n = self.per_tier
+        categories = self.spec["categories"]
+
+        # Tamsayı sütunları (ızgara indeksleri ve eşikler)
+        cat_col = array("H")
+        tier_col = array("H")
+        slot_col = array("I")
+        for c in range(len(categories)):
+            for t in range(len(tiers)):
+                cat_col.extend([c] * n)
+                tier_col.extend([t] * n)
+                slot_col.extend(range(n))
+
+        for c, t, slot in zip(cat_col, tier_col, slot_col):
+            category = categories[c]
+            tier = self.tier_names[t]
+            tier_spec = tiers[tier]
+            sub_types = category["sub_types"]
+            sub_type = sub_types[slot % len(sub_types)]
+            ladder = category.get("ladders", {}).get(tier)
+            threshold = ladder[slot % len(ladder)] if ladder else None
+            templates = category["templates"][tier]
+            name_template = templates["name"]
+            if threshold == 1 and "name_when_one" in templates:
+                name_template = templates["name_when_one"]
+
+            criteria = {"type": category["criteria_type"], category["sub_field"]: sub_type}
+            if category.get("threshold_field"):
+                criteria[category["threshold_field"]] = threshold
+            criteria.update(category.get("criteria_extra", {}))
+
+            self.cores.append({
+                "category": category["id"],
+                "tier": tier,
+                "slot": slot,
+                "name": _format(name_template, sub_type, threshold),
+                "description": _format(templates["description"], sub_type, threshold),
+                "color": tier_spec["colors"][slot % len(tier_spec["colors"])],
+                "rarity": tier_spec["rarity"],
+                "points": int(tier_spec["points"] * category["multiplier"]),
+                "criteria": criteria,
+            })
+
+        # Önceden kodlanmış JSON parçaları
+        for core in self.cores:
+            criteria_text = json.dumps(core["criteria"], ensure_ascii=False, indent=2)
+            core["_criteria_open"] = _indent(criteria_text[:-2], "      ")  # son "\n}" hariç
+            core["_criteria_compact_open"] = json.dumps(
+                core["criteria"], ensure_ascii=False, separators=(",", ":")
+            )[:-1]
+            core["_tail"] = (
+                f'      "category": {_quote(core["category"])},\n'
+                f'      "tier": {_quote(core["tier"])},\n'
+                f'      "rarity": {_quote(core["rarity"])},\n'
+                f'      "points": {core["points"]},\n'
+                f'      "criteria": '
+            )
+            core["_compact_tail"] = (
+                f',"category":{_quote(core["category"])},"tier":{_quote(core["tier"])}'
+                f',"rarity":{_quote(core["rarity"])},"points":{core["points"]},"criteria":'
+            )
+
+    # -- Tek rozet --------------------------------------------------------------
+
+    def _fields(self, i):
+        set_index, core_index = divmod(i, len(self.cores))
+        core = self.cores[core_index]
+        set_id, set_title = self.sets[set_index]
+        key = f"{core['category']}_{core['tier']}_{core['slot'] + 1}"
+        name = core["name"]
+        if set_id is not None:
+            key = f"{set_id}_{key}"
+            name = f"{name} ({set_title})"
+        return core, set_id, {
+            "id": f"badge-{i + 1:0{self.id_width}d}",
+            "key": key,
+            "name": name,
+            "icon": self.emojis[i % len(self.emojis)],
+        }
+
+    def badge(self, i):
+        """i. rozeti dict olarak döner (alan sırası badges.json ile aynı)."""
+        core, set_id, fields = self._fields(i)
+        criteria = dict(core["criteria"])
+        if set_id is not None:
+            criteria["scope"] = set_id
+        return {
+            "id": fields["id"],
+            "key": fields["key"],
+            "name": fields["name"],
+            "description": core["description"],
+            "icon": fields["icon"],
+            "color": core["color"],
+            "category": core["category"],
+            "tier": core["tier"],
+            "rarity": core["rarity"],
+            "points": core["points"],
+            "criteria": criteria,
+        }
+
+    def iter_badges(self):
+        for i in range(len(self)):
+            yield self.badge(i)
+
+    def iter_classified(self):
+        """
+        Rozetlerin (id, tür, metrik, eşik) sınıflandırması (bkz.
+        badge_index.index_from_classified). Kriterler core başına bir kez
+        sınıflandırılır; set'li kataloglarda metriğe "@set" eklenir.
+        """
+        classified = [classify(core["criteria"]) for core in self.cores]
+        width = self.id_width
+        i = 0
+        for set_id, _ in self.sets:
+            suffix = "" if set_id is None else "@" + set_id
+            for kind, metric, threshold in classified:
+                i += 1
+                yield f"badge-{i:0{width}d}", kind, metric and metric + suffix, threshold
+
+    # -- Akış halinde çıktı -------------------------------------------------------
+
+    def _records(self, compact):
+        """
+        Rozetleri set-major sırada, önceden kodlanmış parçaları birleştirerek
+        JSON metni olarak verir (dict veya json.dumps yok).
+        """
+        icons = [_quote(e) for e in self.emojis]
+        n_icons = len(icons)
+        if compact:
+            head, sep_key, sep_name, sep_desc, sep_icon, sep_color = (
+                '{"id":"badge-', '","key":', ',"name":', ',"description":', ',"icon":', ',"color":'
+            )
+        else:
+            head, sep_key, sep_name, sep_desc, sep_icon, sep_color = (
+                '    {\n      "id": "badge-', '",\n      "key": ', ',\n      "name": ',
+                ',\n      "description": ', ',\n      "icon": ', ',\n      "color": ',
+            )
+        cores = [
+            (
+                _quote(f"{core['category']}_{core['tier']}_{core['slot'] + 1}")[1:],
+                _quote(core["name"])[:-1],
+                sep_desc + _quote(core["description"]) + sep_icon,
+                sep_color + _quote(core["color"]) + (
+                    core["_compact_tail"] + core["_criteria_compact_open"] if compact
+                    else ",\n" + core["_tail"] + core["_criteria_open"]
+                ),
+            )
+            for core in self.cores
+        ]
+        width = self.id_width
+        i = 0
+        for set_id, set_title in self.sets:
+            if set_id is None:
+                key_prefix, name_suffix, scope = '"', '"', ""
+            else:
+                key_prefix = _quote(set_id + "_")[:-1]
+                name_suffix = _quote(f" ({set_title})")[1:]
+                scope = f',"scope":{_quote(set_id)}' if compact else f',\n        "scope": {_quote(set_id)}'
+            close = scope + ("}}\n" if compact else "\n      }\n    }")
+            for key, name, desc_icon, rest in cores:
+                yield (
+                    f"{head}{i + 1:0{width}d}{sep_key}{key_prefix}{key}{sep_name}{name}{name_suffix}"
+                    f"{desc_icon}{icons[i % n_icons]}{rest}{close}"
+                )
+                i += 1
+
+    def iter_json(self, chunk_records=512):
+        """{"totalBadges": n, "badges": [...]} metnini parça parça verir."""
+        total = len(self)
+        if not total:
+            yield '{\n  "totalBadges": 0,\n  "badges": []\n}'
+            return
+        yield f'{{\n  "totalBadges": {total},\n  "badges": [\n'
+        records = self._records(compact=False)
+        for start in range(0, total, chunk_records):
+            end = min(start + chunk_records, total)
+            text = ",\n".join(next(records) for _ in range(start, end))
+            yield text + (",\n" if end < total else "\n")
+        yield "  ]\n}"
+
+    def iter_ndjson(self, chunk_records=2048):
+        """Her satırda bir rozet (kompakt JSON)."""
+        total = len(self)
+        records = self._records(compact=True)
+        for start in range(0, total, chunk_records):
+            yield "".join(next(records) for _ in range(start, min(start + chunk_records, total)))
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Rozetler için önceden hesaplanmış değerlendirme index'i (badges-index.json).
+
+badge-service.ts her kontrolde badges.json'u okuyup her rozeti uzun bir
+if/switch zincirinden geçirir. Index, rozetleri kriter türü ve alt türüne
+göre "metrik"lere ayırır (ör. "score:ortalama", "streak:login",
+"test_count"; set'li kataloglarda "score:ortalama@season-01"); her metrikte eşikler artan sırada tutulur. "Metrik X'in
+değeri old'dan new'e çıkan kullanıcı hangi rozetleri yeni kazanır?"
+sorusu metrik başına iki ikili aramadır (bisect).
+
+Eşiksiz kriterler (special) olay olarak, tanınmayan kriterler
+"unindexed" listesinde tutulur; bunlar eskisi gibi tek tek
+değerlendirilmelidir.
+
+Biçim (INDEX_VERSION):
+    {
+      "version": 1,
+      "totalBadges": 200,
+      "metrics": {
+        "score:ortalama": {"type": "score", "subType": "ortalama", "field": "min_score",
+                           "thresholds": [60, 80, 90, 100], "badges": [["badge-042"], ...]},
+        ...
+      },
+      "events": {"special:ilk test": ["badge-161", ...]},
+      "unindexed": ["badge-xyz"]
+    }
+"""
+
+import bisect
+import hashlib
+import json
+import random
+
+INDEX_VERSION = 1
+
+# criteria.type -> (alt tür alanı, eşik alanı); badge-service.ts ile aynı alanlar
+THRESHOLD_CRITERIA = {
+    "daily_activity": ("activity_type", "count"),
+    "score": ("score_type", "min_score"),
+    "social_interaction": ("interaction_type", "count"),
+    "streak": ("streak_type", "days"),
+    "test_count": (None, "count"),
+    "perfect_score_count": (None, "count"),
+    "total_score": (None, "count"),
+    "lesson_count": (None, "count"),
+    "quiz_count": (None, "count"),
+    "live_coding_count": (None, "count"),
+    "bugfix_count": (None, "count"),
+    # Eski yapı (criteria.value)
+    "total_quizzes": (None, "value"),
+    "average_score": (None, "value"),
+    "single_score": (None, "value"),
+    "perfect_scores": (None, "value"),
+    "current_streak": (None, "value"),
+    "longest_streak": (None, "value"),
+    "total_days_active": (None, "value"),
+    "topic_complete": (None, "value"),
+}
+
+# criteria.type -> olay alt tür alanı (eşik yok, olay gerçekleşince kazanılır)
+EVENT_CRITERIA = {
+    "special": "special_type",
+}
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def metric_name(type_, sub_type=None, scope=None):
+    name = f"{type_}:{sub_type}" if sub_type is not None else type_
+    return f"{name}@{scope}" if scope is not None else name
+
+
+def classify(criteria):
+    """
+    Kriteri sınıflandırır:
+        ("threshold", metrik, eşik) | ("event", metrik, None) | ("unindexed", None, None)
+    """
+    if not isinstance(criteria, dict):
+        return "unindexed", None, None
+    type_ = criteria.get("type")
+    scope = criteria.get("scope")  # set'li kataloglar (ör. "season-01")
+    if scope is not None and not isinstance(scope, str):
+        return "unindexed", None, None
+    if type_ in THRESHOLD_CRITERIA:
+        sub_field, threshold_field = THRESHOLD_CRITERIA[type_]
+        sub_type = criteria.get(sub_field) if sub_field else None
+        threshold = criteria.get(threshold_field)
+        if type_ == "topic_complete":
+            threshold = threshold or 1  # badge-service.ts: criteria.value || 1
+        if (sub_field is None or (isinstance(sub_type, str) and sub_type)) and _is_number(threshold):
+            return "threshold", metric_name(type_, sub_type, scope), threshold
+    if type_ in EVENT_CRITERIA:
+        sub_type = criteria.get(EVENT_CRITERIA[type_])
+        if isinstance(sub_type, str) and sub_type:
+            return "event", metric_name(type_, sub_type, scope), None
+    return "unindexed", None, None
+
+
+def build_index(badges, source_bytes=None):
+    """Rozet listesinden index'i oluşturur (metrik ve eşik sırası deterministiktir)."""
+    classified = ((badge["id"], *classify(badge.get("criteria"))) for badge in badges)
+    return index_from_classified(classified, len(badges), source_bytes)
+
+
+def index_from_classified(classified, total, source_bytes=None):
+    """
+    (rozet id, tür, metrik, eşik) dörtlülerinden (classify sonucu, rozet
+    sırasıyla) index'i oluşturur; rozet dict'i gerektirmez (bkz.
+    BadgeCatalog.iter_classified).
+    """
+    grouped = {}
+    events = {}
+    unindexed = []
+    for badge_id, kind, metric, threshold in classified:
+        if kind == "threshold":
+            grouped.setdefault(metric, {}).setdefault(threshold, []).append(badge_id)
+        elif kind == "event":
+            events.setdefault(metric, []).append(badge_id)
+        else:
+            unindexed.append(badge_id)
+
+    metrics = {}
+    for metric in sorted(grouped):
+        base, _, scope = metric.partition("@")
+        type_, _, sub_type = base.partition(":")
+        thresholds = sorted(grouped[metric])
+        metrics[metric] = {
+            "type": type_,
+            "subType": sub_type or None,
+            "field": THRESHOLD_CRITERIA[type_][1],
+            "thresholds": thresholds,
+            "badges": [grouped[metric][t] for t in thresholds],
+        }
+        if scope:
+            metrics[metric]["scope"] = scope
+
+    index = {
+        "version": INDEX_VERSION,
+        "totalBadges": total,
+        "metrics": metrics,
+        "events": {metric: events[metric] for metric in sorted(events)},
+        "unindexed": unindexed,
+    }
+    if source_bytes is not None:
+        index["sourceSha256"] = hashlib.sha256(source_bytes).hexdigest()
+    return index
+
+
+def check_version(index):
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"desteklenmeyen rozet index sürümü: {index.get('version')} (beklenen {INDEX_VERSION})")
+
+
+# -- Sorgular (referans değerlendirici) ----------------------------------------
+
+def qualified(index, metric, value):
+    """Metriğin değeri value iken kazanılmış tüm rozetler (eşik <= value)."""
+    entry = index["metrics"].get(metric)
+    if entry is None:
+        return []
+    end = bisect.bisect_right(entry["thresholds"], value)
+    return [badge_id for ids in entry["badges"][:end] for badge_id in ids]
+
+
+def newly_qualified(index, metric, old_value, new_value):
+    """Metrik old_value'dan new_value'ya çıkınca yeni kazanılan rozetler."""
+    entry = index["metrics"].get(metric)
+    if entry is None or new_value <= old_value:
+        return []
+    thresholds = entry["thresholds"]
+    start = bisect.bisect_right(thresholds, old_value)
+    end = bisect.bisect_right(thresholds, new_value)
+    return [badge_id for ids in entry["badges"][start:end] for badge_id in ids]
+
+
+def evaluate(index, metrics, events=(), earned=()):
+    """
+    Kullanıcının metrik değerleri ({metrik: değer}) ve gerçekleşen olaylarla
+    kazanılmış, henüz earned içinde olmayan rozet id'lerini döner.
+    """
+    earned = set(earned)
+    result = []
+    for metric, value in metrics.items():
+        result.extend(b for b in qualified(index, metric, value) if b not in earned)
+    for metric in events:
+        result.extend(b for b in index["events"].get(metric, ()) if b not in earned)
+    return sorted(set(result))
+
+
+# badge-service.ts'deki dallar: sayaç türleri ve eski (criteria.value) türler
+_COUNT_TYPES = (
+    "test_count", "perfect_score_count", "total_score", "lesson_count",
+    "quiz_count", "live_coding_count", "bugfix_count",
+)
+_VALUE_TYPES = (
+    "total_quizzes", "average_score", "single_score", "perfect_scores",
+    "current_streak", "longest_streak", "total_days_active",
+)
+
+
+def _reference_check(criteria):
+    """
+    badge-service.ts'nin okuduğu alanlarla (metrik, eşik) ya da olay için
+    (metrik, None); değerlendirilemeyen kriterde None. classify() ve
+    THRESHOLD_CRITERIA kullanılmaz.
+    """
+    if not isinstance(criteria, dict):
+        return None
+    type_ = criteria.get("type")
+    scope = criteria.get("scope")
+    if scope is not None and not isinstance(scope, str):
+        return None
+    suffix = f"@{scope}" if scope is not None else ""
+
+    if type_ == "special":
+        special_type = criteria.get("special_type")
+        if not special_type or not isinstance(special_type, str):
+            return None
+        return f"special:{special_type}{suffix}", None
+
+    if type_ == "score":
+        # criteria.score_type && criteria.min_score !== undefined
+        sub_type, threshold = criteria.get("score_type"), criteria.get("min_score")
+    elif type_ == "streak":
+        sub_type, threshold = criteria.get("streak_type"), criteria.get("days")
+    elif type_ == "daily_activity":
+        sub_type, threshold = criteria.get("activity_type"), criteria.get("count")
+    elif type_ == "social_interaction":
+        sub_type, threshold = criteria.get("interaction_type"), criteria.get("count")
+    elif type_ in _COUNT_TYPES:
+        sub_type, threshold = None, criteria.get("count")
+    elif type_ in _VALUE_TYPES:
+        sub_type, threshold = None, criteria.get("value")
+    elif type_ == "topic_complete":
+        # const requiredCount = criteria.value || 1
+        sub_type, threshold = None, criteria.get("value") or 1
+    else:
+        return None
+
+    if not _is_number(threshold):
+        return None
+    if type_ in ("score", "streak", "daily_activity", "social_interaction"):
+        if not sub_type or not isinstance(sub_type, str):
+            return None
+        return f"{type_}:{sub_type}{suffix}", threshold
+    return f"{type_}{suffix}", threshold
+
+
+def evaluate_naive(badges, metrics, events=(), earned=()):
+    """
+    Referans: her rozetin criteria alanlarını badge-service.ts gibi tek tek
+    okuyan tam tarama. Index'teki bir sınıflandırma hatasını yakalayabilmesi
+    için build_index'ten bağımsız yazılmıştır.
+    """
+    earned = set(earned)
+    events = set(events)
+    result = []
+    for badge in badges:
+        if badge["id"] in earned:
+            continue
+        check = _reference_check(badge.get("criteria"))
+        if check is None:
+            continue
+        metric, threshold = check
+        if threshold is None:
+            if metric in events:
+                result.append(badge["id"])
+        elif metric in metrics and metrics[metric] >= threshold:
+            result.append(badge["id"])
+    return sorted(set(result))
+
+
+def verify_index(index, badges, samples=200, seed=0):
+    """
+    Index'i tam taramayla karşılaştırır: her eşiğin altı/üstü/kendisi ve
+    rastgele metrik kombinasyonları. Uyuşmazlıkların listesini döner.
+    """
+    check_version(index)
+    problems = []
+    if index["totalBadges"] != len(badges):
+        problems.append(f"totalBadges {index['totalBadges']} != {len(badges)}")
+
+    # Referans kontrolü rozet başına bir kez yapılır ve metriğe göre gruplanır;
+    # eşik denemeleri yalnızca o metriğin rozetlerini tarar. Referansın
+    # gördüğü metrikler de denenir: index'ten tümüyle düşmüş bir metrik
+    # (ör. yanlış eşik alanı) yalnızca index'e bakılarak yakalanamaz.
+    reference = {}
+    reference_events = set()
+    for badge in badges:
+        check = _reference_check(badge.get("criteria"))
+        if check is None:
+            continue
+        metric, threshold = check
+        if threshold is None:
+            reference_events.add(metric)
+        else:
+            reference.setdefault(metric, []).append((threshold, badge["id"]))
+
+    for metric in sorted(set(index["metrics"]) | set(reference)):
+        thresholds = index["metrics"][metric]["thresholds"] if metric in index["metrics"] else []
+        if thresholds != sorted(set(thresholds)):
+            problems.append(f"{metric}: eşikler artan ve tekil değil")
+        entries = reference.get(metric, [])
+        known = sorted(set(thresholds) | {t for t, _ in entries})
+        probes = {known[0] - 1}
+        for t in known:
+            probes.update((t - 1, t, t + 0.5))
+        scanned = {}
+        for value in sorted(probes):
+            scanned[value] = expected = sorted({badge_id for t, badge_id in entries if t <= value})
+            actual = evaluate(index, {metric: value})
+            if expected != actual:
+                problems.append(f"{metric}={value}: index {actual} != tarama {expected}")
+        for old in sorted(probes):
+            for new in sorted(probes):
+                if new <= old:
+                    continue
+                expected = sorted(set(scanned[new]) - set(scanned[old]))
+                actual = sorted(newly_qualified(index, metric, old, new))
+                if expected != actual:
+                    problems.append(f"{metric} {old}->{new}: index {actual} != tarama {expected}")
+
+    event_names = sorted(set(index["events"]) | reference_events)
+    for metric in event_names:
+        expected = evaluate_naive(badges, {}, [metric])
+        actual = evaluate(index, {}, [metric])
+        if expected != actual:
+            problems.append(f"{metric}: index {actual} != tarama {expected}")
+
+    rng = random.Random(seed)
+    metric_names = list(index["metrics"])
+    for _ in range(samples if metric_names else 0):
+        chosen = rng.sample(metric_names, min(len(metric_names), rng.randint(1, 6)))
+        metrics = {}
+        for metric in chosen:
+            top = index["metrics"][metric]["thresholds"][-1]
+            metrics[metric] = rng.randint(0, int(top) + 1)
+        events = rng.sample(event_names, min(len(event_names), rng.randint(0, 2)))
+        earned = rng.sample([b["id"] for b in badges], min(len(badges), rng.randint(0, 5)))
+        expected = evaluate_naive(badges, metrics, events, earned)
+        actual = evaluate(index, metrics, events, earned)
+        if expected != actual:
+            problems.append(f"{metrics} {events}: index {actual} != tarama {expected}")
+    return problems
+
+
+def dumps_index(index):
+    return json.dumps(index, ensure_ascii=False, indent=2)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Üreticiler için benchmark altyapısı.
+
+Her benchmark bir "case"tir: prepare() sentetik girdiyi (ölçek 1×/10×/100×)
+çalışma dizinine bir kez hazırlar, run() asıl işi yapar ve işlenen bayt
+sayısını döner. run() her ölçüm için ayrı bir alt süreçte çalıştırılır;
+böylece tepe RSS (resource.getrusage) o case'e aittir ve önceki
+case'lerin belleği ölçümü kirletmez. İstenirse tracemalloc ile Python
+tarafındaki tepe ayırma da ayrı bir geçişte ölçülür.
+
+Sonuçlar JSON olarak kaydedilir ve saklanan bir baseline ile
+karşılaştırılır; süre veya bellek eşiği aşan case'ler regresyon sayılır.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+RESULTS_VERSION = 1
+
+
+class BenchmarkCase:
+    """prepare(workdir, scale) -> None, run(workdir, scale) -> işlenen bayt sayısı"""
+
+    def __init__(self, name, prepare, run, description=""):
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+        self.description = description
+
+
+def case_key(name, scale):
+    return f"{name}@{scale}x"
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt döner
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(case, workdir, scale, with_tracemalloc=False):
+    """Alt süreç içinde çağrılır: case'i çalıştırıp ölçümleri döner."""
+    started = time.perf_counter()
+    processed = case.run(workdir, scale)
+    wall = time.perf_counter() - started
+
+    result = {
+        "case": case.name,
+        "scale": scale,
+        "wallSeconds": round(wall, 6),
+        "bytes": processed,
+        "mbPerSecond": round(processed / (1024 * 1024) / wall, 3) if wall > 0 else None,
+        "peakRssMb": round(_peak_rss_mb(), 2),
+    }
+
+    if with_tracemalloc:
+        tracemalloc.start()
+        case.run(workdir, scale)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peakTracemallocMb"] = round(peak / (1024 * 1024), 2)
+
+    return result
+
+
+def run_in_subprocess(script, name, scale, workdir, with_tracemalloc=False):
+    """script'i '--run-case' ile çağırır; son satırdaki JSON sonucu döner."""
+    cmd = [sys.executable, script, "--run-case", name, "--scale", str(scale), "--workdir", workdir]
+    if with_tracemalloc:
+        cmd.append("--tracemalloc")
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{case_key(name, scale)} başarısız:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {case_key(r["case"], r["scale"]): r for r in data.get("results", [])}
+
+
+def save_results(path, results):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    data = {
+        "version": RESULTS_VERSION,
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def compare(results, baseline, threshold=0.25, min_seconds=0.05):
+    """
+    Baseline'a göre regresyonları listeler. Çok kısa süren ölçümler
+    (min_seconds altı) gürültülü olduğu için süre karşılaştırmasına girmez.
+    """
+    regressions = []
+    for result in results:
+        key = case_key(result["case"], result["scale"])
+        base = baseline.get(key)
+        if not base:
+            continue
+        old, new = base["wallSeconds"], result["wallSeconds"]
+        if max(old, new) >= min_seconds and new > old * (1 + threshold):
+            regressions.append(f"{key}: süre {old:.3f}s -> {new:.3f}s (+{(new / old - 1) * 100:.0f}%)")
+        old, new = base.get("peakRssMb"), result.get("peakRssMb")
+        if old and new and new > old * (1 + threshold):
+            regressions.append(f"{key}: tepe RSS {old:.1f}MB -> {new:.1f}MB (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
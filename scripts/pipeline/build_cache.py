@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+İçerik üreticileri için artımlı (incremental) build cache.
+
+Her üretici için girdilerin (script kaynağı, şablon tabloları, okunan
+dosyalar) özeti ile ürettiği çıktı dosyalarının özetleri bir manifest
+dosyasında tutulur. Girdiler değişmediyse ve çıktılar hâlâ kaydedilen
+içerikteyse üretici hiç çalışmaz. Çalıştığında da baytları aynı olan
+çıktılar yeniden yazılmaz; böylece mtime değişmez ve Next.js build
+cache'i (public/data/badges.json, data/lesson-contents/* ...) boşa
+geçersiz kılınmaz.
+
+Kullanım:
+    cache = BuildCache("generate-200-badges")
+    cache.add_source(__file__)
+    cache.add_data(category_multipliers, tier_base_points)
+    if cache.is_fresh():
+        return
+    ...
+    cache.write_json("public/data/badges.json", output, indent=2)
+    cache.commit()
+
+Önbelleği atlamak için script "--force" argümanıyla ya da
+CONTENT_CACHE=off ortam değişkeniyle çalıştırılır.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+from . import REPO_ROOT
+
+MANIFEST_VERSION = 1
+CACHE_DIR = os.path.join(REPO_ROOT, ".content-cache")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+
+_HASH_BLOCK = 1 << 20
+
+
+def _current_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# open() ile yeni oluşturulan bir dosyanın alacağı izinler
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_HASH_BLOCK)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def _manifest_key(path):
+    """Manifest'te dosyalar depo köküne göre, '/' ayraçlı yol ile tutulur."""
+    return os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/")
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "generators": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "generators": {}}
+    return manifest
+
+
+def _copy_mode(tmp_path, path):
+    """
+    mkstemp'in 0600'lük geçici dosyasına hedefin izinlerini, hedef yoksa
+    open()'ın vereceği izinleri (0666 & ~umask) verir.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+    os.chmod(tmp_path, mode)
+
+
+def atomic_write_bytes(path, data):
+    """Veriyi aynı dizindeki geçici dosyaya yazıp yerine taşır."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        _copy_mode(tmp_path, path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path, data, snapshot=True):
+    """
+    data (bytes) dosyadakiyle aynıysa hiçbir şey yapmaz. Dosyanın
+    yazılıp yazılmadığını döner. Var olan dosyanın üzerine yazılmadan
+    önce eski hali snapshot deposuna alınır (bkz. snapshots.py).
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    if snapshot:
+        from .snapshots import snapshot_before_overwrite
+
+        snapshot_before_overwrite(path)
+    atomic_write_bytes(path, data)
+    return True
+
+
+def write_chunks_if_changed(path, chunks, snapshot=True):
+    """
+    write_if_changed'in akış hali: parçalar (str veya bytes) aynı dizindeki
+    geçici dosyaya yazılırken hash'lenir, çıktı bellekte birleştirilmez.
+    Sonuç dosyadakiyle aynıysa geçici dosya silinir. (yazıldı mı, sha256)
+    döner.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    h = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                h.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+        digest = h.hexdigest()
+        try:
+            unchanged = os.path.getsize(path) == size and sha256_file(path) == digest
+        except OSError:
+            unchanged = False
+        if unchanged:
+            os.unlink(tmp_path)
+            return False, digest
+        if snapshot:
+            from .snapshots import snapshot_before_overwrite
+
+            snapshot_before_overwrite(path)
+        _copy_mode(tmp_path, path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return True, digest
+
+
+def _file_record(path, digest=None):
+    st = os.stat(path)
+    return {
+        "sha256": digest or sha256_file(path),
+        "size": st.st_size,
+        "mtimeNs": st.st_mtime_ns,
+    }
+
+
+def _record_matches(path, record):
+    """Çıktı dosyası manifest'teki içerikte mi? stat aynıysa yeniden hash'lenmez."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if st.st_size != record.get("size"):
+        return False
+    if st.st_mtime_ns == record.get("mtimeNs"):
+        return True
+    return sha256_file(path) == record.get("sha256")
+
+
+class BuildCache:
+    """Tek bir üreticinin girdi/çıktı kaydı."""
+
+    def __init__(self, name, force=None, manifest_path=MANIFEST_PATH):
+        self.name = name
+        self.manifest_path = manifest_path
+        if force is None:
+            force = "--force" in sys.argv[1:] or os.environ.get("CONTENT_CACHE") == "off"
+        self.force = force
+        self._inputs = hashlib.sha256()
+        self._inputs.update(name.encode("utf-8"))
+        self._outputs = {}
+        self.written = []
+        self.unchanged = []
+
+    # -- Girdiler ---------------------------------------------------------
+
+    def add_source(self, *paths):
+        """Script kaynağı veya okunan girdi dosyalarını özete ekler."""
+        for path in paths:
+            self._inputs.update(b"\0file\0" + _manifest_key(path).encode("utf-8") + b"\0")
+            self._inputs.update(sha256_file(path).encode("ascii"))
+
+    def add_data(self, *values):
+        """Şablon tabloları gibi JSON'a çevrilebilir verileri özete ekler."""
+        for value in values:
+            encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+            self._inputs.update(b"\0data\0" + encoded.encode("utf-8"))
+
+    @property
+    def input_hash(self):
+        return self._inputs.hexdigest()
+
+    # -- Tazelik kontrolü -------------------------------------------------
+
+    def is_fresh(self):
+        """
+        Girdiler son başarılı çalıştırmayla aynıysa ve tüm çıktılar hâlâ
+        o çalıştırmanın ürettiği içerikteyse True döner.
+        """
+        if self.force:
+            return False
+        entry = load_manifest(self.manifest_path)["generators"].get(self.name)
+        if not entry or entry.get("inputs") != self.input_hash:
+            return False
+        outputs = entry.get("outputs") or {}
+        if not outputs:
+            return False
+        return all(
+            _record_matches(os.path.join(REPO_ROOT, key), record)
+            for key, record in outputs.items()
+        )
+
+    # -- Çıktılar ---------------------------------------------------------
+
+    def write_bytes(self, path, data):
+        """Çıktıyı yalnızca baytları değiştiyse yazar ve manifest'e kaydeder."""
+        changed = write_if_changed(path, data)
+        (self.written if changed else self.unchanged).append(path)
+        self._outputs[_manifest_key(path)] = _file_record(path, sha256_bytes(data))
+        return changed
+
+    def write_text(self, path, text):
+        return self.write_bytes(path, text.encode("utf-8"))
+
+    def write_json(self, path, obj, **dump_kwargs):
+        dump_kwargs.setdefault("ensure_ascii", False)
+        return self.write_text(path, json.dumps(obj, **dump_kwargs))
+
+    def write_chunks(self, path, chunks):
+        """write_bytes'ın akış hali; büyük çıktılar bellekte tutulmaz."""
+        changed, digest = write_chunks_if_changed(path, chunks)
+        (self.written if changed else self.unchanged).append(path)
+        self._outputs[_manifest_key(path)] = _file_record(path, digest)
+        return changed
+
+    def track_output(self, path):
+        """Başka bir yolla yazılmış bir çıktıyı manifest'e kaydeder."""
+        self._outputs[_manifest_key(path)] = _file_record(path)
+
+    def commit(self):
+        """Başarılı çalıştırmayı manifest'e işler."""
+        manifest = load_manifest(self.manifest_path)
+        manifest["generators"][self.name] = {
+            "inputs": self.input_hash,
+            "outputs": self._outputs,
+        }
+        data = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+        atomic_write_bytes(self.manifest_path, data.encode("utf-8"))
+
+    def report(self):
+        """Yazılan / aynı kalan çıktıları ekrana basar."""
+        for path in self.written:
+            print(f"  yazıldı: {path}")
+        for path in self.unchanged:
+            print(f"  değişmedi: {path}")
+
+    def skip_message(self):
+        print(f"{self.name}: girdiler değişmedi, atlanıyor (zorlamak için --force)")
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Üretilen JSON içeriğinin uygulamanın hızlı okuyacağı kopyaları.
+
+Next.js route'ları (badge-service.ts, admin/create-test/*) girintili
+JSON dosyalarını readFile + JSON.parse ile okur; serverless soğuk
+başlangıçta bu süre belirgindir. Her JSON çıktısının yanına şunlar
+yazılır:
+
+    <ad>.min.json      girintisiz JSON (aynı içerik)
+    <ad>.ndjson        kayıt dizisinin (badges/modules/lessons/topics/users veya
+                       kök dizi) her elemanı bir satırda; akış halinde okunur
+    <ad>.min.json.gz   .min.json'un gzip'li hali (mtime=0, deterministik)
+    <ad>.min.json.br   .min.json'un brotli'li hali ('pip install brotli'
+                       kurulu değilse atlanır)
+
+export_json() her varyantın boyutunu ve ayrıştırma (gerekiyorsa açma +
+JSON.parse eşdeğeri) süresini döner; format_report() bunu tablo olarak
+basar. Çıktılar build cache ile yazılır; baytları aynıysa dosyaya
+dokunulmaz.
+"""
+
+import gzip
+import json
+import time
+
+from .build_cache import write_if_changed
+
+# NDJSON'a satır satır yazılacak dizinin aranacağı kök anahtarlar (sırayla)
+RECORD_KEYS = ("badges", "modules", "lessons", "topics", "users")
+
+SUFFIXES = {
+    "min": ".min.json",
+    "ndjson": ".ndjson",
+    "gzip": ".min.json.gz",
+    "brotli": ".min.json.br",
+}
+EXPORT_SUFFIXES = tuple(SUFFIXES.values())
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def _brotli():
+    """brotli isteğe bağlıdır; kurulu değilse None."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def has_brotli():
+    return _brotli() is not None
+
+
+def is_export(path):
+    """badges.min.json, badges.ndjson ... export kopyası mı?"""
+    return path.endswith(EXPORT_SUFFIXES)
+
+
+def variant_path(path, variant):
+    """("public/data/badges.json", "gzip") -> "public/data/badges.min.json.gz" """
+    base = path[:-len(".json")] if path.endswith(".json") else path
+    return base + SUFFIXES[variant]
+
+
+def record_list(value):
+    """NDJSON'a yazılacak kayıt dizisi (bulunamazsa None)."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        for key in RECORD_KEYS:
+            if isinstance(value.get(key), list):
+                return value[key]
+    return None
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_variants(value):
+    """{varyant: bytes}; NDJSON kayıt dizisi yoksa, brotli kurulu değilse ilgili varyant yok."""
+    minified = _compact(value).encode("utf-8")
+    variants = {"min": minified}
+    records = record_list(value)
+    if records is not None:
+        variants["ndjson"] = "".join(_compact(r) + "\n" for r in records).encode("utf-8")
+    variants["gzip"] = gzip.compress(minified, compresslevel=GZIP_LEVEL, mtime=0)
+    brotli = _brotli()
+    if brotli is not None:
+        variants["brotli"] = brotli.compress(minified, quality=BROTLI_QUALITY)
+    return variants
+
+
+def _decompress(variant, data):
+    if variant == "gzip":
+        return gzip.decompress(data)
+    if variant == "brotli":
+        return _brotli().decompress(data)
+    return data
+
+
+def parse_seconds(variant, data, repeat=3):
+    """Varyantı belleğe almak için gereken en kısa süre (açma + ayrıştırma)."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if variant == "ndjson":
+            for line in data.splitlines():
+                json.loads(line)
+        else:
+            json.loads(_decompress(variant, data))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def export_json(path, value=None, cache=None, measure=True):
+    """
+    path'teki (veya verilen value) JSON'un varyantlarını yanına yazar.
+    cache verilirse çıktılar onun manifest'ine kaydedilir. Rapor
+    satırlarını döner: [{"variant", "path", "bytes", "parseSeconds"}],
+    ilk satır kaynağın kendisidir.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    if value is None:
+        value = json.loads(source)
+    rows = [{
+        "variant": "json",
+        "path": path,
+        "bytes": len(source),
+        "parseSeconds": parse_seconds("json", source) if measure else None,
+    }]
+    for variant, data in encode_variants(value).items():
+        target = variant_path(path, variant)
+        if cache is not None:
+            cache.write_bytes(target, data)
+        else:
+            write_if_changed(target, data, snapshot=False)
+        rows.append({
+            "variant": variant,
+            "path": target,
+            "bytes": len(data),
+            "parseSeconds": parse_seconds(variant, data) if measure else None,
+        })
+    return rows
+
+
+def format_report(rows):
+    """export_json satırlarını kaynağa göre oranlı bir tabloya çevirir."""
+    source = rows[0]["bytes"] or 1
+    lines = [f"  {rows[0]['path']}"]
+    for row in rows:
+        parse = f"{row['parseSeconds'] * 1000:9.2f} ms" if row["parseSeconds"] is not None else ""
+        lines.append(
+            f"    {row['variant']:<7} {row['bytes']:>12,} B {row['bytes'] / source:7.1%}{parse}"
+        )
+    if not has_brotli():
+        lines.append("    brotli  atlandı ('pip install brotli')")
+    return "\n".join(lines)
+
+
+def export_stage(paths, cache=None):
+    """Üreticilerin --export aşaması: her çıktıyı dışa aktarır ve raporu basar."""
+    for path in paths:
+        print(format_report(export_json(path, cache=cache)))
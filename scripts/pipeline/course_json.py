@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Syllabus (müfredat) tanımından kurs JSON'u (data/lesson-contents/*-course.json)
+üreten motor.
+
+Syllabus yalnızca başlıklardan oluşan küçük bir tanımdır:
+
+    {
+      "courseId": "course-mssql-roadmap",
+      "courseTitle": "MSSQL Kursu",
+      "description": "...",
+      "hrefBase": "/education/lessons/mssql",
+      "subject": "MSSQL veritabanı yönetimi ve geliştirme",
+      "language": "sql",
+      "codeSample": "SELECT * FROM INFORMATION_SCHEMA.TABLES;",
+      "lessonMinutes": 30,
+      "modules": [
+        {"title": "SQL Temelleri", "lessons": ["MSSQL Nedir?", ...]},
+        {"id": "module-02", "title": "...", "lessons": [{"title": "...", "href": "...", "description": "..."}]}
+      ]
+    }
+
+Ders gövdeleri (keyTakeaways, sections ...) dosyaya yazılırken tek tek
+üretilir; kurs ne kadar büyük olursa olsun bellekte en fazla bir ders
+tutulur. totalLessons, modül id'leri ve seviyeler (modüllerin ilk üçte
+biri Başlangıç, ikinci üçte biri Orta, kalanı İleri) syllabus'tan
+hesaplanır.
+"""
+
+from .json_stream import iter_json
+from .topic_render import comment_prefix
+
+COURSE_VERSION = "1.0"
+DEFAULT_LESSON_MINUTES = 30
+LEVELS = ("Başlangıç", "Orta", "İleri")
+
+
+def total_lessons(syllabus):
+    return sum(len(module["lessons"]) for module in syllabus["modules"])
+
+
+def module_level(index, count):
+    """Modülün kurs içindeki konumuna göre seviye (üçte birlik dilimler)."""
+    return LEVELS[index * len(LEVELS) // count]
+
+
+class CourseTemplate:
+    """Kursun tüm derslerinde ortak olan, önceden hesaplanmış parçalar."""
+
+    def __init__(self, syllabus):
+        self.syllabus = syllabus
+        self.href_base = syllabus["hrefBase"].rstrip("/")
+        self.minutes = syllabus.get("lessonMinutes", DEFAULT_LESSON_MINUTES)
+        self.language = syllabus.get("language", "text")
+        comment = comment_prefix(self.language)
+        self.comment = comment + " "
+        self.code_suffix = " örnek kodu\n" + syllabus.get("codeSample", f"{comment} Örnek kod buraya gelecek")
+        self.body_suffix = (
+            f" konusu {syllabus['subject']} için önemli bir konudur."
+            " Bu derste bu konuyu detaylı olarak öğreneceksin."
+        )
+
+    def render_lesson(self, module_id, level, number, lesson):
+        if isinstance(lesson, str):
+            lesson = {"title": lesson}
+        title = lesson["title"]
+        return {
+            "label": f"Ders {number}: {title}",
+            "href": lesson.get("href") or f"{self.href_base}/{module_id}/lesson-{number:02d}",
+            "description": lesson.get("description") or f"{title} konusunda detaylı bilgi ve uygulamalar.",
+            "estimatedDurationMinutes": self.minutes,
+            "level": level,
+            "keyTakeaways": [
+                f"{title} konusunu öğreneceksin",
+                "Pratik örnekler ile konuyu pekiştireceksin",
+                "Best practices ve yaygın hataları öğreneceksin"
+            ],
+            "sections": [
+                {
+                    "id": f"{module_id}-lesson-{number:02d}-intro",
+                    "title": "Giriş",
+                    "summary": f"{title} konusuna giriş.",
+                    "content": [
+                        {
+                            "type": "text",
+                            "body": title + self.body_suffix
+                        },
+                        {
+                            "type": "code",
+                            "language": self.language,
+                            "code": self.comment + title + self.code_suffix,
+                            "explanation": f"{title} için temel örnek kod."
+                        }
+                    ]
+                }
+            ]
+        }
+
+    def iter_lessons(self, module_id, level, lessons):
+        for number, lesson in enumerate(lessons, 1):
+            yield self.render_lesson(module_id, level, number, lesson)
+
+    def iter_modules(self):
+        modules = self.syllabus["modules"]
+        for index, module in enumerate(modules):
+            module_id = module.get("id") or f"module-{index + 1:02d}"
+            level = module_level(index, len(modules))
+            yield {
+                "moduleId": module_id,
+                "moduleTitle": module["title"],
+                "lessons": self.iter_lessons(module_id, level, module["lessons"]),
+            }
+
+    def document(self):
+        """Kurs JSON'u; modules ve lessons iterator olarak (bkz. json_stream)."""
+        return {
+            "version": COURSE_VERSION,
+            "totalLessons": total_lessons(self.syllabus),
+            "courseId": self.syllabus["courseId"],
+            "courseTitle": self.syllabus["courseTitle"],
+            "description": self.syllabus["description"],
+            "modules": self.iter_modules(),
+        }
+
+
+def iter_course_json(syllabus, compact=False):
+    """Kurs JSON metnini parça parça verir (compact=True: girintisiz)."""
+    return iter_json(CourseTemplate(syllabus).document(), indent=None if compact else 2)
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""
+Büyük içerik JSON dosyalarında tam ayrıştırma yapmadan yol (path) erişimi.
+
+Dosyaya ilk erişimde üst seviye yapının bayt aralıkları bir kez taranır:
+kök nesnenin anahtarları, kökteki dizilerin (ve kök dizi ise kökün)
+elemanları ve bu elemanların kısa metin alanları (moduleId, id, slug
+...). İndeks .content-cache/json-index/ altında dosyanın mtime ve
+boyutuyla birlikte saklanır; dosya değişmedikçe yeniden taranmaz.
+İstenen alt ağaç mmap üzerinden yalnızca kendi bayt aralığı okunarak
+çözülür.
+
+    with LazyJson("data/topic-lessons/dotnet-core-topics.json") as doc:
+        doc.get('modules[moduleId == "module-08-logging"]')
+        doc.get("modules[3].topics[0].label")
+        doc.field_values("modules", "moduleId")
+
+Yol sözdizimi: anahtar adları "." ile ayrılır; [n] (negatif olabilir)
+dizi elemanı, [alan == "değer"] alanı eşleşen ilk eleman, ["anahtar"]
+ad olarak yazılamayan anahtardır. İndeksin kapsamadığı derinlikler
+çözülmüş eleman üzerinde yürünür.
+
+Tarama yalnızca ayraçların eşleşmesini denetler; ayracı bozuk dosya
+satır:sütun ile reddedilir, eleman içindeki diğer sözdizimi hataları
+ancak o eleman çözülürken raporlanır.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+
+from .build_cache import CACHE_DIR, atomic_write_bytes
+
+INDEX_VERSION = 1
+INDEX_DIR = os.path.join(CACHE_DIR, "json-index")
+
+# İndekse alınan eleman alanlarının en uzun değeri (bayt)
+MAX_FIELD_BYTES = 160
+
+_TOKEN = re.compile(rb'("[^"\\]*(?:\\.[^"\\]*)*")|([\[{])|([\]}])|(:)|(,)')
+_STRING, _OPEN, _CLOSE, _COLON, _COMMA = 1, 2, 3, 4, 5
+
+_PATH_STEP = re.compile(
+    r"""\s*(?:
+        \.?([A-Za-z_$][\w$-]*)                            # anahtar
+      | \[\s*(-?\d+)\s*\]                                 # [n]
+      | \[\s*("(?:[^"\\]|\\.)*")\s*\]                     # ["anahtar"]
+      | \[\s*([A-Za-z_$][\w$-]*)\s*==\s*("(?:[^"\\]|\\.)*"|[^\]\s]+)\s*\]  # [alan == değer]
+    )""",
+    re.VERBOSE,
+)
+
+_MISSING = object()
+
+
+class JsonPathError(ValueError):
+    """Yol sözdizimi hatalı, yol dosyada yok ya da alt ağaç çözülemedi."""
+
+
+def parse_path(expr):
+    """
+    Yol ifadesini adımlara ayırır:
+    ("key", ad) | ("index", n) | ("match", alan, değer)
+    """
+    steps = []
+    pos = 0
+    expr = expr.strip()
+    while pos < len(expr):
+        m = _PATH_STEP.match(expr, pos)
+        if not m or m.end() == pos:
+            raise JsonPathError(f"yol çözümlenemedi: {expr!r} ({pos + 1}. karakter)")
+        key, index, quoted, field, value = m.groups()
+        if key is not None:
+            steps.append(("key", key))
+        elif index is not None:
+            steps.append(("index", int(index)))
+        elif quoted is not None:
+            steps.append(("key", json.loads(quoted)))
+        else:
+            try:
+                steps.append(("match", field, json.loads(value)))
+            except ValueError:
+                raise JsonPathError(f"{expr!r}: {value} bir JSON değeri değil") from None
+        pos = m.end()
+    return steps
+
+
+def format_path(steps):
+    parts = []
+    for step in steps:
+        if step[0] == "key":
+            name = step[1]
+            plain = re.fullmatch(r"[A-Za-z_$][\w$-]*", name)
+            parts.append(("." + name if parts else name) if plain else f"[{json.dumps(name, ensure_ascii=False)}]")
+        elif step[0] == "index":
+            parts.append(f"[{step[1]}]")
+        else:
+            parts.append(f"[{step[1]} == {json.dumps(step[2], ensure_ascii=False)}]")
+    return "".join(parts)
+
+
+def _location(buf, pos):
+    head = buf[:pos]
+    line = head.count(b"\n") + 1
+    col = len(head[head.rfind(b"\n") + 1:].decode("utf-8", "replace")) + 1
+    return line, col
+
+
+def _new_array():
+    # items: [başlangıç, bitiş, {kısa metin alanları}]
+    return {"items": []}
+
+
+def scan(buf, path="<json>"):
+    """
+    buf (bytes/mmap) için indeks: {"root": "object" | "array" | "value",
+    "keys": {anahtar: [başlangıç, bitiş]}, "arrays": {anahtar: {"items": ...}}}.
+    Kök dizinin elemanları "" anahtarı altındadır.
+    """
+    def fail(pos, message):
+        line, col = _location(buf, pos)
+        raise JsonPathError(f"{path}:{line}:{col}: {message}")
+
+    index = {"root": "value", "keys": {}, "arrays": {}}
+    depth = 0
+    opened = []          # açık ayraçlar (b"{" / b"[")
+    array_depth = None   # indekslenen dizinin elemanlarının derinliği
+    array = None
+    item_start = 0
+    item_fields = None   # eleman nesneyse kısa metin alanları
+    key = None           # kök nesnede son anahtar
+    value_start = 0
+    field = None         # eleman nesnesinde son anahtar
+    pending = None       # (alan, başlangıç, bitiş) değeri metin olan alan
+    expect_key = False
+
+    for m in _TOKEN.finditer(buf):
+        kind = m.lastindex
+        if depth == 1 and index["root"] == "object":
+            if kind == _STRING and key is None:
+                key = json.loads(m.group(1))
+            elif kind == _COLON:
+                value_start = m.end()
+            elif kind == _COMMA or kind == _CLOSE:
+                if key is not None:
+                    index["keys"][key] = [value_start, m.start()]
+                key = None
+            elif kind == _OPEN and m.group(2) == b"[":
+                array = index["arrays"][key] = _new_array()
+                array_depth = 2
+                item_start = m.end()
+        elif depth == array_depth:
+            if kind == _COMMA or kind == _CLOSE:
+                if kind == _COMMA or buf[item_start:m.start()].strip():
+                    array["items"].append([item_start, m.start(), item_fields or {}])
+                item_start = m.end()
+                item_fields = None
+                if kind == _CLOSE:
+                    array_depth = None
+            elif kind == _OPEN and m.group(2) == b"{":
+                item_fields = {}
+                expect_key = True
+                pending = None
+        elif array_depth is not None and depth == array_depth + 1:
+            if item_fields is not None:
+                if kind == _STRING:
+                    if expect_key:
+                        field = m.group(1)
+                    elif m.end() - m.start() <= MAX_FIELD_BYTES:
+                        pending = (field, m.start(), m.end())
+                elif kind == _COLON:
+                    expect_key = False
+                    pending = None
+                elif kind == _COMMA or kind == _CLOSE:
+                    if pending is not None:
+                        name, start, end = pending
+                        item_fields[json.loads(name)] = json.loads(buf[start:end])
+                    pending = None
+                    expect_key = True
+                elif kind == _OPEN:
+                    pending = None
+
+        if kind == _OPEN:
+            opened.append(m.group(2))
+            if depth == 0:
+                if m.group(2) == b"{":
+                    index["root"] = "object"
+                else:
+                    index["root"] = "array"
+                    array = index["arrays"][""] = _new_array()
+                    array_depth = 1
+                    item_start = m.end()
+            depth += 1
+        elif kind == _CLOSE:
+            if not opened:
+                fail(m.start(), "fazladan kapanış ayracı")
+            expected = b"}" if opened.pop() == b"{" else b"]"
+            if m.group(3) != expected:
+                fail(m.start(), f"'{expected.decode()}' bekleniyordu")
+            depth -= 1
+    if depth:
+        fail(len(buf), "dosya beklenmedik şekilde bitti (kapanmamış ayraç)")
+    return index
+
+
+def _index_path(path):
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(INDEX_DIR, f"{os.path.basename(path)}.{digest}.json")
+
+
+def load_index(path, buf=None, stat=None):
+    """
+    Dosyanın indeksi; mtime ve boyut tutan önbellek varsa ondan, yoksa
+    buf taranarak oluşturulup kaydedilir.
+    """
+    stat = stat or os.stat(path)
+    cache_path = _index_path(path)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if (cached.get("version") == INDEX_VERSION
+                and cached.get("mtime") == stat.st_mtime_ns
+                and cached.get("size") == stat.st_size):
+            return cached["index"]
+    except (OSError, ValueError):
+        pass
+
+    if buf is None:
+        with open(path, "rb") as f:
+            buf = f.read()
+    index = scan(buf, path)
+    payload = {
+        "version": INDEX_VERSION,
+        "path": os.path.abspath(path),
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "index": index,
+    }
+    try:
+        atomic_write_bytes(cache_path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    except OSError:
+        pass  # Önbellek yazılamazsa indeks yine de kullanılır
+    return index
+
+
+def _walk(value, steps, path, prefix=()):
+    """Çözülmüş değer üzerinde kalan adımlar; prefix hata mesajındaki yol içindir."""
+    for n, step in enumerate(steps):
+        where = lambda: f"{path}: {format_path([*prefix, *steps[:n + 1]])}"  # noqa: E731
+        if step[0] == "key":
+            if not isinstance(value, dict) or step[1] not in value:
+                raise JsonPathError(f"{where()} bulunamadı")
+            value = value[step[1]]
+        elif step[0] == "index":
+            if not isinstance(value, list) or not -len(value) <= step[1] < len(value):
+                raise JsonPathError(f"{where()} bulunamadı")
+            value = value[step[1]]
+        else:
+            _, field, expected = step
+            if not isinstance(value, list):
+                raise JsonPathError(f"{where()}: dizi değil")
+            for item in value:
+                if isinstance(item, dict) and item.get(field, _MISSING) == expected:
+                    value = item
+                    break
+            else:
+                raise JsonPathError(f"{where()} bulunamadı")
+    return value
+
+
+class LazyJson:
+    """Bir JSON dosyası üzerinde mmap ve bayt aralığı indeksi ile yol erişimi."""
+
+    def __init__(self, path):
+        self.path = path
+        stat = os.stat(path)
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        self.index = load_index(path, self._map, stat)
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def decode(self, start, end):
+        """[start, end) bayt aralığındaki JSON değerini çözer."""
+        try:
+            return json.loads(self._map[start:end])
+        except ValueError as e:
+            offset = start + getattr(e, "pos", 0)
+            line, col = _location(self._map, offset)
+            message = getattr(e, "msg", str(e))
+            raise JsonPathError(f"{self.path}:{line}:{col}: {message}") from None
+
+    def items(self, key=""):
+        """Indekslenmiş dizinin eleman kayıtları: [(başlangıç, bitiş, alanlar)]."""
+        array = self.index["arrays"].get(key)
+        if array is None:
+            raise JsonPathError(f"{self.path}: {key or 'kök'} indekslenmiş bir dizi değil")
+        return array["items"]
+
+    def field_values(self, key, field):
+        """Dizinin her elemanındaki kısa metin alanı (yoksa None); eleman çözülmez."""
+        return [fields.get(field) for _, _, fields in self.items(key)]
+
+    def find(self, key, field, value):
+        """field == value olan ilk elemanın sırası ya da None."""
+        for i, (_, _, fields) in enumerate(self.items(key)):
+            if fields.get(field, _MISSING) == value:
+                return i
+        return None
+
+    def _item(self, key, step):
+        """Indekslenmiş dizide [n] ya da [alan == değer] adımına denk gelen eleman."""
+        items = self.items(key)
+        if step[0] == "index":
+            n = step[1]
+            return self.decode(*items[n][:2]) if -len(items) <= n < len(items) else _MISSING
+        _, field, expected = step
+        found = self.find(key, field, expected) if isinstance(expected, str) else None
+        if found is not None:
+            return self.decode(*items[found][:2])
+        # Alan indekste yoksa (uzun metin, sayı ...) elemanlar tek tek çözülür
+        for start, end, fields in items:
+            if field in fields:
+                continue
+            item = self.decode(start, end)
+            if isinstance(item, dict) and item.get(field, _MISSING) == expected:
+                return item
+        return _MISSING
+
+    def get(self, expr, default=_MISSING):
+        """Yol ifadesindeki değer; yoksa default (verilmediyse JsonPathError)."""
+        steps = parse_path(expr) if isinstance(expr, str) else list(expr)
+        try:
+            return self._resolve(steps)
+        except JsonPathError:
+            if default is _MISSING:
+                raise
+            return default
+
+    def _resolve(self, steps):
+        index = self.index
+        if not steps:
+            return self.decode(0, len(self._map))
+        if index["root"] == "array":
+            if steps[0][0] == "key":
+                raise JsonPathError(f"{self.path}: kök bir dizi, {format_path(steps[:1])} bulunamadı")
+            value, rest, used = self._item("", steps[0]), steps[1:], steps[:1]
+        elif index["root"] == "object" and steps[0][0] == "key":
+            key = steps[0][1]
+            if key not in index["keys"]:
+                raise JsonPathError(f"{self.path}: {format_path(steps[:1])} bulunamadı")
+            if key in index["arrays"] and len(steps) > 1 and steps[1][0] != "key":
+                value, rest, used = self._item(key, steps[1]), steps[2:], steps[:2]
+            else:
+                value, rest, used = self.decode(*index["keys"][key]), steps[1:], steps[:1]
+        else:
+            value, rest, used = self.decode(0, len(self._map)), steps, []
+        if value is _MISSING:
+            raise JsonPathError(f"{self.path}: {format_path(used)} bulunamadı")
+        return _walk(value, rest, self.path, used) if rest else value
+
+
+def read_path(path, expr, default=_MISSING):
+    """Tek seferlik erişim: LazyJson(path).get(expr, default)."""
+    with LazyJson(path) as doc:
+        return doc.get(expr, default)
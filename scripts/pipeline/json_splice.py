@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Büyük kurs JSON dosyalarında tek bir modülü yerinde güncelleme (upsert).
+
+Dosya json.load + json.dump(indent=2) ile baştan yazılmaz. Üst seviye
+nesne ve "modules" dizisi taranarak her modülün metin aralığı bulunur;
+yalnızca eklenen/değişen modülün metni dosyaya eklenir, diğer modüller
+olduğu gibi (aynı baytlarla) kalır. Toplam ders sayısı artırılmaz, her
+seferinde modüllerdeki derslerden yeniden hesaplanır. Aynı modülü iki kez
+eklemek dosyayı değiştirmez.
+
+Modüller çözülmez: her birinin yalnızca ayraçları eşleştirilir, bu
+sırada kimlik alanı (moduleId) ve ders dizisinin eleman sayısı okunur.
+Upsert'ün maliyeti böylece modül nesnelerinin değil dosya metninin tek
+bir taranmasıdır (bkz. json_index.py'deki aynı yaklaşım).
+"""
+
+import json
+import re
+
+from .build_cache import write_if_changed
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+_CLOSERS = {"{": "}", "[": "]"}
+# Sonraki ayraca kadar her şey (metinler içindeki ayraçlar dahil) tek eşleşmede atlanır
+_STRUCT = re.compile(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}])')
+# İki ayraç arasındaki boşluğun öğeleri
+_TOKEN = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")|(:)|(,)')
+_STRING, _COLON, _COMMA = 1, 2, 3
+
+
+class SpliceError(ValueError):
+    """Dosya yapısı beklenen biçimde değil; mesaj satır:sütun içerir."""
+
+
+def _location(text, pos):
+    line = text.count("\n", 0, pos) + 1
+    col = pos - (text.rfind("\n", 0, pos) + 1) + 1
+    return line, col
+
+
+def _fail(path, text, pos, message):
+    line, col = _location(text, pos)
+    raise SpliceError(f"{path}:{line}:{col}: {message}")
+
+
+def _skip_ws(text, pos):
+    return _WS.match(text, pos).end()
+
+
+def _decode(path, text, pos):
+    try:
+        return _DECODER.raw_decode(text, pos)
+    except json.JSONDecodeError as e:
+        raise SpliceError(f"{path}:{e.lineno}:{e.colno}: {e.msg}") from None
+
+
+def _expect(path, text, pos, char):
+    pos = _skip_ws(text, pos)
+    if text[pos:pos + 1] != char:
+        _fail(path, text, pos, f"'{char}' bekleniyordu")
+    return pos + 1
+
+
+def _skip_value(path, text, pos, key=None, items_key=None):
+    """
+    pos'taki değerin bitişi ve özeti: (bitiş, {"id": key değeri, "count":
+    items_key dizisinin uzunluğu}). Nesne ve diziler çözülmez; _STRUCT
+    metinleri atlayıp yalnızca ayraçlarda durur. Özet için yalnızca
+    nesnenin kendi alanları ile ders dizisinin elemanları arasındaki
+    kısa boşluklar tokenize edilir.
+    """
+    if text[pos:pos + 1] not in _CLOSERS:
+        _, end = _decode(path, text, pos)
+        return end, {}
+    info = {}
+    opened = []
+    field = None
+    expect_key = False
+    counting = None  # items_key dizisinin açılış ayracından sonraki konum
+    gap = pos
+    while True:
+        m = _STRUCT.match(text, gap)
+        if m is None:
+            _fail(path, text, gap, "dosya beklenmedik şekilde bitti (kapanmamış ayraç ya da metin)")
+        at = m.start(1)
+        bracket = m.group(1)
+        depth = len(opened)
+        if depth > 2 or (depth == 2 and counting is None):
+            # Derin alt ağaç: yalnızca ayraçlar eşleştirilir
+            if bracket in _CLOSERS:
+                opened.append(bracket)
+            elif bracket != _CLOSERS[opened.pop()]:
+                _fail(path, text, at, "ayraçlar eşleşmiyor")
+            gap = at + 1
+            continue
+        if depth == 1 and opened[0] == "{":
+            for token in _TOKEN.finditer(text, gap, at):
+                kind = token.lastindex
+                if kind == _STRING and expect_key:
+                    field = json.loads(token.group(1))
+                elif kind == _COLON:
+                    expect_key = False
+                    if field == key:
+                        info["id"], _ = _decode(path, text, _skip_ws(text, token.end()))
+                elif kind == _COMMA:
+                    expect_key = True
+                    field = None
+        elif depth == 2 and counting is not None:
+            info["count"] += sum(token.lastindex == _COMMA for token in _TOKEN.finditer(text, gap, at))
+
+        if bracket in _CLOSERS:
+            if depth == 0:
+                expect_key = bracket == "{"
+            elif depth == 1 and opened[0] == "{" and not expect_key and field == items_key and bracket == "[":
+                counting = at + 1
+                info["count"] = 0
+            opened.append(bracket)
+        else:
+            if not opened or bracket != _CLOSERS[opened.pop()]:
+                _fail(path, text, at, "ayraçlar eşleşmiyor")
+            if counting is not None and len(opened) == 1:
+                if _skip_ws(text, counting) < at:
+                    info["count"] += 1
+                counting = None
+            if not opened:
+                return at + 1, info
+        gap = at + 1
+
+
+class CourseLayout:
+    """
+    Üst seviye nesnenin anahtar aralıkları ve liste elemanlarının aralıkları.
+
+    values: anahtar -> (başlangıç, bitiş) metin aralığı
+    items:  [(başlangıç, bitiş, özet)] liste anahtarındaki her eleman;
+            özet _skip_value'nun döndürdüğü {"id", "count"} sözlüğü
+    """
+
+    def __init__(self, path, text, list_key, key="moduleId", items_key="lessons"):
+        self.path = path
+        self.text = text
+        self.list_key = list_key
+        self.key = key
+        self.items_key = items_key
+        self.values = {}
+        self.key_columns = []
+        self.items = []
+        self.list_open = None
+        self.list_close = None
+        self._scan()
+
+    def _scan(self):
+        path, text = self.path, self.text
+        pos = _expect(path, text, 1 if text.startswith("\ufeff") else 0, "{")
+        pos = _skip_ws(text, pos)
+        if text[pos:pos + 1] == "}":
+            return
+        while True:
+            pos = _skip_ws(text, pos)
+            key_start = pos
+            key, pos = _decode(path, text, pos)
+            if not isinstance(key, str):
+                _fail(path, text, key_start, "nesne anahtarı bekleniyordu")
+            self.key_columns.append(_location(text, key_start)[1] - 1)
+            pos = _skip_ws(text, _expect(path, text, pos, ":"))
+            value_start = pos
+            if key == self.list_key:
+                pos = self._scan_list(pos)
+            else:
+                pos, _ = _skip_value(path, text, pos)
+            self.values[key] = (value_start, pos)
+            pos = _skip_ws(text, pos)
+            if text[pos:pos + 1] == ",":
+                pos += 1
+                continue
+            if text[pos:pos + 1] == "}":
+                return
+            _fail(path, text, pos, "',' veya '}' bekleniyordu")
+
+    def _scan_list(self, pos):
+        path, text = self.path, self.text
+        if text[pos:pos + 1] != "[":
+            _fail(path, text, pos, f"'{self.list_key}' bir dizi olmalı")
+        self.list_open = pos
+        pos = _skip_ws(text, pos + 1)
+        if text[pos:pos + 1] == "]":
+            self.list_close = pos
+            return pos + 1
+        while True:
+            pos = _skip_ws(text, pos)
+            start = pos
+            pos, info = _skip_value(path, text, pos, self.key, self.items_key)
+            self.items.append((start, pos, info))
+            pos = _skip_ws(text, pos)
+            if text[pos:pos + 1] == ",":
+                pos += 1
+                continue
+            if text[pos:pos + 1] == "]":
+                self.list_close = pos
+                return pos + 1
+            _fail(path, text, pos, "',' veya ']' bekleniyordu")
+
+    def indent_unit(self):
+        """Dosyanın girinti birimi: üst seviye anahtarların sütunu (en az 2)."""
+        return max(2, min(self.key_columns)) if self.key_columns else 2
+
+    def item_indent(self):
+        """Liste elemanlarının satır başı girintisi."""
+        if self.items:
+            start = self.items[0][0]
+            line_start = self.text.rfind("\n", 0, start) + 1
+            prefix = self.text[line_start:start]
+            if not prefix.strip():
+                return prefix
+        return " " * (self.indent_unit() * 2)
+
+
+def _render(obj, indent_unit, base_indent):
+    rendered = json.dumps(obj, ensure_ascii=False, indent=indent_unit)
+    return rendered.replace("\n", "\n" + base_indent)
+
+
+def upsert_module(
+    path,
+    module,
+    key="moduleId",
+    list_key="modules",
+    items_key="lessons",
+    total_key="totalLessons",
+):
+    """
+    path'teki kurs dosyasına modülü key (moduleId) ile ekler ya da var olanı
+    değiştirir. Aynı id'ye sahip sonraki kopyalar silinir. total_key
+    dosyada varsa tüm modüllerdeki items_key uzunluklarından yeniden
+    hesaplanır. (dosya değişti mi, "inserted" | "replaced") döner.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+
+    layout = CourseLayout(path, text, list_key, key, items_key)
+    if layout.list_open is None:
+        raise SpliceError(f"{path}: '{list_key}' anahtarı bulunamadı")
+
+    module_id = module[key]
+    matches = [
+        i for i, (_, _, info) in enumerate(layout.items)
+        if "id" in info and info["id"] == module_id
+    ]
+
+    unit = layout.indent_unit()
+    indent = layout.item_indent()
+    rendered = _render(module, unit, indent)
+
+    # (başlangıç, bitiş, yeni metin) düzenlemeleri; başlangıç sırasıyla uygulanır
+    edits = []
+    if matches:
+        action = "replaced"
+        first = layout.items[matches[0]]
+        edits.append((first[0], first[1], rendered))
+        for i in matches[1:]:
+            # Kopyayı önündeki virgül ve boşlukla birlikte sil
+            prev_end = layout.items[i - 1][1]
+            edits.append((prev_end, layout.items[i][1], ""))
+    elif layout.items:
+        action = "inserted"
+        last_end = layout.items[-1][1]
+        edits.append((last_end, last_end, ",\n" + indent + rendered))
+    else:
+        action = "inserted"
+        close_line = text.rfind("\n", 0, layout.list_close) + 1
+        close_indent = text[close_line:layout.list_close]
+        if close_indent.strip():
+            close_indent = ""
+        edits.append((
+            layout.list_open + 1,
+            layout.list_close,
+            "\n" + indent + rendered + "\n" + close_indent,
+        ))
+
+    if total_key in layout.values:
+        total = len(module.get(items_key) or []) + sum(
+            info.get("count", 0) for i, (_, _, info) in enumerate(layout.items)
+            if i not in matches
+        )
+        start, end = layout.values[total_key]
+        edits.append((start, end, str(total)))
+
+    edits.sort(key=lambda e: e[0])
+    parts = []
+    pos = 0
+    for start, end, replacement in edits:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+
+    changed = write_if_changed(path, "".join(parts).encode("utf-8"))
+    return changed, action
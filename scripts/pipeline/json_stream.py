@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Artımlı (incremental) JSON kodlayıcı.
+
+iter_json(), json.dumps(value, ensure_ascii=False, indent=...) ile aynı
+metni parça parça verir. Değer ağacındaki iterator'lar (generator, map
+...) dizi olarak kodlanır ve ancak yazılırken tüketilir; böylece binlerce
+elemanlı bir dizi hiçbir zaman bellekte birikmez. Iterator içermeyen
+alt ağaçlar tek json.dumps çağrısıyla kodlanır.
+
+    doc = {"version": "1.0", "modules": (render(m) for m in syllabus)}
+    cache.write_chunks(path, iter_json(doc, indent=2))
+
+indent=None kompakt çıktı verir (", " / ": " yerine "," / ":").
+
+Çok sayıda küçük kayıttan oluşan diziler için EncodedArray, elemanları
+önceden (ör. NumPy sütunlarından) kodlanmış metin olarak alır;
+object_layout() ve dumps() kayıtları iter_json'un yazacağı biçimde kurmak
+için gereken sabit parçaları verir.
+"""
+
+import json
+from collections.abc import Iterator
+from json.encoder import encode_basestring as _quote
+
+_END = object()
+
+
+class EncodedArray:
+    """
+    Elemanları önceden kodlanmış dizi. render(indent, level, sep), level
+    düzeyindeki elemanları sep ile birleştirilmiş metin parçaları olarak
+    üretir; iter_json parçaların arasına da sep koyar.
+    """
+
+    def __init__(self, render):
+        self.render = render
+
+
+def _is_lazy(value):
+    return isinstance(value, (Iterator, EncodedArray))
+
+
+def dumps(value, indent=None, level=0):
+    """value'nun iter_json'da level derinliğinde yazılacak metni."""
+    if indent is None:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    text = json.dumps(value, ensure_ascii=False, indent=indent)
+    if level:
+        text = text.replace("\n", "\n" + " " * (indent * level))
+    return text
+
+
+def _layout(indent, level):
+    """(açılıştan sonra, elemanlar arası, kapanıştan önce, anahtar ayracı)"""
+    if indent is None:
+        return "", ",", "", ":"
+    inner = "\n" + " " * (indent * (level + 1))
+    return inner, "," + inner, "\n" + " " * (indent * level), ": "
+
+
+def object_layout(keys, indent=None, level=0):
+    """
+    keys sırasındaki nesnenin sabit parçaları: parts[i] i. değerden önce,
+    parts[-1] kapanışta gelir. Değerler dumps(değer, indent, level + 1) ile
+    kodlanırsa birleşim dumps(nesne, indent, level) ile aynıdır.
+    """
+    open_, sep, close, key_sep = _layout(indent, level)
+    parts = [("{" + open_ if i == 0 else sep) + _quote(key) + key_sep for i, key in enumerate(keys)]
+    parts.append(close + "}")
+    return parts
+
+
+def iter_json(value, indent=None, _level=0):
+    """value'yu JSON metni parçaları olarak verir (bkz. modül açıklaması)."""
+    if isinstance(value, dict):
+        if not value or not any(_is_lazy(v) for v in value.values()):
+            yield dumps(value, indent, _level)
+            return
+        open_, sep, close, key_sep = _layout(indent, _level)
+        prefix = "{" + open_
+        for key, item in value.items():
+            yield prefix + _quote(key) + key_sep
+            yield from iter_json(item, indent, _level + 1)
+            prefix = sep
+        yield close + "}"
+    elif isinstance(value, EncodedArray):
+        open_, sep, close, _ = _layout(indent, _level)
+        empty = True
+        for text in value.render(indent, _level + 1, sep):
+            if text:
+                yield "[" + open_ if empty else sep
+                yield text
+                empty = False
+        yield "[]" if empty else close + "]"
+    elif _is_lazy(value):
+        first = next(value, _END)
+        if first is _END:
+            yield "[]"
+            return
+        open_, sep, close, _ = _layout(indent, _level)
+        yield "[" + open_
+        yield from iter_json(first, indent, _level + 1)
+        for item in value:
+            yield sep
+            yield from iter_json(item, indent, _level + 1)
+        yield close + "]"
+    else:
+        yield dumps(value, indent, _level)
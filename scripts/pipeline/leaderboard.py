@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+"""
+Liderlik tablosunun (leaderboard_entries) çevrimdışı hesaplanması.
+
+/api/competition/leaderboard her istekte dönemin tüm quiz/test/live
+coding/bug fix/hackaton denemelerini, userEarnedPoint toplamlarını ve
+rozetleri çekip 100'e kadar upsert yapar. Bu motor aynı hesabı deneme
+akışları üzerinde toplu yapar:
+
+    girdi   data/seed-data/seed-data-for-profile.json biçimi ya da
+            COPY (FORMAT csv) betiği (generate-profile-seed --format copy)
+    kova    (dönem, dönem anahtarı, kullanıcı); dönemler günlük, haftalık
+            (pazartesi), aylık; hepsi UTC
+    kısmi   kova başına tür (quiz/test/...) için sayı, toplam, en yüksek;
+            puan toplamı; geçilen (skor >= 70) kurslar
+    sıra    puan, compositeScore, topicCompletion (azalan), sonra userId
+
+Skor kuralları route ile aynıdır: metrics'ten codeQuality ?? score
+(hackaton'da projectScore ?? score) okunur, 0'dan büyük skorlar 100'le
+sınırlanıp ortalamaya girer, quiz skorları sayıysa sayılır; compositeScore
+topicCompletion ile test/liveCoding/bugFix/hackaton ortalamalarının
+ortalamasıdır. Gruplama NumPy ile vektörel yapılır (np.unique + bincount).
+
+Kısmi toplamlar bir durum dosyasında (.npz) tutulur. fold() yalnızca
+akış başına filigrandan (en son katlanan completedAt/earnedAt) yeni
+satırları ekler ve değişen kovaları döner; yeni bir günün denemeleri
+geçmişi yeniden hesaplamadan eklenir ve yalnızca o günün/haftanın/ayın
+sıralaması yeniden yazılır. Filigrandan eski (geç gelen) satırlar
+atlanır; bunun için durum baştan kurulmalıdır.
+
+NumPy isteğe bağlıdır; yalnızca bu motor için gerekir.
+"""
+
+import datetime
+import io
+import json
+import math
+import os
+
+from . import REPO_ROOT
+from .build_cache import CACHE_DIR, atomic_write_bytes
+from .pg_copy import DEFAULT_BATCH_SIZE, copy_statement, iter_batches, iter_copy_rows, quote_ident
+from .question_bank import source_paths
+from .sql_rows import SqlParseError, read_rows
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+KINDS = ("quiz", "test", "liveCoding", "bugFix", "hackaton")
+PERIODS = ("daily", "weekly", "monthly")
+PASSING_SCORE = 70
+HUNDRED = 100
+DEFAULT_TOP = 100
+DAY_MS = 86_400_000
+
+# Tür: (seed JSON anahtarı, tablo, metrics'te sırayla denenecek skor alanları)
+STREAMS = {
+    "quiz": ("quizAttempts", "quiz_attempts", None),
+    "test": ("testAttempts", "test_attempts", ("score",)),
+    "liveCoding": ("liveCodingAttempts", "live_coding_attempts", ("codeQuality", "score")),
+    "bugFix": ("bugFixAttempts", "bug_fix_attempts", ("codeQuality", "score")),
+    "hackaton": ("hackatonAttempts", "hackaton_attempts", ("projectScore", "score")),
+    # Puanlar: user_earned_points varsa o, yoksa rozetlerin badges.json puanı
+    "points": ("userEarnedPoints", "user_earned_points", None),
+    "badges": ("userBadges", "user_badges", None),
+}
+_TIME_FIELDS = {"points": "earnedAt", "badges": "earnedAt"}
+
+LEADERBOARD_TABLE = "leaderboard_entries"
+LEADERBOARD_COLUMNS = (
+    "id", "userId", "period", "periodDate", "quizCount", "averageScore",
+    "totalScore", "highestScore", "rank", "points", "updatedAt",
+)
+
+STATE_PATH = os.path.join(CACHE_DIR, "leaderboard", "state.npz")
+STATE_VERSION = 1
+
+# Kova anahtarı: dönem << 60 | dönem anahtarı (gün/ay sayısı) << 32 | kullanıcı
+_PERIOD_SHIFT = 60
+_USER_BITS = 32
+_USER_MASK = (1 << _USER_BITS) - 1
+_PERIOD_KEY_MASK = (1 << (_PERIOD_SHIFT - _USER_BITS)) - 1
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("leaderboard motoru için NumPy gerekli: pip install numpy")
+
+
+def safe_number(value):
+    """route.ts safeNumber: sayı ya da sayıya çevrilebilen metin, yoksa 0."""
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, (int, float)):
+        return 0 if math.isnan(value) else value
+    if isinstance(value, str):
+        try:
+            parsed = float(value) if value.strip() else 0
+        except ValueError:
+            return 0
+        return parsed if math.isfinite(parsed) else 0
+    return 0
+
+
+def metric_score(metrics, fields):
+    """metrics?.a ?? metrics?.b ... -> safeNumber"""
+    if isinstance(metrics, str):
+        try:
+            metrics = json.loads(metrics)
+        except ValueError:
+            metrics = None
+    if not isinstance(metrics, dict):
+        return 0
+    for field in fields:
+        if metrics.get(field) is not None:
+            return safe_number(metrics[field])
+    return 0
+
+
+def js_round2(values):
+    """Math.round(x * 100) / 100 (yarımlar yukarı yuvarlanır, np.round gibi çifte değil)."""
+    return np.floor(values * 100 + 0.5) / 100
+
+
+def period_date(period, key):
+    """Kova anahtarı -> route'un periodDate metni."""
+    if period == "monthly":
+        return f"{1970 + key // 12}-{key % 12 + 1:02d}"
+    day = datetime.date(1970, 1, 1) + datetime.timedelta(days=int(key))
+    if period == "daily":
+        return day.isoformat()
+    # Yıl pazartesinin takvim yılıdır (route'taki gibi; ISO yılı değil)
+    return f"{day.year}-W{day.isocalendar()[1]:02d}"
+
+
+def period_keys(ms):
+    """Epoch ms -> (gün, haftanın pazartesi günü, ay) sayıları."""
+    days = ms // DAY_MS
+    # 1970-01-01 perşembedir: (gün + 3) % 7 pazartesi için 0
+    monday = days - (days + 3) % 7
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    return days, monday, months
+
+
+def bucket_keys(ms, users):
+    """Her satır için üç dönemin kova anahtarları (dönem sırasıyla art arda)."""
+    return np.concatenate([
+        (np.int64(p) << _PERIOD_SHIFT) | (key << _USER_BITS) | users
+        for p, key in enumerate(period_keys(ms))
+    ])
+
+
+def parse_ms(texts):
+    """ISO 8601 metinleri (UTC) -> epoch ms dizisi."""
+    texts = [t[:-1] if t.endswith("Z") else t for t in texts]
+    return np.array(texts, dtype="datetime64[ms]").astype(np.int64)
+
+
+# -- Girdi -------------------------------------------------------------------
+
+def read_streams(paths):
+    """Girdi dosyalarından {akış: [kayıt]}; .json seed biçimi, diğerleri COPY betiği."""
+    streams = {name: [] for name in STREAMS}
+    by_table = {table: name for name, (_, table, _) in STREAMS.items()}
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+            for name, (key, _, _) in STREAMS.items():
+                streams[name].extend(doc.get(key) or [])
+        else:
+            for table, row in iter_copy_rows(path, by_table):
+                streams[by_table[table]].append(row)
+    return streams
+
+
+def load_catalog(paths=None, warn=None):
+    """Seed SQL'lerinden (quizId -> courseId, kurs sayısı); topicCompletion için."""
+    quiz_courses, courses = {}, set()
+    for path in paths if paths is not None else [p for p in source_paths() if p.endswith(".sql")]:
+        def on_error(error, path=path):
+            if warn:
+                warn(f"{path}: {error}")
+
+        try:
+            for table, row in read_rows(os.path.join(REPO_ROOT, path), tables=["quizzes", "courses"],
+                                        on_error=on_error):
+                if not isinstance(row.get("id"), str):
+                    continue
+                if table == "courses":
+                    courses.add(row["id"])
+                elif isinstance(row.get("courseId"), str):
+                    quiz_courses.setdefault(row["id"], row["courseId"])
+        except SqlParseError as e:
+            on_error(e)
+    return quiz_courses, len(courses)
+
+
+# -- Kısmi toplamlar ---------------------------------------------------------
+
+class Rollup:
+    """
+    Kova başına kısmi toplamlar. key sıralı ve tekildir; count/total/highest
+    (kova, tür) matrisleri, points kova başına puan toplamı, topics
+    (kova, kurs) çiftleridir. users/courses dizinleri metin kimliklere çevirir.
+    """
+
+    def __init__(self):
+        require_numpy()
+        self.users, self._user_index = [], {}
+        self.courses, self._course_index = [], {}
+        self.key = np.zeros(0, np.int64)
+        self.count = np.zeros((0, len(KINDS)), np.int64)
+        self.total = np.zeros((0, len(KINDS)), np.float64)
+        self.highest = np.zeros((0, len(KINDS)), np.float64)
+        self.points = np.zeros(0, np.int64)
+        self.topics = np.zeros((0, 2), np.int64)
+        self.watermark = {}
+
+    # -- Durum dosyası -------------------------------------------------------
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        rollup = cls()
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != STATE_VERSION:
+                raise ValueError(f"{path}: desteklenmeyen durum sürümü {meta.get('version')}")
+            for name in ("key", "count", "total", "highest", "points", "topics"):
+                setattr(rollup, name, data[name])
+            rollup.users = data["users"].tolist()
+            rollup.courses = data["courses"].tolist()
+        rollup._user_index = {u: i for i, u in enumerate(rollup.users)}
+        rollup._course_index = {c: i for i, c in enumerate(rollup.courses)}
+        rollup.watermark = meta["watermark"]
+        return rollup
+
+    def save(self, path=STATE_PATH):
+        buf = io.BytesIO()
+        np.savez_compressed(
+            buf,
+            key=self.key, count=self.count, total=self.total, highest=self.highest,
+            points=self.points, topics=self.topics,
+            users=np.array(self.users, dtype=np.str_),
+            courses=np.array(self.courses, dtype=np.str_),
+            meta=np.array(json.dumps({"version": STATE_VERSION, "watermark": self.watermark})),
+        )
+        atomic_write_bytes(path, buf.getvalue())
+
+    # -- Katlama -------------------------------------------------------------
+
+    def _index(self, index, names, value):
+        i = index.get(value)
+        if i is None:
+            i = index[value] = len(names)
+            names.append(value)
+        return i
+
+    def _rows_for(self, keys):
+        """Durumu tekil keys'i de içerecek şekilde büyütür; keys'in satır indeksleri."""
+        merged = np.union1d(self.key, keys)
+        if len(merged) != len(self.key):
+            pos = np.searchsorted(merged, self.key)
+            for name in ("count", "total", "highest", "points"):
+                old = getattr(self, name)
+                grown = np.zeros((len(merged),) + old.shape[1:], old.dtype)
+                grown[pos] = old
+                setattr(self, name, grown)
+            self.key = merged
+        return np.searchsorted(self.key, keys)
+
+    def _fresh(self, stream, rows, time_field):
+        """Filigrandan yeni satırlar ve zamanları (ms); filigranı ilerletir."""
+        rows = [r for r in rows if r.get("userId") and r.get(time_field)]
+        if not rows:
+            return [], np.zeros(0, np.int64)
+        ms = parse_ms([r[time_field] for r in rows])
+        if ms.min() < 0:
+            raise ValueError(f"{stream}: 1970 öncesi zaman damgası")
+        mark = self.watermark.get(stream)
+        if mark is not None:
+            keep = np.nonzero(ms > mark)[0]
+            rows, ms = [rows[i] for i in keep.tolist()], ms[keep]
+        if len(ms):
+            self.watermark[stream] = max(int(ms.max()), mark if mark is not None else 0)
+        return rows, ms
+
+    def _fold_attempts(self, k, kind, rows, ms, quiz_courses):
+        fields = STREAMS[kind][2]
+        users = np.fromiter((self._index(self._user_index, self.users, r["userId"]) for r in rows),
+                            np.int64, len(rows))
+        if fields is None:
+            # Quiz skoru sayıysa sayılır (0 dahil); COPY'den metin gelir
+            raw = [r.get("score") for r in rows]
+            counted = np.array([s is not None and not isinstance(s, bool) for s in raw], bool)
+            score = np.array([safe_number(s) for s in raw], np.float64)
+            passed = counted & (score >= PASSING_SCORE)
+        else:
+            score = np.array([metric_score(r.get("metrics"), fields) for r in rows], np.float64)
+            counted = score > 0
+            passed = score >= PASSING_SCORE
+            score = np.minimum(score, HUNDRED)
+        course = np.array([
+            self._index(self._course_index, self.courses, quiz_courses[r.get("quizId")])
+            if r.get("quizId") in quiz_courses else -1
+            for r in rows
+        ], np.int64)
+
+        keys = bucket_keys(ms, users)
+        counted3, score3 = np.tile(counted, len(PERIODS)), np.tile(score, len(PERIODS))
+        uk, inv = np.unique(keys[counted3], return_inverse=True)
+        rows_at = self._rows_for(uk)
+        values = score3[counted3]
+        self.count[rows_at, k] += np.bincount(inv, minlength=len(uk))
+        self.total[rows_at, k] += np.bincount(inv, weights=values, minlength=len(uk))
+        highest = np.zeros(len(uk))
+        np.maximum.at(highest, inv, values)
+        self.highest[rows_at, k] = np.maximum(self.highest[rows_at, k], highest)
+
+        topic = np.tile(passed & (course >= 0), len(PERIODS))
+        if topic.any():
+            pairs = np.stack([keys[topic], np.tile(course, len(PERIODS))[topic]], axis=1)
+            self.topics = np.unique(np.concatenate([self.topics, pairs]), axis=0)
+        return keys
+
+    def _fold_points(self, rows, ms, values):
+        users = np.fromiter((self._index(self._user_index, self.users, r["userId"]) for r in rows),
+                            np.int64, len(rows))
+        keys = bucket_keys(ms, users)
+        uk, inv = np.unique(keys, return_inverse=True)
+        rows_at = self._rows_for(uk)
+        self.points[rows_at] += np.bincount(inv, weights=np.tile(values, len(PERIODS)),
+                                            minlength=len(uk)).astype(np.int64)
+        return keys
+
+    def fold(self, streams, quiz_courses=None, badge_points=None):
+        """
+        read_streams() çıktısını durum üzerine ekler. Değişen kovaların
+        (dönem << 28 | dönem anahtarı) sıralı dizisini ve akış başına
+        eklenen satır sayısını döner.
+        """
+        quiz_courses = quiz_courses or {}
+        touched, added = [np.zeros(0, np.int64)], {}
+        for k, kind in enumerate(KINDS):
+            rows, ms = self._fresh(kind, streams.get(kind) or [], "completedAt")
+            added[kind] = len(rows)
+            if rows:
+                touched.append(self._fold_attempts(k, kind, rows, ms, quiz_courses))
+
+        # user_earned_points varsa puan kaynağı odur; yoksa rozet puanları
+        if streams.get("points"):
+            rows, ms = self._fresh("points", streams["points"], _TIME_FIELDS["points"])
+            values = np.array([int(safe_number(r.get("points"))) for r in rows], np.int64)
+        else:
+            badge_points = badge_points or {}
+            rows, ms = self._fresh("badges", streams.get("badges") or [], _TIME_FIELDS["badges"])
+            values = np.array([int(badge_points.get(r.get("badgeId"), 0)) for r in rows], np.int64)
+        added["points"] = len(rows)
+        if rows:
+            touched.append(self._fold_points(rows, ms, values))
+        return np.unique(np.concatenate(touched) >> _USER_BITS), added
+
+    # -- Sıralama ------------------------------------------------------------
+
+    def buckets(self):
+        return np.unique(self.key >> _USER_BITS)
+
+    def as_of(self):
+        """updatedAt: katlanan en son zaman (çıktı bayt bayt tekrarlanabilir olsun diye)."""
+        mark = max(self.watermark.values(), default=0)
+        return np.datetime_as_string(np.datetime64(mark, "ms"), unit="ms") + "Z"
+
+    def ranked(self, buckets=None, total_courses=1, top=DEFAULT_TOP):
+        """
+        Kovalarda route'un sıralaması. Kova, sonra sıra düzeninde
+        (bucket, userIdx, rank, points, testAverage, testCount, quizCount,
+        testHighest) dizileri döner.
+        """
+        active = (self.count.sum(axis=1) > 0) | (self.points > 0)
+        if buckets is not None:
+            active &= np.isin(self.key >> _USER_BITS, buckets)
+        idx = np.nonzero(active)[0]
+        key, count = self.key[idx], self.count[idx]
+        average = np.zeros(count.shape)
+        np.divide(self.total[idx], count, out=average, where=count > 0)
+        average = np.minimum(average, HUNDRED)
+
+        courses = np.zeros(len(key), np.int64)
+        topic_keys, topic_counts = np.unique(self.topics[:, 0], return_counts=True)
+        if len(topic_keys):
+            pos = np.minimum(np.searchsorted(topic_keys, key), len(topic_keys) - 1)
+            hit = topic_keys[pos] == key
+            courses[hit] = topic_counts[pos[hit]]
+        topic = np.minimum(courses / (total_courses or 1) * 100, HUNDRED)
+        # Bileşenler route'taki sırayla toplanır (aynı kayan nokta sonucu)
+        composite = topic
+        for k in range(1, len(KINDS)):
+            composite = composite + average[:, k]
+        composite = js_round2(composite / len(KINDS))
+        points = np.maximum(self.points[idx], 0)
+
+        users = key & _USER_MASK
+        user_order = np.argsort(np.argsort(np.array(self.users, dtype=np.str_)))
+        bucket = key >> _USER_BITS
+        order = np.lexsort((user_order[users], -js_round2(topic), -composite, -points, bucket))
+        bucket = bucket[order]
+        _, starts, sizes = np.unique(bucket, return_index=True, return_counts=True)
+        rank = np.arange(len(order)) - np.repeat(starts, sizes) + 1
+        keep = rank <= top if top else np.ones(len(order), bool)
+        order = order[keep]
+        test = KINDS.index("test")
+        return (
+            bucket[keep], users[order], rank[keep], points[order],
+            js_round2(average[order, test]), count[order, test], count[order, KINDS.index("quiz")],
+            self.highest[idx[order], test],
+        )
+
+    def iter_entries(self, buckets=None, total_courses=1, top=DEFAULT_TOP):
+        """LEADERBOARD_COLUMNS sırasında satırlar."""
+        bucket, users, rank, points, average, test_count, quiz_count, highest = self.ranked(
+            buckets, total_courses, top)
+        updated = self.as_of()
+        labels = {}
+        for i in range(len(bucket)):
+            b = int(bucket[i])
+            if b not in labels:
+                labels[b] = bucket_label(b)
+            period, date = labels[b]
+            user = self.users[int(users[i])]
+            avg = float(average[i])
+            yield (
+                f"lb-{period}-{date}-{user}", user, period, date,
+                int(quiz_count[i]), avg,
+                int(math.floor(avg * int(test_count[i]) + 0.5)),
+                int(math.floor(float(highest[i]) + 0.5)),
+                int(rank[i]), int(points[i]), updated,
+            )
+
+
+def bucket_label(bucket):
+    """Kova (dönem << 28 | dönem anahtarı) -> (period, periodDate)"""
+    period = PERIODS[bucket >> (_PERIOD_SHIFT - _USER_BITS)]
+    return period, period_date(period, bucket & _PERIOD_KEY_MASK)
+
+
+def iter_copy_script(rows, buckets, batch_size=DEFAULT_BATCH_SIZE, header=()):
+    """
+    psql ile çalışan betik: kovaların eski satırlarını silip yenilerini
+    COPY ile yükler (tek transaction; endpoint hazır satırları okur).
+    """
+    for line in header:
+        yield f"-- {line}\n"
+    yield "BEGIN;\n\n"
+    labels = [bucket_label(b) for b in np.asarray(buckets).tolist()]
+    table = quote_ident(LEADERBOARD_TABLE)
+    for s in range(0, len(labels), DEFAULT_BATCH_SIZE):
+        values = ",\n    ".join(f"('{p}', '{d}')" for p, d in labels[s:s + DEFAULT_BATCH_SIZE])
+        yield f'DELETE FROM {table} WHERE ("period", "periodDate") IN (\n    {values}\n);\n\n'
+    statement = copy_statement(LEADERBOARD_TABLE, LEADERBOARD_COLUMNS)
+    for _, text in iter_batches(rows, batch_size):
+        yield statement + ";\n"
+        yield text
+        yield "\\.\n\n"
+    yield "COMMIT;\n"
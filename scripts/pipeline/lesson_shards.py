@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+Kurs JSON dosyalarını modül başına parçalara (shard) bölme ve geri birleştirme.
+
+Tek parça ders dosyası (ör. data/lesson-contents/dotnet-core-lessons.json,
+~2.7 MB) yerine her modül ayrı bir dosyaya yazılır ve yanına küçük bir
+index.json konur. Index'te modül kimlikleri, ders href'leri, başlıklar,
+süreler ve her dersin shard dosyası içindeki bayt aralığı bulunur; bir
+ders sayfası ya da admin import'u yalnızca ihtiyaç duyduğu dersi
+(seek + read + tek bir JSON.parse) okuyabilir.
+
+Dizin yapısı:
+    mssql-course.shards/
+        index.json
+        modules/001-module-01-intro.json
+        modules/002-...
+
+Shard dosyalarında her ders kendi satırındadır; index'teki offset/length
+o satırın bayt aralığıdır. assemble_course() eski tek parça dosyayı
+json.dump(indent=2) ile aynı baytlarla yeniden üretir.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from .build_cache import BuildCache, write_if_changed
+
+SHARD_FORMAT = "lesson-shards"
+SHARD_VERSION = 1
+INDEX_NAME = "index.json"
+MODULES_DIR = "modules"
+
+# Index'e kopyalanan ders alanları (ders gövdesi shard'da kalır)
+LESSON_INDEX_FIELDS = ("label", "href", "estimatedDurationMinutes", "level")
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class ShardError(ValueError):
+    """Kaynak dosya veya shard dizini beklenen yapıda değil."""
+
+
+def default_shard_dir(source):
+    """data/lesson-contents/x.json -> data/lesson-contents/x.shards"""
+    base, ext = os.path.splitext(source)
+    return (base if ext == ".json" else source) + ".shards"
+
+
+def _shard_name(position, module_id):
+    slug = _UNSAFE_CHARS.sub("-", str(module_id or "module")).strip("-") or "module"
+    return f"{position:03d}-{slug}.json"
+
+
+def _dumps_compact(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_module(module, items_key="lessons"):
+    """
+    Modülü shard baytlarına çevirir; (bytes, [(offset, length)]) döner.
+    Anahtar sırası korunur, items_key listesindeki her öğe ayrı satırdadır.
+    """
+    out = bytearray(b"{")
+    ranges = []
+    for i, (key, value) in enumerate(module.items()):
+        if i:
+            out += b","
+        out += _dumps_compact(key).encode("utf-8") + b":"
+        if key == items_key and isinstance(value, list):
+            out += b"["
+            for j, item in enumerate(value):
+                out += b",\n" if j else b"\n"
+                encoded = _dumps_compact(item).encode("utf-8")
+                ranges.append((len(out), len(encoded)))
+                out += encoded
+            out += b"\n]" if value else b"]"
+        else:
+            out += _dumps_compact(value).encode("utf-8")
+    out += b"}\n"
+    return bytes(out), ranges
+
+
+def _load_source(source):
+    try:
+        with open(source, "r", encoding="utf-8-sig") as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        raise ShardError(f"{source}:{e.lineno}:{e.colno}: {e.msg}") from None
+
+
+def split_course(source, out_dir=None, items_key="lessons", total_key="totalLessons", force=None):
+    """
+    Kaynak kurs dosyasını out_dir altına shard'lar. Girdiler değişmediyse
+    hiçbir şey yazılmaz. (index, değişen dosya sayısı) döner; kaynak
+    güncelse index None'dır.
+    """
+    out_dir = out_dir or default_shard_dir(source)
+    index_path = os.path.join(out_dir, INDEX_NAME)
+
+    cache = BuildCache(f"lesson-shards:{os.path.relpath(os.path.abspath(out_dir))}", force=force)
+    cache.add_source(__file__, source)
+    cache.add_data(items_key, total_key)
+    if cache.is_fresh():
+        return None, 0
+
+    course = _load_source(source)
+    if not isinstance(course, dict) or not isinstance(course.get("modules"), list):
+        raise ShardError(f"{source}: üst seviyede 'modules' dizisi yok")
+
+    index_modules = []
+    shard_files = set()
+    total = 0
+    for position, module in enumerate(course["modules"], 1):
+        if not isinstance(module, dict):
+            raise ShardError(f"{source}: modules[{position - 1}] bir nesne değil")
+        data, ranges = encode_module(module, items_key)
+        name = _shard_name(position, module.get("moduleId"))
+        shard_files.add(name)
+        cache.write_bytes(os.path.join(out_dir, MODULES_DIR, name), data)
+
+        items = module.get(items_key) if isinstance(module.get(items_key), list) else []
+        total += len(items)
+        entries = []
+        for item, (offset, length) in zip(items, ranges):
+            entry = {f: item[f] for f in LESSON_INDEX_FIELDS if isinstance(item, dict) and f in item}
+            entry["offset"] = offset
+            entry["length"] = length
+            entries.append(entry)
+        index_modules.append({
+            "moduleId": module.get("moduleId"),
+            "moduleTitle": module.get("moduleTitle"),
+            "file": f"{MODULES_DIR}/{name}",
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            items_key: entries,
+        })
+
+    index = {
+        "format": SHARD_FORMAT,
+        "version": SHARD_VERSION,
+        "source": os.path.basename(source),
+        "itemsKey": items_key,
+        "totalKey": total_key,
+        "keys": list(course),
+        "course": {k: v for k, v in course.items() if k != "modules"},
+        total_key: total,
+        "modules": index_modules,
+    }
+    # index en son yazılır: okuyucular yalnızca index'teki shard'lara bakar
+    cache.write_json(index_path, index, separators=(",", ":"))
+
+    # modülsüz kursta shard yazılmaz, dizin hiç oluşmamış olabilir
+    modules_dir = os.path.join(out_dir, MODULES_DIR)
+    for name in os.listdir(modules_dir) if os.path.isdir(modules_dir) else ():
+        if name.endswith(".json") and name not in shard_files:
+            os.unlink(os.path.join(modules_dir, name))
+            cache.written.append(os.path.join(modules_dir, name))
+
+    cache.commit()
+    return index, len(cache.written)
+
+
+class ShardedCourse:
+    """Shard dizinini okur; dersleri ve modülleri tek tek yükler."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        index_path = os.path.join(directory, INDEX_NAME)
+        with open(index_path, "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        if self.index.get("format") != SHARD_FORMAT or self.index.get("version") != SHARD_VERSION:
+            raise ShardError(f"{index_path}: desteklenmeyen shard biçimi")
+        self.items_key = self.index["itemsKey"]
+        self._by_href = {}
+        for module in self.index["modules"]:
+            for entry in module[self.items_key]:
+                if "href" in entry:
+                    self._by_href.setdefault(entry["href"], (module, entry))
+
+    def _path(self, module):
+        return os.path.join(self.directory, module["file"])
+
+    def find_module(self, module_id):
+        for module in self.index["modules"]:
+            if module["moduleId"] == module_id:
+                return module
+        raise KeyError(module_id)
+
+    def module(self, module_id):
+        """Tek bir modülü (tüm dersleriyle) yükler."""
+        with open(self._path(self.find_module(module_id)), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def lesson(self, href):
+        """Tek bir dersi shard içindeki bayt aralığından okur."""
+        module, entry = self._by_href[href]
+        with open(self._path(module), "rb") as f:
+            f.seek(entry["offset"])
+            return json.loads(f.read(entry["length"]).decode("utf-8"))
+
+    def iter_modules(self):
+        """Modülleri index sırasıyla, tek tek yükleyerek verir."""
+        for module in self.index["modules"]:
+            path = self._path(module)
+            with open(path, "rb") as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() != module["sha256"]:
+                raise ShardError(f"{path}: içerik index'teki sha256 ile uyuşmuyor")
+            yield json.loads(data.decode("utf-8"))
+
+
+def _render(obj, base_indent):
+    return json.dumps(obj, ensure_ascii=False, indent=2).replace("\n", "\n" + base_indent)
+
+
+def render_course(sharded):
+    """Shard'lardan eski tek parça dosyanın metnini (json.dump indent=2) üretir."""
+    index = sharded.index
+    course = index["course"]
+    total_key = index["totalKey"]
+    parts = []
+    for key in index["keys"]:
+        if key == "modules":
+            modules = [_render(module, "    ") for module in sharded.iter_modules()]
+            value = "[\n    " + ",\n    ".join(modules) + "\n  ]" if modules else "[]"
+        elif key == total_key:
+            # Toplam, kaynaktaki değer yerine modüllerden hesaplanan değerdir
+            value = _render(index[total_key], "  ")
+        else:
+            value = _render(course[key], "  ")
+        parts.append(f"{json.dumps(key, ensure_ascii=False)}: {value}")
+    if not parts:
+        return "{}"
+    return "{\n  " + ",\n  ".join(parts) + "\n}"
+
+
+def assemble_course(directory, output):
+    """Shard dizininden tek parça kurs dosyasını yazar; dosya değiştiyse True döner."""
+    text = render_course(ShardedCourse(directory))
+    return write_if_changed(output, text.encode("utf-8"))
@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+"""
+Live coding case'lerinin paralel ve önbellekli doğrulanması.
+
+scripts/test-csharp-cases-ai.ts yalnızca C# case'lerini sırayla (her
+case arasında 2 sn beklemeyle) çalıştırır ve her seferinde hepsini
+yeniden yürütür. Bu motor aynı akışı bütün dil dosyaları için kurar:
+
+    case    data/live-coding-cases/*-cases.json ve
+            data/live-coding/junior-cases/*-junior-cases.json
+    çözüm   çözücü (solver): başlangıç kodu, önceki bir raporun
+            correctedCode'u ya da /api/education/live-coding/evaluate-output
+    çalışma yürütücü (executor): yerel derleyici/yorumlayıcılar,
+            /api/education/live-coding/run ya da beklenen çıktıyı dönen stub
+    karşılaştırma  normalizeOutput/compareOutputs ile birebir aynı
+
+Case'ler en fazla workers iş parçacığında eşzamanlı doğrulanır; sonuçlar
+case sırasıyla döner. Her test girdisinin çalışma sonucu
+sha256(yürütücü, dil, başlangıç kodu, çözüm, girdi) anahtarıyla
+.content-cache/live-coding/results.json'da tutulur; değişmeyen bir case
+yeniden çalıştırılmaz, yalnızca çıktısı güncel expectedOutput ile
+yeniden karşılaştırılır. Rapor test-csharp-cases-ai.ts ile aynı
+biçimdedir (totalCases/.../summary); summary'ye p50Duration ve
+p95Duration eklenir.
+"""
+
+import functools
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from . import REPO_ROOT
+from .build_cache import CACHE_DIR, atomic_write_bytes
+from .output_compare import LIVE_CODING, compare
+
+CASE_GLOBS = (
+    os.path.join(REPO_ROOT, "data", "live-coding-cases", "*-cases.json"),
+    os.path.join(REPO_ROOT, "data", "live-coding", "junior-cases", "*-junior-cases.json"),
+)
+CACHE_PATH = os.path.join(CACHE_DIR, "live-coding", "results.json")
+CACHE_VERSION = 1
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 30
+AI_TIMEOUT = 60
+DEFAULT_BASE_URL = "http://localhost:3000"
+
+LiveCase = namedtuple("LiveCase", "language source id title description starter_code tests")
+
+
+class SolveError(Exception):
+    """Çözücü case için çalıştırılacak kod üretemedi."""
+
+
+class ExecutorUnavailable(RuntimeError):
+    """Program hiç çalışmadı (araç yok, zaman aşımı, sunucuya ulaşılamadı); sonuç önbelleğe girmez."""
+
+
+def _language_of(path, data):
+    name = os.path.basename(path)
+    for suffix in ("-junior-cases.json", "-cases.json"):
+        if name.endswith(suffix):
+            return data.get("language") or name[: -len(suffix)]
+    return data.get("language") or data.get("id") or os.path.splitext(name)[0]
+
+
+def load_cases(paths=None):
+    """
+    Case dosyalarını okuyup LiveCase listesi döner (dosya ve case
+    sırasıyla). paths verilmezse CASE_GLOBS kullanılır. Junior case'lerde
+    starterCode/testCases yoktur; bunlar rapora hata olarak girer.
+    """
+    if not paths:
+        paths = [p for pattern in CASE_GLOBS for p in sorted(glob.glob(pattern))]
+    cases = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        language = _language_of(path, data)
+        for item in data.get("cases") or []:
+            tests = tuple(
+                (t.get("input") or "", t.get("expectedOutput") or "")
+                for t in item.get("testCases") or []
+            )
+            cases.append(LiveCase(
+                language=language,
+                source=os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/"),
+                id=item.get("id", ""),
+                title=item.get("title", ""),
+                description=item.get("description") or item.get("taskDescription") or item.get("title", ""),
+                starter_code=(item.get("starterCode") or {}).get(language, ""),
+                tests=tests,
+            ))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Karşılaştırma (scripts/test-csharp-cases-ai.ts ile aynı kurallar)
+# ---------------------------------------------------------------------------
+
+def normalize_output(output):
+    output = output.strip().replace("\r\n", "\n").replace("\r", "\n")
+    output = re.sub(r"\n{3,}", "\n\n", output)
+    output = re.sub(r"[ \t]+", " ", output)
+    output = re.sub(r"[ \t]+\n", "\n", output)
+    output = re.sub(r"\n[ \t]+", "\n", output)
+    return output.strip()
+
+
+def compare_outputs(actual, expected):
+    """Normalize edilmiş çıktılar aynıysa ya da beklenen 'baş...son' ise eşleşir."""
+    actual = normalize_output(actual)
+    expected = normalize_output(expected)
+    if actual == expected:
+        return True
+    parts = expected.split("...")
+    if len(parts) == 2:
+        return actual.startswith(normalize_output(parts[0])) and actual.endswith(normalize_output(parts[1]))
+    return False
+
+
+# ---------------------------------------------------------------------------
+# HTTP (uygulama sunucusu)
+# ---------------------------------------------------------------------------
+
+def _post_json(url, payload, timeout, headers=None):
+    """(durum kodu, JSON gövde) döner; bağlantı hatasında ExecutorUnavailable."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", **(headers or {})},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status, body = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, body = e.code, e.read()
+    except (urllib.error.URLError, OSError) as e:
+        raise ExecutorUnavailable(f"Cannot connect to server at {url}: {getattr(e, 'reason', e)}") from e
+    try:
+        return status, json.loads(body or b"{}")
+    except ValueError:
+        return status, {}
+
+
+# ---------------------------------------------------------------------------
+# Çözücüler: case -> (kod, geri bildirim)
+# ---------------------------------------------------------------------------
+
+class StarterSolver:
+    """Başlangıç kodunu olduğu gibi çalıştırır."""
+
+    name = "starter"
+    cacheable = False
+
+    def solve(self, case, expected):
+        return case.starter_code, ""
+
+
+class ReportSolver:
+    """Önceki raporlardaki (ör. csharp-cases-ai-test-results.json) correctedCode'u kullanır."""
+
+    name = "report"
+    cacheable = False
+
+    def __init__(self, paths):
+        self.solutions = {}
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                for result in json.load(f).get("results") or []:
+                    if result.get("correctedCode"):
+                        self.solutions[result["caseId"]] = (result["correctedCode"], result.get("aiFeedback") or "")
+
+    def solve(self, case, expected):
+        try:
+            return self.solutions[case.id]
+        except KeyError:
+            raise SolveError("No correctedCode in report") from None
+
+
+class ApiSolver:
+    """evaluate-output endpoint'inden correctedCode alır; yanıt önbelleğe girer."""
+
+    name = "api"
+    cacheable = True
+
+    def __init__(self, base_url=DEFAULT_BASE_URL):
+        self.url = base_url.rstrip("/") + "/api/education/live-coding/evaluate-output"
+
+    def solve(self, case, expected):
+        status, data = _post_json(self.url, {
+            "taskDescription": case.description,
+            "expectedOutput": expected,
+            "userCode": case.starter_code.strip(),
+            "userOutput": "",
+            "language": case.language,
+        }, AI_TIMEOUT, headers={"x-test-mode": "true"})
+        if status >= 400:
+            raise SolveError(data.get("error") or f"HTTP {status}")
+        if not data.get("correctedCode"):
+            raise SolveError("AI did not return correctedCode")
+        return data["correctedCode"], data.get("feedback") or ""
+
+
+SOLVERS = ("starter", "report", "api")
+
+
+# ---------------------------------------------------------------------------
+# Yürütücüler: (case, kod, girdi, beklenen) -> (çıktı, hata); program hiç
+# çalışamadıysa ExecutorUnavailable
+# ---------------------------------------------------------------------------
+
+class StubExecutor:
+    """Hiçbir şey çalıştırmaz, beklenen çıktıyı döner (harness'ı denemek için)."""
+
+    name = "stub"
+    echoes_expected = True
+
+    def run(self, case, code, stdin, expected):
+        return expected, None
+
+
+class ApiExecutor:
+    """/api/education/live-coding/run (Piston) üzerinden çalıştırır."""
+
+    name = "api"
+    echoes_expected = False
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, timeout=DEFAULT_TIMEOUT):
+        self.url = base_url.rstrip("/") + "/api/education/live-coding/run"
+        self.timeout = timeout
+
+    def run(self, case, code, stdin, expected):
+        status, data = _post_json(self.url, {"language": case.language, "code": code.strip(), "stdin": stdin},
+                                  self.timeout)
+        if status >= 400:
+            # Derleme/çalışma hataları 200 ile gelir; 4xx/5xx kodun çalışmadığı anlamına gelir
+            raise ExecutorUnavailable(data.get("error") or f"HTTP {status}")
+        run, compile_ = data.get("run") or {}, data.get("compile") or {}
+        output = run.get("stdout") or run.get("output") or ""
+        stderr = run.get("stderr") or compile_.get("stderr") or ""
+        if (run.get("code") != 0 or stderr) and not output:
+            return "", stderr or "Code execution failed"
+        return output, None
+
+
+@functools.lru_cache(maxsize=None)
+def _dotnet_project():
+    version = subprocess.run(["dotnet", "--version"], capture_output=True, text=True).stdout.strip()
+    framework = f"net{version.split('.')[0]}.0" if version else "net8.0"
+    return (
+        '<Project Sdk="Microsoft.NET.Sdk"><PropertyGroup><OutputType>Exe</OutputType>'
+        f"<TargetFramework>{framework}</TargetFramework><ImplicitUsings>enable</ImplicitUsings>"
+        "<Nullable>disable</Nullable></PropertyGroup></Project>\n"
+    )
+
+
+# dil -> (kaynak dosya, komutlar, ek dosyalar); son komut programı çalıştırır
+# ve girdiyi stdin'den alır, öncekiler derleme adımlarıdır.
+TOOLCHAINS = {
+    "python": ("main.py", [["python3", "main.py"]], None),
+    "javascript": ("main.js", [["node", "main.js"]], None),
+    "typescript": ("main.ts", [["tsx", "main.ts"]], None),
+    "ruby": ("main.rb", [["ruby", "main.rb"]], None),
+    "php": ("main.php", [["php", "main.php"]], None),
+    "go": ("main.go", [["go", "run", "main.go"]], None),
+    "java": ("Main.java", [["java", "Main.java"]], None),
+    "kotlin": ("Main.kt", [["kotlinc", "Main.kt", "-include-runtime", "-d", "main.jar"],
+                           ["java", "-jar", "main.jar"]], None),
+    "cpp": ("main.cpp", [["g++", "-O2", "-std=c++17", "-o", "main", "main.cpp"], ["./main"]], None),
+    "rust": ("main.rs", [["rustc", "-O", "-o", "main", "main.rs"], ["./main"]], None),
+    "csharp": ("Program.cs", [["dotnet", "build", "-nologo", "-v", "q", "-o", "out"],
+                              ["dotnet", "out/main.dll"]], lambda: {"main.csproj": _dotnet_project()}),
+}
+
+
+def _resolve_tool(tool):
+    if tool.startswith("./"):
+        return tool
+    local = os.path.join(REPO_ROOT, "node_modules", ".bin", tool)
+    return shutil.which(tool) or (local if os.path.exists(local) else None)
+
+
+class LocalExecutor:
+    """Kodu geçici bir dizinde yerel derleyici/yorumlayıcılarla çalıştırır."""
+
+    name = "local"
+    echoes_expected = False
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.env = dict(os.environ, DOTNET_CLI_TELEMETRY_OPTOUT="1", DOTNET_NOLOGO="1")
+
+    def run(self, case, code, stdin, expected):
+        try:
+            file_name, steps, extra = TOOLCHAINS[case.language]
+        except KeyError:
+            return "", f"Unsupported language: {case.language}"
+        with tempfile.TemporaryDirectory(prefix="live-coding-") as directory:
+            files = {file_name: code, **(extra() if extra else {})}
+            for name, text in files.items():
+                with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+                    f.write(text)
+            for number, step in enumerate(steps, 1):
+                tool = _resolve_tool(step[0])
+                if tool is None:
+                    raise ExecutorUnavailable(f"{step[0]} not found (install the {case.language} toolchain)")
+                last = number == len(steps)
+                try:
+                    done = subprocess.run(
+                        [tool, *step[1:]], cwd=directory, env=self.env, capture_output=True,
+                        input=stdin.encode("utf-8") if last else None, timeout=self.timeout,
+                    )
+                except subprocess.TimeoutExpired:
+                    raise ExecutorUnavailable(f"Timeout ({self.timeout}s)")
+                stdout = done.stdout.decode("utf-8", "replace")
+                stderr = done.stderr.decode("utf-8", "replace")
+                if not last:
+                    if done.returncode != 0:
+                        return "", (stderr or stdout).strip() or "Compilation failed"
+                elif done.returncode != 0 and not stdout:
+                    return "", stderr.strip() or "Code execution failed"
+            return stdout, None
+
+
+EXECUTORS = ("local", "api", "stub")
+
+
+# ---------------------------------------------------------------------------
+# Önbellek
+# ---------------------------------------------------------------------------
+
+def cache_key(*parts):
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    {anahtar: kayıt} JSON deposu. Kayıtlar iş parçacıklarından eklenir,
+    save() ana iş parçacığında değişiklik varsa atomik yazar. force ile
+    okunan kayıtlar yok sayılır (yeniden çalıştırılıp üzerine yazılır).
+    """
+
+    def __init__(self, path=CACHE_PATH, force=False):
+        self.path = path
+        self.entries = {}
+        self.hits = self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path and not force:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = data.get("entries") or {}
+            except (OSError, ValueError):
+                pass
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty = True
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps({"version": CACHE_VERSION, "entries": self.entries}, ensure_ascii=False)
+            self._dirty = False
+        atomic_write_bytes(self.path, data.encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Doğrulama ve rapor
+# ---------------------------------------------------------------------------
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000)
+
+
+def _solve(case, expected, solver, cache):
+    """(kod, geri bildirim, süre ms); api çözücüsünün yanıtları önbelleğe girer."""
+    key = cache_key("solve", solver.name, case.language, case.starter_code, case.description, expected)
+    entry = cache.get(key) if solver.cacheable else None
+    if entry is None:
+        started = time.perf_counter()
+        code, feedback = solver.solve(case, expected)
+        entry = {"code": code, "feedback": feedback, "duration": _elapsed_ms(started)}
+        if solver.cacheable:
+            cache.put(key, entry)
+    return entry["code"], entry["feedback"], entry["duration"]
+
+
+def verify_case(case, solver, executor, cache):
+    """
+    Tek case'i doğrular; test-csharp-cases-ai.ts'in TestResult'ı biçiminde
+    sözlük döner (language, source, cached alanları eklidir; çıktı
+    eşleşmezse mismatch ilk farkın yerini ve diff'ini verir). duration,
+    önbellekten gelen adımlar için kaydedilen süredir; böylece rapor
+    önbellekli çalıştırmalarda da karşılaştırılabilir kalır.
+    """
+    result = {
+        "caseId": case.id,
+        "title": case.title,
+        "language": case.language,
+        "source": case.source,
+        "success": False,
+        "aiAnalysisSuccess": False,
+        "codeExecutionSuccess": False,
+        "outputMatch": False,
+        "duration": 0,
+    }
+    if not case.starter_code:
+        result["error"] = "No starter code found"
+        return result
+    if not case.tests or not case.tests[0][1]:
+        result["error"] = "No expected output found"
+        return result
+    result["expectedOutput"] = case.tests[0][1]
+
+    try:
+        code, feedback, duration = _solve(case, case.tests[0][1], solver, cache)
+    except (SolveError, RuntimeError) as e:
+        result["error"] = f"AI analysis failed: {e}"
+        return result
+    result.update(aiAnalysisSuccess=True, correctedCode=code, aiFeedback=feedback)
+
+    cached = True
+    match = True
+    for number, (stdin, expected) in enumerate(case.tests):
+        key = cache_key("run", executor.name, case.language, case.starter_code, code, stdin,
+                        expected if executor.echoes_expected else None)
+        entry = cache.get(key)
+        if entry is None:
+            cached = False
+            started = time.perf_counter()
+            try:
+                output, error = executor.run(case, code, stdin, expected)
+            except ExecutorUnavailable as e:
+                # Ortam hatası: bir sonraki çalıştırmada yeniden denensin
+                entry = {"output": "", "error": str(e), "duration": _elapsed_ms(started)}
+            else:
+                entry = {"output": output, "error": error, "duration": _elapsed_ms(started)}
+                cache.put(key, entry)
+        duration += entry["duration"]
+        if entry["error"]:
+            result.update(error=f"Code execution failed: {entry['error']}", duration=duration, cached=cached)
+            return result
+        if number == 0:
+            result["actualOutput"] = entry["output"]
+        if match and not compare_outputs(entry["output"], expected):
+            match = False
+            mismatch = compare(expected, entry["output"], LIVE_CODING)
+            if mismatch is not None:
+                result["mismatch"] = {"test": number, "line": mismatch.line, "column": mismatch.column,
+                                      "diff": mismatch.diff}
+
+    result.update(codeExecutionSuccess=True, outputMatch=match, success=match, duration=duration, cached=cached)
+    return result
+
+
+def verify_cases(cases, solver, executor, cache, workers=DEFAULT_WORKERS):
+    """Case'leri en fazla workers eşzamanlı doğrular; sonuçları case sırasıyla üretir."""
+    if workers <= 1:
+        for case in cases:
+            yield verify_case(case, solver, executor, cache)
+        return
+    with ThreadPoolExecutor(workers) as pool:
+        yield from pool.map(lambda case: verify_case(case, solver, executor, cache), cases)
+
+
+def percentile(values, q):
+    """Doğrusal enterpolasyonlu yüzdelik (numpy.percentile varsayılanı)."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def generate_report(results):
+    """test-csharp-cases-ai.ts generateReport() çıktısı + p50/p95 süreler."""
+    total = len(results)
+    successful = sum(1 for r in results if r["success"])
+    durations = [r["duration"] for r in results]
+
+    def rate(field):
+        return sum(1 for r in results if r[field]) / total * 100 if total else 0
+
+    return {
+        "totalCases": total,
+        "successfulCases": successful,
+        "failedCases": total - successful,
+        "results": results,
+        "summary": {
+            "aiAnalysisSuccessRate": rate("aiAnalysisSuccess"),
+            "codeExecutionSuccessRate": rate("codeExecutionSuccess"),
+            "outputMatchRate": rate("outputMatch"),
+            "averageDuration": sum(durations) / total if total else 0,
+            "p50Duration": percentile(durations, 50),
+            "p95Duration": percentile(durations, 95),
+        },
+    }
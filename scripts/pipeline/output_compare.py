@@ -0,0 +1,478 @@
+# -*- coding: utf-8 -*-
+"""
+Live coding çıktıları için akışlı, normalize eden karşılaştırıcı.
+
+compare(expected, actual) iki çıktıyı satır satır karşılaştırır ve ilk
+farkta durur: farkın satır/sütununu ve boyutu sınırlı bir diff'i içeren
+Mismatch, eşleşirse None döner. Girdiler str, bytes, dosya nesnesi
+(metin ya da ikili) veya parça (chunk) iterable'ı olabilir; dosyalar
+block_size'lık bloklarla okunur, çıktının tamamı hiçbir zaman tek bir
+string olarak kurulmaz.
+
+Normalizasyon CompareOptions ile seçilir:
+
+    crlf            \\r\\n ve tek \\r satır sonu sayılır
+    rstrip / strip  satır sonundaki / iki uçtaki boşluklar atılır
+    collapse_spaces satır içindeki boşluk/tab dizileri tek boşluk olur
+    blank_lines     boş satırlar: keep, squeeze (normalizasyondan önce
+                    tamamen boş olan art arda satırlar tek satır olur;
+                    yalnızca boşluktan oluşan satırlar tek tek kalır) ya
+                    da ignore
+    trim_blank_edges baştaki ve sondaki boş satırlar yok sayılır
+    float_tolerance sayı gibi okunan kelimeler bu mutlak/göreli farka
+                    kadar eşit sayılır
+    unordered       satırların sırası önemsiz (satır çoklu kümesi)
+
+Hızlı yol: normalizasyondan önce (satır sonları düzeltilmiş) iki taraf
+blok blok aynıysa satırlar tek tek işlenmez; aynı metin aynı şekilde
+normalize edileceğinden blok atlanır. Blok eşleşmezse satır yoluna
+geçilir: satırlar ~64 KB'lık partiler halinde bölünüp normalize edilir
+ve partiler liste olarak karşılaştırılır; tek tek satıra yalnızca fark
+bulunan partide inilir. Hızlı yol, başarısız denemeler arttıkça
+seyrekleşerek yeniden denenir. Satır numaraları ham (normalizasyon
+öncesi) satırlardır, sütunlar normalize edilmiş satırdadır; ikisi de
+1'den başlar.
+
+LIVE_CODING, test-csharp-cases-ai.ts normalizeOutput() (ve
+live_coding.normalize_output) kurallarının satır bazlı karşılığıdır:
+orada \n{3,} boşluklar silinmeden daraltıldığı için squeeze de yalnızca
+ham boş satırları birleştirir. Eşdeğerlik boşluk olarak ' ', '\t' ve
+satır sonlarını içeren çıktılar içindir; strip diğer Unicode boşluklarını
+da satır uçlarından atar.
+"""
+
+import codecs
+import math
+import os
+import re
+from collections import deque, namedtuple
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+DEFAULT_CONTEXT = 3
+DEFAULT_MAX_DIFF_LINES = 40
+DEFAULT_MAX_WIDTH = 200
+BLANK_LINE_MODES = ("keep", "squeeze", "ignore")
+EOF_MARK = "<EOF>"
+
+# Hızlı yol başarısız olduktan sonra yeniden denemeden önce satır satır
+# karşılaştırılacak satır sayısı (her başarısızlıkta ikiye katlanır) ve
+# satır yolunda bir kerede okunup normalize edilen parti (karakter).
+_SLOW_RUN = 64
+_MAX_SLOW_RUN = 1 << 16
+_BATCH_SIZE = 1 << 16
+
+_SPACES = re.compile(r"[ \t]+")
+_SPACE_RUNS = re.compile(r"\t[ \t]*| [ \t]+")  # _SPACES'in tek boşluk dışındaki eşleşmeleri
+
+CompareOptions = namedtuple(
+    "CompareOptions",
+    "crlf rstrip strip collapse_spaces blank_lines trim_blank_edges float_tolerance unordered",
+    defaults=(True, True, False, False, "keep", True, None, False),
+)
+CompareOptions.__doc__ = "Karşılaştırmadan önce uygulanacak normalizasyonlar (bkz. modül belgesi)."
+
+EXACT = CompareOptions(crlf=False, rstrip=False, trim_blank_edges=False)
+LIVE_CODING = CompareOptions(strip=True, collapse_spaces=True, blank_lines="squeeze")
+
+Mismatch = namedtuple("Mismatch", "line actual_line column expected actual diff")
+Mismatch.__doc__ = """
+İlk fark. line/actual_line beklenen/gerçek taraftaki ham satır numarası
+(taraf bittiyse None), column normalize edilmiş satırdaki ilk farklı
+karakter (unordered modda None), expected/actual normalize edilmiş
+satırlar (taraf bittiyse None), diff satırları '\\n' ile birleştirilmiş
+sınırlı diff metni.
+"""
+
+
+def _iter_chunks(source, block_size):
+    """Dosya nesnesi ya da parça iterable'ından str parçalar üretir (bytes UTF-8 çözülür)."""
+    read = getattr(source, "read", None)
+    chunks = iter(lambda: read(block_size), None) if read is not None else iter(source)
+    decoder = None
+    for chunk in chunks:
+        if not chunk:
+            if read is not None:
+                break
+            continue
+        if isinstance(chunk, bytes):
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")("replace")
+            chunk = decoder.decode(chunk)
+        yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+class _Reader:
+    """Ham satır okuyucu: tampon, satır sayacı ve blok düzeyinde erişim."""
+
+    def __init__(self, source, options, block_size):
+        self.crlf = options.crlf
+        self.block_size = block_size
+        self.line_no = 0
+        self.pos = 0
+        self._held_cr = ""
+        if isinstance(source, (bytes, bytearray)):
+            source = bytes(source).decode("utf-8", "replace")
+        if isinstance(source, str):
+            self.buf = self._newlines(source, final=True)
+            self._chunks = None
+        else:
+            self.buf = ""
+            self._chunks = _iter_chunks(source, block_size)
+
+    def _newlines(self, text, final):
+        if not self.crlf:
+            return text
+        text = self._held_cr + text
+        self._held_cr = ""
+        if not final and text.endswith("\r"):
+            text, self._held_cr = text[:-1], "\r"
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def _fill(self):
+        """Tampona bir parça daha ekler; kaynak bittiyse False."""
+        while self._chunks is not None:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._chunks = None
+                text = self._newlines("", final=True)
+            else:
+                text = self._newlines(chunk, final=False)
+            if text:
+                if self.pos:
+                    self.buf = self.buf[self.pos:]
+                    self.pos = 0
+                self.buf += text
+                return True
+        return False
+
+    def text(self, limit):
+        """
+        Sonraki ham satırlar tek metin olarak (son '\\n' olmadan); yaklaşık
+        limit karakterlik, en az bir satır. Kaynak bittiyse None.
+        """
+        while len(self.buf) - self.pos < limit and self._fill():
+            pass
+        end = self.buf.rfind("\n", self.pos, self.pos + limit)
+        while end < 0:
+            end = self.buf.find("\n", self.pos)
+            if end < 0 and not self._fill():
+                break
+        if end < 0:
+            if self.pos >= len(self.buf):
+                return None
+            end = len(self.buf)
+        text = self.buf[self.pos:end]
+        self.pos = end + 1
+        self.line_no += text.count("\n") + 1
+        return text
+
+    def block(self, is_blank):
+        """
+        En fazla block_size karakterlik, '\\n' ile biten ve son satırı boş
+        olmayan ham metin (yoksa ""). Sondaki boş satırlar bloğa alınmaz;
+        dosya sonundaki boş satırların yok sayılması satır yoluna kalır.
+        """
+        while len(self.buf) - self.pos < self.block_size and self._fill():
+            pass
+        end = self.buf.rfind("\n", self.pos, self.pos + self.block_size)
+        while end >= self.pos:
+            start = self.buf.rfind("\n", self.pos, end) + 1 or self.pos
+            if not is_blank(self.buf[max(start, self.pos):end]):
+                return self.buf[self.pos:end + 1]
+            end = start - 1
+        return ""
+
+    def startswith(self, text):
+        while len(self.buf) - self.pos < len(text) and self._fill():
+            pass
+        return self.buf.startswith(text, self.pos)
+
+    def skip(self, text):
+        self.pos += len(text)
+        self.line_no += text.count("\n")
+
+
+class _Side:
+    """
+    Normalize edilmiş satır akışı. Satırlar partiler halinde okunup
+    normalize edilir (texts/nums, i sıradaki satır); boş satır kuralları
+    ve uçların kırpılması burada uygulanır. Sondaki boş satırlar,
+    ardından boş olmayan bir satır gelene ya da akış bitene kadar
+    (satır no, ham satır boş mu) olarak bekletilir (held).
+    """
+
+    def __init__(self, reader, options, batch_size):
+        self.reader = reader
+        self.collapse_spaces = options.collapse_spaces
+        self.line_step = _line_step(options)
+        self.batch_size = batch_size
+        self.blank_lines = options.blank_lines
+        self.trim = options.trim_blank_edges
+        self.started = not self.trim
+        self.texts, self.nums, self.i = [], [], 0
+        self.held = []
+        self.eof = False
+
+    @property
+    def ready(self):
+        """Hızlı yol için: okunmuş ama tüketilmemiş satır yok, baştaki boşluklar geçildi."""
+        return self.started and self.i >= len(self.texts) and not self.held
+
+    def available(self):
+        """Tüketilmemiş normalize satır sayısı; gerekirse yeni parti okur (0: akış bitti)."""
+        while self.i >= len(self.texts):
+            if self.eof:
+                return 0
+            self._load()
+        return len(self.texts) - self.i
+
+    def _emit_held(self, texts, nums):
+        if self.held and self.blank_lines != "ignore" and self.started:
+            if self.blank_lines == "squeeze":
+                held = [num for k, (num, empty) in enumerate(self.held)
+                        if not (empty and k and self.held[k - 1][1])]
+            else:
+                held = [num for num, _ in self.held]
+            texts.extend([""] * len(held))
+            nums.extend(held)
+        self.held = []
+
+    def _load(self):
+        first = self.reader.line_no + 1
+        raw = self.reader.text(self.batch_size)
+        texts, nums = [], []
+        if raw is None:
+            self.eof = True
+            if not self.trim:
+                self._emit_held(texts, nums)
+        else:
+            # boşluk dizileri satır sonunu aşmaz; partinin tamamında tek seferde daraltılır
+            if self.collapse_spaces and ("  " in raw or "\t" in raw):
+                raw = _SPACE_RUNS.sub(" ", raw)
+            lines = normalized = raw.split("\n")
+            if self.line_step is not None:
+                normalized = list(map(self.line_step, lines))
+            if not self.held and "" not in normalized:
+                texts, nums = normalized, range(first, first + len(normalized))
+                self.started = True
+            else:
+                for num, line, text in zip(range(first, first + len(lines)), lines, normalized):
+                    if not text:
+                        self.held.append((num, not line))
+                        continue
+                    self._emit_held(texts, nums)
+                    self.started = True
+                    texts.append(text)
+                    nums.append(num)
+        self.texts, self.nums, self.i = texts, nums, 0
+
+    def next(self):
+        """(ham satır no, normalize satır) ya da akış bittiyse None."""
+        if not self.available():
+            return None
+        self.i += 1
+        return self.nums[self.i - 1], self.texts[self.i - 1]
+
+
+def _line_step(options):
+    if options.strip:
+        return str.strip
+    if options.rstrip:
+        return str.rstrip
+    return None
+
+
+def make_normalizer(options):
+    """Ham satırı options'a göre normalize eden fonksiyon döner."""
+    step = _line_step(options)
+    if options.collapse_spaces:
+        if step is None:
+            return lambda s: _SPACES.sub(" ", s)
+        return lambda s: step(_SPACES.sub(" ", s))
+    return step or (lambda s: s)
+
+
+def _is_number_close(a, b, tolerance):
+    try:
+        x, y = float(a), float(b)
+    except ValueError:
+        return False
+    return math.isclose(x, y, rel_tol=tolerance, abs_tol=tolerance)
+
+
+def _first_difference(expected, actual, tolerance):
+    """Satırlar eşitse None, değilse ilk farkın 1 tabanlı sütunu."""
+    if expected == actual:
+        return None
+    if tolerance is not None:
+        e_words = [(m.start(), m.group()) for m in re.finditer(r"\S+", expected)]
+        a_words = re.findall(r"\S+", actual)
+        for (offset, e), a in zip(e_words, a_words):
+            if e != a and not _is_number_close(e, a, tolerance):
+                return offset + 1
+        if len(e_words) == len(a_words):
+            return None
+        if len(e_words) > len(a_words):
+            return e_words[len(a_words)][0] + 1
+        return len(expected) + 1
+    return len(os.path.commonprefix((expected, actual))) + 1
+
+
+def _clip(text, width):
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def _skip_identical_block(expected, actual, is_blank):
+    """Hızlı yol: iki tarafın sıradaki ham bloğu aynıysa ikisini de atlar, bloğu döner."""
+    block = expected.reader.block(is_blank)
+    if block and actual.reader.startswith(block):
+        expected.reader.skip(block)
+        actual.reader.skip(block)
+        return block
+    return ""
+
+
+def _mismatch(expected, actual, e, a, column, history, context, max_width):
+    diff = [f"@@ beklenen satır {e[0] if e else EOF_MARK}, gerçek satır {a[0] if a else EOF_MARK} @@"]
+    diff.extend("  " + _clip(s, max_width) for s in history)
+    for sign, side, first in (("-", expected, e), ("+", actual, a)):
+        line = first
+        for _ in range(context + 1):
+            diff.append(f"{sign} {_clip(line[1], max_width) if line else EOF_MARK}")
+            if line is None:
+                break
+            line = side.next()
+    return Mismatch(
+        line=e[0] if e else None,
+        actual_line=a[0] if a else None,
+        column=column,
+        expected=e[1] if e else None,
+        actual=a[1] if a else None,
+        diff="\n".join(diff),
+    )
+
+
+def _ordered(expected, actual, options, normalize, context, max_width):
+    is_blank = lambda s: not normalize(s)
+    tolerance = options.float_tolerance
+    history = deque(maxlen=context)
+    slow_run = _SLOW_RUN
+    slow_left = 0
+    while True:
+        if slow_left <= 0 and expected.ready and actual.ready:
+            block = _skip_identical_block(expected, actual, is_blank)
+            if block:
+                if context:
+                    tail = block[:-1].rsplit("\n", context)[-context:]
+                    history.extend(normalize(s) for s in tail)
+                slow_run = _SLOW_RUN
+                continue
+            slow_left, slow_run = slow_run, min(slow_run * 2, _MAX_SLOW_RUN)
+
+        n = min(expected.available(), actual.available())
+        if n == 0:
+            if not expected.available() and not actual.available():
+                return None
+            return _mismatch(expected, actual, expected.next(), actual.next(), 1, history, context, max_width)
+        e_texts = expected.texts[expected.i:expected.i + n]
+        a_texts = actual.texts[actual.i:actual.i + n]
+        if e_texts != a_texts:
+            for k, (x, y) in enumerate(zip(e_texts, a_texts)):
+                column = _first_difference(x, y, tolerance)
+                if column is not None:
+                    if context:
+                        history.extend(e_texts[max(0, k - context):k])
+                    expected.i += k
+                    actual.i += k
+                    return _mismatch(expected, actual, expected.next(), actual.next(), column,
+                                     history, context, max_width)
+        expected.i += n
+        actual.i += n
+        if context:
+            history.extend(e_texts[-context:])
+        slow_left -= n
+
+
+def _unordered(expected, actual, options, normalize, max_diff_lines, max_width):
+    # satır -> [beklenen - gerçek adedi, beklenende ilk satır no, gerçekte ilk satır no];
+    # adedi sıfıra inen satırlar silinir, bellek yalnızca eşleşmemiş satırlar kadar büyür.
+    open_lines = {}
+    is_blank = lambda s: not normalize(s)
+    slow_run = _SLOW_RUN
+    slow_left = 0
+    while True:
+        if slow_left <= 0 and expected.ready and actual.ready:
+            if _skip_identical_block(expected, actual, is_blank):
+                slow_run = _SLOW_RUN
+                continue
+            slow_left, slow_run = slow_run, min(slow_run * 2, _MAX_SLOW_RUN)
+
+        counts = expected.available(), actual.available()
+        if not any(counts):
+            break
+        batches = [(side.texts[side.i:], side.nums[side.i:]) for side in (expected, actual)]
+        expected.i, actual.i = len(expected.texts), len(actual.texts)
+        slow_left -= max(counts)
+        if batches[0][0] == batches[1][0]:
+            continue
+        for (texts, nums), delta, slot in zip(batches, (1, -1), (1, 2)):
+            for num, text in zip(nums, texts):
+                entry = open_lines.get(text)
+                if entry is None:
+                    entry = open_lines[text] = [0, None, None]
+                entry[0] += delta
+                if entry[slot] is None:
+                    entry[slot] = num
+                if entry[0] == 0:
+                    del open_lines[text]
+
+    if not open_lines:
+        return None
+    entries = sorted(
+        ((count, e_line, a_line, text) for text, (count, e_line, a_line) in open_lines.items()),
+        key=lambda x: (x[1] if x[0] > 0 else x[2]),
+    )
+    missing = sum(count for count, _, _, _ in entries if count > 0)
+    extra = -sum(count for count, _, _, _ in entries if count < 0)
+    diff = [f"@@ sırasız: beklenen {missing} satır eksik, {extra} satır fazla @@"]
+    for count, e_line, a_line, text in entries[:max_diff_lines]:
+        sign, line_no = ("-", e_line) if count > 0 else ("+", a_line)
+        diff.append(f"{sign} {_clip(text, max_width)}  (satır {line_no}, ×{abs(count)})")
+    if len(entries) > max_diff_lines:
+        diff.append(f"  ... {len(entries) - max_diff_lines} farklı satır daha")
+    count, e_line, a_line, text = entries[0]
+    return Mismatch(
+        line=e_line if count > 0 else None,
+        actual_line=a_line if count < 0 else None,
+        column=None,
+        expected=text if count > 0 else None,
+        actual=text if count < 0 else None,
+        diff="\n".join(diff),
+    )
+
+
+def compare(expected, actual, options=CompareOptions(), context=DEFAULT_CONTEXT,
+            max_diff_lines=DEFAULT_MAX_DIFF_LINES, max_width=DEFAULT_MAX_WIDTH,
+            block_size=DEFAULT_BLOCK_SIZE):
+    """
+    expected ile actual'ı options'a göre karşılaştırır; eşleşirse None,
+    yoksa ilk farkın Mismatch'i. Diff, farktan önceki ve sonraki en fazla
+    context satırı (unordered modda en fazla max_diff_lines farklı satırı)
+    içerir; satırlar max_width karakterde kesilir.
+    """
+    if options.blank_lines not in BLANK_LINE_MODES:
+        raise ValueError(f"blank_lines: {options.blank_lines!r} ({', '.join(BLANK_LINE_MODES)})")
+    if options.unordered and options.float_tolerance is not None:
+        raise ValueError("float_tolerance unordered karşılaştırmada kullanılamaz")
+    normalize = make_normalizer(options)
+    batch_size = min(block_size, _BATCH_SIZE)
+    sides = [_Side(_Reader(source, options, block_size), options, batch_size)
+             for source in (expected, actual)]
+    if options.unordered:
+        return _unordered(*sides, options, normalize, max_diff_lines, max_width)
+    return _ordered(*sides, options, normalize, context, max_width)
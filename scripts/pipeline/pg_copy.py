@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Üretici çıktısını PostgreSQL'e COPY ... FROM STDIN ile toplu yükler.
+
+Büyük çok satırlı INSERT + elle escape edilmiş '...'::jsonb literal'ları
+yerine satırlar CSV olarak akıtılır: her batch tek bir COPY (tek round
+trip), tüm yükleme tek transaction içindedir. upsert=True ile satırlar
+önce geçici bir tabloya kopyalanır ve INSERT ... ON CONFLICT ile hedefe
+aktarılır; böylece seed tekrar çalıştırılabilir.
+
+Dry-run modunda aynı COPY blokları psql ile çalıştırılabilen bir dosyaya
+yazılır (psql -f dosya.copy.sql); iter_copy_rows() bu dosyaları geri okur.
+
+Sürücü olarak psycopg (3) veya psycopg2 kullanılır; ikisi de isteğe
+bağlıdır ve yalnızca veritabanına bağlanırken gerekir.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+
+from .build_cache import atomic_write_bytes
+
+DEFAULT_BATCH_SIZE = 500
+
+# Bağlantı adresinin okunacağı ortam değişkenleri (prisma/schema.prisma ile aynı)
+DATABASE_URL_ENV = ("POSTGRES_URL_NON_POOLING", "POSTGRES_PRISMA_URL", "DATABASE_URL")
+
+_COPY_RE = re.compile(r'^COPY\s+("?[\w.]+"?)\s*\(([^)]*)\)\s+FROM\s+STDIN', re.I)
+# CSV kaydındaki alanlar; tırnaklı alanlar satır sonu içerebilir
+_CSV_FIELD_RE = re.compile(r'(?:^|,)("(?:[^"]|"")*"|[^,"\r\n]*)')
+
+# generate_tests.py'nin doldurduğu "quizzes" kolonları
+QUIZ_COLUMNS = (
+    "id",
+    "courseId",
+    "title",
+    "description",
+    "topic",
+    "type",
+    "level",
+    "questions",
+    "passingScore",
+    "lessonSlug",
+)
+
+
+def quote_ident(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _csv_field(value):
+    if value is None:
+        return ""  # CSV modunda tırnaksız boş alan NULL'dır
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def encode_csv_row(values):
+    """Bir satırı COPY (FORMAT csv) satırına çevirir; dict/list JSON olur."""
+    return ",".join(_csv_field(v) for v in values) + "\n"
+
+
+def copy_statement(table, columns):
+    cols = ", ".join(quote_ident(c) for c in columns)
+    return f"COPY {quote_ident(table)} ({cols}) FROM STDIN WITH (FORMAT csv)"
+
+
+def _null_fields(record, values):
+    """
+    csv.reader tırnaksız boş alanı (NULL) tırnaklı boş string'den ("")
+    ayırmaz; boş alanlardan tırnaksız olanları ham kayda bakarak None yapar.
+    """
+    fields = [m.group(1) for m in _CSV_FIELD_RE.finditer(record.rstrip("\r\n"))]
+    return [
+        None if v == "" and not (i < len(fields) and fields[i].startswith('"')) else v
+        for i, v in enumerate(values)
+    ]
+
+
+def iter_copy_rows(path, tables=None, columns=None):
+    """
+    COPY ... FROM STDIN WITH (FORMAT csv) bloklarından (tablo, satır sözlüğü).
+    Tırnaksız boş alan None, tırnaklı boş alan ("") boş string olur.
+    tables (tablo adları) verilirse yalnızca o tabloların satırları
+    ayrıştırılır. columns ({tablo: sütunlar}) verilirse o tabloların
+    satırlarında yalnızca bu sütunlar bulunur.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        lines = iter(f)
+        for line in lines:
+            m = _COPY_RE.match(line)
+            if not m:
+                continue
+            table = m.group(1).strip('"')
+            names = [c.strip().strip('"') for c in m.group(2).split(",")]
+            record = []  # csv.reader'ın o anki kaydı için okuduğu ham satırlar
+
+            def block(lines=lines, record=record):
+                for row_line in lines:
+                    if row_line.rstrip("\r\n") == "\\.":
+                        return
+                    record.append(row_line)
+                    yield row_line
+
+            if tables is not None and table not in tables:
+                for _ in block():
+                    pass
+                continue
+            wanted = columns.get(table) if columns is not None else None
+            picked = [(i, c) for i, c in enumerate(names) if wanted is None or c in wanted]
+            for values in csv.reader(block()):
+                if "" in values:
+                    raw = "".join(record)
+                    # tırnaklı boş alan yoksa tüm boş alanlar NULL'dır
+                    values = _null_fields(raw, values) if '""' in raw else [v or None for v in values]
+                record.clear()
+                yield table, {c: values[i] for i, c in picked if i < len(values)}
+
+
+def iter_batches(rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Satırları batch_size'lık CSV metin blokları halinde verir: (satır sayısı, metin)."""
+    buf = io.StringIO()
+    count = 0
+    for row in rows:
+        buf.write(encode_csv_row(row))
+        count += 1
+        if count == batch_size:
+            yield count, buf.getvalue()
+            buf = io.StringIO()
+            count = 0
+    if count:
+        yield count, buf.getvalue()
+
+
+def database_url_from_env():
+    for name in DATABASE_URL_ENV:
+        if os.environ.get(name):
+            return os.environ[name]
+    return None
+
+
+def connect(url):
+    """psycopg (3) veya psycopg2 ile bağlanır."""
+    try:
+        import psycopg
+    except ImportError:
+        psycopg = None
+    if psycopg is not None:
+        return psycopg.connect(url)
+    try:
+        import psycopg2
+    except ImportError:
+        raise RuntimeError(
+            "PostgreSQL sürücüsü bulunamadı: 'pip install psycopg' (veya psycopg2-binary)"
+        ) from None
+    return psycopg2.connect(url)
+
+
+def _copy(cursor, statement, text):
+    """Bir CSV bloğunu tek COPY ile gönderir (psycopg 3 / psycopg2)."""
+    if hasattr(cursor, "copy"):
+        with cursor.copy(statement) as copy:
+            copy.write(text)
+    else:
+        cursor.copy_expert(statement, io.StringIO(text))
+
+
+class CopyLoader:
+    """
+    Satırları tek transaction içinde batch'ler halinde COPY ile yükler.
+
+    upsert=True ise conflict_key çakışmasında mevcut satır güncellenir;
+    columns arasında yoksa touch sütunu (None: hiçbiri) CURRENT_TIMESTAMP olur.
+    """
+
+    def __init__(self, conn, table, columns, batch_size=DEFAULT_BATCH_SIZE,
+                 upsert=False, conflict_key="id", touch="updatedAt"):
+        self.conn = conn
+        self.table = table
+        self.columns = tuple(columns)
+        self.batch_size = batch_size
+        self.upsert = upsert
+        self.conflict_key = conflict_key
+        self.touch = touch
+
+    def _merge_sql(self, stage):
+        cols = ", ".join(quote_ident(c) for c in self.columns)
+        updates = [
+            f"{quote_ident(c)} = EXCLUDED.{quote_ident(c)}"
+            for c in self.columns
+            if c != self.conflict_key
+        ]
+        if self.touch and self.touch not in self.columns:
+            updates.append(f"{quote_ident(self.touch)} = CURRENT_TIMESTAMP")
+        action = "DO UPDATE SET " + ", ".join(updates) if updates else "DO NOTHING"
+        return (
+            f"INSERT INTO {quote_ident(self.table)} ({cols}) "
+            f"SELECT {cols} FROM {quote_ident(stage)} "
+            f"ON CONFLICT ({quote_ident(self.conflict_key)}) {action}"
+        )
+
+    def load(self, rows):
+        """Satırları yükler, yüklenen satır sayısını döner. Hata olursa rollback."""
+        total = 0
+        cursor = self.conn.cursor()
+        try:
+            target = self.table
+            if self.upsert:
+                target = f"_stage_{self.table}"
+                cursor.execute(
+                    f"CREATE TEMP TABLE {quote_ident(target)} "
+                    f"(LIKE {quote_ident(self.table)} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            statement = copy_statement(target, self.columns)
+            for count, text in iter_batches(rows, self.batch_size):
+                _copy(cursor, statement, text)
+                total += count
+            if self.upsert:
+                cursor.execute(self._merge_sql(target))
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        return total
+
+
+def copy_script_text(table, columns, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    COPY bloklarını psql ile çalıştırılabilir tek bir metin olarak üretir.
+    (satır sayısı, metin) döner.
+    """
+    statement = copy_statement(table, columns)
+    out = io.StringIO()
+    out.write("-- COPY ile toplu yükleme (psql -f ile çalıştırın)\n")
+    out.write("BEGIN;\n\n")
+    total = 0
+    for count, text in iter_batches(rows, batch_size):
+        out.write(statement + ";\n")
+        out.write(text)
+        out.write("\\.\n\n")
+        total += count
+    out.write("COMMIT;\n")
+    return total, out.getvalue()
+
+
+def write_copy_script(path, table, columns, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Dry-run: COPY bloklarını psql ile çalıştırılabilir bir dosyaya yazar.
+    Yazılan satır sayısını döner.
+    """
+    total, text = copy_script_text(table, columns, rows, batch_size)
+    atomic_write_bytes(path, text.encode("utf-8"))
+    return total
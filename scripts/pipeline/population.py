@@ -0,0 +1,575 @@
+# -*- coding: utf-8 -*-
+"""
+Yük testleri için sentetik kullanıcı popülasyonu (profil seed verisi).
+
+scripts/generate-profile-seed.ts her kullanıcıyı ve etkinliğini tek tek
+nesne olarak kurar; 100k+ kullanıcıda bu yol çok yavaştır. Bu motor
+tabloları sütun sütun NumPy dizileri olarak üretir:
+
+    app_users      ad/soyad/rol/e-posta indeksleri, createdAt/updatedAt (ms)
+    quiz_attempts  kullanıcı başına attempts aralığında deneme: quiz, skor, süre, zaman
+    user_badges    public/data/badges.json kriterlerinden (bkz. badge_index)
+    user_balances  puan, lifetimeXp, seviye
+    user_streaks   currentStreak/longestStreak, son etkinlik = son deneme
+
+Rozetler üretilen verilerle tutarlıdır. Sayaç rozetleri (test_count,
+quiz_count, bugfix_count, perfect_score_count, total_score; badge-service.ts
+hepsini quiz denemelerinden sayar) denemeler zaman sırasıyla toplanınca
+eşiğin aşıldığı denemenin zamanında, streak rozetleri currentStreak'in
+days'e ulaştığı günde kazanılır. Kaynağı üretilmeyen kriterler (ders,
+sosyal, günlük ...) verilmez.
+
+Aynı seed, kullanıcı sayısı ve now ile çıktı bayt bayt aynıdır. Çıktı
+tablo tablo, chunk_rows satırlık metin parçaları halinde üretilir:
+iter_copy_script() psql ile çalışan COPY (FORMAT csv) blokları,
+iter_seed_json() data/seed-data/seed-data-for-profile.json biçimi. İki
+biçimde de satırlar sütunlardan kurulur: tekrar eden değerler (isimler,
+quiz'ler, sayılar, saatler) tablolarda bir kez biçimlenir, satırlar
+indeksle seçilen parçaların tek bir str.join'iyle birleşir.
+
+NumPy isteğe bağlıdır; yalnızca bu motor için gerekir.
+"""
+
+import json
+import os
+import re
+
+from . import REPO_ROOT
+from .badge_index import build_index
+from .json_index import LazyJson
+from .json_stream import EncodedArray, dumps, iter_json, object_layout
+from .pg_copy import copy_statement
+from .question_bank import source_paths, turkish_casefold
+from .sql_rows import SqlParseError, read_rows
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DAY_MS = 86_400_000
+DEFAULT_CHUNK_ROWS = 50_000
+DEFAULT_ATTEMPTS = (3, 6)
+SCORE_RANGE = (60, 100)
+ANSWERED_RANGE = (8, 15)
+
+BADGES_PATH = os.path.join(REPO_ROOT, "public", "data", "badges.json")
+PROFILE_SEED_PATH = os.path.join(REPO_ROOT, "data", "seed-data", "seed-data-for-profile.json")
+
+# json-to-sql-seed.ts'in parolasız kullanıcılar için yazdığı değer
+SEED_PASSWORD_HASH = "$2b$10$defaultpasswordhashedvalueforseeddatageneration"
+
+FEMALE_FIRST_NAMES = (
+    "Ayşe", "Zeynep", "Elif", "Fatma", "Merve", "Seda", "Derya", "Gizem", "Büşra", "Sibel",
+    "Ece", "Pelin", "Hande", "Sevgi", "İrem", "Tuğçe", "Aslı", "Nisan", "Melis", "Cansu",
+    "Naz", "Yasemin", "Kübra", "Nil", "Gül", "Sena", "Esra", "Hale", "Selin", "Gonca",
+)
+MALE_FIRST_NAMES = (
+    "Mehmet", "Ahmet", "Mustafa", "Hüseyin", "Emre", "Burak", "Cem", "Can", "Ozan", "Eren",
+    "Deniz", "Hakan", "Onur", "Tolga", "Yasin", "Kerem", "Umut", "Murat", "Gökhan", "Kaan",
+    "Baran", "Bora", "Halil", "Suat", "Serkan", "Berk", "Mert", "Kadir", "Furkan", "Çağrı",
+)
+LAST_NAMES = (
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Aydın", "Öztürk", "Arslan",
+    "Doğan", "Kılıç", "Aslan", "Kara", "Koç", "Kurt", "Özdemir", "Polat", "Özcan", "Kaplan",
+    "Sarı", "Tekin", "Taş", "Güneş", "Bozkurt", "Aksoy", "Erdoğan", "Bulut", "Avcı", "Keskin",
+    "Işık", "Yalçın", "Ceylan", "Çetin", "Eren", "Sezer", "Dinç", "Karaaslan", "Bal", "Uçar",
+    "Özkan", "Erdoğdu", "Bayrak", "Toprak", "Öztuna", "Duman", "Karaca", "Kuzu", "Gökmen", "Öz",
+)
+ROLES = ("candidate", "candidate", "candidate", "candidate", "candidate", "employer")
+EMAIL_DOMAINS = ("gmail.com", "outlook.com", "hotmail.com", "yahoo.com", "proton.me")
+
+AI_ANALYSIS = {"strengths": ["consistency"], "focus": ["refactoring"]}
+
+# badge-service.ts'te quiz denemesi sayısından hesaplanan sayaç kriterleri
+ATTEMPT_COUNT_METRICS = ("test_count", "quiz_count", "bugfix_count")
+
+# Tablolar yükleme (yabancı anahtar) sırasıyla
+TABLES = {
+    "app_users": ("id", "email", "password", "name", "role", "profileImage", "createdAt", "updatedAt"),
+    "quiz_attempts": ("id", "userId", "quizId", "score", "answers", "aiAnalysis", "duration", "topic", "level", "completedAt"),
+    "user_badges": ("id", "userId", "badgeId", "earnedAt", "isDisplayed", "featuredOrder"),
+    "user_balances": ("userId", "points", "lifetimeXp", "level", "updatedAt"),
+    "user_streaks": ("id", "userId", "currentStreak", "longestStreak", "lastActivityDate", "totalDaysActive", "updatedAt"),
+}
+
+_SLUG_CHARS = str.maketrans("ğüşıöç", "gusioc")
+
+# _numbers ve _timestamps'in metin tabloları (ilk kullanımda kurulur)
+_TEXT_TABLES = {}
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("NumPy bulunamadı: 'pip install numpy'")
+
+
+def slugify(text):
+    """generate-profile-seed.ts'teki slugify (İ/I Türkçe kurala göre küçültülür)."""
+    return re.sub(r"[^a-z0-9]+", "-", turkish_casefold(text).translate(_SLUG_CHARS)).strip("-")
+
+
+def _csv_text(value):
+    """Katalogdan gelen metin için CSV alanı (None -> NULL)."""
+    return "" if value is None else '"' + str(value).replace('"', '""') + '"'
+
+
+def load_quizzes(paths=None, warn=None):
+    """Seed SQL'lerindeki quizzes satırları: id sırasıyla [(id, topic, level)]."""
+    quizzes = {}
+    for path in paths if paths is not None else [p for p in source_paths() if p.endswith(".sql")]:
+        def on_error(error, path=path):
+            if warn:
+                warn(f"{path}: {error}")
+
+        try:
+            for _, row in read_rows(os.path.join(REPO_ROOT, path), tables=["quizzes"], on_error=on_error):
+                if isinstance(row.get("id"), str):
+                    topic, level = row.get("topic"), row.get("level")
+                    quizzes.setdefault(row["id"], (
+                        topic if isinstance(topic, str) else None,
+                        level if isinstance(level, str) else None,
+                    ))
+        except SqlParseError as e:
+            on_error(e)
+    return [(quiz_id, *quizzes[quiz_id]) for quiz_id in sorted(quizzes)]
+
+
+def load_profile_images(path=PROFILE_SEED_PATH):
+    """Mevcut profil seed'indeki fotoğraf yolları (Photos/ProfilePhotos depoda yok)."""
+    try:
+        with LazyJson(path) as doc:
+            images = doc.field_values("users", "profileImage")
+    except (OSError, ValueError):
+        return []
+    # Eski seed'de Windows yol ayracı kalmış olabilir
+    return sorted({image.replace("\\", "/") for image in images if image})
+
+
+def load_badges(path=BADGES_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["badges"]
+
+
+def _json_text(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _objects(values):
+    return np.array(list(values), dtype=object)
+
+
+def _numbers(values):
+    """Negatif olmayan tam sayı dizisi -> metin dizisi (büyüyen bir tablodan seçilir)."""
+    count = int(values.max()) + 1 if len(values) else 0
+    texts = _TEXT_TABLES.get("numbers", ())
+    if len(texts) < count:
+        texts = _TEXT_TABLES["numbers"] = _objects(str(i) for i in range(max(count, 2 * len(texts))))
+    return texts[values]
+
+
+def _timestamps(ms):
+    """
+    Epoch milisaniye dizisi -> ISO 8601 (YYYY-MM-DDTHH:MM:SS.mmm) parçaları:
+    (tarih, "THH:MM:SS.", milisaniye). Günün saniyeleri ve milisaniyeler
+    sabit tablolardan, tarihler dizideki farklı günlerden bir kez
+    biçimlenir; _join_rows'a *_timestamps(...) olarak verilir.
+    """
+    if "seconds" not in _TEXT_TABLES:
+        _TEXT_TABLES["seconds"] = _objects(
+            f"T{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}." for s in range(DAY_MS // 1000)
+        )
+        _TEXT_TABLES["millis"] = _objects(f"{i:03d}" for i in range(1000))
+    seconds, millis = _TEXT_TABLES["seconds"], _TEXT_TABLES["millis"]
+    days, rest = np.divmod(ms, DAY_MS)
+    first = int(days.min()) if len(days) else 0
+    dates = np.datetime_as_string(np.arange(first, int(days.max()) + 1 if len(days) else first)
+                                  .astype("datetime64[D]")).astype(object)
+    return dates[days - first], seconds[rest // 1000], millis[rest % 1000]
+
+
+def _join_rows(pieces, n, sep=""):
+    """
+    n satırı sütunlardan tek metinde birleştirir. pieces satır içi sırayla
+    sabit metinler ve n uzunluğunda metin dizileridir (bitişik sabitler
+    birleştirilir); sep satırların arasına girer. Satır başına Python
+    biçimlemesi yerine tek bir str.join çalışır.
+    """
+    merged = []
+    for piece in pieces:
+        if isinstance(piece, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += piece
+        else:
+            merged.append(piece)
+    if not n:
+        return ""
+    grid = np.empty((n, len(merged) + 1), dtype=object)
+    for column, piece in enumerate(merged):
+        grid[:, column] = piece
+    grid[:, -1] = sep
+    grid[-1, -1] = ""
+    return "".join(grid.ravel().tolist())
+
+
+def _group_cumsum(values, starts, counts):
+    """Ardışık kullanıcı grupları içinde kümülatif toplam."""
+    total = np.cumsum(values)
+    return total - np.repeat(total[starts] - values[starts], counts)
+
+
+class Population:
+    """
+    Sütunsal sentetik kullanıcı popülasyonu. Diziler kullanıcı (ve
+    deneme) sırasındadır; denemeler kullanıcı içinde zamana göre sıralıdır.
+    """
+
+    def __init__(self, users, quizzes, badges, seed=0, now_ms=0, attempts=DEFAULT_ATTEMPTS,
+                 images=(), days=30):
+        require_numpy()
+        if users < 1:
+            raise ValueError("kullanıcı sayısı en az 1 olmalı")
+        if not quizzes:
+            raise ValueError("quiz kataloğu boş")
+        low, high = attempts
+        if not 1 <= low <= high:
+            raise ValueError(f"geçersiz deneme aralığı: {low}-{high}")
+        self.size = users
+        self.quizzes = list(quizzes)
+        self.images = list(images)
+        self.now = int(now_ms)
+        rng = np.random.default_rng(seed)
+        self._generate_users(rng, days)
+        self._generate_attempts(rng, low, high)
+        self._generate_streaks(rng)
+        self._generate_balances(rng)
+        self._award_badges(build_index(badges))
+        self._handles = None
+        self._tables = None
+
+    # -- Üretim --------------------------------------------------------------
+
+    def _generate_users(self, rng, days):
+        n = self.size
+        if self.images:
+            self.image = np.arange(n) % len(self.images)
+            woman = np.array(["/Woman/" in image for image in self.images])[self.image]
+        else:
+            self.image = None
+            woman = rng.random(n) < 0.5
+        female, male = len(FEMALE_FIRST_NAMES), len(MALE_FIRST_NAMES)
+        first = (rng.random(n) * np.where(woman, female, male)).astype(np.int64)
+        # İsim tablosu: önce kadın, sonra erkek adları
+        self.first = np.where(woman, first, female + first)
+        self.last = rng.integers(0, len(LAST_NAMES), n)
+        self.role = rng.integers(0, len(ROLES), n)
+        self.domain = rng.integers(0, len(EMAIL_DOMAINS), n)
+        self.created = self.now - rng.integers(0, days * DAY_MS, n)
+        self.updated = self.created + (rng.random(n) * (self.now - self.created)).astype(np.int64)
+
+    def _generate_attempts(self, rng, low, high):
+        n = self.size
+        self.attempt_count = rng.integers(low, high + 1, n)
+        self.attempt_start = np.cumsum(self.attempt_count) - self.attempt_count
+        total = int(self.attempt_count.sum())
+        self.attempt_user = np.repeat(np.arange(n), self.attempt_count)
+        self.attempt_number = np.arange(1, total + 1) - np.repeat(self.attempt_start, self.attempt_count)
+        self.attempt_quiz = rng.integers(0, len(self.quizzes), total)
+        self.score = rng.integers(SCORE_RANGE[0], SCORE_RANGE[1] + 1, total)
+        self.duration = rng.integers(300, 1801, total)
+        self.answered = rng.integers(ANSWERED_RANGE[0], ANSWERED_RANGE[1] + 1, total)
+        self.correct = (self.answered * self.score + 50) // 100
+        created = self.created[self.attempt_user]
+        completed = created + (rng.random(total) * (self.now - created)).astype(np.int64)
+        # Kullanıcı içinde zaman sırası (attempt_user zaten artan)
+        self.completed = completed[np.lexsort((completed, self.attempt_user))]
+
+    def _generate_streaks(self, rng):
+        n = self.size
+        self.last_activity = self.completed[self.attempt_start + self.attempt_count - 1]
+        # Streak, kayıttan son etkinliğe kadar geçen günleri aşamaz
+        limit = (self.last_activity - self.created) // DAY_MS + 1
+        self.current_streak = np.minimum(rng.integers(3, 21, n), limit)
+        self.longest_streak = np.minimum(np.maximum(self.current_streak, rng.integers(7, 31, n)), limit)
+        day = self.completed // DAY_MS
+        user = self.attempt_user
+        new_day = (day[1:] != day[:-1]) & (user[1:] == user[:-1])
+        active_days = 1 + np.bincount(user[1:][new_day], minlength=n)
+        self.days_active = np.maximum(active_days, self.longest_streak)
+
+    def _generate_balances(self, rng):
+        n = self.size
+        self.points = rng.integers(200, 2001, n)
+        self.lifetime_xp = self.points * rng.integers(3, 9, n)
+        self.level = np.maximum(1, np.floor(np.sqrt(self.lifetime_xp / 100))).astype(np.int64)
+
+    def _award_badges(self, index):
+        starts, counts = self.attempt_start, self.attempt_count
+        last = starts + counts - 1
+        # Her denemeden sonra metriğin kullanıcıdaki değeri
+        attempts = _group_cumsum(np.ones(len(self.score), dtype=np.int64), starts, counts)
+        cumulative = {metric: attempts for metric in ATTEMPT_COUNT_METRICS}
+        cumulative["perfect_score_count"] = _group_cumsum((self.score == 100).astype(np.int64), starts, counts)
+        cumulative["total_score"] = _group_cumsum(self.score, starts, counts)
+
+        self.badge_ids = []
+        users, badges, times = [], [], []
+
+        def award(winners, earned_at, ids):
+            for badge_id in ids:
+                users.append(winners)
+                badges.append(np.full(len(winners), len(self.badge_ids)))
+                times.append(earned_at)
+                self.badge_ids.append(badge_id)
+
+        for metric, entry in index["metrics"].items():
+            if "scope" in entry:
+                continue  # set'li kataloglar
+            if metric in cumulative:
+                running = cumulative[metric]
+                final = running[last]
+                # Kullanıcı başına artan değerler tek bir artan anahtara dönüşür
+                bound = int(final.max()) + 1
+                key = self.attempt_user * bound + running
+                for threshold, ids in zip(entry["thresholds"], entry["badges"]):
+                    target = max(0, int(np.ceil(threshold)))
+                    winners = np.flatnonzero(final >= target)
+                    position = np.searchsorted(key, winners * bound + target)
+                    award(winners, self.completed[position], ids)
+            elif entry["type"] == "streak":
+                for threshold, ids in zip(entry["thresholds"], entry["badges"]):
+                    winners = np.flatnonzero(self.current_streak >= threshold)
+                    reached = self.last_activity[winners] - (self.current_streak[winners] - threshold) * DAY_MS
+                    award(winners, np.maximum(reached.astype(np.int64), self.created[winners]), ids)
+
+        if users:
+            user, badge, time = np.concatenate(users), np.concatenate(badges), np.concatenate(times)
+        else:
+            user = badge = time = np.zeros(0, dtype=np.int64)
+        order = np.lexsort((badge, time, user))
+        self.award_user, self.award_badge, self.award_time = user[order], badge[order], time[order]
+        award_count = np.bincount(self.award_user, minlength=self.size)
+        award_start = np.cumsum(award_count) - award_count
+        # Kullanıcının ilk iki rozeti profilde gösterilir (generate-profile-seed.ts gibi)
+        self.award_rank = np.arange(len(order)) - np.repeat(award_start, award_count)
+
+    # -- Çıktı ---------------------------------------------------------------
+
+    def counts(self):
+        return {
+            "app_users": self.size,
+            "quiz_attempts": len(self.score),
+            "user_badges": len(self.award_user),
+            "user_balances": self.size,
+            "user_streaks": self.size,
+        }
+
+    def handles(self):
+        """Kullanıcı başına "ad-soyad-n" (id'lerin ortak kısmı)."""
+        if self._handles is None:
+            first = np.array([slugify(name) for name in FEMALE_FIRST_NAMES + MALE_FIRST_NAMES], dtype=object)
+            last = np.array([slugify(name) for name in LAST_NAMES], dtype=object)
+            self._handles = np.array([
+                f"{a}-{b}-{i}"
+                for i, (a, b) in enumerate(zip(first[self.first].tolist(), last[self.last].tolist()), 1)
+            ], dtype=object)
+        return self._handles
+
+    def _lookups(self):
+        """
+        Sütunların indekslediği sabit metin tabloları (CSV ve JSON
+        biçiminde); her değer bir kez biçimlenir, satırlar indeksle seçer.
+        """
+        if self._tables is None:
+            names = FEMALE_FIRST_NAMES + MALE_FIRST_NAMES
+            full = [f"{a} {b}" for a in names for b in LAST_NAMES]
+            # "ad-soyad-n" -> "ad.soyad" + n
+            local = [f"{slugify(a).replace('-', '.')}.{slugify(b).replace('-', '.')}"
+                     for a in names for b in LAST_NAMES]
+            scores = range(SCORE_RANGE[0], SCORE_RANGE[1] + 1)
+            ai = _csv_text(json.dumps(AI_ANALYSIS, separators=(",", ":")))
+            self._tables = {
+                "name": _objects(full),
+                "name_json": _objects(_json_text(n) for n in full),
+                "email": _objects(local),
+                "domain": _objects("@" + d for d in EMAIL_DOMAINS),
+                "role": _objects(ROLES),
+                "role_json": _objects(_json_text(r) for r in ROLES),
+                "image": _objects(_csv_text(i) for i in self.images),
+                "image_json": _objects(_json_text(i) for i in self.images),
+                "quiz": _objects(_csv_text(q) for q, _, _ in self.quizzes),
+                "quiz_tail": _objects(f"{_csv_text(t)},{_csv_text(lv)}" for _, t, lv in self.quizzes),
+                "quiz_json": _objects(_json_text(q) for q, _, _ in self.quizzes),
+                "topic_json": _objects(_json_text(t) for _, t, _ in self.quizzes),
+                "level_json": _objects(_json_text(lv) for _, _, lv in self.quizzes),
+                # (answered, score) çifti -> 'score,"answers",aiAnalysis'
+                "middle": _objects(
+                    f'{score},"{{""answered"":{a},""correct"":{(a * score + 50) // 100}}}",{ai}'
+                    for a in range(ANSWERED_RANGE[0], ANSWERED_RANGE[1] + 1)
+                    for score in scores
+                ),
+                "badge_mid": _objects(f"-{b},user-" for b in self.badge_ids),
+                "badge_tail": _objects(f",{b}," for b in self.badge_ids),
+                "badge_id_json": _objects("-" + _json_text(b)[1:] for b in self.badge_ids),
+                "badge_json": _objects(_json_text(b) for b in self.badge_ids),
+            }
+        return self._tables
+
+    def _name_index(self, s, e):
+        return self.first[s:e] * len(LAST_NAMES) + self.last[s:e]
+
+    def _middle_index(self, s, e):
+        """Denemenin (answered, score) çiftinin _lookups()["middle"] sırasındaki yeri."""
+        width = SCORE_RANGE[1] - SCORE_RANGE[0] + 1
+        return (self.answered[s:e] - ANSWERED_RANGE[0]) * width + self.score[s:e] - SCORE_RANGE[0]
+
+    def _iter_ranges(self, total, chunk_rows):
+        for s in range(0, total, chunk_rows):
+            yield s, min(total, s + chunk_rows)
+
+    def iter_csv(self, table, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Tablonun COPY (FORMAT csv) satırları, chunk_rows satırlık metinler halinde."""
+        encode = getattr(self, "_csv_" + table)
+        for s, e in self._iter_ranges(self.counts()[table], chunk_rows):
+            yield encode(s, e)
+
+    # Ad, e-posta ve rol sabit listelerden gelir; CSV kaçışı gerekmez
+    def _csv_app_users(self, s, e):
+        t = self._lookups()
+        names = self._name_index(s, e)
+        images = t["image"][self.image[s:e]] if self.image is not None else ""
+        return _join_rows([
+            "user-", self.handles()[s:e], ",", t["email"][names], _numbers(np.arange(s + 1, e + 1)),
+            t["domain"][self.domain[s:e]], f",{SEED_PASSWORD_HASH},", t["name"][names], ",",
+            t["role"][self.role[s:e]], ",", images, ",", *_timestamps(self.created[s:e]), ",",
+            *_timestamps(self.updated[s:e]), "\n",
+        ], e - s)
+
+    def _csv_quiz_attempts(self, s, e):
+        t = self._lookups()
+        handles = self.handles()[self.attempt_user[s:e]]
+        quiz = self.attempt_quiz[s:e]
+        return _join_rows([
+            "quizattempt-", handles, "-", _numbers(self.attempt_number[s:e]), ",user-", handles, ",",
+            t["quiz"][quiz], ",", t["middle"][self._middle_index(s, e)], ",", _numbers(self.duration[s:e]), ",",
+            t["quiz_tail"][quiz], ",", *_timestamps(self.completed[s:e]), "\n",
+        ], e - s)
+
+    def _csv_user_badges(self, s, e):
+        t = self._lookups()
+        handles = self.handles()[self.award_user[s:e]]
+        badge = self.award_badge[s:e]
+        # rank 0/1 profilde gösterilir (featuredOrder 1/2), diğerleri gösterilmez
+        display = _objects((",true,1\n", ",true,2\n", ",false,\n"))
+        return _join_rows([
+            "userbadge-", handles, t["badge_mid"][badge], handles, t["badge_tail"][badge],
+            *_timestamps(self.award_time[s:e]), display[np.minimum(self.award_rank[s:e], 2)],
+        ], e - s)
+
+    def _csv_user_balances(self, s, e):
+        return _join_rows([
+            "user-", self.handles()[s:e], ",", _numbers(self.points[s:e]), ",", _numbers(self.lifetime_xp[s:e]), ",",
+            _numbers(self.level[s:e]), ",", *_timestamps(self.last_activity[s:e]), "\n",
+        ], e - s)
+
+    def _csv_user_streaks(self, s, e):
+        handles = self.handles()[s:e]
+        last = _timestamps(self.last_activity[s:e])
+        return _join_rows([
+            "streak-", handles, ",user-", handles, ",", _numbers(self.current_streak[s:e]), ",",
+            _numbers(self.longest_streak[s:e]), ",", *last, ",", _numbers(self.days_active[s:e]), ",", *last, "\n",
+        ], e - s)
+
+    def iter_copy_script(self, chunk_rows=DEFAULT_CHUNK_ROWS, header=()):
+        """Tüm tablolar için psql -f ile çalışan COPY betiği (tek transaction)."""
+        for line in header:
+            yield f"-- {line}\n"
+        yield "BEGIN;\n\n"
+        for table, columns in TABLES.items():
+            yield copy_statement(table, columns) + ";\n"
+            yield from self.iter_csv(table, chunk_rows)
+            yield "\\.\n\n"
+        yield "COMMIT;\n"
+
+    # -- seed-data-for-profile.json ---------------------------------------------
+
+    def _json_array(self, table, chunk_rows):
+        """Tablonun JSON nesneleri; iter_json yazarken chunk_rows satırlık parçalarla kodlanır."""
+        encode = getattr(self, "_json_" + table)
+
+        def render(indent, level, sep):
+            for s, e in self._iter_ranges(self.counts()[table], chunk_rows):
+                yield encode(s, e, indent, level, sep)
+
+        return EncodedArray(render)
+
+    def _json_app_users(self, s, e, indent, level, sep):
+        t = self._lookups()
+        k = object_layout(("id", "email", "password", "name", "role", "profileImage", "createdAt", "updatedAt"),
+                          indent, level)
+        names = self._name_index(s, e)
+        images = t["image_json"][self.image[s:e]] if self.image is not None else "null"
+        return _join_rows([
+            k[0], '"user-', self.handles()[s:e], '"', k[1], '"', t["email"][names], _numbers(np.arange(s + 1, e + 1)),
+            t["domain"][self.domain[s:e]], '"', k[2], "null", k[3], t["name_json"][names], k[4],
+            t["role_json"][self.role[s:e]], k[5], images, k[6], '"', *_timestamps(self.created[s:e]), 'Z"', k[7],
+            '"', *_timestamps(self.updated[s:e]), 'Z"', k[8],
+        ], e - s, sep)
+
+    def _json_quiz_attempts(self, s, e, indent, level, sep):
+        t = self._lookups()
+        k = object_layout(("id", "userId", "quizId", "score", "answers", "aiAnalysis", "duration", "topic", "level",
+                           "completedAt"), indent, level)
+        answers = _objects(
+            dumps({"answered": a, "correct": (a * score + 50) // 100}, indent, level + 1)
+            for a in range(ANSWERED_RANGE[0], ANSWERED_RANGE[1] + 1)
+            for score in range(SCORE_RANGE[0], SCORE_RANGE[1] + 1)
+        )
+        handles = self.handles()[self.attempt_user[s:e]]
+        quiz = self.attempt_quiz[s:e]
+        return _join_rows([
+            k[0], '"quizattempt-', handles, "-", _numbers(self.attempt_number[s:e]), '"', k[1], '"user-', handles, '"',
+            k[2], t["quiz_json"][quiz], k[3], _numbers(self.score[s:e]), k[4], answers[self._middle_index(s, e)],
+            k[5], dumps(AI_ANALYSIS, indent, level + 1), k[6], _numbers(self.duration[s:e]), k[7],
+            t["topic_json"][quiz], k[8], t["level_json"][quiz], k[9], '"', *_timestamps(self.completed[s:e]), 'Z"',
+            k[10],
+        ], e - s, sep)
+
+    def _json_user_badges(self, s, e, indent, level, sep):
+        t = self._lookups()
+        k = object_layout(("id", "userId", "badgeId", "earnedAt", "isDisplayed", "featuredOrder"), indent, level)
+        handles = self.handles()[self.award_user[s:e]]
+        badge = self.award_badge[s:e]
+        rank = np.minimum(self.award_rank[s:e], 2)
+        return _join_rows([
+            k[0], '"userbadge-', handles, t["badge_id_json"][badge], k[1], '"user-', handles, '"', k[2],
+            t["badge_json"][badge], k[3], '"', *_timestamps(self.award_time[s:e]), 'Z"', k[4],
+            _objects(("true", "true", "false"))[rank], k[5], _objects(("1", "2", "null"))[rank], k[6],
+        ], e - s, sep)
+
+    def _json_user_balances(self, s, e, indent, level, sep):
+        k = object_layout(("userId", "points", "lifetimeXp", "level"), indent, level)
+        return _join_rows([
+            k[0], '"user-', self.handles()[s:e], '"', k[1], _numbers(self.points[s:e]), k[2],
+            _numbers(self.lifetime_xp[s:e]), k[3], _numbers(self.level[s:e]), k[4],
+        ], e - s, sep)
+
+    def _json_user_streaks(self, s, e, indent, level, sep):
+        k = object_layout(("userId", "currentStreak", "longestStreak", "lastActivityDate", "totalDaysActive"),
+                          indent, level)
+        return _join_rows([
+            k[0], '"user-', self.handles()[s:e], '"', k[1], _numbers(self.current_streak[s:e]), k[2],
+            _numbers(self.longest_streak[s:e]), k[3], '"', *_timestamps(self.last_activity[s:e]), 'Z"', k[4],
+            _numbers(self.days_active[s:e]), k[5],
+        ], e - s, sep)
+
+    def iter_seed_json(self, meta, chunk_rows=DEFAULT_CHUNK_ROWS, indent=2):
+        """seed-data-for-profile.json biçimi; satırlar yazılırken sütunlardan kodlanır."""
+        document = {
+            "meta": meta,
+            "users": self._json_array("app_users", chunk_rows),
+            "userBadges": self._json_array("user_badges", chunk_rows),
+            "quizAttempts": self._json_array("quiz_attempts", chunk_rows),
+            "userBalances": self._json_array("user_balances", chunk_rows),
+            "userStreaks": self._json_array("user_streaks", chunk_rows),
+        }
+        return iter_json(document, indent=indent)
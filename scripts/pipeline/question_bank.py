@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+"""
+Kurslar arası soru bankası ve yakın-kopya (near-duplicate) indeksi.
+
+Kaynaklar:
+    database-seed.sql, DB-Scripts/*.sql   quizzes.questions içindeki çoktan
+                                          seçmeli sorular ("mcq")
+    data/test-modules/*.json              relatedTests başlıkları; seçeneksiz
+                                          soru kökleri ("prompt")
+
+Sorular sütun sütun (columnar) tutulur: metinler listelerde, kaynak,
+tür, cevap, cluster ve MinHash imzaları array'lerde. Her sorunun metni
+Türkçe'ye uygun küçük harfe çevrilip (I -> ı, İ -> i) noktalama
+atılarak normalize edilir ve 4 karakterlik shingle'larından tek
+permütasyonlu (one-permutation) bir MinHash imzası çıkarılır. İmzalar
+LSH bantlarına bölünür; yalnızca aynı kovaya düşen sorular
+karşılaştırıldığından on binlerce soruda da yakın kopyalar birkaç
+saniyede bulunur.
+
+Kullanım:
+    bank = build_bank()                 # kaynakları tara
+    bank.save(BANK_PATH)
+    bank = QuestionBank.load(BANK_PATH)
+    bank.near_duplicates("FOR döngüsünde koşul ifadesi false olduğunda ne olur")
+    # -> [(1.0, i), (0.92..., j)]: aynı soru ve "olduğundane" yazımlı kopyası
+"""
+
+import base64
+import glob
+import json
+import os
+import re
+import sys
+import unicodedata
+import zlib
+from array import array
+from operator import eq
+
+from . import REPO_ROOT, sql_rows, stacks
+from .build_cache import BuildCache, atomic_write_bytes
+from .sql_rows import SqlParseError, read_rows
+from .stacks import STACK_COURSES, TEST_MODULES_GLOB, lesson_title, stack_name
+
+BANK_VERSION = 1
+BANK_PATH = os.path.join(REPO_ROOT, ".content-cache", "question-bank.json")
+
+SQL_SOURCES = ("database-seed.sql", "DB-Scripts/*.sql")
+
+KINDS = ("mcq", "prompt")
+MCQ, PROMPT = 0, 1
+
+SHINGLE_SIZE = 4
+NUM_BINS = 64
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+DEFAULT_THRESHOLD = 0.8
+
+_BIN_BITS = NUM_BINS.bit_length() - 1  # NUM_BINS ikinin kuvveti
+_EMPTY = 0xFFFFFFFF
+
+_TURKISH_UPPER = str.maketrans({"I": "ı", "İ": "i"})
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+# Liste olarak tutulan metin sütunları (kayıt dict'lerindeki anahtarlar)
+TEXT_COLUMNS = ("uid", "quiz", "course", "lesson", "text", "explanation")
+
+
+def turkish_casefold(text):
+    """str.casefold, ancak I/İ Türkçe kurallarıyla ("KODLAMA IŞIĞI" -> "kodlama ışığı")."""
+    return unicodedata.normalize("NFC", text).translate(_TURKISH_UPPER).casefold()
+
+
+def normalize_text(text):
+    """Küçük harf, noktalamasız, tek boşluklu metin (karşılaştırma anahtarı)."""
+    return " ".join(_NON_WORD_RE.sub(" ", turkish_casefold(text)).split())
+
+
+def _mix32(h):
+    # murmur3 fmix32: crc32'nin doğrusallığını kırar
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    return h ^ (h >> 16)
+
+
+# Boş kutu b için yoklanacak kutular (deterministik, kutuya özgü sıra)
+_PROBES = [
+    [_mix32(b * 4 * NUM_BINS + k + 1) & (NUM_BINS - 1) for k in range(4 * NUM_BINS)] + list(range(NUM_BINS))
+    for b in range(NUM_BINS)
+]
+
+
+class MinHasher:
+    """Tek permütasyonlu MinHash; shingle hash'leri süreç boyunca önbelleklenir."""
+
+    def __init__(self):
+        self._hashes = {}
+        self._signatures = {}
+
+    def _shingle_hashes(self, normalized):
+        text = f" {normalized} "
+        hashes = self._hashes
+        out = set()
+        for i in range(max(1, len(text) - SHINGLE_SIZE + 1)):
+            shingle = text[i:i + SHINGLE_SIZE]
+            h = hashes.get(shingle)
+            if h is None:
+                h = hashes[shingle] = _mix32(zlib.crc32(shingle.encode("utf-8")))
+            out.add(h)
+        return out
+
+    def signature(self, normalized):
+        """
+        NUM_BINS değerlik imza: her shingle hash'i alt bitleriyle bir kutuya
+        düşer, kutu en küçük değeri tutar. Kısa metinlerde boş kalan kutular,
+        kutuya özgü sözde rastgele bir sırayla yoklanan ilk dolu kutunun
+        değerini alır (densification). Komşu kutudan kopyalamanın aksine
+        bir LSH bandındaki kutular aynı shingle'a bağlanmaz.
+        """
+        sig = self._signatures.get(normalized)
+        if sig is None:
+            sig = self._signatures[normalized] = self._signature(normalized)
+        return sig
+
+    def _signature(self, normalized):
+        sig = [_EMPTY] * NUM_BINS
+        mask = NUM_BINS - 1
+        for h in self._shingle_hashes(normalized):
+            b = h & mask
+            v = h >> _BIN_BITS
+            if v < sig[b]:
+                sig[b] = v
+        filled = [v != _EMPTY for v in sig]
+        if any(filled) and not all(filled):
+            for b in range(NUM_BINS):
+                if not filled[b]:
+                    for source in _PROBES[b]:
+                        if filled[source]:
+                            sig[b] = sig[source]
+                            break
+        return sig
+
+
+def similarity(sig_a, sig_b):
+    """İki imzanın tahmini Jaccard benzerliği (eşit kutu oranı)."""
+    return sum(map(eq, sig_a, sig_b)) / NUM_BINS
+
+
+# -- Kaynaklar ----------------------------------------------------------------
+
+def source_paths():
+    """Bankanın okuduğu tüm dosyalar (depo köküne göre, sıralı)."""
+    paths = []
+    for pattern in SQL_SOURCES + (TEST_MODULES_GLOB,):
+        paths.extend(sorted(glob.glob(os.path.join(REPO_ROOT, pattern))))
+    return [os.path.relpath(p, REPO_ROOT).replace(os.sep, "/") for p in paths]
+
+
+def _answer_index(question, options):
+    answer = question.get("correctAnswer", question.get("answer"))
+    if isinstance(answer, bool) or not isinstance(answer, int) or not 0 <= answer < len(options):
+        return -1
+    return answer
+
+
+def iter_sql_questions(path, on_error):
+    """quizzes satırlarındaki çoktan seçmeli sorular (kayıt dict'leri)."""
+    rows = read_rows(os.path.join(REPO_ROOT, path), tables=["quizzes"], on_error=on_error)
+    try:
+        for _, row in rows:
+            questions = row.get("questions")
+            if not isinstance(questions, list):
+                continue  # geçersiz jsonb gövdesi veya SQL ifadesi
+            for n, q in enumerate(questions, 1):
+                if not isinstance(q, dict) or not isinstance(q.get("question"), str):
+                    continue  # live coding / bugfix görevleri
+                options = q.get("options")
+                options = [str(o) for o in options] if isinstance(options, list) else []
+                yield {
+                    "uid": f"{row.get('id')}#{q.get('id') or n}",
+                    "quiz": str(row.get("id")),
+                    "course": row.get("courseId") or "",
+                    "lesson": row.get("lessonSlug") or "",
+                    "text": q["question"],
+                    "explanation": q.get("explanation") or "",
+                    "options": options,
+                    "answer": _answer_index(q, options),
+                    "kind": MCQ,
+                }
+    except SqlParseError as e:
+        # Bozuk dosya: o ana kadar okunanlar kalır
+        on_error(e)
+
+
+def iter_test_module_prompts(path):
+    """relatedTests başlıkları seçeneksiz soru kökü olarak."""
+    stack = stack_name(path)
+    course_id = STACK_COURSES.get(stack, (f"course-{stack}-roadmap", None))[0]
+    with open(os.path.join(REPO_ROOT, path), "r", encoding="utf-8") as f:
+        modules = json.load(f)["modules"]
+    for module in modules:
+        for test in module.get("relatedTests") or []:
+            yield {
+                "uid": f"{stack}/{module['id']}/{test.get('id')}",
+                "quiz": module["id"],
+                "course": course_id,
+                "lesson": test.get("href") or "",
+                "text": lesson_title(test["title"]),
+                "explanation": test.get("description") or "",
+                "options": [],
+                "answer": -1,
+                "kind": PROMPT,
+            }
+
+
+def build_bank(paths=None, warn=None):
+    """Kaynakları tarayıp indekslenmiş bir QuestionBank döner."""
+    bank = QuestionBank()
+    for path in paths if paths is not None else source_paths():
+        def on_error(error, path=path):
+            bank.warnings.append(f"{path}: {error}")
+            if warn:
+                warn(f"{path}: {error}")
+
+        if path.endswith(".sql"):
+            records = iter_sql_questions(path, on_error)
+        else:
+            records = iter_test_module_prompts(path)
+        bank.add_source(path, records)
+    bank.build_clusters()
+    return bank
+
+
+def load_or_build(path=BANK_PATH, force=None, warn=None):
+    """
+    Kaynaklar son derlemeden beri değişmediyse bankayı dosyadan yükler,
+    değiştiyse yeniden derleyip kaydeder (build cache ile).
+    """
+    paths = source_paths()
+    cache = BuildCache("question-bank", force=force)
+    cache.add_source(__file__, sql_rows.__file__, stacks.__file__)
+    cache.add_source(*(os.path.join(REPO_ROOT, p) for p in paths))
+    if cache.is_fresh():
+        try:
+            return QuestionBank.load(path)
+        except (OSError, ValueError):
+            pass
+    bank = build_bank(paths, warn=warn)
+    bank.save(path)
+    cache.track_output(path)
+    cache.commit()
+    return bank
+
+
+# -- Banka ----------------------------------------------------------------------
+
+class QuestionBank:
+    """Sütun tabanlı soru deposu + MinHash/LSH indeksi."""
+
+    def __init__(self):
+        self.sources = []
+        self.source = array("H")
+        self.kind = array("B")
+        self.answer = array("b")
+        self.cluster = array("I")
+        self.signatures = array("I")
+        self.options = []
+        for column in TEXT_COLUMNS:
+            setattr(self, column, [])
+        self.warnings = []
+        self._hasher = MinHasher()
+        self._buckets = None
+        self._members = None
+
+    def __len__(self):
+        return len(self.text)
+
+    def add_source(self, path, records):
+        index = len(self.sources)
+        self.sources.append(path)
+        for record in records:
+            self.source.append(index)
+            self.kind.append(record["kind"])
+            self.answer.append(record["answer"])
+            self.options.append(record["options"])
+            for column in TEXT_COLUMNS:
+                getattr(self, column).append(record[column])
+            self.signatures.extend(self._hasher.signature(normalize_text(record["text"])))
+        self._buckets = None
+
+    def signature(self, i):
+        return self.signatures[i * NUM_BINS:(i + 1) * NUM_BINS]
+
+    def record(self, i):
+        return {
+            "uid": self.uid[i],
+            "source": self.sources[self.source[i]],
+            "quiz": self.quiz[i],
+            "course": self.course[i],
+            "lesson": self.lesson[i],
+            "kind": KINDS[self.kind[i]],
+            "text": self.text[i],
+            "options": self.options[i],
+            "answer": self.answer[i],
+            "explanation": self.explanation[i],
+            "cluster": self.cluster[i],
+        }
+
+    # -- LSH -------------------------------------------------------------------
+
+    def _band_keys(self, sig):
+        raw = array("I", sig).tobytes()
+        step = ROWS * 4
+        return [raw[b * step:(b + 1) * step] for b in range(BANDS)]
+
+    def buckets(self):
+        """Bant başına {kova anahtarı: [soru indeksleri]} (aynı imzalılardan yalnızca biri)."""
+        if self._buckets is None:
+            self._buckets = [{} for _ in range(BANDS)]
+            seen = set()
+            raw = self.signatures.tobytes()
+            width = NUM_BINS * 4
+            for i in range(len(self)):
+                whole = raw[i * width:(i + 1) * width]
+                if whole in seen:
+                    continue
+                seen.add(whole)
+                for band, key in zip(self._buckets, self._band_keys(self.signature(i))):
+                    band.setdefault(key, []).append(i)
+        return self._buckets
+
+    def build_clusters(self, threshold=DEFAULT_THRESHOLD):
+        """
+        Yakın kopyaları birleştirir (union-find); cluster[i] kümenin en
+        küçük indeksidir. Aynı imzalı sorular doğrudan birleştirilir,
+        diğerleri yalnızca ortak bir LSH kovasındaysa karşılaştırılır.
+        """
+        n = len(self)
+        parent = list(range(n))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(a, b):
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+
+        raw = self.signatures.tobytes()
+        width = NUM_BINS * 4
+        first = {}
+        for i in range(n):
+            union(i, first.setdefault(raw[i * width:(i + 1) * width], i))
+
+        # Kovadaki her soru yalnızca kovanın o ana kadarki küme temsilcileriyle
+        # karşılaştırılır (kova boyu × küme sayısı, kova boyunun karesi değil)
+        for band in self.buckets():
+            for members in band.values():
+                if len(members) < 2:
+                    continue
+                reps = []
+                for a in members:
+                    sig_a = self.signature(a)
+                    matched = False
+                    for b, sig_b in reps:
+                        if find(a) == find(b):
+                            matched = True
+                        elif similarity(sig_a, sig_b) >= threshold:
+                            union(a, b)
+                            matched = True
+                    if not matched:
+                        reps.append((a, sig_a))
+
+        self.cluster = array("I", (find(i) for i in range(n)))
+        self._members = None
+        return self.cluster
+
+    def clusters(self, min_size=2):
+        """{temsilci: [indeksler]} (yalnızca min_size ve üstü kümeler)."""
+        groups = {}
+        for i, root in enumerate(self.cluster):
+            groups.setdefault(root, []).append(i)
+        return {root: members for root, members in groups.items() if len(members) >= min_size}
+
+    def near_duplicates(self, text, threshold=DEFAULT_THRESHOLD):
+        """Metne benzeyen sorular: [(benzerlik, indeks)] (azalan benzerlik)."""
+        sig = self._hasher.signature(normalize_text(text))
+        candidates = set()
+        for band, key in zip(self.buckets(), self._band_keys(sig)):
+            candidates.update(band.get(key, ()))
+        # Kovada yalnızca her imzanın ilk sorusu var; kümenin kalanı cluster'dan gelir
+        roots = {self.cluster[i] for i in candidates
+                 if similarity(sig, self.signature(i)) >= threshold}
+        if self._members is None:
+            self._members = self.clusters(min_size=1)
+        found = []
+        for root in roots:
+            for i in self._members[root]:
+                score = similarity(sig, self.signature(i))
+                if score >= threshold:
+                    found.append((score, i))
+        return sorted(found, key=lambda item: (-item[0], item[1]))
+
+    # -- Çekme -------------------------------------------------------------------
+
+    def draw(self, candidates, count, used_clusters):
+        """
+        candidates sırasından, cluster'ı used_clusters'ta olmayan en fazla
+        count soru indeksi seçer; seçilenlerin cluster'ları kümeye eklenir.
+        candidates bir iterator ise kalan elemanlar sonraki çağrıda kullanılabilir.
+        """
+        picked = []
+        if count <= 0:
+            return picked
+        for i in candidates:
+            root = self.cluster[i]
+            if root in used_clusters:
+                continue
+            used_clusters.add(root)
+            picked.append(i)
+            if len(picked) == count:
+                break
+        return picked
+
+    # -- Kalıcılık -----------------------------------------------------------------
+
+    def to_json(self):
+        def packed(values):
+            return base64.b64encode(values.tobytes()).decode("ascii")
+
+        return {
+            "version": BANK_VERSION,
+            "byteorder": sys.byteorder,
+            "numBins": NUM_BINS,
+            "sources": self.sources,
+            "warnings": self.warnings,
+            "columns": {column: getattr(self, column) for column in TEXT_COLUMNS + ("options",)},
+            "packed": {
+                "source": packed(self.source),
+                "kind": packed(self.kind),
+                "answer": packed(self.answer),
+                "cluster": packed(self.cluster),
+                "signatures": packed(self.signatures),
+            },
+        }
+
+    def save(self, path=BANK_PATH):
+        data = json.dumps(self.to_json(), ensure_ascii=False, separators=(",", ":"))
+        atomic_write_bytes(path, data.encode("utf-8"))
+
+    @classmethod
+    def load(cls, path=BANK_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != BANK_VERSION or data.get("numBins") != NUM_BINS:
+            raise ValueError(f"{path}: desteklenmeyen soru bankası sürümü")
+        bank = cls()
+        bank.sources = data["sources"]
+        bank.warnings = data.get("warnings", [])
+        for column in TEXT_COLUMNS + ("options",):
+            setattr(bank, column, data["columns"][column])
+        for name, values in data["packed"].items():
+            column = getattr(bank, name)
+            column.frombytes(base64.b64decode(values))
+            if data.get("byteorder") != sys.byteorder:
+                column.byteswap()
+        return bank
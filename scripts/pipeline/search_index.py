@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+"""
+Ders, konu, test modülü ve case içerikleri için tam metin arama indeksi.
+
+İçerik JSON ağaçlarında DOC_KEYS dizilerinin (modules, lessons, topics,
+cases, relatedTests, relatedTopics) her elemanı bir dokümandır; metni,
+iç içe doküman dizileri hariç alt ağacındaki bütün metin alanlarıdır
+(href/id gibi SKIP_KEYS dışında). Kökte bu dizilerin dışında kalan
+metin (courseTitle, overview ...) kök dokümanıdır. Dokümanın yolu
+json-path.py sözdizimindedir (ör. modules[3].lessons[0]).
+
+Çözümleme (analyze):
+    katlama   İ/I/ı -> i (Türkçe kuralı; str.lower() 'İ'yi 'i̇' yapar) ve
+              ç ğ ö ş ü â î û -> c g o s u a i u; içeriğin bir kısmı zaten
+              ASCII Türkçe ("Sayisal Cikti Dongusu") ve İngilizce terimler
+              (Injection) noktasız ı'ya düşmemeli
+    kelime    \\w+ (c++ ve c# korunur); STOPWORDS konumu sayılıp atlanır
+    gövde     hafif Türkçe ek atıcı: hal, iyelik/ilgi, çoğul ek grupları
+              sırayla, her gruptan en fazla bir ek, gövde en az 3 harf;
+              sonda kalan ı/i/u/ü (uzun gövdelerde) atılır
+
+Her kaynak dosya ayrı bir segmenttir: dokümanları, uzunlukları ve terim
+konumları .content-cache/search-index/ altında dosyanın sha256'sı ile
+saklanır. Yeniden kurulumda yalnızca değişen dosyalar çözümlenir;
+BM25 istatistikleri (N, avgdl, df) küresel olduğundan segmentler her
+seferinde birleştirilir ve ağırlıklar yeniden hesaplanır.
+
+İndeks dosyası (little-endian, bölümler 4 bayta hizalı) mmap ile
+açılır; sorgu yalnızca dokunduğu terimlerin baytlarını okur:
+
+    başlık    HEADER: magic, sürüm, doküman/terim sayısı, avgdl, k1, b,
+              bölüm ofsetleri
+    doküman   n_docs × DOC_ENTRY (meta ofseti, meta uzunluğu, uzunluk);
+              meta JSON: {source, path, kind, title, href}
+    sözlük    n_terms × TERM_ENTRY, terim baytlarına göre sıralı (ikili
+              arama): terim ofseti/uzunluğu, df, postings ve konum
+              bloklarının ofsetleri
+    postings  terim başına df × u32 doküman, df × f32 BM25 ağırlığı,
+              df × u32 konum ofseti
+    konumlar  doküman başına varint farklar; blok sonu bir sonraki
+              ofset (sonuncuda terimin konum bloğu uzunluğu). Farkların
+              hepsi 128'den küçükse blok bayt dizisi olarak tek adımda
+              açılır
+
+BM25 ağırlığı kurulumda hesaplanır (idf × tf(k1+1) / (tf + k1(1-b+b·dl/avgdl))),
+sorgu yalnızca toplar. Başlıktaki terimlerin tf'si TITLE_BOOST katıdır.
+Tırnak içindeki ifadeler, aradaki durak kelimeler dahil, indeksteki
+konum farklarıyla eşleşmelidir.
+"""
+
+import array
+import bisect
+import glob
+import heapq
+import itertools
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+
+from . import REPO_ROOT
+from .build_cache import CACHE_DIR, sha256_bytes, sha256_file, write_if_changed
+from .content_export import is_export
+
+INDEX_MAGIC = b"YKSRCH\x00\x01"
+INDEX_VERSION = 1
+INDEX_PATH = os.path.join(REPO_ROOT, "public", "data", "search-index.bin")
+SEGMENT_DIR = os.path.join(CACHE_DIR, "search-index")
+
+SOURCE_GLOBS = (
+    "data/lesson-contents/*.json",
+    "data/topic-lessons/*.json",
+    "data/test-modules/*.json",
+    "data/bugfix-cases.json",
+    "data/live-coding-cases/*-cases.json",
+    "data/live-coding/junior-cases/*-junior-cases.json",
+)
+
+DOC_KEYS = {
+    "modules": "module",
+    "lessons": "lesson",
+    "topics": "topic",
+    "cases": "case",
+    "relatedTests": "test",
+    "relatedTopics": "topic",
+}
+TITLE_KEYS = ("title", "label", "moduleTitle", "courseTitle", "name")
+SKIP_KEYS = frozenset((
+    "href", "id", "moduleId", "courseId", "caseId", "type", "level", "difficulty", "version",
+    "language", "icon", "image", "url",
+))
+
+K1 = 1.2
+B = 0.75
+TITLE_BOOST = 3
+# Alanlar arasında bırakılan konum boşluğu (ifadeler alan sınırını aşmasın)
+FIELD_GAP = 8
+
+HEADER = struct.Struct("<8sIIIfffIIIIII")
+DOC_ENTRY = struct.Struct("<III")
+TERM_ENTRY = struct.Struct("<IHHIIII")
+
+STOPWORDS = frozenset((
+    "ve", "ile", "bir", "bu", "su", "o", "da", "de", "icin", "gibi", "olan", "olarak", "cok", "daha",
+    "her", "veya", "ya", "ne", "mi", "ki", "the", "a", "an", "and", "or", "of", "to", "in", "is",
+    "for", "on", "with", "be", "as", "by", "it",
+))
+
+_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i", "Ç": "c", "ç": "c", "Ğ": "g", "ğ": "g", "Ö": "o", "ö": "o",
+    "Ş": "s", "ş": "s", "Ü": "u", "ü": "u", "Â": "a", "â": "a", "Î": "i", "î": "i", "Û": "u", "û": "u",
+})
+_WORD = re.compile(r"\w+(?:\+\+|#)?")
+_PHRASE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Katlanmış (ASCII) biçimde ek grupları; her gruptan en uzun eşleşen tek ek atılır.
+SUFFIX_GROUPS = (
+    ("ndan", "nden", "ntan", "nten", "dan", "den", "tan", "ten", "nda", "nde", "nin", "nun",
+     "yla", "yle", "da", "de", "ta", "te", "na", "ne", "ya", "ye", "yi", "yu"),
+    ("lari", "leri", "imiz", "umuz", "iniz", "unuz", "si", "su", "in", "un"),
+    ("lar", "ler"),
+)
+MIN_STEM = 3
+# Eklerden sonra kalan belirtme/iyelik ünlüsü (veritabanı/veritabanları, kullanıcı/kullanıcılar)
+FINAL_VOWELS = ("i", "u")
+MIN_FINAL_STEM = 5
+_SUFFIXES = tuple(sorted(group, key=len, reverse=True) for group in SUFFIX_GROUPS)
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SearchIndexError(Exception):
+    """İndeks dosyası okunamadı ya da biçimi/sürümü uyumsuz."""
+
+
+# ---------------------------------------------------------------------------
+# Çözümleme
+# ---------------------------------------------------------------------------
+
+def fold(text):
+    """Türkçe büyük/küçük harf ve aksan katlaması (bkz. modül belgesi)."""
+    return text.translate(_FOLD).lower()
+
+
+def stem(word):
+    if not word.isalpha():
+        return word
+    for suffixes in _SUFFIXES:
+        for suffix in suffixes:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+                word = word[: -len(suffix)]
+                break
+    if word.endswith(FINAL_VOWELS) and len(word) > MIN_FINAL_STEM:
+        word = word[:-1]
+    return word
+
+
+class Analyzer:
+    """Metni (konum, terim) dizisine çevirir; gövdeler sözlükte önbelleğe alınır."""
+
+    def __init__(self):
+        self._stems = {}
+
+    def terms(self, text, start=0):
+        """[(konum, terim)], sonraki boş konum. Durak kelimeler konum tüketir ama dönmez."""
+        stems = self._stems
+        words = _WORD.findall(fold(text))
+        out = []
+        for position, word in enumerate(words, start):
+            if word in STOPWORDS:
+                continue
+            term = stems.get(word)
+            if term is None:
+                term = stems[word] = stem(word)
+            out.append((position, term))
+        return out, start + len(words)
+
+
+def query_terms(analyzer, text):
+    """
+    Sorguyu [[(konum, terim), ...], ...] gruplarına böler; tırnaklı ifade tek
+    gruptur. Konumlar ifade içindedir ve atlanan durak kelimeleri de sayar,
+    böylece "Middleware ve Pipeline" indeksteki gibi iki konum arayla eşleşir.
+    """
+    groups = []
+    for phrase, word in _PHRASE.findall(text):
+        terms = analyzer.terms(phrase or word)[0]
+        if phrase:
+            if terms:
+                groups.append(terms)
+        else:
+            groups.extend([(0, term)] for _, term in terms)
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Dokümanlar ve segmentler
+# ---------------------------------------------------------------------------
+
+def _title(value):
+    for key in TITLE_KEYS:
+        if isinstance(value.get(key), str) and value[key].strip():
+            return value[key].strip()
+    return ""
+
+
+def _texts(value):
+    """Alt ağaçtaki metin alanları (doküman dizileri ve SKIP_KEYS hariç)."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _texts(item)
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            if key in SKIP_KEYS or (key in DOC_KEYS and isinstance(child, list)):
+                continue
+            yield from _texts(child)
+
+
+def iter_documents(data, path=""):
+    """(json yolu, tür, doküman değeri) — önce kök, sonra iç içe doküman dizileri."""
+    if path == "":
+        yield "", "course", data
+    if isinstance(data, dict):
+        for key, child in data.items():
+            child_path = f"{path}.{key}" if path else key
+            if key in DOC_KEYS and isinstance(child, list):
+                for i, item in enumerate(child):
+                    if isinstance(item, dict):
+                        yield f"{child_path}[{i}]", DOC_KEYS[key], item
+                        yield from iter_documents(item, f"{child_path}[{i}]")
+            elif key not in SKIP_KEYS and isinstance(child, (dict, list)):
+                yield from iter_documents(child, child_path)
+    elif isinstance(data, list):
+        for i, item in enumerate(data):
+            yield from iter_documents(item, f"{path}[{i}]")
+
+
+def analyze_source(path, analyzer=None):
+    """
+    Bir kaynak dosyanın segmenti: [{meta, length, terms: {terim: [tf, [konum...]]}}].
+    Metni olmayan dokümanlar atlanır. Bozuk JSON ValueError yükseltir.
+    """
+    analyzer = analyzer or Analyzer()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    source = os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/")
+    docs = []
+    for doc_path, kind, value in iter_documents(data):
+        if not isinstance(value, dict):
+            continue
+        title = _title(value)
+        terms = {}
+        position = 0
+        for text in _texts(value):
+            found, position = analyzer.terms(text, position)
+            for pos, term in found:
+                entry = terms.get(term)
+                if entry is None:
+                    entry = terms[term] = [0, []]
+                entry[0] += 1
+                entry[1].append(pos)
+            position += FIELD_GAP
+        if not terms:
+            continue
+        for _, term in analyzer.terms(title)[0]:
+            if term in terms:
+                terms[term][0] += TITLE_BOOST - 1
+        docs.append({
+            "meta": {"source": source, "path": doc_path, "kind": kind, "title": title or source,
+                     "href": value.get("href") if isinstance(value.get("href"), str) else None},
+            "length": sum(entry[0] for entry in terms.values()),
+            "terms": terms,
+        })
+    return docs
+
+
+def collect_sources(patterns=SOURCE_GLOBS):
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(REPO_ROOT, pattern) if not os.path.isabs(pattern) else pattern)):
+            if path.endswith(".json") and not is_export(path) and path not in paths:
+                paths.append(path)
+    return paths
+
+
+def _segment_path(path):
+    source = os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/")
+    return os.path.join(SEGMENT_DIR, sha256_bytes(source.encode("utf-8"))[:24] + ".json")
+
+
+def load_segments(paths, force=False, warn=None):
+    """
+    Kaynak başına segmentleri döner, değişmeyenleri önbellekten okur.
+    (segmentler, yeniden çözümlenen dosya sayısı). Okunamayan/bozuk
+    JSON dosyaları warn ile bildirilip atlanır.
+    """
+    warn = warn or (lambda message: None)
+    analyzer_hash = sha256_file(__file__)
+    analyzer = Analyzer()
+    segments = []
+    rebuilt = 0
+    for path in paths:
+        try:
+            digest = sha256_file(path)
+        except OSError as e:
+            warn(f"{path}: {e}")
+            continue
+        cache_path = _segment_path(path)
+        key = f"{digest}:{analyzer_hash}"
+        cached = None
+        if not force:
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = None
+        if cached is not None and cached.get("key") == key:
+            segments.append(cached["docs"])
+            continue
+        try:
+            docs = analyze_source(path, analyzer)
+        except (OSError, ValueError) as e:
+            warn(f"{os.path.relpath(path, REPO_ROOT)}: {e}")
+            continue
+        rebuilt += 1
+        data = json.dumps({"key": key, "docs": docs}, ensure_ascii=False, separators=(",", ":"))
+        write_if_changed(cache_path, data.encode("utf-8"), snapshot=False)
+        segments.append(docs)
+    return segments, rebuilt
+
+
+# ---------------------------------------------------------------------------
+# İndeks dosyası
+# ---------------------------------------------------------------------------
+
+def encode_varints(values, out):
+    for value in values:
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+
+def _decode_varints(buf, offset, count):
+    values = []
+    for _ in range(count):
+        value = shift = 0
+        while True:
+            byte = buf[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        values.append(value)
+    return values, offset
+
+
+def _pad(buf):
+    buf.extend(b"\0" * (-len(buf) % 4))
+
+
+def _le_bytes(values):
+    if not _LITTLE_ENDIAN:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_index_bytes(segments):
+    """Segmentleri birleştirip indeks dosyasının baytlarını döner; (baytlar, doküman, terim)."""
+    docs = [doc for segment in segments for doc in segment]
+    n_docs = len(docs)
+    avgdl = sum(doc["length"] for doc in docs) / n_docs if n_docs else 0.0
+
+    postings = {}
+    for doc_id, doc in enumerate(docs):
+        for term, (tf, positions) in doc["terms"].items():
+            postings.setdefault(term, []).append((doc_id, tf, positions))
+
+    out = bytearray(HEADER.size)
+    docs_off = len(out)
+    meta = bytearray()
+    for doc in docs:
+        text = json.dumps(doc["meta"], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        out += DOC_ENTRY.pack(len(meta), len(text), doc["length"])
+        meta += text
+    meta_off = len(out)
+    out += meta
+    _pad(out)
+
+    terms = sorted(postings, key=lambda t: t.encode("utf-8"))
+    dict_off = len(out)
+    out += bytes(TERM_ENTRY.size * len(terms))
+    terms_off = len(out)
+    term_bytes = bytearray()
+    entries = []
+    for term in terms:
+        encoded = term.encode("utf-8")
+        entries.append((len(term_bytes), len(encoded)))
+        term_bytes += encoded
+    out += term_bytes
+    _pad(out)
+
+    for i, term in enumerate(terms):
+        plist = postings[term]
+        df = len(plist)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        doc_ids = array.array("I")
+        weights = array.array("f")
+        offsets = array.array("I")
+        blob = bytearray()
+        for doc_id, tf, positions in plist:
+            norm = K1 * (1 - B + B * docs[doc_id]["length"] / avgdl)
+            doc_ids.append(doc_id)
+            weights.append(idf * tf * (K1 + 1) / (tf + norm))
+            offsets.append(len(blob))
+            encode_varints([p - q for p, q in zip(positions, [0] + positions[:-1])], blob)
+        postings_off = len(out)
+        out += _le_bytes(doc_ids) + _le_bytes(weights) + _le_bytes(offsets)
+        positions_off = len(out)
+        out += blob
+        _pad(out)
+        term_off, term_len = entries[i]
+        TERM_ENTRY.pack_into(out, dict_off + i * TERM_ENTRY.size, term_off, term_len, 0, df,
+                             postings_off, positions_off, len(blob))
+
+    HEADER.pack_into(out, 0, INDEX_MAGIC, INDEX_VERSION, n_docs, len(terms), avgdl, K1, B,
+                     docs_off, meta_off, len(meta), dict_off, terms_off, len(term_bytes))
+    return bytes(out), n_docs, len(terms)
+
+
+class SearchIndex:
+    """mmap ile açılan indeks üzerinde BM25 sorguları."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            header = HEADER.unpack_from(self._map, 0)
+        except (ValueError, struct.error) as e:
+            self._file.close()
+            raise SearchIndexError(f"{path}: indeks okunamadı: {e}") from None
+        magic, version, self.n_docs, self.n_terms, self.avgdl, self.k1, self.b, \
+            self._docs_off, self._meta_off, _, self._dict_off, self._terms_off, _ = header
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.close()
+            raise SearchIndexError(f"{path}: arama indeksi değil ya da sürümü farklı")
+        self.analyzer = Analyzer()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _term(self, i):
+        term_off, term_len, _, df, postings_off, positions_off, positions_len = TERM_ENTRY.unpack_from(
+            self._map, self._dict_off + i * TERM_ENTRY.size)
+        start = self._terms_off + term_off
+        return self._map[start:start + term_len], (df, postings_off, positions_off, positions_len)
+
+    def lookup(self, term):
+        """Terimin (df, postings ofseti, konum ofseti, konum uzunluğu) kaydı ya da None (ikili arama)."""
+        key = term.encode("utf-8")
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_terms:
+            found, entry = self._term(lo)
+            if found == key:
+                return entry
+        return None
+
+    def _array(self, typecode, start, count):
+        values = array.array(typecode)
+        values.frombytes(self._map[start:start + 4 * count])
+        if not _LITTLE_ENDIAN:
+            values.byteswap()
+        return values
+
+    def postings(self, entry):
+        """(doküman id'leri, ağırlıklar, konum ofsetleri) dizileri."""
+        df, start = entry[0], entry[1]
+        return (self._array("I", start, df), self._array("f", start + 4 * df, df),
+                self._array("I", start + 8 * df, df))
+
+    def positions(self, entry, offsets, slot):
+        """Postings'teki slot'un artan konum listesi."""
+        df, _, base, length = entry
+        end = offsets[slot + 1] if slot + 1 < df else length
+        block = self._map[base + offsets[slot]:base + end]
+        if block.isascii():
+            return list(itertools.accumulate(block))
+        deltas, _ = _decode_varints(block, 0, len(block) - sum(b >= 0x80 for b in block))
+        return list(itertools.accumulate(deltas))
+
+    def document(self, doc_id):
+        meta_off, meta_len, length = DOC_ENTRY.unpack_from(self._map, self._docs_off + doc_id * DOC_ENTRY.size)
+        start = self._meta_off + meta_off
+        meta = json.loads(self._map[start:start + meta_len])
+        meta["length"] = length
+        return meta
+
+    def _phrase(self, terms):
+        """[(konum, terim)] ifadesinin geçtiği dokümanlar için {doküman: ağırlık toplamı}."""
+        entries = [self.lookup(term) for _, term in terms]
+        if any(entry is None for entry in entries):
+            return {}
+        lists = [self.postings(entry) for entry in entries]
+        smallest = min(lists, key=lambda p: len(p[0]))
+        candidates = set(smallest[0]).intersection(*(p[0] for p in lists if p is not smallest))
+        scores = {}
+        for doc_id in sorted(candidates):
+            # doküman id'leri postings'te artan sıradadır
+            slots = [bisect.bisect_left(ids, doc_id) for ids, _, _ in lists]
+            starts = None
+            for (k, _), entry, (_, _, offsets), slot in zip(terms, entries, lists, slots):
+                shifted = {p - k for p in self.positions(entry, offsets, slot)}
+                starts = shifted if starts is None else starts & shifted
+                if not starts:
+                    break
+            if starts:
+                scores[doc_id] = sum(weights[slot] for (_, weights, _), slot in zip(lists, slots))
+        return scores
+
+    def search(self, query, limit=10):
+        """[(skor, meta)] en yüksek skordan; tırnaklı ifadeler ardışık eşleşmelidir."""
+        scores = {}
+        for group in query_terms(self.analyzer, query):
+            if len(group) > 1:
+                found = self._phrase(group)
+            else:
+                entry = self.lookup(group[0][1])
+                if entry is None:
+                    continue
+                ids, weights, _ = self.postings(entry)
+                found = zip(ids, weights)
+            get = scores.get
+            for doc_id, weight in (found.items() if isinstance(found, dict) else found):
+                scores[doc_id] = get(doc_id, 0.0) + weight
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, self.document(doc_id)) for doc_id, score in best]
@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+"""
+Seed SQL dosyasını tablo başına ifade gruplarına ayırır ve
+database-schema.sql'deki foreign key'lerden bir bağımlılık grafiği
+(DAG) kurar.
+
+database-seed.sql tek bir BEGIN; TRUNCATE ...; INSERT ...; COMMIT;
+betiğidir ve psql / run-seed.js ile baştan sona seri çalışır. Burada:
+
+    split_seed()       ifadeleri ayırır: preamble (ilk tablo ifadesinden
+                       önceki CREATE EXTENSION, SET ...), TRUNCATE listesi,
+                       tablo grupları (INSERT/UPDATE/DELETE, dosya
+                       sırasıyla) ve post (sonraki diğer ifadeler)
+    parse_foreign_keys() CREATE TABLE ... REFERENCES ve ALTER TABLE ...
+                       REFERENCES'tan {tablo: {bağımlı olduğu tablolar}}
+    SeedPlan           yükleme katmanları, kritik yol ve seed'in TRUNCATE
+                       listesinin FK kapanışıyla sıralanmış TRUNCATE
+    load_plan()        bağımsız tabloları küçük bir bağlantı havuzunda
+                       eşzamanlı yükler; bir tablo, bağımlı olduğu
+                       tablolar commit edildiği anda başlar
+
+Her tablo grubu kendi transaction'ındadır; yükleme yarıda kalırsa
+seed'in kendi TRUNCATE'i (ya da ON CONFLICT upsert'leri) sayesinde
+tekrar çalıştırmak yeterlidir.
+İfade metinleri sql_rows tokenizer'ından yeniden kurulur (yorumlar
+atılır, string'ler aynen korunur).
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .pg_copy import connect, quote_ident
+from .sql_rows import identifier, iter_tokens, raw_text
+
+DEFAULT_WORKERS = 4
+
+_TRANSACTION_WORDS = frozenset(["BEGIN", "COMMIT", "END", "START", "ROLLBACK"])
+_TRUNCATE_END = frozenset(["RESTART", "CONTINUE", "CASCADE", "RESTRICT"])
+
+
+class SeedCycleError(ValueError):
+    """Foreign key grafiğinde döngü var (tablolar sıralanamıyor)."""
+
+
+class Statement:
+    __slots__ = ("kind", "table", "sql", "line")
+
+    def __init__(self, kind, table, sql, line):
+        self.kind = kind
+        self.table = table
+        self.sql = sql
+        self.line = line
+
+
+def iter_statements(src, standard_strings=True):
+    """Dosya nesnesindeki ifadeleri ';' ile ayırır: [token] listeleri (';' hariç)."""
+    tokens = []
+    depth = 0
+    for token in iter_tokens(src, standard_strings):
+        if token.kind == "punct":
+            if token.text in "([":
+                depth += 1
+            elif token.text in ")]":
+                depth -= 1
+            elif token.text == ";" and depth == 0:
+                if tokens:
+                    yield tokens
+                tokens = []
+                continue
+        tokens.append(token)
+    if tokens:
+        yield tokens
+
+
+def _qualified_name(tokens, i):
+    """tokens[i]'den başlayan (şema ön ekli olabilen) tablo adı ve sonraki indeks."""
+    name = identifier(tokens[i])
+    i += 1
+    while i + 1 < len(tokens) and tokens[i].text == ".":
+        name = identifier(tokens[i + 1])
+        i += 2
+    return name, i
+
+
+def _words(tokens, count):
+    return [t.upper for t in tokens[:count]]
+
+
+def classify(tokens):
+    """(tür, tablo): ("insert", "quizzes"), ("truncate", None), ("tx", None), ("other", None)"""
+    first = tokens[0].upper
+    if first in _TRANSACTION_WORDS:
+        return "tx", None
+    words = _words(tokens, 3)
+    if first == "INSERT" and words[1:2] == ["INTO"]:
+        return "insert", _qualified_name(tokens, 2)[0]
+    if first == "DELETE" and words[1:2] == ["FROM"]:
+        i = 3 if words[2:3] == ["ONLY"] else 2
+        return "delete", _qualified_name(tokens, i)[0]
+    if first == "UPDATE":
+        i = 2 if words[1:2] == ["ONLY"] else 1
+        return "update", _qualified_name(tokens, i)[0]
+    if first == "TRUNCATE":
+        return "truncate", None
+    return "other", None
+
+
+def truncate_tables(tokens):
+    """TRUNCATE [TABLE] [ONLY] "a", "b" ... -> ["a", "b"]"""
+    tables = []
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        if token.upper in _TRUNCATE_END:
+            break
+        if token.upper in ("TABLE", "ONLY") or token.text == ",":
+            i += 1
+            continue
+        name, i = _qualified_name(tokens, i)
+        tables.append(name)
+    return tables
+
+
+def split_seed(path, standard_strings=True):
+    """
+    Seed dosyasını ayırır. (preamble, truncate, groups, post) döner:
+    groups {tablo: [Statement]} ilk görülme sırasındadır.
+    """
+    preamble, truncate, post = [], [], []
+    groups = {}
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for tokens in iter_statements(f, standard_strings):
+            kind, table = classify(tokens)
+            if kind == "tx":
+                continue
+            if kind == "truncate":
+                truncate.extend(t for t in truncate_tables(tokens) if t not in truncate)
+                continue
+            statement = Statement(kind, table, raw_text(tokens), tokens[0].line)
+            if table is not None:
+                groups.setdefault(table, []).append(statement)
+            elif groups:
+                post.append(statement)
+            else:
+                preamble.append(statement)
+    return preamble, truncate, groups, post
+
+
+def parse_foreign_keys(path):
+    """Şemadaki foreign key'ler: {tablo: {referans verdiği tablolar}} (kendine referans hariç)."""
+    deps = {}
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for tokens in iter_statements(f):
+            words = _words(tokens, 6)
+            if words[:2] == ["CREATE", "TABLE"]:
+                i = 5 if words[2:5] == ["IF", "NOT", "EXISTS"] else 2
+            elif words[:2] == ["ALTER", "TABLE"]:
+                i = 3 if words[2:3] == ["ONLY"] else 2
+                if words[2:4] == ["IF", "EXISTS"]:
+                    i = 4
+            else:
+                continue
+            table, i = _qualified_name(tokens, i)
+            refs = deps.setdefault(table, set())
+            for j in range(i, len(tokens) - 1):
+                if tokens[j].upper == "REFERENCES":
+                    ref, _ = _qualified_name(tokens, j + 1)
+                    if ref != table:
+                        refs.add(ref)
+    return deps
+
+
+def topo_levels(tables, deps):
+    """
+    tables'ı bağımlılık katmanlarına ayırır (Kahn); her katman kendi
+    içinde sıralıdır. Yalnızca tables içindeki bağımlılıklar dikkate alınır.
+    """
+    tables = set(tables)
+    remaining = {t: {d for d in deps.get(t, ()) if d in tables} for t in tables}
+    levels = []
+    while remaining:
+        ready = sorted(t for t, pending in remaining.items() if not pending)
+        if not ready:
+            raise SeedCycleError("foreign key döngüsü: " + ", ".join(sorted(remaining)))
+        levels.append(ready)
+        for t in ready:
+            del remaining[t]
+        for pending in remaining.values():
+            pending.difference_update(ready)
+    return levels
+
+
+def referencing_closure(tables, deps):
+    """tables + onlara (dolaylı) foreign key ile bağlı tüm tablolar."""
+    referenced_by = {}
+    for table, refs in deps.items():
+        for ref in refs:
+            referenced_by.setdefault(ref, set()).add(table)
+    closure = set(tables)
+    stack = list(tables)
+    while stack:
+        for child in referenced_by.get(stack.pop(), ()):
+            if child not in closure:
+                closure.add(child)
+                stack.append(child)
+    return closure
+
+
+class SeedPlan:
+    """Ayrılmış seed + FK grafiği: yükleme katmanları ve TRUNCATE sırası."""
+
+    def __init__(self, preamble, truncate, groups, post, deps):
+        self.preamble = preamble
+        self.truncate = truncate
+        self.groups = groups
+        self.post = post
+        self.schema_deps = deps
+        self.deps = {t: {d for d in deps.get(t, ()) if d in groups} for t in groups}
+        self.levels = topo_levels(groups, deps)
+
+    @classmethod
+    def from_files(cls, seed_paths, schema_path, standard_strings=True):
+        preamble, truncate, groups, post = [], [], {}, []
+        for path in seed_paths:
+            p, t, g, q = split_seed(path, standard_strings)
+            preamble.extend(p)
+            truncate.extend(x for x in t if x not in truncate)
+            for table, statements in g.items():
+                groups.setdefault(table, []).extend(statements)
+            post.extend(q)
+        return cls(preamble, truncate, groups, post, parse_foreign_keys(schema_path))
+
+    def truncate_order(self):
+        """
+        TRUNCATE edilecek tablolar (seed'in kendi TRUNCATE listesi + FK ile
+        bunlara bağlı tüm tablolar), önce çocuklar. Liste FK kapanışını
+        içerdiğinden CASCADE gerekmez. Seed hiçbir şey TRUNCATE etmiyorsa
+        (ör. ON CONFLICT upsert'leri) liste boştur; yüklenen tablolar
+        kendiliğinden listeye girmez.
+        """
+        if not self.truncate:
+            return []
+        tables = referencing_closure(self.truncate, self.schema_deps)
+        return [t for level in reversed(topo_levels(tables, self.schema_deps)) for t in level]
+
+    def critical_path(self, cost=None):
+        """
+        En uzun bağımlılık zinciri: (toplam maliyet, [tablolar]). cost
+        verilmezse ifade metinlerinin uzunluğu kullanılır.
+        """
+        if cost is None:
+            cost = {t: sum(len(s.sql) for s in statements) for t, statements in self.groups.items()}
+        best = {}
+        for level in self.levels:
+            for table in level:
+                prev = max((best[d] for d in self.deps[table]), default=(0, []), key=lambda b: b[0])
+                best[table] = (prev[0] + cost.get(table, 0), prev[1] + [table])
+        return max(best.values(), default=(0, []), key=lambda b: b[0])
+
+
+def truncate_sql(tables):
+    if not tables:
+        return ""
+    names = ",\n".join("    " + quote_ident(t) for t in tables)
+    return f"TRUNCATE TABLE\n{names}\nRESTART IDENTITY"
+
+
+# -- Yükleme ---------------------------------------------------------------------------
+
+class ConnectionPool:
+    """En fazla size bağlantı; bağlantılar ilk ihtiyaçta açılır."""
+
+    def __init__(self, url, size):
+        self.url = url
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.size:
+                conn = connect(self.url)
+                self._opened.append(conn)
+                return conn
+        return self._idle.get()
+
+    def release(self, conn):
+        self._idle.put(conn)
+
+    def close(self):
+        for conn in self._opened:
+            conn.close()
+
+
+def _run_group(pool, statements):
+    """İfadeleri tek transaction'da çalıştırır; süreyi (sn) döner."""
+    conn = pool.acquire()
+    started = time.perf_counter()
+    try:
+        cursor = conn.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    finally:
+        pool.release(conn)
+    return time.perf_counter() - started
+
+
+def load_plan(plan, url, workers=DEFAULT_WORKERS, log=None):
+    """
+    Planı veritabanına yükler: preamble + TRUNCATE tek transaction'da,
+    sonra tablo grupları bağımlılıkları bittikçe en fazla workers
+    bağlantı üzerinden eşzamanlı, en son post ifadeleri. Hata olursa
+    yeni grup başlatılmaz, çalışanlar beklenir ve ilk hata yükseltilir.
+    {tablo: süre} döner.
+    """
+    log = log or (lambda message: None)
+    pool = ConnectionPool(url, max(1, workers))
+    timings = {}
+    try:
+        setup = [s.sql for s in plan.preamble]
+        truncate = truncate_sql(plan.truncate_order())
+        if truncate:
+            setup.append(truncate)
+        if setup:
+            timings["(setup)"] = _run_group(pool, setup)
+
+        pending = {t: set(d) for t, d in plan.deps.items()}
+        running = {}
+        failure = None
+        with ThreadPoolExecutor(max(1, workers)) as executor:
+            while pending or running:
+                if failure is None:
+                    for table in sorted(t for t, d in pending.items() if not d):
+                        del pending[table]
+                        statements = [s.sql for s in plan.groups[table]]
+                        running[executor.submit(_run_group, pool, statements)] = table
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table = running.pop(future)
+                    try:
+                        timings[table] = future.result()
+                    except Exception as e:
+                        failure = failure or (table, e)
+                        continue
+                    log(f"  {table}: {len(plan.groups[table])} ifade, {timings[table]:.2f} sn")
+                    for deps in pending.values():
+                        deps.discard(table)
+        if failure is not None:
+            table, error = failure
+            raise RuntimeError(f"{table} yüklenemedi: {error}") from error
+
+        if plan.post:
+            timings["(post)"] = _run_group(pool, [s.sql for s in plan.post])
+    finally:
+        pool.close()
+    return timings
+
+
+def write_split(plan, directory):
+    """
+    Planı psql ile sırayla (veya aynı katmandakiler paralel) çalıştırılabilen
+    dosyalara yazar: 00-setup.sql, <katman>-<tablo>.sql, 99-post.sql.
+    Yazılan dosya adlarını döner.
+    """
+    os.makedirs(directory, exist_ok=True)
+    files = []
+
+    def write(name, statements):
+        body = "".join(s + ";\n\n" for s in statements)
+        with open(os.path.join(directory, name), "w", encoding="utf-8", newline="\n") as f:
+            f.write("BEGIN;\n\n" + body + "COMMIT;\n")
+        files.append(name)
+
+    setup = [s.sql for s in plan.preamble]
+    truncate = truncate_sql(plan.truncate_order())
+    if truncate:
+        setup.append(truncate)
+    write("00-setup.sql", setup)
+    for number, level in enumerate(plan.levels, 1):
+        for table in level:
+            write(f"{number:02d}-{table}.sql", [s.sql for s in plan.groups[table]])
+    if plan.post:
+        write("99-post.sql", [s.sql for s in plan.post])
+    return files
@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+"""
+Üretilen dosyalar için içerik adresli (content-addressed) snapshot deposu.
+
+Üreticiler bir dosyanın üzerine yazmadan önce eski halinin snapshot'ını
+alır; dosyanın yanına tam boyutlu .backup / .backup2 kopyaları bırakılmaz.
+Dosya JSON yapısına göre parçalara (chunk) bölünür: büyük liste/nesne
+elemanları (dersler, bölümler, rozetler...) kendi chunk'ıdır, aradaki
+küçük değerler ve ayraçlar komşu chunk'a eklenir. Her chunk sha256
+özetiyle bir kez (zlib ile sıkıştırılmış) saklanır.
+
+Chunk listeleri de üst seviye elemana (ör. $.modules[3]) göre gruplanıp
+"tree" nesnesi olarak aynı şekilde saklanır; snapshot manifest'i yalnızca
+bu tree'lerin sırasıdır. Değişmeyen modüllerin tree'si önceki snapshot
+ile paylaşılır; bu yüzden tek modülü değişen on snapshot, diskte kabaca
+bir modül kadar yer kaplar.
+
+Chunk'lar orijinal baytların dilimleridir; restore birebir aynı dosyayı
+üretir ve JSON'u bozuk dosyalar da (ör. dotnet-core-lessons.json)
+saklanabilir. JSON olmayan dosyalar (SQL) satır sınırlarında, içerik
+tanımlı noktalardan bölünür.
+
+Depo .content-cache/snapshots/ altındadır ve yalnızca depo içindeki
+dosyaları tutar; depo dışındaki yollara (benchmark dizinleri, /tmp
+çıktıları) otomatik snapshot alınmaz. CONTENT_SNAPSHOTS=off ile
+üreticilerin otomatik snapshot alması kapatılır.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import time
+import zlib
+
+from . import REPO_ROOT
+from .build_cache import CACHE_DIR, atomic_write_bytes
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = os.path.join(CACHE_DIR, "snapshots")
+
+# Bu boyuttan büyük JSON alt ağaçları kendi chunk'ı olur
+MIN_CHUNK = 2048
+# Chunk'lar bu derinlikteki elemana göre tree'lerde gruplanır ($.modules[3] = 2)
+GROUP_DEPTH = 2
+# JSON olmayan dosyalarda içerik tanımlı satır sınırı
+LINE_CHUNK_MIN = 4096
+LINE_CHUNK_MASK = 0x0F
+LINE_GROUP_SIZE = 64
+
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\],:]', re.S)
+_NON_WS = re.compile(r"[^ \t\r\n]")
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+
+
+def snapshots_enabled():
+    return os.environ.get("CONTENT_SNAPSHOTS", "on") != "off"
+
+
+def in_repo(path):
+    """Yol depo kökünün altında mı?"""
+    return os.path.commonpath([REPO_ROOT, os.path.abspath(path)]) == REPO_ROOT
+
+
+def _repo_key(path):
+    if not in_repo(path):
+        raise SnapshotError(f"{path}: depo dışındaki dosyaların snapshot'ı tutulmaz")
+    return os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, "/")
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# -- Chunk'lara bölme -------------------------------------------------------
+
+def _path_part(frame):
+    kind, _, key, _ = frame
+    if kind == "[":
+        return f"[{key}]"
+    if isinstance(key, str) and _IDENTIFIER.fullmatch(key):
+        return "." + key
+    return "[" + json.dumps(key, ensure_ascii=False) + "]"
+
+
+def _close_element(stack, text, end, spans):
+    frame = stack[-1]
+    start = frame[3]
+    frame[3] = None
+    if start is None:
+        return
+    # sondaki boşlukları elemana dahil etme
+    while end > start and text[end - 1] in " \t\r\n":
+        end -= 1
+    if end - start >= MIN_CHUNK:
+        spans.append((start, end, frame[1] + _path_part(frame), len(stack)))
+
+
+def _json_spans(text):
+    """
+    Alt ağaçların (start, end, json yolu, derinlik) aralıklarını döner.
+    Bozuk JSON'da da çalışır; kesim noktaları yalnızca dedup'ı etkiler.
+    """
+    spans = []
+    # Yığın elemanı: [tür, yol, sıradaki anahtar/indeks, elemanın başlangıcı]
+    stack = []
+    expect_value = True
+    for match in _JSON_TOKEN.finditer(text):
+        token = match.group()
+        pos = match.start()
+        if stack and expect_value and stack[-1][3] is None and token not in ("]", "}", ","):
+            stack[-1][3] = pos
+        if token == "{" or token == "[":
+            path = stack[-1][1] + _path_part(stack[-1]) if stack else "$"
+            stack.append([token, path, 0 if token == "[" else None, None])
+            expect_value = token == "["
+        elif token == "}" or token == "]":
+            opener = "{" if token == "}" else "["
+            if not any(frame[0] == opener for frame in stack):
+                continue
+            # Eşleşmeyen kapanış (ör. "]}" yerine "}"): aradaki çerçeveler de kapanır
+            while stack:
+                _close_element(stack, text, pos, spans)
+                kind = stack.pop()[0]
+                if kind == opener:
+                    break
+            expect_value = False
+        elif token == ",":
+            if stack:
+                _close_element(stack, text, pos, spans)
+                if stack[-1][0] == "[":
+                    stack[-1][2] += 1
+                expect_value = stack[-1][0] == "["
+        elif token == ":":
+            expect_value = True
+        elif stack and stack[-1][0] == "{" and not expect_value:
+            # nesnede anahtar
+            try:
+                stack[-1][2] = json.loads(token)
+            except ValueError:
+                stack[-1][2] = token
+    return spans
+
+
+def _json_segments(text):
+    """Metni ardışık (start, end, etiket, grup) segmentlerine böler."""
+    spans = _json_spans(text)
+    cuts = {0, len(text)}
+    for start, end, _, _ in spans:
+        cuts.update((start, end))
+    points = sorted(cuts)
+    events = sorted(spans, key=lambda s: (s[0], -s[1]))
+    segments = []
+    active = []
+    i = 0
+    for a, b in zip(points, points[1:]):
+        while i < len(events) and events[i][0] <= a:
+            active.append(events[i])
+            i += 1
+        active = [s for s in active if s[1] >= b]
+        label = min(active, key=lambda s: s[1] - s[0])[2] if active else "$"
+        grouping = [s for s in active if s[3] <= GROUP_DEPTH]
+        group = max(grouping, key=lambda s: s[3])[2] if grouping else "$"
+        segments.append((a, b, label, group))
+    return _merge_small(segments)
+
+
+def _merge_small(segments):
+    """MIN_CHUNK altındaki segmentleri aynı gruptaki bir sonraki (yoksa önceki) segmente ekler."""
+    merged = []
+    pending = None
+    for a, b, label, group in segments:
+        if pending is not None and pending[3] != group:
+            merged.append(pending)
+            pending = None
+        if pending is not None:
+            if b - a < MIN_CHUNK:
+                label = pending[2]
+            a = pending[0]
+        if b - a < MIN_CHUNK:
+            pending = (a, b, label, group)
+            continue
+        merged.append((a, b, label, group))
+        pending = None
+    if pending is not None:
+        if merged and merged[-1][3] == pending[3]:
+            a, _, label, group = merged.pop()
+            pending = (a, pending[1], label, group)
+        merged.append(pending)
+    return merged
+
+
+def _line_segments(data):
+    """JSON olmayan içerik: satır sonlarından, satır özetine göre içerik tanımlı kesim."""
+    segments = []
+    start = 0
+    pos = 0
+    while True:
+        nl = data.find(b"\n", pos)
+        if nl < 0:
+            break
+        line = data[pos:nl + 1]
+        pos = nl + 1
+        if pos - start >= LINE_CHUNK_MIN and (zlib.crc32(line) & LINE_CHUNK_MASK) == 0:
+            segments.append((start, pos))
+            start = pos
+    if start < len(data):
+        segments.append((start, len(data)))
+    return [(a, b, f"@{a}", f"lines[{n // LINE_GROUP_SIZE}]") for n, (a, b) in enumerate(segments)]
+
+
+def split_chunks(data):
+    """Dosya baytlarını [(chunk baytları, etiket, grup)] listesine böler."""
+    head = _NON_WS.search(data[:4096].decode("utf-8", "ignore").lstrip("\ufeff"))
+    if head and head.group() in "{[":
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+        if text is not None:
+            return [(text[a:b].encode("utf-8"), label, group) for a, b, label, group in _json_segments(text)]
+    return [(data[a:b], label, group) for a, b, label, group in _line_segments(data)]
+
+
+def _group_chunks(chunks):
+    """Ardışık aynı gruptaki chunk'ları [(grup, [(chunk, etiket)])] olarak toplar."""
+    groups = []
+    for chunk, label, group in chunks:
+        if not groups or groups[-1][0] != group:
+            groups.append((group, []))
+        groups[-1][1].append((chunk, label))
+    return groups
+
+
+# -- Depo -------------------------------------------------------------------
+
+class SnapshotError(ValueError):
+    """Snapshot bulunamadı, bozuk ya da dosya depo dışında."""
+
+
+class SnapshotStore:
+    """
+    objects/ab/<sha256>  : zlib ile sıkıştırılmış chunk veya tree
+    manifests/<dosya-anahtarı>/<snapshot-id>.json : tree sırası
+
+    tree:     [[chunk sha256, boyut, json yolu], ...]
+    manifest: {"trees": [[tree sha256, boyut, grup yolu], ...], ...}
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifests_dir = os.path.join(root, "manifests")
+
+    # -- Nesneler ---------------------------------------------------------
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def _put(self, data):
+        """Nesneyi saklar; (özet, diske yeni yazılan bayt) döner."""
+        digest = _digest(data)
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+        compressed = zlib.compress(data, 6)
+        atomic_write_bytes(path, compressed)
+        return digest, len(compressed)
+
+    def _get(self, digest):
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                return zlib.decompress(f.read())
+        except OSError:
+            raise SnapshotError(f"nesne eksik: {digest}") from None
+
+    def tree(self, manifest, digest):
+        """Tree'nin chunk listesini döner (describe() çıktısında tree'ler içindedir)."""
+        inline = manifest.get("inlineTrees")
+        if inline and digest in inline:
+            return inline[digest]
+        return json.loads(self._get(digest).decode("utf-8"))
+
+    # -- Manifest'ler -----------------------------------------------------
+
+    def _manifest_dir(self, key):
+        return os.path.join(self.manifests_dir, key.replace("/", "__"))
+
+    def list(self, path=None):
+        """Snapshot manifest'lerini (eskiden yeniye) döner; path verilirse yalnızca o dosyanınkiler."""
+        if path is not None:
+            dirs = [self._manifest_dir(_repo_key(path))]
+        elif os.path.isdir(self.manifests_dir):
+            dirs = [os.path.join(self.manifests_dir, d) for d in sorted(os.listdir(self.manifests_dir))]
+        else:
+            dirs = []
+        manifests = []
+        for directory in dirs:
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(".json"):
+                    with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                        manifests.append(json.load(f))
+        return manifests
+
+    def get(self, path, snapshot_id=None):
+        """Dosyanın snapshot'ını id'si (veya benzersiz ön eki) ile bulur; id yoksa en sonuncusu."""
+        manifests = self.list(path)
+        if snapshot_id is None:
+            if not manifests:
+                raise SnapshotError(f"{_repo_key(path)}: snapshot yok")
+            return manifests[-1]
+        matches = [m for m in manifests if m["id"].startswith(snapshot_id)]
+        if len(matches) != 1:
+            raise SnapshotError(
+                f"{_repo_key(path)}: snapshot bulunamadı: {snapshot_id}" if not matches
+                else f"{_repo_key(path)}: birden fazla snapshot eşleşiyor: {snapshot_id}"
+            )
+        return matches[0]
+
+    def _build_trees(self, data, store):
+        trees = []
+        inline = {}
+        new_bytes = 0
+        for group, chunks in _group_chunks(split_chunks(data)):
+            entries = []
+            for chunk, label in chunks:
+                if store:
+                    digest, written = self._put(chunk)
+                    new_bytes += written
+                else:
+                    digest = _digest(chunk)
+                entries.append([digest, len(chunk), label])
+            encoded = json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if store:
+                tree_digest, written = self._put(encoded)
+                new_bytes += written
+            else:
+                tree_digest = _digest(encoded)
+                inline[tree_digest] = entries
+            trees.append([tree_digest, sum(e[1] for e in entries), group])
+        return trees, inline, new_bytes
+
+    def describe(self, path):
+        """Dosyanın şu anki halini depoya yazmadan manifest biçiminde döner (diff için)."""
+        with open(path, "rb") as f:
+            data = f.read()
+        trees, inline, _ = self._build_trees(data, store=False)
+        return {
+            "id": "current",
+            "path": _repo_key(path),
+            "sha256": _digest(data),
+            "size": len(data),
+            "trees": trees,
+            "inlineTrees": inline,
+        }
+
+    def snapshot(self, path, key=None, label=None):
+        """
+        Dosyanın snapshot'ını alır; (manifest, diske yeni yazılan bayt) döner.
+        key, dosyanın depodaki kaydedileceği yol (ör. bir .backup dosyasını
+        asıl dosyanın geçmişine eklemek için). Son snapshot ile aynı
+        içerikteyse yeni snapshot oluşturulmaz.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        key = key or _repo_key(path)
+        digest = _digest(data)
+        existing = self.list(os.path.join(REPO_ROOT, key))
+        if existing and existing[-1]["sha256"] == digest:
+            return existing[-1], 0
+
+        trees, _, new_bytes = self._build_trees(data, store=True)
+
+        # Sıra numarası, aynı saniyede alınan snapshot'ların da sıralı kalmasını sağlar
+        seq = existing[-1]["seq"] + 1 if existing else 1
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "id": f"{seq:05d}-{digest[:12]}",
+            "seq": seq,
+            "path": key,
+            "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "label": label,
+            "sha256": digest,
+            "size": len(data),
+            "trees": trees,
+        }
+        encoded = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        atomic_write_bytes(os.path.join(self._manifest_dir(key), manifest["id"] + ".json"), encoded)
+        return manifest, new_bytes + len(encoded)
+
+    def read(self, manifest):
+        """Snapshot içeriğini bayt olarak döner; sha256 doğrulanır."""
+        data = b"".join(
+            self._get(digest)
+            for tree_digest, _, _ in manifest["trees"]
+            for digest, _, _ in self.tree(manifest, tree_digest)
+        )
+        if _digest(data) != manifest["sha256"]:
+            raise SnapshotError(f"{manifest['id']}: içerik sha256 ile uyuşmuyor")
+        return data
+
+    def restore(self, manifest, dest=None):
+        """Snapshot'ı dest'e (varsayılan: asıl yolu) atomik olarak yazar."""
+        dest = dest or os.path.join(REPO_ROOT, manifest["path"])
+        atomic_write_bytes(dest, self.read(manifest))
+        return dest
+
+    def diff(self, old, new):
+        """
+        İki snapshot arasındaki değişen chunk'ları (json yolu ile) listeler.
+        [(işlem, etiket, eski bayt, yeni bayt)] döner; işlem: added/removed/changed.
+        Aynı tree'ye sahip gruplar açılmadan atlanır.
+        """
+        changes = []
+        for op, i1, i2, j1, j2 in _opcodes(old["trees"], new["trees"]):
+            if op == "equal":
+                continue
+            olds = [c for t in old["trees"][i1:i2] for c in self.tree(old, t[0])]
+            news = [c for t in new["trees"][j1:j2] for c in self.tree(new, t[0])]
+            for op2, k1, k2, l1, l2 in _opcodes(olds, news):
+                if op2 == "equal":
+                    continue
+                a, b = olds[k1:k2], news[l1:l2]
+                for n in range(max(len(a), len(b))):
+                    o = a[n] if n < len(a) else None
+                    c = b[n] if n < len(b) else None
+                    if o and c:
+                        changes.append(("changed", c[2], o[1], c[1]))
+                    elif c:
+                        changes.append(("added", c[2], 0, c[1]))
+                    else:
+                        changes.append(("removed", o[2], o[1], 0))
+        return changes
+
+    def prune(self, path=None, keep=10):
+        """Her dosya için son keep snapshot'ı bırakır; silinen manifest sayısını döner."""
+        by_path = {}
+        for manifest in self.list(path):
+            by_path.setdefault(manifest["path"], []).append(manifest)
+        removed = 0
+        for key, manifests in by_path.items():
+            for manifest in manifests[:-keep] if keep else manifests:
+                os.unlink(os.path.join(self._manifest_dir(key), manifest["id"] + ".json"))
+                removed += 1
+        return removed
+
+    def gc(self):
+        """Hiçbir manifest'in kullanmadığı nesneleri siler; (silinen, boşalan bayt) döner."""
+        live = set()
+        for manifest in self.list():
+            for tree_digest, _, _ in manifest["trees"]:
+                if tree_digest not in live:
+                    live.add(tree_digest)
+                    live.update(digest for digest, _, _ in self.tree(manifest, tree_digest))
+        removed = freed = 0
+        if not os.path.isdir(self.objects_dir):
+            return 0, 0
+        for prefix in os.listdir(self.objects_dir):
+            directory = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(directory):
+                if prefix + name not in live:
+                    path = os.path.join(directory, name)
+                    freed += os.path.getsize(path)
+                    os.unlink(path)
+                    removed += 1
+        return removed, freed
+
+    def disk_usage(self):
+        total = 0
+        for directory, _, files in os.walk(self.root):
+            total += sum(os.path.getsize(os.path.join(directory, f)) for f in files)
+        return total
+
+
+def _opcodes(a, b):
+    return difflib.SequenceMatcher(None, [x[0] for x in a], [x[0] for x in b], autojunk=False).get_opcodes()
+
+
+def snapshot_before_overwrite(path, label=None):
+    """
+    Üreticiler tarafından çağrılır: dosya depo içindeyse, varsa ve snapshot
+    açıksa eski halini saklar. Depo dışındaki yollar sessizce atlanır.
+    """
+    if not snapshots_enabled() or not in_repo(path) or not os.path.exists(path):
+        return None
+    manifest, _ = SnapshotStore().snapshot(path, label=label)
+    return manifest
@@ -0,0 +1,551 @@
+# -*- coding: utf-8 -*-
+"""
+SQL seed/dump dosyalarından tablo satırlarını akış halinde okur.
+
+database-seed.sql ve profile-seed-data.sql gibi dosyalardaki
+
+    INSERT INTO "t" ("a", "b") VALUES (...), (...) [ON CONFLICT ...];
+    INSERT INTO "t" ("a", "b") SELECT ... WHERE EXISTS (...) ON CONFLICT DO NOTHING;
+
+ifadeleri tokenize edilir ve her satır {kolon: değer} dict'i olarak
+üretilir (generator). Dosya sabit boyutlu parçalar halinde okunur;
+bellekte yalnızca o anki token ve satır tutulur, yüzlerce MB'lık
+dump'lar da sabit bellekle taranabilir.
+
+Tanınan değerler:
+    'metin' ('' escape'i), E'...' (ters bölü escape'leri), $$...$$ / $tag$...$tag$
+    ...::jsonb / ::json      -> dict/list (json.loads)
+    ...::int, ::numeric, ::boolean, ::text[] vb. ve TIMESTAMP '...' / DATE '...'
+    sayılar, NULL, TRUE/FALSE, ARRAY[...]
+Bunların dışındaki ifadeler (CURRENT_TIMESTAMP, gen_random_uuid() ...)
+SqlExpression olarak (ham SQL metni) döner.
+
+fix_quotes.py'nin düzelttiği ve generate_tests.py'nin ürettiği '...'::jsonb
+gövdeleri standart SQL string'leridir (standard_conforming_strings=on):
+ters bölü literal'dir. generate_tests.escape_sql_string ters bölüleri de
+ikilediği için onun çıktısını okurken standard_strings=False verilmelidir.
+"""
+
+import datetime
+import json
+import re
+
+from .pg_copy import quote_ident
+
+# Okuma parça boyutu (karakter)
+CHUNK_SIZE = 1 << 20
+
+# Bir token'ın kesinleşmesi için arkasında olması gereken karakter sayısı
+_LOOKAHEAD = 3
+
+# Tamamlanmamışken tek karakterlik token olarak eşleşen başlangıçlar
+_SPLIT_PREFIXES = frozenset(["E'", "e'", "/*"])
+
+_STRING_STD = r"'[^']*(?:''[^']*)*'"
+_STRING_ESC = r"'(?:[^'\\]|\\.|'')*'"
+
+# Token'dan önceki boşluk ve yorumlar token'dan ayrı eşleşir; "--" yorumu
+# satır sonunda ya da dosya sonunda biter
+_SKIP = r"(?:\s+|--[^\n]*|/\*.*?\*/)*"
+
+_TOKEN_TEMPLATE = r"""
+ (?P<estring>[eE]""" + _STRING_ESC + r""")
+|(?P<string>{string})
+|(?P<dollar>\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?\$(?P=tag)\$)
+|(?P<ident>"[^"]*(?:""[^"]*)*")
+|(?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)
+|(?P<word>[^\W\d]\w*)
+|(?P<cast>::)
+|(?P<punct>[(),;\[\].+\-*/%<>=!|:])
+"""
+
+_TOKEN_RE = {
+    True: re.compile(_TOKEN_TEMPLATE.format(string=_STRING_STD), re.S | re.X),
+    False: re.compile(_TOKEN_TEMPLATE.format(string=_STRING_ESC), re.S | re.X),
+}
+_SKIP_RE = re.compile(_SKIP, re.S)
+
+_BACKSLASH_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_BACKSLASH_RE = re.compile(r"\\(x[0-9A-Fa-f]{1,2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|[0-7]{1,3}|.)", re.S)
+
+# Bir VALUES/SELECT satırındaki ifadeyi bitiren anahtar kelimeler (derinlik 0'da)
+_SELECT_END = frozenset(["FROM", "WHERE", "ON", "RETURNING", "GROUP", "ORDER", "LIMIT", "UNION"])
+
+# TIMESTAMP '...' gibi tipli literal'ler
+_TYPED_LITERALS = frozenset(["TIMESTAMP", "TIMESTAMPTZ", "DATE", "TIME", "INTERVAL"])
+
+
+class SqlParseError(ValueError):
+    """Dosya beklenen SQL yapısında değil (satır numarasıyla)."""
+
+
+class SqlExpression(str):
+    """Değere çevrilemeyen ham SQL ifadesi (ör. CURRENT_TIMESTAMP)."""
+
+    def __repr__(self):
+        return f"SqlExpression({str.__repr__(self)})"
+
+
+class _Token:
+    __slots__ = ("kind", "text", "line", "space")
+
+    def __init__(self, kind, text, line, space):
+        self.kind = kind
+        self.text = text
+        self.line = line
+        self.space = space
+
+    @property
+    def upper(self):
+        return self.text.upper() if self.kind == "word" else None
+
+
+def iter_tokens(src, standard_strings=True, chunk_size=CHUNK_SIZE):
+    """
+    Dosya nesnesinden token'ları üretir (boşluk ve yorumlar atlanır).
+
+    Bir token parça sınırına denk gelirse (ör. parça ortasında biten bir
+    string) yeni parça okunup eşleşme tekrarlanır; okunan miktar eldeki
+    tamponla birlikte büyüdüğü için çok büyük literal'ler de doğrusal
+    sürede okunur.
+    """
+    match = _TOKEN_RE[standard_strings].match
+    skip = _SKIP_RE.match
+    text_quote = {"string": "'", "estring": "'", "ident": '"'}
+    buf = ""
+    pos = 0
+    limit = -1
+    line = 1
+    eof = False
+    while True:
+        start = skip(buf, pos).end()
+        m = match(buf, start)
+        if m is not None:
+            kind = m.lastgroup
+            if kind == "tag":
+                kind = "dollar"
+            end = m.end()
+        # Eşleşme tamponun sonuna yakınsa devamı sonraki parçada olabilir:
+        # "1.5" + "e+2", "'a'" + "'b'" ('' escape'i bölünmüş), parça sonunda
+        # kesilen -- yorumu, tamamlanmamış E'... ve /* ... ("E" / "/" olarak eşleşir)
+        if not eof and (
+            start > limit
+            or m is None
+            or end > limit
+            or buf[end] == text_quote.get(kind)
+            or (end - start == 1 and buf[start:start + 2] in _SPLIT_PREFIXES)
+        ):
+            chunk = src.read(max(chunk_size, len(buf) - pos))
+            if chunk:
+                buf = buf[pos:] + chunk
+                pos = 0
+                limit = len(buf) - _LOOKAHEAD
+            else:
+                eof = True
+            continue
+        if m is None:
+            if start >= len(buf):
+                return
+            line += buf.count("\n", pos, start)
+            raise SqlParseError(f"satır {line}: beklenmeyen karakter {buf[start]!r}")
+        if start > pos:
+            line += buf.count("\n", pos, start)
+        text = buf[start:end]
+        yield _Token(kind, text, line, start > pos)
+        if kind in text_quote or kind == "dollar":
+            line += text.count("\n")
+        pos = end
+
+
+# -- Değerler ----------------------------------------------------------------------
+
+def _unescape_backslashes(body):
+    def repl(m):
+        esc = m.group(1)
+        if esc in _BACKSLASH_ESCAPES:
+            return _BACKSLASH_ESCAPES[esc]
+        if esc[0] in "xuU" and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        if esc[0] in "01234567":
+            return chr(int(esc, 8))
+        return esc
+    return _BACKSLASH_RE.sub(repl, body)
+
+
+def _string_value(token, standard_strings):
+    text = token.text
+    if token.kind == "dollar":
+        tag_len = text.index("$", 1) + 1
+        return text[tag_len:-tag_len]
+    if token.kind == "estring":
+        return _unescape_backslashes(text[2:-1].replace("''", "'"))
+    body = text[1:-1].replace("''", "'")
+    return body if standard_strings else _unescape_backslashes(body)
+
+
+def _parse_array_literal(text):
+    """'{a,"b c",NULL}' biçimindeki tek boyutlu PostgreSQL dizisi."""
+    text = text.strip()
+    if not (text.startswith("{") and text.endswith("}")):
+        raise ValueError(f"dizi literal'i değil: {text[:40]!r}")
+    items = []
+    i, n = 1, len(text) - 1
+    while i < n:
+        if text[i] == '"':
+            j = i + 1
+            value = []
+            while text[j] != '"':
+                if text[j] == "\\":
+                    j += 1
+                value.append(text[j])
+                j += 1
+            items.append("".join(value))
+            i = j + 1
+        else:
+            j = text.find(",", i)
+            j = n if j < 0 else j
+            raw = text[i:j].strip()
+            items.append(None if raw.upper() == "NULL" else raw)
+            i = j
+        if i < n and text[i] == ",":
+            i += 1
+    return items
+
+
+def _parse_timestamp(text):
+    try:
+        return datetime.datetime.fromisoformat(text.strip())
+    except ValueError:
+        return text
+
+
+def _cast(value, type_name):
+    """Bir literal'i ::tip dönüşümüne göre Python değerine çevirir."""
+    if value is None:
+        return None
+    base = type_name.lower().strip('"')
+    if base.endswith("[]"):
+        element = base[:-2]
+        items = _parse_array_literal(value) if isinstance(value, str) else value
+        return [_cast(item, element) for item in items]
+    if base in ("json", "jsonb"):
+        return json.loads(value) if isinstance(value, str) else value
+    if base in ("int", "int2", "int4", "int8", "integer", "bigint", "smallint"):
+        return int(value)
+    if base in ("numeric", "decimal", "real", "float", "float4", "float8", "double precision"):
+        return float(value)
+    if base in ("bool", "boolean"):
+        return value if isinstance(value, bool) else str(value).lower() in ("t", "true", "1", "yes", "on")
+    if base == "date" and isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value.strip())
+        except ValueError:
+            return value
+    if base.startswith("timestamp"):
+        return _parse_timestamp(value) if isinstance(value, str) else value
+    return value
+
+
+def raw_text(tokens):
+    return "".join((" " if t.space and i else "") + t.text for i, t in enumerate(tokens))
+
+
+def _split_top_level(tokens, separator=","):
+    parts = [[]]
+    depth = 0
+    for token in tokens:
+        if token.kind == "punct":
+            if token.text in "([":
+                depth += 1
+            elif token.text in ")]":
+                depth -= 1
+            elif token.text == separator and depth == 0:
+                parts.append([])
+                continue
+        parts[-1].append(token)
+    return parts
+
+
+def evaluate(tokens, standard_strings=True, on_error=None):
+    """
+    Tek bir ifadenin token listesini Python değerine çevirir.
+
+    Tip dönüşümü başarısız olursa (ör. ::jsonb ile geçersiz JSON)
+    SqlParseError fırlatılır; on_error verilmişse hata ona iletilir ve
+    literal'in metni dönüştürülmeden bırakılır.
+    """
+    if not tokens:
+        raise SqlParseError("boş ifade")
+
+    # Sondaki ::tip dönüşümlerini ayır
+    casts = []
+    depth = 0
+    cut = len(tokens)
+    for i, token in enumerate(tokens):
+        if token.kind == "punct" and token.text in "([":
+            depth += 1
+        elif token.kind == "punct" and token.text in ")]":
+            depth -= 1
+        elif token.kind == "cast" and depth == 0:
+            cut = min(cut, i)
+            casts.append([])
+            continue
+        if casts:
+            casts[-1].append(token)
+    head = tokens[:cut]
+    type_names = [raw_text(c).replace(" [", "[") for c in casts]
+
+    first = head[0]
+    value = _MISSING
+    if len(head) == 1:
+        if first.kind in ("string", "estring", "dollar"):
+            value = _string_value(first, standard_strings)
+        elif first.kind == "number":
+            text = first.text
+            value = float(text) if any(c in text for c in ".eE") else int(text)
+        elif first.upper == "NULL":
+            value = None
+        elif first.upper in ("TRUE", "FALSE"):
+            value = first.upper == "TRUE"
+    elif len(head) == 2 and first.kind == "punct" and first.text in "+-" and head[1].kind == "number":
+        value = evaluate(head[1:], standard_strings, on_error)
+        value = -value if first.text == "-" else value
+    elif len(head) == 2 and first.upper in _TYPED_LITERALS and head[1].kind in ("string", "estring"):
+        type_names.insert(0, first.upper.lower())
+        value = _string_value(head[1], standard_strings)
+    elif first.upper == "ARRAY" and head[1].text == "[" and head[-1].text == "]":
+        inner = head[2:-1]
+        value = [evaluate(part, standard_strings, on_error) for part in _split_top_level(inner)] if inner else []
+    elif first.kind == "punct" and first.text == "(" and head[-1].text == ")" and len(head) > 2:
+        inner = _split_top_level(head[1:-1])
+        if len(inner) == 1:
+            value = evaluate(inner[0], standard_strings, on_error)
+
+    if value is _MISSING or isinstance(value, SqlExpression):
+        return SqlExpression(raw_text(tokens))
+    for type_name in type_names:
+        try:
+            value = _cast(value, type_name)
+        except (ValueError, TypeError) as e:
+            error = SqlParseError(f"satır {first.line}: {type_name} dönüşümü başarısız: {e}")
+            if on_error is None:
+                raise error from None
+            on_error(error)
+            break
+    return value
+
+
+_MISSING = object()
+
+
+# -- İfadeler ----------------------------------------------------------------------
+
+class _TokenStream:
+    def __init__(self, tokens):
+        self._tokens = tokens
+        self._peeked = None
+
+    def peek(self):
+        if self._peeked is None:
+            self._peeked = next(self._tokens, None)
+        return self._peeked
+
+    def next(self):
+        token = self.peek()
+        self._peeked = None
+        return token
+
+    def expect(self, text):
+        token = self.next()
+        if token is None:
+            raise SqlParseError(f"dosya sonu: {text!r} bekleniyordu")
+        if token.text.upper() != text:
+            raise SqlParseError(f"satır {token.line}: {text!r} bekleniyordu, {token.text[:40]!r} bulundu")
+        return token
+
+    def skip_statement(self):
+        """Derinlik 0'daki ';' dahil ifadenin geri kalanını atlar."""
+        depth = 0
+        while True:
+            token = self.next()
+            if token is None:
+                return
+            if token.kind == "punct":
+                if token.text == "(":
+                    depth += 1
+                elif token.text == ")":
+                    depth -= 1
+                elif token.text == ";" and depth == 0:
+                    return
+
+    def collect(self, stop_words=frozenset(), stop_punct=",)"):
+        """Derinlik 0'da bir ayraca (veya anahtar kelimeye) kadar token toplar."""
+        tokens = []
+        depth = 0
+        while True:
+            token = self.peek()
+            if token is None:
+                raise SqlParseError("dosya sonu: ifade tamamlanmadı")
+            kind = token.kind
+            if depth == 0 and (
+                (kind == "punct" and token.text in stop_punct)
+                or (stop_words and kind == "word" and token.upper in stop_words)
+            ):
+                return tokens
+            if kind == "punct":
+                if token.text in "([":
+                    depth += 1
+                elif token.text in ")]":
+                    depth -= 1
+            tokens.append(self.next())
+
+
+def identifier(token):
+    if token.kind == "ident":
+        return token.text[1:-1].replace('""', '"')
+    if token.kind == "word":
+        return token.text
+    raise SqlParseError(f"satır {token.line}: isim bekleniyordu, {token.text[:40]!r} bulundu")
+
+
+def _table_name(stream):
+    name = identifier(stream.next())
+    while stream.peek() is not None and stream.peek().text == ".":
+        stream.next()
+        name = identifier(stream.next())  # şema ön eki atılır: public."t" -> t
+    return name
+
+
+def _column_list(stream):
+    stream.expect("(")
+    columns = []
+    while True:
+        columns.append(identifier(stream.next()))
+        token = stream.next()
+        if token is None or token.text not in ",)":
+            raise SqlParseError(f"satır {getattr(token, 'line', '?')}: kolon listesi bozuk")
+        if token.text == ")":
+            return columns
+
+
+def _row(columns, values, line):
+    if columns is None:
+        columns = [f"${i + 1}" for i in range(len(values))]
+    if len(values) != len(columns):
+        raise SqlParseError(f"satır {line}: {len(columns)} kolon, {len(values)} değer")
+    return dict(zip(columns, values))
+
+
+def _insert_rows(stream, table, columns, standard_strings, on_error):
+    token = stream.next()
+    word = token.upper if token else None
+    if word == "VALUES":
+        while True:
+            start = stream.expect("(")
+            values = []
+            while True:
+                values.append(evaluate(stream.collect(), standard_strings, on_error))
+                if stream.next().text == ")":
+                    break
+            yield _row(columns, values, start.line)
+            following = stream.peek()
+            if following is not None and following.text == ",":
+                stream.next()
+                continue
+            break
+    elif word == "SELECT":
+        values = []
+        while True:
+            values.append(evaluate(stream.collect(_SELECT_END, ",;"), standard_strings, on_error))
+            following = stream.peek()
+            if following is None or following.text != ",":
+                break
+            stream.next()
+        yield _row(columns, values, token.line)
+    elif word != "DEFAULT":
+        raise SqlParseError(
+            f"satır {getattr(token, 'line', '?')}: {table} için VALUES veya SELECT bekleniyordu"
+        )
+    stream.skip_statement()
+
+
+def iter_rows(src, tables=None, standard_strings=True, on_error=None, chunk_size=CHUNK_SIZE):
+    """
+    Dosya nesnesindeki INSERT ifadelerinden (tablo, {kolon: değer}) üretir.
+
+    tables verilirse yalnızca o tabloların satırları değerlendirilir; diğer
+    INSERT'ler token düzeyinde atlanır (JSON gövdeleri çözülmez).
+    on_error için evaluate()'a bakın.
+    """
+    tables = set(tables) if tables else None
+    stream = _TokenStream(iter_tokens(src, standard_strings, chunk_size))
+    while True:
+        token = stream.next()
+        if token is None:
+            return
+        if token.upper != "INSERT":
+            if not (token.kind == "punct" and token.text == ";"):
+                stream.skip_statement()
+            continue
+        stream.expect("INTO")
+        table = _table_name(stream)
+        columns = None
+        following = stream.peek()
+        if following is not None and following.text == "(":
+            columns = _column_list(stream)
+        if tables is not None and table not in tables:
+            stream.skip_statement()
+            continue
+        for row in _insert_rows(stream, table, columns, standard_strings, on_error):
+            yield table, row
+
+
+def read_rows(path, tables=None, standard_strings=True, on_error=None):
+    """iter_rows'un dosya yolu alan hali."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        yield from iter_rows(f, tables, standard_strings, on_error)
+
+
+# -- Yeniden SQL üretme ------------------------------------------------------------
+
+def sql_literal(value):
+    """
+    Python değerini SQL literal'ine çevirir (generate_tests.py'deki biçim:
+    '...' içinde '' escape'i, dict/list için '...'::jsonb).
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, SqlExpression):
+        return str(value)
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime.datetime):
+        return f"TIMESTAMP '{json_default(value)}'"
+    if isinstance(value, datetime.date):
+        return f"DATE '{value.isoformat()}'"
+    if isinstance(value, (dict, list)):
+        text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return "'" + text.replace("'", "''") + "'::jsonb"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def render_insert(table, columns, rows):
+    """Satırlar için tek bir çok satırlı INSERT ifadesi üretir."""
+    cols = ",\n".join(f"    {quote_ident(c)}" for c in columns)
+    values = ",\n".join(
+        "    (\n" + ",\n".join(f"        {sql_literal(row.get(c))}" for c in columns) + "\n    )"
+        for row in rows
+    )
+    return f"INSERT INTO {quote_ident(table)} (\n{cols}\n)\nVALUES\n{values};\n"
+
+
+def json_default(value):
+    """json.dumps(default=...) için: tarih/zamanları SQL'deki biçimde yazar."""
+    if isinstance(value, datetime.datetime):
+        timespec = "milliseconds" if value.microsecond % 1000 == 0 else "microseconds"
+        return value.isoformat(sep=" ", timespec=timespec)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f"JSON'a çevrilemez: {type(value).__name__}")
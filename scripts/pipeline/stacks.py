@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+data/test-modules/<kurs>-test-modules.json dosyalarından türetilen
+kurs (stack) bilgileri.
+
+Konu anlatımı ve kurs JSON üreticileri, elle hazırlanmış içeriği olmayan
+kurslar için modül/ders iskeletini bu dosyalardaki modül başlıkları ve
+relatedTests listesinden çıkarır.
+"""
+
+import glob
+import json
+import os
+import re
+
+TEST_MODULES_GLOB = "data/test-modules/*-test-modules.json"
+
+# Kurs -> kod örneklerinin dili
+STACK_LANGUAGES = {
+    "ai-for-developers": "python",
+    "angular": "typescript",
+    "aws": "bash",
+    "azure": "bash",
+    "docker-kubernetes": "yaml",
+    "dotnet-core-senior": "csharp",
+    "ethical-hacking": "bash",
+    "flutter": "dart",
+    "go": "go",
+    "java": "java",
+    "kotlin": "kotlin",
+    "mongodb": "javascript",
+    "mssql": "sql",
+    "nestjs": "typescript",
+    "nextjs": "typescript",
+    "nodejs": "javascript",
+    "owasp-security": "javascript",
+    "postgresql": "sql",
+    "python": "python",
+    "react": "javascript",
+    "spring-boot": "java",
+    "swift": "swift",
+    "typescript": "typescript",
+    "vuejs": "javascript"
+}
+
+# Kurs -> (courseId, kurs başlığı); app/api/admin/create-course/<kurs>/route.ts ile aynı
+STACK_COURSES = {
+    "ai-for-developers": ("course-ai-for-developers", "Yazılımcılar İçin Yapay Zeka"),
+    "angular": ("course-angular-roadmap", "Angular Kursu"),
+    "aws": ("course-aws-roadmap", "AWS Kursu"),
+    "azure": ("course-azure-roadmap", "Azure Kursu"),
+    "docker-kubernetes": ("course-docker-kubernetes-roadmap", "Docker & Kubernetes Kursu"),
+    "dotnet-core": ("course-dotnet-roadmap", ".NET Core Kursu"),
+    "dotnet-core-senior": ("course-dotnet-core-senior", ".NET Core Senior Kursu"),
+    "ethical-hacking": ("course-ethical-hacking", "Ethical Hacking Kursu"),
+    "flutter": ("course-flutter", "Flutter Kursu"),
+    "go": ("course-go-roadmap", "Go Kursu"),
+    "java": ("course-java-roadmap", "Java Kursu"),
+    "kotlin": ("course-kotlin-roadmap", "Kotlin Kursu"),
+    "mongodb": ("course-mongodb-roadmap", "MongoDB Kursu"),
+    "mssql": ("course-mssql-roadmap", "MSSQL Kursu"),
+    "nestjs": ("course-nestjs-roadmap", "NestJS Kursu"),
+    "nextjs": ("course-nextjs-roadmap", "Next.js Kursu"),
+    "nodejs": ("course-nodejs-roadmap", "Node.js Kursu"),
+    "owasp-security": ("course-owasp-security", "OWASP & Web Security Kursu"),
+    "postgresql": ("course-postgresql-roadmap", "PostgreSQL Kursu"),
+    "python": ("course-python-roadmap", "Python Kursu"),
+    "react": ("course-react-roadmap", "React Kursu"),
+    "spring-boot": ("course-spring-boot-roadmap", "Spring Boot Kursu"),
+    "swift": ("course-swift-roadmap", "Swift Kursu"),
+    "typescript": ("course-typescript-roadmap", "TypeScript Kursu"),
+    "vuejs": ("course-vuejs-roadmap", "Vue.js Kursu")
+}
+
+_MODULE_TITLE_RE = re.compile(r"^Module\s+\d+:\s*|\s+Testi$")
+_LESSON_TITLE_RE = re.compile(r"^Ders\s+\d+:\s*")
+
+
+def stack_name(path):
+    """data/test-modules/go-test-modules.json -> go"""
+    return os.path.basename(path)[:-len("-test-modules.json")]
+
+
+def module_title(title):
+    """"Module 1: Go Tanımı ve Temelleri Testi" -> "Go Tanımı ve Temelleri" """
+    return _MODULE_TITLE_RE.sub("", title)
+
+
+def lesson_title(title):
+    """"Ders 1: Go Nedir?" -> "Go Nedir?" """
+    return _LESSON_TITLE_RE.sub("", title)
+
+
+def load_test_modules(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def select_stacks(spec, exclude=()):
+    """--stacks değeri ("all" veya virgüllü liste) -> test modülü dosyaları"""
+    if not spec:
+        return []
+    paths = sorted(glob.glob(TEST_MODULES_GLOB))
+    available = {stack_name(p): p for p in paths if stack_name(p) not in exclude}
+    if spec == "all":
+        return list(available.values())
+    selected = []
+    for stack in spec.split(","):
+        stack = stack.strip()
+        if stack not in available:
+            raise ValueError(f"bilinmeyen kurs: {stack} (seçenekler: {', '.join(sorted(available))})")
+        selected.append(available[stack])
+    return selected
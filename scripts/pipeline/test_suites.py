@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+data/test-modules/<kurs>-test-modules.json dosyalarından kurs başına test
+serisi (quizzes satırları) üretir.
+
+Her relatedTests girdisi bir test olur: id test-<kurs>-module-NN-<ders>,
+lessonSlug girdinin href'i. Sorular soru bankasından çekilir; önce
+dersin href'ine, sonra modül dizinine, en son kursun courseId'sine
+düşen çoktan seçmeli sorular denenir. Yakın kopyalar (aynı MinHash
+kümesi) bir kurs içinde en fazla bir kez kullanılır; eksik kalan sorular
+derse özel placeholder'larla tamamlanır.
+
+Kurslar birbirinden bağımsızdır: adaylar ana süreçte bankadan kurs
+başına ayrılır, seçim ve SQL/COPY metni render_suites() ile bir süreç
+havuzunda üretilir. Sonuçlar girdi sırasıyla döner ve kurslar arasında
+paylaşılan durum yoktur; çıktı işçi sayısından bağımsızdır.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from . import question_bank
+from .build_cache import sha256_bytes
+from .pg_copy import DEFAULT_BATCH_SIZE, QUIZ_COLUMNS, copy_script_text, quote_ident
+from .stacks import STACK_COURSES, lesson_title, load_test_modules, module_title, stack_name
+from .topic_render import DEFAULT_LEVEL, level_for_position
+
+QUESTIONS_PER_TEST = 10
+PASSING_SCORE = 70
+FORMATS = ("sql", "copy")
+
+# topic_render seviyeleri -> quizzes.level
+_QUIZ_LEVELS = {"Başlangıç": "beginner", DEFAULT_LEVEL: "intermediate", "İleri": "advanced"}
+
+_MODULE_NUMBER_RE = re.compile(r"module-\d+")
+
+
+def course_for(stack):
+    """(courseId, topic): "go" -> ("course-go-roadmap", "Go")"""
+    course_id, course_title = STACK_COURSES.get(stack, (f"course-{stack}-roadmap", stack))
+    return course_id, course_title.removesuffix(" Kursu")
+
+
+def shard_name(stack, fmt):
+    return f"{stack}-tests.copy.sql" if fmt == "copy" else f"{stack}-tests.sql"
+
+
+def test_id(stack, module_id, lesson_id):
+    """("java", "java-module-01", "java-introduction") -> "test-java-module-01-java-introduction" """
+    m = _MODULE_NUMBER_RE.search(module_id)
+    return f"test-{stack}-{m.group(0) if m else module_id}-{lesson_id}"
+
+
+def stack_candidates(bank, paths):
+    """
+    Kurs başına bankadan aday sorular (banka sırasıyla): cevabı belli,
+    en az iki seçenekli, dersi kursun dizininde ya da courseId'si kursun
+    olan çoktan seçmeli sorular. {kurs: [soru sözlüğü]} döner.
+    """
+    wanted = {}
+    for path in paths:
+        stack = stack_name(path)
+        wanted[stack] = (course_for(stack)[0], f"/education/lessons/{stack}/")
+    candidates = {stack: [] for stack in wanted}
+    for i in range(len(bank)):
+        if bank.kind[i] != question_bank.MCQ or bank.answer[i] < 0 or len(bank.options[i]) < 2:
+            continue
+        for stack, (course_id, prefix) in wanted.items():
+            if bank.course[i] == course_id or bank.lesson[i].startswith(prefix):
+                candidates[stack].append({
+                    "cluster": bank.cluster[i],
+                    "lesson": bank.lesson[i],
+                    "question": bank.text[i],
+                    "options": bank.options[i],
+                    "correctAnswer": bank.answer[i],
+                    "explanation": bank.explanation[i],
+                })
+    return candidates
+
+
+def placeholder_question(title, description, i):
+    return {
+        "id": f"q{i+1}",
+        "question": f"{title} - Soru {i+1}",
+        "options": ["Seçenek A", "Seçenek B", "Seçenek C", "Seçenek D"],
+        "correctAnswer": i % 4,
+        "explanation": description or f"Açıklama {i+1}",
+    }
+
+
+def _draw(tiers, count, used_clusters):
+    """Katmanları sırayla dolaşıp kümesi kullanılmamış en fazla count soru seçer."""
+    picked = []
+    if count <= 0:
+        return picked
+    for tier in tiers:
+        for q in tier:
+            if q["cluster"] in used_clusters:
+                continue
+            used_clusters.add(q["cluster"])
+            picked.append(q)
+            if len(picked) == count:
+                return picked
+    return picked
+
+
+def iter_stack_tests(stack, modules, candidates, stats):
+    """Bir kursun testleri, QUIZ_COLUMNS sırasında satırlar olarak."""
+    course_id, topic = course_for(stack)
+    used_clusters = set()
+    for index, module in enumerate(modules):
+        level = _QUIZ_LEVELS[level_for_position(index, len(modules))]
+        title_of_module = module_title(module["title"])
+        module_dir = f"/education/lessons/{stack}/{module['id']}/"
+        in_module = [q for q in candidates if q["lesson"].startswith(module_dir)]
+        for test in module.get("relatedTests") or []:
+            title = lesson_title(test["title"])
+            description = test.get("description") or ""
+            href = test.get("href") or ""
+            in_lesson = [q for q in in_module if href and q["lesson"].startswith(href)]
+            picked = _draw((in_lesson, in_module, candidates), QUESTIONS_PER_TEST, used_clusters)
+            questions = [
+                {
+                    "id": f"q{n+1}",
+                    "question": q["question"],
+                    "options": q["options"],
+                    "correctAnswer": q["correctAnswer"],
+                    "explanation": q["explanation"],
+                }
+                for n, q in enumerate(picked)
+            ]
+            # Bankada yeterli soru yoksa derse özel placeholder ile tamamla
+            questions.extend(
+                placeholder_question(title, description, n)
+                for n in range(len(questions), QUESTIONS_PER_TEST)
+            )
+            stats["bank"] += len(picked)
+            stats["placeholder"] += QUESTIONS_PER_TEST - len(picked)
+            yield (
+                test_id(stack, module["id"], test["id"]),
+                course_id,
+                title,
+                f"{topic} Test Serisi - {title_of_module}" + (f": {description}" if description else ""),
+                topic,
+                "TEST",
+                level,
+                questions,
+                PASSING_SCORE,
+                href or None,
+            )
+
+
+def _sql_literal(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return "'" + value.replace("'", "''") + "'::jsonb"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def insert_script_text(table, columns, rows):
+    """
+    Satırları tek bir INSERT ... ON CONFLICT DO NOTHING deyimi olarak
+    üretir (database-seed.sql biçiminde). (satır sayısı, metin) döner.
+    """
+    tuples = []
+    for row in rows:
+        fields = [_sql_literal(v) for v in row] + ["CURRENT_TIMESTAMP", "CURRENT_TIMESTAMP"]
+        tuples.append("    (\n" + ",\n".join("        " + f for f in fields) + "\n    )")
+    if not tuples:
+        return 0, ""
+    cols = ",\n".join("    " + quote_ident(c) for c in tuple(columns) + ("createdAt", "updatedAt"))
+    text = (
+        f"INSERT INTO {quote_ident(table)} (\n{cols}\n)\nVALUES\n"
+        + ",\n".join(tuples)
+        + '\nON CONFLICT ("id") DO NOTHING;\n'
+    )
+    return len(tuples), text
+
+
+def render_suite(job):
+    """
+    Tek kursun shard'ı: (stack, path, candidates, fmt, batch_size) ->
+    {"stack", "file", "data" (bytes), "tests", "questions", "bank", "placeholder", "sha256"}
+    """
+    stack, path, candidates, fmt, batch_size = job
+    modules = load_test_modules(path)["modules"]
+    stats = {"bank": 0, "placeholder": 0}
+    rows = iter_stack_tests(stack, modules, candidates, stats)
+    if fmt == "copy":
+        count, text = copy_script_text("quizzes", QUIZ_COLUMNS, rows, batch_size)
+    else:
+        count, text = insert_script_text("quizzes", QUIZ_COLUMNS, rows)
+    header = (
+        f"-- {course_for(stack)[1]} test serisi ({os.path.basename(path)})\n"
+        f"-- {count} test, {count * QUESTIONS_PER_TEST} soru; generate_tests.py --stacks ile üretildi\n\n"
+    )
+    data = (header + text).encode("utf-8")
+    return {
+        "stack": stack,
+        "file": shard_name(stack, fmt),
+        "data": data,
+        "tests": count,
+        "questions": count * QUESTIONS_PER_TEST,
+        "bank": stats["bank"],
+        "placeholder": stats["placeholder"],
+        "sha256": sha256_bytes(data),
+    }
+
+
+def render_suites(jobs, workers=None):
+    """Kursları paralel işler; sonuç listesi jobs sırasındadır."""
+    jobs = list(jobs)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [render_suite(job) for job in jobs]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(render_suite, jobs))
+
+
+def build_jobs(bank, paths, fmt="sql", batch_size=DEFAULT_BATCH_SIZE):
+    """Kurs dosyalarından (sıralı) render_suite işleri."""
+    paths = sorted(paths, key=stack_name)
+    candidates = stack_candidates(bank, paths)
+    return [(stack_name(p), p, candidates[stack_name(p)], fmt, batch_size) for p in paths]
+
+
+def suite_manifest(results, fmt):
+    """Shard'ların sayı ve hash'lerini toplayan birleşik manifest (zaman damgası yok)."""
+    stacks = {
+        r["stack"]: {
+            "file": r["file"],
+            "tests": r["tests"],
+            "questions": r["questions"],
+            "bankQuestions": r["bank"],
+            "placeholders": r["placeholder"],
+            "bytes": len(r["data"]),
+            "sha256": r["sha256"],
+        }
+        for r in results
+    }
+    combined = sha256_bytes("".join(f"{r['sha256']}  {r['file']}\n" for r in results).encode("ascii"))
+    return {
+        "format": fmt,
+        "questionsPerTest": QUESTIONS_PER_TEST,
+        "stacks": stacks,
+        "totals": {
+            "stacks": len(results),
+            "tests": sum(r["tests"] for r in results),
+            "questions": sum(r["questions"] for r in results),
+            "bankQuestions": sum(r["bank"] for r in results),
+            "placeholders": sum(r["placeholder"] for r in results),
+        },
+        "sha256": combined,
+    }
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Konu anlatımı (topic-lessons) iskeletlerini üreten ortak motor.
+
+Her konu aynı iskeletten (başlık, kazanımlar, tek bölüm, kod örneği,
+checkpoint) türetilir. Modüle bağlı parçalar (seviye, href ön eki, kod
+dili, modül başlığı geçen cümleler) ModuleTemplate içinde modül başına
+bir kez hesaplanır; konu başına yalnızca konuya bağlı metinler
+doldurulur.
+
+render_modules() modülleri bir süreç havuzunda işler; sonuçlar girdi
+sırasıyla döner, dolayısıyla çıktı işçi sayısından bağımsızdır.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_LEVEL = "Orta"
+DEFAULT_DURATION_MINUTES = 35
+
+_MODULE_NUMBER_RE = re.compile(r"module-(\d+)")
+
+# Kod dili -> satır yorumu ön eki
+_COMMENT_PREFIX = {"python": "#", "bash": "#", "yaml": "#", "sql": "--"}
+
+_CHECKPOINT_OPTIONS = ("Seçenek 1", "Seçenek 2", "Seçenek 3", "Seçenek 4")
+
+
+def module_prefix(module_id):
+    """"module-03-project-structure" -> "module-03" (eşleşmezse None)."""
+    m = _MODULE_NUMBER_RE.match(module_id)
+    return m.group(0) if m else None
+
+
+def level_for_position(index, count):
+    """Açık seviye tablosu olmayan kurslar için: ilk beşte bir başlangıç, son üçte bir ileri."""
+    if index < max(1, count // 5):
+        return "Başlangıç"
+    if index >= count - count // 3:
+        return "İleri"
+    return DEFAULT_LEVEL
+
+
+def comment_prefix(language):
+    """Kod dilinin satır yorumu ön eki ("sql" -> "--", "python" -> "#")."""
+    return _COMMENT_PREFIX.get(language, "//")
+
+
+def _code_sample(language, topic_title):
+    if language == "csharp":
+        return f"// {topic_title} örnek kullanımı\npublic class Example\n{{\n    // Örnek kod buraya gelecek\n}}"
+    comment = comment_prefix(language)
+    return f"{comment} {topic_title} örnek kullanımı\n{comment} Örnek kod buraya gelecek"
+
+
+class ModuleTemplate:
+    """Bir modülün tüm konularında ortak olan, önceden hesaplanmış parçalar."""
+
+    def __init__(self, module_id, module_title, level=DEFAULT_LEVEL, language="csharp",
+                 duration_minutes=DEFAULT_DURATION_MINUTES):
+        self.module_id = module_id
+        self.module_title = module_title
+        self.level = level
+        self.language = language
+        self.duration_minutes = duration_minutes
+        # Eski üreticideki varsayılan href: module-03-project-structure -> 03/project/structure
+        self.href_base = "/education/lessons/" + module_id.replace("module-", "").replace("-", "/")
+        self.role_suffix = " önemli bir rol oynar."
+        self.role_prefix = f"{module_title} modülünde "
+        self.body_suffix = (
+            f" Bu konu, {module_title} modülünün önemli bir parçasıdır"
+            " ve gerçek dünya uygulamalarında sıklıkla kullanılır."
+        )
+
+    def default_href(self, topic_slug):
+        if "dotnet-core" in topic_slug or "architecture" in topic_slug:
+            return f"/education/lessons/{topic_slug}"
+        return f"{self.href_base}/{topic_slug}"
+
+    def render_topic(self, topic_title, topic_slug, description, href=None):
+        return {
+            "label": topic_title if "Nedir" in topic_title or topic_title.endswith("?") else f"{topic_title} Nedir?",
+            "href": href or self.default_href(topic_slug),
+            "description": description,
+            "estimatedDurationMinutes": self.duration_minutes,
+            "level": self.level,
+            "keyTakeaways": [
+                f"{topic_title} kavramını ve temel kullanımını öğreneceksin.",
+                self.role_prefix + topic_title + self.role_suffix,
+                "Pratik örneklerle konuyu pekiştireceksin."
+            ],
+            "sections": [
+                {
+                    "id": f"{topic_slug}-overview",
+                    "title": f"{topic_title} Temelleri",
+                    "summary": f"{topic_title} kavramını ve temel kullanımını öğren.",
+                    "content": [
+                        {
+                            "type": "text",
+                            "body": description + self.body_suffix
+                        },
+                        {
+                            "type": "code",
+                            "language": self.language,
+                            "code": _code_sample(self.language, topic_title),
+                            "explanation": f"{topic_title} kullanımına dair temel örnek."
+                        },
+                        {
+                            "type": "callout",
+                            "variant": "tip",
+                            "title": "İpucu",
+                            "body": f"{topic_title} konusunda dikkat edilmesi gereken önemli noktalar."
+                        }
+                    ]
+                }
+            ],
+            "checkpoints": [
+                {
+                    "id": f"checkpoint-{topic_slug}",
+                    "question": f"{topic_title} ile ilgili temel soru?",
+                    "options": list(_CHECKPOINT_OPTIONS),
+                    "answer": _CHECKPOINT_OPTIONS[0],
+                    "rationale": "Açıklama buraya gelecek."
+                }
+            ],
+            "resources": [],
+            "practice": []
+        }
+
+
+def render_module(job):
+    """
+    job: (ModuleTemplate argümanları dict'i, [(başlık, slug, açıklama, href|None), ...])
+    Süreç havuzuna gönderilebilmesi için modül düzeyinde tanımlıdır.
+    """
+    template_args, topics = job
+    template = ModuleTemplate(**template_args)
+    return {
+        "moduleId": template.module_id,
+        "moduleTitle": template.module_title,
+        "topics": [template.render_topic(*topic) for topic in topics],
+    }
+
+
+def render_modules(jobs, workers=None):
+    """Modülleri paralel işler; sonuç listesi jobs sırasındadır."""
+    jobs = list(jobs)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [render_module(job) for job in jobs]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(render_module, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+"""
+İçerik JSON dosyaları için hızlı doğrulayıcı.
+
+Her dosya C tabanlı json ayrıştırıcısıyla okunur ve içeriğine göre bir
+şema türü seçilir:
+
+    lessons      modules[].lessons[] (veya tek modül dosyası) - sections / checkpoints
+    topics       modules[].topics[]  - lessons ile aynı kurallar
+    quizzes      quizzes[].questions[] - answer / correctAnswer seçenek aralığında
+    badges       badges[].criteria - criteria.type'a göre zorunlu alanlar
+    test-modules modules[].relatedTests[]
+    json         yalnızca sözdizimi
+
+Sorunlar dosya:satır:sütun olarak raporlanır. Şema hatalarının konumu
+yalnızca hata bulunduğunda, ilgili değere kadar inilerek hesaplanır;
+temiz dosyalar için ek maliyet yoktur. Dosyalar süreç havuzunda paralel
+doğrulanır.
+"""
+
+import glob
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from . import REPO_ROOT
+
+# Varsayılan olarak taranan kökler (depo köküne göre)
+DEFAULT_ROOTS = ["data", "public/data", "DB-Seeds/JSON"]
+
+ERROR = "error"
+WARNING = "warning"
+
+_WS = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# criteria.type -> zorunlu alanlar; app/api/badges/check/badge-service.ts ile uyumlu
+BADGE_CRITERIA_FIELDS = {
+    "daily_activity": {"activity_type": str, "count": int},
+    "score": {"score_type": str, "min_score": int},
+    "social_interaction": {"interaction_type": str, "count": int},
+    "streak": {"streak_type": str, "days": int},
+    "special": {"special_type": str},
+    # Toplam sayaç rozetleri
+    "test_count": {"count": int},
+    "perfect_score_count": {"count": int},
+    "total_score": {"count": int},
+    "lesson_count": {"count": int},
+    "quiz_count": {"count": int},
+    "live_coding_count": {"count": int},
+    "bugfix_count": {"count": int},
+    # Eski "value" yapısı
+    "total_quizzes": {"value": int},
+    "average_score": {"value": int},
+    "single_score": {"value": int},
+    "perfect_scores": {"value": int},
+    "current_streak": {"value": int},
+    "longest_streak": {"value": int},
+    "total_days_active": {"value": int},
+    "fast_completion": {"value": int},
+    "perfect_score": {},
+    "first_quiz": {},
+    "topic_complete": {},
+}
+
+
+class Issue:
+    __slots__ = ("path", "line", "col", "severity", "message", "json_path")
+
+    def __init__(self, path, line, col, severity, message, json_path=""):
+        self.path = path
+        self.line = line
+        self.col = col
+        self.severity = severity
+        self.message = message
+        self.json_path = json_path
+
+    def __str__(self):
+        where = f" ({self.json_path})" if self.json_path else ""
+        return f"{self.path}:{self.line}:{self.col}: {self.severity}: {self.message}{where}"
+
+
+def format_json_path(parts):
+    out = ["$"]
+    for part in parts:
+        out.append(f"[{part}]" if isinstance(part, int) else f".{part}")
+    return "".join(out)
+
+
+# -- Konum bulma ------------------------------------------------------------
+
+def _line_col(text, pos):
+    line = text.count("\n", 0, pos) + 1
+    col = pos - (text.rfind("\n", 0, pos) + 1) + 1
+    return line, col
+
+
+def _skip_ws(text, pos):
+    return _WS.match(text, pos).end()
+
+
+def _descend(text, pos, part):
+    """pos'taki nesne/dizide part anahtarının/indeksinin değer başlangıcını bulur."""
+    pos = _skip_ws(text, pos)
+    opener = text[pos]
+    pos = _skip_ws(text, pos + 1)
+    if opener == "{":
+        while text[pos] != "}":
+            key, pos = _DECODER.raw_decode(text, pos)
+            pos = _skip_ws(text, pos)
+            pos = _skip_ws(text, pos + 1)  # ':'
+            if key == part:
+                return pos
+            _, pos = _DECODER.raw_decode(text, pos)
+            pos = _skip_ws(text, pos)
+            if text[pos] == ",":
+                pos = _skip_ws(text, pos + 1)
+    elif opener == "[":
+        index = 0
+        while text[pos] != "]":
+            if index == part:
+                return pos
+            _, pos = _DECODER.raw_decode(text, pos)
+            pos = _skip_ws(text, pos)
+            if text[pos] == ",":
+                pos = _skip_ws(text, pos + 1)
+            index += 1
+    return None
+
+
+def locate(text, parts):
+    """JSON yolundaki değerin (satır, sütun) konumu; bulunamayan son adımda durur."""
+    pos = _skip_ws(text, 1 if text.startswith("\ufeff") else 0)
+    for part in parts:
+        found = _descend(text, pos, part)
+        if found is None:
+            break
+        pos = found
+    return _line_col(text, pos)
+
+
+# -- Şema kuralları ---------------------------------------------------------
+
+def _is_str(value):
+    return isinstance(value, str) and value.strip() != ""
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_lesson(lesson, at, issues):
+    if not isinstance(lesson, dict):
+        issues.append((ERROR, at, "ders bir nesne olmalı"))
+        return
+    for field in ("label", "href"):
+        if not _is_str(lesson.get(field)):
+            issues.append((ERROR, at + (field,), f"'{field}' boş olmayan bir string olmalı"))
+
+    sections = lesson.get("sections")
+    if sections is not None:
+        if not isinstance(sections, list):
+            issues.append((ERROR, at + ("sections",), "'sections' bir dizi olmalı"))
+        else:
+            for i, section in enumerate(sections):
+                s_at = at + ("sections", i)
+                if not isinstance(section, dict):
+                    issues.append((ERROR, s_at, "bölüm bir nesne olmalı"))
+                    continue
+                if not _is_str(section.get("title")):
+                    issues.append((ERROR, s_at + ("title",), "bölüm 'title' eksik"))
+                content = section.get("content")
+                if content is not None and not isinstance(content, list):
+                    issues.append((ERROR, s_at + ("content",), "'content' bir dizi olmalı"))
+                elif content:
+                    for j, block in enumerate(content):
+                        if not isinstance(block, dict) or not _is_str(block.get("type")):
+                            issues.append((ERROR, s_at + ("content", j), "içerik bloğunda 'type' eksik"))
+
+    checkpoints = lesson.get("checkpoints")
+    if checkpoints is not None:
+        if not isinstance(checkpoints, list):
+            issues.append((ERROR, at + ("checkpoints",), "'checkpoints' bir dizi olmalı"))
+        else:
+            for i, checkpoint in enumerate(checkpoints):
+                c_at = at + ("checkpoints", i)
+                if not isinstance(checkpoint, dict):
+                    issues.append((ERROR, c_at, "checkpoint bir nesne olmalı"))
+                    continue
+                if not _is_str(checkpoint.get("question")):
+                    issues.append((ERROR, c_at + ("question",), "checkpoint 'question' eksik"))
+                options = checkpoint.get("options")
+                if not isinstance(options, list) or not options:
+                    issues.append((ERROR, c_at + ("options",), "checkpoint 'options' boş olmayan bir dizi olmalı"))
+                elif checkpoint.get("answer") not in options:
+                    issues.append((ERROR, c_at + ("answer",), "checkpoint 'answer' seçeneklerden biri değil"))
+
+
+def _check_course(data, items_key, total_key, issues):
+    modules = data.get("modules")
+    seen = {}
+    total = 0
+    for m, module in enumerate(modules):
+        m_at = ("modules", m)
+        if not isinstance(module, dict):
+            issues.append((ERROR, m_at, "modül bir nesne olmalı"))
+            continue
+        module_id = module.get("moduleId")
+        if not _is_str(module_id):
+            issues.append((ERROR, m_at + ("moduleId",), "'moduleId' eksik"))
+        elif module_id in seen:
+            issues.append((ERROR, m_at + ("moduleId",), f"'{module_id}' tekrar ediyor (ilki modules[{seen[module_id]}])"))
+        else:
+            seen[module_id] = m
+        items = module.get(items_key)
+        if not isinstance(items, list):
+            issues.append((ERROR, m_at + (items_key,), f"'{items_key}' bir dizi olmalı"))
+            continue
+        total += len(items)
+        for i, item in enumerate(items):
+            _check_lesson(item, m_at + (items_key, i), issues)
+
+    declared = data.get(total_key)
+    if declared is not None and declared != total:
+        issues.append((WARNING, (total_key,), f"'{total_key}' {declared}, modüllerdeki toplam {total}"))
+
+
+def _report_duplicates(duplicates, label, issues):
+    """Tekrarlanan her id için tek sorun: ilk tekrarın konumu ve toplam sayı."""
+    for value, (first_at, count) in duplicates.items():
+        issues.append((ERROR, first_at, f"{label} '{value}' {count + 1} kez geçiyor"))
+
+
+def _check_quizzes(data, issues):
+    seen = set()
+    duplicates = {}
+    for q, quiz in enumerate(data["quizzes"]):
+        q_at = ("quizzes", q)
+        if not isinstance(quiz, dict):
+            issues.append((ERROR, q_at, "quiz bir nesne olmalı"))
+            continue
+        quiz_id = quiz.get("id")
+        if not _is_str(quiz_id):
+            issues.append((ERROR, q_at + ("id",), "quiz 'id' eksik"))
+        elif quiz_id in seen:
+            first_at, count = duplicates.get(quiz_id, (q_at + ("id",), 0))
+            duplicates[quiz_id] = (first_at, count + 1)
+        else:
+            seen.add(quiz_id)
+        questions = quiz.get("questions")
+        if not isinstance(questions, list):
+            issues.append((ERROR, q_at + ("questions",), "'questions' bir dizi olmalı"))
+            continue
+        for i, question in enumerate(questions):
+            _check_question(question, q_at + ("questions", i), issues)
+    _report_duplicates(duplicates, "quiz id", issues)
+
+
+def _check_question(question, at, issues):
+    if not isinstance(question, dict):
+        issues.append((ERROR, at, "soru bir nesne olmalı"))
+        return
+    if not _is_str(question.get("question")):
+        issues.append((ERROR, at + ("question",), "soru metni eksik"))
+    options = question.get("options")
+    if not isinstance(options, list):
+        issues.append((ERROR, at + ("options",), "'options' bir dizi olmalı"))
+        return
+    field = "correctAnswer" if "correctAnswer" in question else "answer"
+    answer = question.get(field)
+    # Seçeneksiz sorular (canlı kod / bugfix) için cevap indeksi anlamsız
+    if not options:
+        return
+    if not _is_int(answer) or not 0 <= answer < len(options):
+        issues.append((ERROR, at + (field,), f"'{field}' 0..{len(options) - 1} aralığında olmalı, {answer!r} bulundu"))
+
+
+def _check_badges(data, issues):
+    badges = data["badges"]
+    seen = set()
+    duplicates = {}
+    for b, badge in enumerate(badges):
+        b_at = ("badges", b)
+        if not isinstance(badge, dict):
+            issues.append((ERROR, b_at, "rozet bir nesne olmalı"))
+            continue
+        badge_id = badge.get("id")
+        if not _is_str(badge_id):
+            issues.append((ERROR, b_at + ("id",), "rozet 'id' eksik"))
+        elif badge_id in seen:
+            first_at, count = duplicates.get(badge_id, (b_at + ("id",), 0))
+            duplicates[badge_id] = (first_at, count + 1)
+        else:
+            seen.add(badge_id)
+        if not _is_int(badge.get("points")):
+            issues.append((ERROR, b_at + ("points",), "'points' bir tam sayı olmalı"))
+        criteria = badge.get("criteria")
+        if not isinstance(criteria, dict):
+            issues.append((ERROR, b_at + ("criteria",), "'criteria' bir nesne olmalı"))
+            continue
+        fields = BADGE_CRITERIA_FIELDS.get(criteria.get("type"))
+        if fields is None:
+            issues.append((ERROR, b_at + ("criteria", "type"), f"bilinmeyen criteria.type {criteria.get('type')!r}"))
+            continue
+        for field, kind in fields.items():
+            value = criteria.get(field)
+            ok = _is_int(value) and value >= 0 if kind is int else _is_str(value)
+            if not ok:
+                issues.append((ERROR, b_at + ("criteria", field), f"criteria.{field} eksik veya geçersiz"))
+
+    _report_duplicates(duplicates, "rozet id", issues)
+
+    declared = data.get("totalBadges")
+    if declared is not None and declared != len(badges):
+        issues.append((WARNING, ("totalBadges",), f"'totalBadges' {declared}, rozet sayısı {len(badges)}"))
+
+
+def _check_test_modules(data, issues):
+    for m, module in enumerate(data["modules"]):
+        m_at = ("modules", m)
+        if not isinstance(module, dict) or not _is_str(module.get("id")):
+            issues.append((ERROR, m_at, "modül 'id' eksik"))
+            continue
+        for t, test in enumerate(module.get("relatedTests") or []):
+            if not isinstance(test, dict) or not _is_str(test.get("id")) or not _is_str(test.get("href")):
+                issues.append((ERROR, m_at + ("relatedTests", t), "test 'id' / 'href' eksik"))
+
+
+def _check_lesson_shards(data, issues):
+    items_key = data.get("itemsKey", "lessons")
+    for m, module in enumerate(data["modules"]):
+        m_at = ("modules", m)
+        if not isinstance(module, dict) or not _is_str(module.get("file")):
+            issues.append((ERROR, m_at, "shard 'file' eksik"))
+            continue
+        for i, entry in enumerate(module.get(items_key) or []):
+            if not isinstance(entry, dict) or not _is_int(entry.get("offset")) or not _is_int(entry.get("length")):
+                issues.append((ERROR, m_at + (items_key, i), "'offset' / 'length' eksik"))
+
+
+def detect_kind(data):
+    """Dosyanın şema türünü içeriğine bakarak belirler."""
+    if not isinstance(data, dict):
+        return "json"
+    if data.get("format") == "lesson-shards" and isinstance(data.get("modules"), list):
+        return "lesson-shards"
+    if isinstance(data.get("badges"), list):
+        return "badges"
+    if isinstance(data.get("quizzes"), list):
+        return "quizzes"
+    if isinstance(data.get("lessons"), list) and "moduleId" in data:
+        return "lesson-module"
+    modules = data.get("modules")
+    if isinstance(modules, list) and modules and isinstance(modules[0], dict):
+        first = modules[0]
+        if "lessons" in first and "moduleId" in first:
+            return "lessons"
+        if "topics" in first:
+            return "topics"
+        if "relatedTests" in first:
+            return "test-modules"
+    return "json"
+
+
+def check_schema(data):
+    """(tür, [(önem, json yolu, mesaj)]) döner."""
+    kind = detect_kind(data)
+    issues = []
+    if kind == "lessons":
+        _check_course(data, "lessons", "totalLessons", issues)
+    elif kind == "topics":
+        _check_course(data, "topics", "totalTopics", issues)
+    elif kind == "lesson-module":
+        for i, lesson in enumerate(data["lessons"]):
+            _check_lesson(lesson, ("lessons", i), issues)
+    elif kind == "quizzes":
+        _check_quizzes(data, issues)
+    elif kind == "badges":
+        _check_badges(data, issues)
+    elif kind == "test-modules":
+        _check_test_modules(data, issues)
+    elif kind == "lesson-shards":
+        _check_lesson_shards(data, issues)
+    return kind, issues
+
+
+def _reject_constant(name):
+    raise ValueError(f"JSON'da geçersiz sabit: {name}")
+
+
+def validate_file(path):
+    """Tek dosyayı doğrular; (yol, tür, [Issue]) döner."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except UnicodeDecodeError as e:
+        return path, None, [Issue(path, 1, 1, ERROR, f"UTF-8 değil: {e.reason} (bayt {e.start})")]
+
+    if text.startswith("\ufeff"):
+        return path, None, [Issue(path, 1, 1, ERROR, "UTF-8 BOM ile başlıyor (JSON.parse başarısız olur)")]
+
+    try:
+        data = json.loads(text, parse_constant=_reject_constant)
+    except json.JSONDecodeError as e:
+        return path, None, [Issue(path, e.lineno, e.colno, ERROR, e.msg)]
+    except ValueError as e:
+        return path, None, [Issue(path, 1, 1, ERROR, str(e))]
+
+    kind, found = check_schema(data)
+    issues = []
+    for severity, parts, message in found:
+        line, col = locate(text, parts)
+        issues.append(Issue(path, line, col, severity, message, format_json_path(parts)))
+    return path, kind, issues
+
+
+def collect_files(patterns=None):
+    """Glob desenleri/dizinlerden doğrulanacak .json dosyalarını toplar."""
+    if not patterns:
+        patterns = [os.path.relpath(os.path.join(REPO_ROOT, root)) for root in DEFAULT_ROOTS]
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "**", "*.json"), recursive=True)
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        for path in sorted(matches):
+            key = os.path.abspath(path)
+            if os.path.isfile(path) and key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def validate_paths(paths, workers=None):
+    """
+    Dosyaları paralel doğrular; giriş sırasıyla [(yol, tür, [Issue])] döner.
+    Büyük dosyalar önce kuyruğa alınır ki en uzun iş beklemede kalmasın.
+    """
+    if not paths:
+        return []
+    workers = workers or os.cpu_count() or 1
+    order = sorted(paths, key=lambda p: os.path.getsize(p), reverse=True)
+    if workers == 1 or len(paths) == 1:
+        results = {path: validate_file(path) for path in order}
+    else:
+        with ProcessPoolExecutor(min(workers, len(paths))) as executor:
+            results = dict(zip(order, executor.map(validate_file, order)))
+    return [results[path] for path in paths]
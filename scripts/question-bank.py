@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kurslar arası soru bankası: derleme, yakın kopya raporu ve sorgu.
+
+Kullanım:
+    python scripts/question-bank.py build                  # kaynakları tara, .content-cache/question-bank.json
+    python scripts/question-bank.py dupes                  # yakın kopya kümeleri
+    python scripts/question-bank.py dupes --cross-source --threshold 0.9
+    python scripts/question-bank.py query "Middleware sırası neden önemlidir?"
+
+Banka kaynak dosyalar değişmedikçe yeniden derlenmez (--force ile zorlanır).
+"""
+
+import argparse
+import sys
+import time
+
+from pipeline.question_bank import (
+    DEFAULT_THRESHOLD,
+    KINDS,
+    load_or_build,
+    normalize_text,
+)
+
+
+def _load(args):
+    return load_or_build(force=args.force or None)
+
+
+def _describe(bank, i):
+    source = bank.sources[bank.source[i]]
+    text = " ".join(bank.text[i].split())
+    return f"[{KINDS[bank.kind[i]]}] {source} {bank.uid[i]}: {text}"
+
+
+def cmd_build(args):
+    started = time.perf_counter()
+    bank = _load(args)
+    counts = {kind: 0 for kind in KINDS}
+    for k in bank.kind:
+        counts[KINDS[k]] += 1
+    clusters = bank.clusters()
+    print(f"{len(bank)} soru ({', '.join(f'{n} {k}' for k, n in counts.items())}), {len(bank.sources)} kaynak")
+    print(f"{len(clusters)} yakın kopya kümesi, {sum(len(m) for m in clusters.values())} soru")
+    for warning in bank.warnings:
+        print(f"Uyarı: {warning}", file=sys.stderr)
+    print(f"Süre: {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 0
+
+
+def cmd_dupes(args):
+    bank = _load(args)
+    if args.threshold != DEFAULT_THRESHOLD:
+        bank.build_clusters(args.threshold)
+    shown = 0
+    for root, members in sorted(bank.clusters().items()):
+        if args.cross_source and len({bank.source[i] for i in members}) < 2:
+            continue
+        if args.exclude_exact and len({normalize_text(bank.text[i]) for i in members}) < 2:
+            continue
+        print(f"# küme {root} ({len(members)} soru)")
+        for i in members:
+            print(f"  {_describe(bank, i)}")
+        shown += 1
+        if args.limit and shown >= args.limit:
+            break
+    print(f"{shown} küme", file=sys.stderr)
+    return 0
+
+
+def cmd_query(args):
+    bank = _load(args)
+    for score, i in bank.near_duplicates(args.text, args.threshold):
+        print(f"{score:.2f} {_describe(bank, i)}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soru bankası ve yakın kopya indeksi.")
+    parser.add_argument("--force", action="store_true", help="Bankayı yeniden derle")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Bankayı derle ve özetle")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("dupes", help="Yakın kopya kümelerini listele")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Benzerlik eşiği (0-1)")
+    p.add_argument("--cross-source", action="store_true", help="Yalnızca birden fazla dosyaya yayılan kümeler")
+    p.add_argument("--exclude-exact", action="store_true", help="Normalize metni birebir aynı olan kümeleri atla")
+    p.add_argument("--limit", type=int, help="En fazla bu kadar küme")
+    p.set_defaults(func=cmd_dupes)
+
+    p = sub.add_parser("query", help="Metne benzeyen soruları bul")
+    p.add_argument("text")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Benzerlik eşiği (0-1)")
+    p.set_defaults(func=cmd_query)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tüm Python içerik üreticilerini sırayla çalıştırır.
+
+Üreticiler aynı süreç içinde çalıştırılır; girdileri değişmeyenler
+build cache sayesinde hemen atlanır, bu yüzden değişiklik olmayan bir
+yeniden üretim bir saniyenin çok altında biter. Sonunda üreticilerin
+yazdığı JSON çıktıları doğrulanır; hata varsa çıkış kodu 1'dir.
+
+Kullanım:
+    python scripts/regenerate-content.py            # değişenleri üret
+    python scripts/regenerate-content.py --force    # hepsini yeniden üret
+"""
+
+import os
+import runpy
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from pipeline import REPO_ROOT
+from pipeline.build_cache import load_manifest
+from pipeline.validate import ERROR, validate_paths
+
+# Depo köküne göre üretici scriptler (çalıştırma sırası)
+GENERATORS = [
+    "generate_tests.py",
+    "scripts/generate-200-badges.py",
+    "scripts/generate-mssql-course-json.py",
+    "scripts/generate-topic-lessons.py",
+]
+
+
+def main():
+    os.chdir(REPO_ROOT)
+    started = time.perf_counter()
+
+    failed = 0
+    for script in GENERATORS:
+        t0 = time.perf_counter()
+        print(f"▶ {script}")
+        # sys.exit(main()) ile biten üreticiler SystemExit fırlatır
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"  Hata: {script} {e.code} koduyla çıktı")
+                failed += 1
+        print(f"  ({(time.perf_counter() - t0) * 1000:.1f} ms)")
+
+    # Üretilen JSON çıktılarını doğrula
+    outputs = sorted(
+        path
+        for entry in load_manifest()["generators"].values()
+        for path in entry.get("outputs", {})
+        if path.endswith(".json") and os.path.exists(path)
+    )
+    errors = 0
+    for _, _, issues in validate_paths(outputs, workers=1):
+        for issue in issues:
+            print(issue)
+            errors += issue.severity == ERROR
+
+    print(f"Toplam süre: {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 1 if errors or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ders, konu, test modülü, bug fix ve live coding içeriği için tam metin
+arama indeksi kurar ve sorgular.
+
+Kullanım:
+    python scripts/search-index.py build                       # public/data/search-index.bin
+    python scripts/search-index.py build -o /tmp/search.bin --force
+    python scripts/search-index.py query "Dependency Injection"
+    python scripts/search-index.py query '"bağımlılık enjeksiyonu" servis' -n 5
+    python scripts/search-index.py query veritabanı --repeat 1000   # sorgu süresi
+
+Kaynaklar varsayılan olarak data/lesson-contents, data/topic-lessons,
+data/test-modules, data/bugfix-cases.json ve live coding case
+dosyalarıdır. Her kaynağın çözümlemesi .content-cache/search-index/
+altında saklanır; build yalnızca değişen dosyaları yeniden çözümler.
+İndeks mmap ile açılan tek bir ikili dosyadır (biçim için bkz.
+pipeline/search_index.py); baytları değişmediyse yeniden yazılmaz.
+"""
+
+import argparse
+import sys
+import time
+
+from pipeline import search_index
+from pipeline.build_cache import BuildCache, write_if_changed
+from pipeline.search_index import (
+    INDEX_PATH, SOURCE_GLOBS, SearchIndex, SearchIndexError, build_index_bytes, collect_sources,
+    load_segments,
+)
+
+
+def cmd_build(args):
+    started = time.perf_counter()
+    paths = collect_sources(args.sources or SOURCE_GLOBS)
+    if not paths:
+        print("Hata: indekslenecek içerik dosyası bulunamadı", file=sys.stderr)
+        return 1
+    cache = BuildCache("search-index", force=args.force or None)
+    cache.add_source(__file__, search_index.__file__, *paths)
+    cache.add_data(args.output)
+    if cache.is_fresh():
+        cache.skip_message()
+        return 0
+
+    skipped = []
+    segments, rebuilt = load_segments(paths, force=args.force, warn=skipped.append)
+    analyzed = time.perf_counter()
+    data, n_docs, n_terms = build_index_bytes(segments)
+    written = write_if_changed(args.output, data, snapshot=False)
+    cache.track_output(args.output)
+    cache.commit()
+    elapsed = time.perf_counter() - started
+
+    for message in skipped:
+        print(f"Uyarı: atlandı: {message}", file=sys.stderr)
+    state = "yazıldı" if written else "değişmedi"
+    print(f"✅ {len(segments)} kaynak ({rebuilt} yeniden çözümlendi), {n_docs:,} doküman, {n_terms:,} terim, "
+          f"{len(data):,} B -> {args.output} ({state}; çözümleme {analyzed - started:.2f} sn, "
+          f"toplam {elapsed:.2f} sn)")
+    return 0
+
+
+def cmd_query(args):
+    with SearchIndex(args.index) as index:
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            results = index.search(args.query, args.limit)
+        per_query = (time.perf_counter() - started) / args.repeat
+    for score, doc in results:
+        location = doc["href"] or f"{doc['source']} {doc['path']}"
+        print(f"{score:7.3f}  {doc['kind']:<7} {doc['title'][:60]:<60} {location}")
+    print(f"{len(results)} sonuç, {per_query * 1000:.3f} ms/sorgu ({index.n_docs:,} doküman, {index.n_terms:,} terim)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İçerik için BM25 tam metin arama indeksi.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="İndeksi kur (değişen kaynaklar yeniden çözümlenir)")
+    p.add_argument("sources", nargs="*", help="Dosya veya glob desenleri (varsayılan: tüm içerik)")
+    p.add_argument("-o", "--output", default=INDEX_PATH, help="İndeks dosyası")
+    p.add_argument("--force", action="store_true", help="Segment önbelleğini yok say")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("query", help="İndeksi sorgula")
+    p.add_argument("query", help='Sorgu; "..." içindeki kelimeler ardışık aranır')
+    p.add_argument("--index", default=INDEX_PATH, help="İndeks dosyası")
+    p.add_argument("-n", "--limit", type=int, default=10, help="Sonuç sayısı")
+    p.add_argument("--repeat", type=int, default=1, help="Süre ölçümü için tekrar")
+    p.set_defaults(func=cmd_query)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (SearchIndexError, OSError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
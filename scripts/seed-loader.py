@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+database-seed.sql'i tablo gruplarına ayırıp foreign key sırasına göre
+paralel yükler.
+
+Kullanım:
+    python scripts/seed-loader.py plan                       # katmanlar, kritik yol, TRUNCATE sırası
+    python scripts/seed-loader.py split -o /tmp/seed-split   # psql ile çalıştırılabilir dosyalar
+    python scripts/seed-loader.py load --workers 4           # POSTGRES_URL_NON_POOLING ile yükle
+    python scripts/seed-loader.py load --seed database-seed.sql --seed profile-seed-data.sql
+
+Bağımlılıklar database-schema.sql'deki REFERENCES'lardan çıkarılır (bkz.
+pipeline/seed_plan.py). Bir tablo, bağımlı olduğu tablolar commit
+edildiği anda kendi transaction'ında yüklenir; toplam süre tabloların
+toplamı değil en uzun bağımlılık zinciridir. TRUNCATE yalnızca seed'in
+kendi TRUNCATE listesini ve FK ile ona bağlı tabloları önce çocuklar
+olacak şekilde tek ifadede temizler (CASCADE'e gerek kalmaz); TRUNCATE
+içermeyen bir seed (profile-seed-data.sql) hiçbir tabloyu boşaltmaz.
+"""
+
+import argparse
+import sys
+import time
+
+from pipeline.pg_copy import database_url_from_env
+from pipeline.seed_plan import DEFAULT_WORKERS, SeedCycleError, SeedPlan, load_plan, write_split
+from pipeline.sql_rows import SqlParseError
+
+DEFAULT_SEED = "database-seed.sql"
+DEFAULT_SCHEMA = "database-schema.sql"
+
+
+def cmd_plan(plan, args):
+    for number, level in enumerate(plan.levels, 1):
+        parts = [f"{table} ({len(plan.groups[table])})" for table in level]
+        print(f"Katman {number}: {', '.join(parts)}")
+    cost, chain = plan.critical_path()
+    total = sum(len(s.sql) for statements in plan.groups.values() for s in statements)
+    print(f"Kritik yol: {' -> '.join(chain)} ({cost:,} / {total:,} B SQL)")
+    order = plan.truncate_order()
+    print(f"TRUNCATE: {len(order)} tablo (seed listesi {len(plan.truncate)}, FK kapanışıyla)")
+    if args.verbose:
+        for table in order:
+            print(f"  {table}")
+    if plan.post:
+        print(f"Yüklemeden sonra seri: {len(plan.post)} ifade")
+    return 0
+
+
+def cmd_split(plan, args):
+    files = write_split(plan, args.output)
+    print(f"{len(files)} dosya yazıldı: {args.output}")
+    print("Aynı katman numaralı dosyalar paralel, katmanlar sırayla çalıştırılabilir.")
+    return 0
+
+
+def cmd_load(plan, args):
+    url = args.database_url or database_url_from_env()
+    if not url:
+        print("Hata: veritabanı adresi yok: --database-url veya POSTGRES_URL_NON_POOLING", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    timings = load_plan(plan, url, workers=args.workers, log=print)
+    elapsed = time.perf_counter() - started
+    cost, chain = plan.critical_path({t: timings[t] for t in plan.groups})
+    serial = sum(timings.values())
+    print(f"✅ {len(plan.groups)} tablo {elapsed:.2f} sn'de yüklendi "
+          f"(seri toplam {serial:.2f} sn, kritik yol {' -> '.join(chain)} {cost:.2f} sn)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed SQL'i foreign key sırasına göre paralel yükler.")
+    parser.add_argument("--seed", action="append", help=f"Seed dosyası (tekrarlanabilir; varsayılan {DEFAULT_SEED})")
+    parser.add_argument("--schema", default=DEFAULT_SCHEMA, help="Foreign key'lerin okunacağı şema")
+    parser.add_argument(
+        "--backslash-escapes", action="store_true",
+        help="'...' içindeki ters bölüleri escape say (generate_tests.escape_sql_string çıktısı)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("plan", help="Yükleme katmanlarını ve TRUNCATE sırasını göster")
+    p.add_argument("-v", "--verbose", action="store_true", help="TRUNCATE listesini de yaz")
+    p.set_defaults(func=cmd_plan)
+
+    p = sub.add_parser("split", help="Katman/tablo başına SQL dosyaları yaz")
+    p.add_argument("-o", "--output", required=True, help="Çıktı dizini")
+    p.set_defaults(func=cmd_split)
+
+    p = sub.add_parser("load", help="Veritabanına paralel yükle")
+    p.add_argument("--database-url", help="PostgreSQL adresi (varsayılan: ortam değişkenleri)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Bağlantı / eşzamanlı tablo sayısı")
+    p.set_defaults(func=cmd_load)
+
+    args = parser.parse_args(argv)
+    try:
+        plan = SeedPlan.from_files(args.seed or [DEFAULT_SEED], args.schema, not args.backslash_escapes)
+        return args.func(plan, args)
+    except (SqlParseError, SeedCycleError, OSError, RuntimeError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ders JSON dosyalarını modül başına shard'lara böler veya shard'lardan
+eski tek parça dosyayı yeniden oluşturur.
+
+Kullanım:
+    python scripts/shard-lessons.py split data/lesson-contents/mssql-course.json
+    python scripts/shard-lessons.py assemble data/lesson-contents/mssql-course.shards \\
+        data/lesson-contents/mssql-course.json
+    python scripts/shard-lessons.py lesson data/lesson-contents/mssql-course.shards \\
+        /education/lessons/sql/mssql/intro
+"""
+
+import argparse
+import json
+import sys
+
+from pipeline.lesson_shards import (
+    ShardError,
+    ShardedCourse,
+    assemble_course,
+    default_shard_dir,
+    split_course,
+)
+
+
+def cmd_split(args):
+    for source in args.sources:
+        out_dir = args.out_dir or default_shard_dir(source)
+        index, written = split_course(
+            source, out_dir, items_key=args.items_key, total_key=args.total_key, force=args.force
+        )
+        if index is None:
+            print(f"{source}: shard'lar güncel ({out_dir})")
+            continue
+        lessons = sum(len(m[args.items_key]) for m in index["modules"])
+        print(f"{source} -> {out_dir}: {len(index['modules'])} modül, {lessons} ders, {written} dosya yazıldı")
+    return 0
+
+
+def cmd_assemble(args):
+    changed = assemble_course(args.shard_dir, args.output)
+    print(f"{args.output}: {'yazıldı' if changed else 'değişmedi'}")
+    return 0
+
+
+def cmd_lesson(args):
+    lesson = ShardedCourse(args.shard_dir).lesson(args.href)
+    json.dump(lesson, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ders JSON shard aracı.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    split = sub.add_parser("split", help="Kurs dosyasını modül shard'larına böl")
+    split.add_argument("sources", nargs="+", help="Kurs JSON dosyaları")
+    split.add_argument("--out-dir", help="Shard dizini (varsayılan: <kaynak>.shards)")
+    split.add_argument("--items-key", default="lessons", help="Modüldeki ders listesi alanı")
+    split.add_argument("--total-key", default="totalLessons", help="Üst seviye toplam alanı")
+    split.add_argument("--force", action="store_true", help="Build cache'i yok say")
+    split.set_defaults(func=cmd_split)
+
+    assemble = sub.add_parser("assemble", help="Shard'lardan tek parça dosyayı oluştur")
+    assemble.add_argument("shard_dir", help="index.json içeren shard dizini")
+    assemble.add_argument("output", help="Yazılacak tek parça JSON dosyası")
+    assemble.set_defaults(func=cmd_assemble)
+
+    lesson = sub.add_parser("lesson", help="Tek bir dersi href ile oku")
+    lesson.add_argument("shard_dir", help="index.json içeren shard dizini")
+    lesson.add_argument("href", help="Dersin href değeri")
+    lesson.set_defaults(func=cmd_lesson)
+
+    args = parser.parse_args(argv)
+    if args.command == "split" and args.out_dir and len(args.sources) > 1:
+        parser.error("--out-dir yalnızca tek kaynakla kullanılabilir")
+
+    try:
+        return args.func(args)
+    except ShardError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    except KeyError as e:
+        print(f"Hata: bulunamadı: {e.args[0]}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQL seed dosyalarından (database-seed.sql, profile-seed-data.sql ...)
+tablo satırlarını akış halinde çıkarır, karşılaştırır veya yeniden
+INSERT olarak yazar. Dosya tek seferde belleğe alınmaz.
+
+Kullanım:
+    python scripts/sql-extract.py tables profile-seed-data.sql
+    python scripts/sql-extract.py extract database-seed.sql --table quizzes -o /tmp/quizzes.ndjson
+    python scripts/sql-extract.py diff old-seed.sql profile-seed-data.sql --table user_badges
+    python scripts/sql-extract.py emit profile-seed-data.sql --table app_users --where role=admin
+
+Geçersiz ::jsonb gövdeleri varsayılan olarak uyarıyla ham metin olarak
+bırakılır; --strict ile hata sayılır.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from collections import Counter
+from itertools import islice
+
+from pipeline.pg_copy import DEFAULT_BATCH_SIZE
+from pipeline.sql_rows import SqlParseError, json_default, read_rows, render_insert
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=json_default)
+
+
+def _rows(args, path=None, tables=None):
+    def warn(error):
+        print(f"Uyarı: {path or args.file}: {error}", file=sys.stderr)
+
+    return read_rows(
+        path or args.file,
+        tables=tables if tables is not None else args.table,
+        standard_strings=not args.backslash_escapes,
+        on_error=None if args.strict else warn,
+    )
+
+
+def _open_output(path):
+    return open(path, "w", encoding="utf-8", newline="\n") if path else sys.stdout
+
+
+def _matches(row, where):
+    return all(str(row.get(column)) == value for column, value in where)
+
+
+def cmd_tables(args):
+    counts = Counter(table for table, _ in _rows(args))
+    for table, count in counts.items():
+        print(f"{table}: {count} satır")
+    print(f"Toplam: {sum(counts.values())} satır, {len(counts)} tablo")
+    return 0
+
+
+def cmd_extract(args):
+    out = _open_output(args.output)
+    count = 0
+    try:
+        for table, row in _rows(args):
+            if _matches(row, args.where):
+                out.write(_dumps({"table": table, "row": row}) + "\n")
+                count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{count} satır çıkarıldı", file=sys.stderr)
+    return 0
+
+
+def _row_key(row, key):
+    """Anahtar kolonu yoksa (ör. user_balances.userId) ilk kolon kullanılır."""
+    return str(row[key] if key in row else next(iter(row.values()), None))
+
+
+def _fingerprints(args, path):
+    """{(tablo, anahtar): satır özeti}; satırların kendisi bellekte tutulmaz."""
+    result = {}
+    for table, row in _rows(args, path):
+        key = (table, _row_key(row, args.key))
+        result[key] = hashlib.sha256(_dumps(row).encode("utf-8")).hexdigest()
+    return result
+
+
+def cmd_diff(args):
+    old = _fingerprints(args, args.old)
+    added = changed = 0
+    for table, row in _rows(args, args.new):
+        key = (table, _row_key(row, args.key))
+        digest = old.pop(key, None)
+        if digest is None:
+            print(f"+ {table} {key[1]}")
+            added += 1
+        elif digest != hashlib.sha256(_dumps(row).encode("utf-8")).hexdigest():
+            print(f"~ {table} {key[1]}")
+            changed += 1
+    for table, key in old:
+        print(f"- {table} {key}")
+    print(f"{added} eklendi, {len(old)} silindi, {changed} değişti", file=sys.stderr)
+    return 1 if (added or old or changed) and args.exit_code else 0
+
+
+def cmd_emit(args):
+    out = _open_output(args.output)
+    total = 0
+    try:
+        rows = ((table, row) for table, row in _rows(args) if _matches(row, args.where))
+        while True:
+            batch = list(islice(rows, args.batch_size))
+            if not batch:
+                break
+            # Ardışık aynı tablo/kolon satırları tek INSERT'te toplanır
+            start = 0
+            for i in range(1, len(batch) + 1):
+                if i == len(batch) or (batch[i][0], list(batch[i][1])) != (batch[start][0], list(batch[start][1])):
+                    table, first = batch[start]
+                    out.write(render_insert(table, list(first), [row for _, row in batch[start:i]]) + "\n")
+                    start = i
+            total += len(batch)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{total} satır yazıldı", file=sys.stderr)
+    return 0
+
+
+def _where(text):
+    column, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"kolon=değer bekleniyordu: {text}")
+    return column, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQL seed dosyalarından satır çıkarma.")
+    parser.add_argument("--strict", action="store_true", help="Geçersiz ::jsonb gövdelerini hata say")
+    parser.add_argument(
+        "--backslash-escapes", action="store_true",
+        help="'...' içindeki ters bölüleri escape say (generate_tests.escape_sql_string çıktısı)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_filters(p):
+        p.add_argument("--table", action="append", help="Yalnızca bu tablo (tekrarlanabilir)")
+        p.add_argument("--where", action="append", type=_where, default=[], help="kolon=değer filtresi")
+
+    p = sub.add_parser("tables", help="Tablo başına satır sayıları")
+    p.add_argument("file")
+    p.set_defaults(func=cmd_tables, table=None)
+
+    p = sub.add_parser("extract", help='Satırları NDJSON olarak yaz ({"table", "row"})')
+    p.add_argument("file")
+    add_filters(p)
+    p.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan stdout)")
+    p.set_defaults(func=cmd_extract)
+
+    p = sub.add_parser("diff", help="İki SQL dosyasını anahtar kolona göre karşılaştır")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--table", action="append")
+    p.add_argument("--key", default="id", help="Satır anahtarı kolonu (varsayılan id, yoksa ilk kolon)")
+    p.add_argument("--exit-code", action="store_true", help="Fark varsa 1 ile çık")
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser("emit", help="Satırları yeniden INSERT ifadeleri olarak yaz")
+    p.add_argument("file")
+    add_filters(p)
+    p.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan stdout)")
+    p.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    p.set_defaults(func=cmd_emit)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (SqlParseError, OSError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
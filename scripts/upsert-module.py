@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kurs/konu JSON dosyasına tek bir modülü ekler veya günceller.
+
+Modül moduleId ile eşleştirilir; dosyadaki diğer modüller yeniden
+serileştirilmez ve toplam ders sayısı verilerden yeniden hesaplanır.
+Aynı komutu tekrar çalıştırmak dosyayı değiştirmez.
+
+Kullanım:
+    python scripts/upsert-module.py data/lesson-contents/dotnet-core-lessons.json \\
+        data/lesson-contents/module-08-content.json
+    python scripts/upsert-module.py data/topic-lessons/dotnet-core-topics.json \\
+        yeni-modul.json --items-key topics --total-key totalTopics
+"""
+
+import argparse
+import json
+import sys
+
+from pipeline.json_splice import SpliceError, upsert_module
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kurs JSON dosyasına modül ekler/günceller.")
+    parser.add_argument("course", help="Hedef kurs JSON dosyası")
+    parser.add_argument("module", help="Tek bir modül nesnesi içeren JSON dosyası")
+    parser.add_argument("--key", default="moduleId", help="Modül kimlik alanı")
+    parser.add_argument("--items-key", default="lessons", help="Modüldeki ders listesi alanı")
+    parser.add_argument("--total-key", default="totalLessons", help="Üst seviye toplam alanı")
+    args = parser.parse_args(argv)
+
+    with open(args.module, "r", encoding="utf-8") as f:
+        module = json.load(f)
+
+    try:
+        changed, action = upsert_module(
+            args.course,
+            module,
+            key=args.key,
+            items_key=args.items_key,
+            total_key=args.total_key,
+        )
+    except SpliceError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    status = {"inserted": "eklendi", "replaced": "güncellendi"}[action]
+    if not changed:
+        status = "zaten güncel"
+    print(f"{module[args.key]}: {status} ({len(module.get(args.items_key) or [])} öğe)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
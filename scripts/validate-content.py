@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+data/, public/data/ ve DB-Seeds/JSON/ altındaki tüm içerik JSON
+dosyalarını doğrular (sözdizimi + türe göre şema).
+
+Kullanım:
+    python scripts/validate-content.py                       # tüm içerik
+    python scripts/validate-content.py "data/lesson-contents/*.json"
+    python scripts/validate-content.py --strict -j 1 public/data
+
+Hata varsa (--strict ile uyarı da varsa) çıkış kodu 1'dir; üreticilerden
+sonra kapı (gate) olarak kullanılabilir.
+"""
+
+import argparse
+import sys
+import time
+
+from pipeline.validate import ERROR, collect_files, validate_paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İçerik JSON dosyalarını doğrular.")
+    parser.add_argument("patterns", nargs="*", help="Dosya, dizin veya glob desenleri")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="İşçi süreç sayısı")
+    parser.add_argument("--strict", action="store_true", help="Uyarıları da hata say")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Sadece sorunları yazdır")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    paths = collect_files(args.patterns)
+    results = validate_paths(paths, args.workers)
+
+    errors = warnings = 0
+    for path, kind, issues in results:
+        for issue in issues:
+            print(issue)
+            if issue.severity == ERROR:
+                errors += 1
+            else:
+                warnings += 1
+
+    elapsed = time.perf_counter() - started
+    if not args.quiet:
+        print(
+            f"{len(paths)} dosya doğrulandı: {errors} hata, {warnings} uyarı "
+            f"({elapsed:.2f} sn)"
+        )
+    failed = errors or (args.strict and warnings)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
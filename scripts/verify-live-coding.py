@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Live coding case'lerini (tüm diller + junior case'ler) paralel çalıştırıp
+test-csharp-cases-ai.ts biçiminde rapor yazar.
+
+Kullanım:
+    python scripts/verify-live-coding.py -o /tmp/live-coding-results.json --executor stub
+    python scripts/verify-live-coding.py --language csharp --solver report \\
+        --solutions csharp-cases-ai-test-results.json -o /tmp/csharp-results.json
+    BASE_URL=http://localhost:3000 python scripts/verify-live-coding.py --solver api --executor api -o ...
+    python scripts/verify-live-coding.py data/live-coding-cases/python-cases.json -o ... --force
+
+Varsayılan girdi data/live-coding-cases/*-cases.json ve
+data/live-coding/junior-cases/*-junior-cases.json'dır. Çalışma sonuçları
+.content-cache/live-coding/results.json'da (başlangıç kodu, çözüm,
+girdi) özetiyle tutulur; değişmeyen case'ler yeniden çalıştırılmaz
+(bkz. pipeline/live_coding.py). --force önbelleği yok sayar.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from pipeline.build_cache import write_if_changed
+from pipeline.live_coding import (
+    CACHE_PATH, DEFAULT_BASE_URL, DEFAULT_TIMEOUT, DEFAULT_WORKERS, EXECUTORS, SOLVERS,
+    ApiExecutor, ApiSolver, LocalExecutor, ReportSolver, ResultCache, StarterSolver, StubExecutor,
+    generate_report, load_cases, verify_cases,
+)
+
+DEFAULT_SOLUTIONS = "csharp-cases-ai-test-results.json"
+
+
+def _solver(args, base_url):
+    if args.solver == "report":
+        return ReportSolver(args.solutions or [DEFAULT_SOLUTIONS])
+    if args.solver == "api":
+        return ApiSolver(base_url)
+    return StarterSolver()
+
+
+def _executor(args, base_url):
+    if args.executor == "api":
+        return ApiExecutor(base_url, args.timeout)
+    if args.executor == "stub":
+        return StubExecutor()
+    return LocalExecutor(args.timeout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Live coding case'lerini paralel ve önbellekli doğrular.")
+    parser.add_argument("inputs", nargs="*", help="Case dosyaları (varsayılan: tüm diller + junior case'ler)")
+    parser.add_argument("-o", "--output", required=True, help="Rapor (JSON)")
+    parser.add_argument("--language", action="append", help="Yalnızca bu dil (tekrarlanabilir)")
+    parser.add_argument("--solver", choices=SOLVERS, default="starter",
+                        help="Çalıştırılacak kod: başlangıç kodu, rapordaki correctedCode ya da AI endpoint'i")
+    parser.add_argument("--solutions", action="append",
+                        help=f"--solver report için rapor (tekrarlanabilir; varsayılan {DEFAULT_SOLUTIONS})")
+    parser.add_argument("--executor", choices=EXECUTORS, default="local",
+                        help="Yerel derleyiciler, /api/education/live-coding/run ya da stub")
+    parser.add_argument("--base-url", help=f"Uygulama adresi (varsayılan: BASE_URL veya {DEFAULT_BASE_URL})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Eşzamanlı case sayısı")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help="Derleme/çalıştırma adımı başına sn")
+    parser.add_argument("--cache", default=CACHE_PATH, help="Sonuç önbelleği")
+    parser.add_argument("--force", action="store_true", help="Önbelleği yok say, hepsini yeniden çalıştır")
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url or os.environ.get("BASE_URL") or DEFAULT_BASE_URL
+    try:
+        cases = load_cases(args.inputs)
+        if args.language:
+            cases = [c for c in cases if c.language in args.language]
+        if not cases:
+            raise ValueError("doğrulanacak case yok")
+        solver = _solver(args, base_url)
+        executor = _executor(args, base_url)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    cache = ResultCache(args.cache, force=args.force)
+    started = time.perf_counter()
+    results = []
+    try:
+        for number, result in enumerate(verify_cases(cases, solver, executor, cache, args.workers), 1):
+            results.append(result)
+            mark = "✅" if result["success"] else "❌"
+            note = " (önbellek)" if result.get("cached") else ""
+            print(f"[{number}/{len(cases)}] {mark} {result['caseId']}{note}"
+                  + (f": {result['error'][:120]}" if result.get("error") else ""))
+    finally:
+        cache.save()
+
+    report = generate_report(results)
+    try:
+        data = json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+        write_if_changed(args.output, data.encode("utf-8"), snapshot=False)
+    except OSError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    summary = report["summary"]
+    elapsed = time.perf_counter() - started
+    print(f"AI/çözüm: {summary['aiAnalysisSuccessRate']:.1f}%  çalışma: {summary['codeExecutionSuccessRate']:.1f}%  "
+          f"çıktı eşleşmesi: {summary['outputMatchRate']:.1f}%")
+    print(f"Süre (ms): ortalama {summary['averageDuration']:.0f}, p50 {summary['p50Duration']:.0f}, "
+          f"p95 {summary['p95Duration']:.0f}")
+    print(f"✅ {report['successfulCases']}/{report['totalCases']} case başarılı, "
+          f"{cache.hits} önbellek isabeti / {cache.misses} çalıştırma -> {args.output} ({elapsed:.2f} sn)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
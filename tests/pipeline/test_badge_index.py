@@ -0,0 +1,137 @@
+"""
+Rozet index'i testleri: önceden hesaplanmış index, badges.json üzerinde
+düz tarama ile aynı sonuçları vermeli (scripts/pipeline/badge_index.py).
+"""
+
+import json
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline import badge_index  # noqa: E402
+from pipeline.badge_index import (  # noqa: E402
+    build_index, evaluate, evaluate_naive, index_from_classified, newly_qualified, verify_index,
+)
+
+BADGES_PATH = os.path.join(REPO_ROOT, "public", "data", "badges.json")
+
+# badge-service.ts'nin anladığı, ama badges.json'da kullanılmayan kriter biçimleri
+EXTRA_BADGES = [
+    {"id": "x-score-1", "criteria": {"type": "score", "score_type": "ortalama", "min_score": 80}},
+    {"id": "x-score-2", "criteria": {"type": "score", "score_type": "ortalama", "min_score": 95}},
+    {"id": "x-score-3", "criteria": {"type": "score", "score_type": "tek test", "min_score": 80}},
+    {"id": "x-score-empty", "criteria": {"type": "score", "score_type": "", "min_score": 10}},
+    {"id": "x-special-1", "criteria": {"type": "special", "special_type": "ilk test"}},
+    {"id": "x-special-2", "criteria": {"type": "special", "special_type": "ilk post"}},
+    {"id": "x-legacy-1", "criteria": {"type": "total_quizzes", "value": 10}},
+    {"id": "x-legacy-2", "criteria": {"type": "current_streak", "value": 7}},
+    {"id": "x-topic-0", "criteria": {"type": "topic_complete", "value": 0}},
+    {"id": "x-topic-3", "criteria": {"type": "topic_complete", "value": 3}},
+    {"id": "x-season-1", "criteria": {"type": "streak", "streak_type": "login", "days": 7, "scope": "season-01"}},
+    {"id": "x-unknown", "criteria": {"type": "first_quiz"}},
+    {"id": "x-no-threshold", "criteria": {"type": "lesson_count"}},
+]
+
+
+def load_badges():
+    with open(BADGES_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)["badges"]
+
+
+def probe_values(thresholds):
+    values = {thresholds[0] - 1}
+    for t in thresholds:
+        values.update((t - 1, t, t + 0.5))
+    return sorted(values)
+
+
+class BadgeIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.badges = load_badges() + EXTRA_BADGES
+        cls.index = build_index(cls.badges)
+
+    def test_shipped_badges_are_indexed(self):
+        index = build_index(load_badges())
+        self.assertEqual(index["unindexed"], [])
+        self.assertEqual(verify_index(index, load_badges()), [])
+
+    def test_every_threshold_matches_full_scan(self):
+        for metric, entry in self.index["metrics"].items():
+            for value in probe_values(entry["thresholds"]):
+                with self.subTest(metric=metric, value=value):
+                    self.assertEqual(
+                        evaluate(self.index, {metric: value}),
+                        evaluate_naive(self.badges, {metric: value}),
+                    )
+
+    def test_newly_qualified_matches_full_scan_difference(self):
+        for metric, entry in self.index["metrics"].items():
+            values = probe_values(entry["thresholds"])
+            for old, new in zip(values, values[1:]):
+                with self.subTest(metric=metric, old=old, new=new):
+                    expected = set(evaluate_naive(self.badges, {metric: new})) \
+                        - set(evaluate_naive(self.badges, {metric: old}))
+                    self.assertEqual(sorted(newly_qualified(self.index, metric, old, new)), sorted(expected))
+
+    def test_random_users_match_full_scan(self):
+        rng = random.Random(7)
+        metrics = list(self.index["metrics"])
+        events = list(self.index["events"])
+        ids = [badge["id"] for badge in self.badges]
+        for _ in range(300):
+            values = {
+                metric: rng.randint(0, int(self.index["metrics"][metric]["thresholds"][-1]) + 1)
+                for metric in rng.sample(metrics, rng.randint(1, 8))
+            }
+            happened = rng.sample(events, rng.randint(0, len(events)))
+            earned = rng.sample(ids, rng.randint(0, 10))
+            self.assertEqual(
+                evaluate(self.index, values, happened, earned),
+                evaluate_naive(self.badges, values, happened, earned),
+            )
+
+    def test_badge_service_edge_cases(self):
+        # criteria.value || 1; boş score_type atlanır; scope ayrı bir metriktir
+        self.assertIn("x-topic-0", evaluate(self.index, {"topic_complete": 1}))
+        self.assertNotIn("x-topic-0", evaluate(self.index, {"topic_complete": 0}))
+        self.assertIn("x-score-empty", self.index["unindexed"])
+        self.assertEqual(evaluate(self.index, {"streak:login@season-01": 7}), ["x-season-1"])
+        self.assertEqual(evaluate(self.index, {}, ["special:ilk test"]), ["x-special-1"])
+        self.assertEqual(
+            evaluate_naive(self.badges, {"topic_complete": 1, "score:": 100}),
+            ["x-topic-0"],
+        )
+
+    def test_verify_catches_misclassified_index(self):
+        # Yanlış eşik alanıyla kurulan index taramayla çelişmeli
+        with mock.patch.dict(badge_index.THRESHOLD_CRITERIA, {"streak": ("streak_type", "count")}):
+            broken = build_index(self.badges)
+        self.assertNotEqual(verify_index(broken, self.badges, samples=20), [])
+
+
+class CatalogIndexTest(unittest.TestCase):
+    def test_catalog_columns_match_badge_dicts(self):
+        # generate-200-badges.py index'i rozet dict'i kurmadan katalogdan üretir
+        import importlib.util
+
+        path = os.path.join(REPO_ROOT, "scripts", "generate-200-badges.py")
+        spec = importlib.util.spec_from_file_location("generate_200_badges", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for sets in (None, module.load_sets(3)):
+            with self.subTest(sets=sets):
+                catalog = module.build_catalog(sets)
+                self.assertEqual(
+                    index_from_classified(catalog.iter_classified(), len(catalog)),
+                    build_index(list(catalog.iter_badges())),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
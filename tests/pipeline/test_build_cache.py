@@ -0,0 +1,61 @@
+"""
+Build cache yazma testleri: atomik yazılan dosyalar open() ile yazılmış
+gibi izin alır (scripts/pipeline/build_cache.py).
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.build_cache import atomic_write_bytes, write_chunks_if_changed  # noqa: E402
+
+
+def mode_of(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@unittest.skipIf(os.name == "nt", "POSIX izinleri gerekli")
+class FileModeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        mask = os.umask(0)
+        os.umask(mask)
+        self.new_mode = 0o666 & ~mask
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_new_files_get_open_mode(self):
+        atomic_write_bytes(self.path("a.json"), b"{}")
+        write_chunks_if_changed(self.path("b.json"), ["{", "}"], snapshot=False)
+        with open(self.path("c.json"), "wb") as f:
+            f.write(b"{}")
+        self.assertEqual(mode_of(self.path("a.json")), self.new_mode)
+        self.assertEqual(mode_of(self.path("b.json")), self.new_mode)
+        self.assertEqual(mode_of(self.path("c.json")), self.new_mode)
+
+    def test_existing_mode_is_kept(self):
+        for name, write in (
+            ("a.json", lambda path: atomic_write_bytes(path, b"[1]")),
+            ("b.json", lambda path: write_chunks_if_changed(path, ["[1]"], snapshot=False)),
+        ):
+            with self.subTest(name=name):
+                path = self.path(name)
+                atomic_write_bytes(path, b"[]")
+                os.chmod(path, 0o640)
+                write(path)
+                self.assertEqual(mode_of(path), 0o640)
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), b"[1]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Leaderboard materializer testleri: aynı popülasyonun COPY betiği ve seed
+JSON'u aynı sıralamayı üretmeli (scripts/pipeline/leaderboard.py).
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.pg_copy import copy_statement, encode_csv_row, iter_copy_rows  # noqa: E402
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+NOW_MS = 1_760_000_000_000
+
+
+def write_chunks(path, chunks):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.writelines(chunks)
+
+
+class IterCopyRowsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "seed.copy.sql")
+        write_chunks(self.path, [
+            copy_statement("quiz_attempts", ("id", "userId", "score")) + ";\n",
+            encode_csv_row(("a1", "u1", 90)),
+            encode_csv_row(("a2", "u2", None)),
+            "\\.\n",
+            copy_statement("posts", ("id", "userId")) + ";\n",
+            encode_csv_row(("p1", "u1")),
+            "\\.\n",
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_table_mapping_keeps_all_columns(self):
+        # leaderboard.read_streams {tablo: akış adı} verir
+        rows = list(iter_copy_rows(self.path, {"quiz_attempts": "quiz"}))
+        self.assertEqual(rows, [
+            ("quiz_attempts", {"id": "a1", "userId": "u1", "score": "90"}),
+            ("quiz_attempts", {"id": "a2", "userId": "u2", "score": None}),
+        ])
+
+    def test_columns_limit_row_fields(self):
+        rows = list(iter_copy_rows(self.path, ["posts", "quiz_attempts"], {"quiz_attempts": ("userId",)}))
+        self.assertEqual(rows, [
+            ("quiz_attempts", {"userId": "u1"}),
+            ("quiz_attempts", {"userId": "u2"}),
+            ("posts", {"id": "p1", "userId": "u1"}),
+        ])
+
+
+@unittest.skipIf(numpy is None, "NumPy gerekli")
+class LeaderboardCopyInputTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from pipeline.leaderboard import load_catalog
+        from pipeline.population import Population, load_badges, load_quizzes
+
+        badges = load_badges()
+        population = Population(200, load_quizzes(), badges, seed=3, now_ms=NOW_MS)
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.copy_path = os.path.join(cls.tmp.name, "profile-seed.copy.sql")
+        cls.json_path = os.path.join(cls.tmp.name, "profile-seed.json")
+        write_chunks(cls.copy_path, population.iter_copy_script())
+        write_chunks(cls.json_path, population.iter_seed_json({"generatedAt": "test"}))
+        cls.catalog = load_catalog()
+        cls.badge_points = {b["id"]: b.get("points") or 0 for b in badges}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def materialize(self, path):
+        from pipeline.leaderboard import Rollup, read_streams
+
+        quiz_courses, total_courses = self.catalog
+        rollup = Rollup()
+        _, added = rollup.fold(read_streams([path]), quiz_courses, self.badge_points)
+        return added, list(rollup.iter_entries(rollup.buckets(), total_courses))
+
+    def test_copy_input_is_read(self):
+        added, rows = self.materialize(self.copy_path)
+        self.assertGreater(added["quiz"], 0)
+        self.assertGreater(added["points"], 0)
+        self.assertTrue(rows)
+
+    def test_copy_and_json_inputs_match(self):
+        self.assertEqual(self.materialize(self.copy_path), self.materialize(self.json_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Live coding doğrulama testleri: yalnızca gerçekten çalışmış programların
+sonuçları cache'lenir (scripts/pipeline/live_coding.py).
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.live_coding import (  # noqa: E402
+    ExecutorUnavailable, LiveCase, LocalExecutor, ResultCache, StarterSolver, verify_case,
+)
+
+CASE = LiveCase("python", "test.json", "case-1", "Echo", "", "print(input())", [("hi", "hi")])
+
+
+class FakeExecutor:
+    name = "fake"
+    echoes_expected = False
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    def run(self, case, code, stdin, expected):
+        self.calls += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class VerifyCaseCacheTest(unittest.TestCase):
+    def verify_twice(self, executor):
+        cache = ResultCache(path=None)
+        results = [verify_case(CASE, StarterSolver(), executor, cache) for _ in range(2)]
+        return results, cache
+
+    def test_program_results_are_cached(self):
+        for outcome in (("hi\n", None), ("", "SyntaxError: invalid syntax")):
+            with self.subTest(outcome=outcome):
+                executor = FakeExecutor(outcome)
+                results, cache = self.verify_twice(executor)
+                self.assertEqual(executor.calls, 1)
+                self.assertEqual(cache.hits, 1)
+                self.assertTrue(results[1]["cached"])
+
+    def test_environment_failures_are_not_cached(self):
+        for message in ("java not found (install the java toolchain)", "Timeout (10s)",
+                        "Cannot connect to server at http://localhost:3000", "HTTP 504"):
+            with self.subTest(message=message):
+                executor = FakeExecutor(ExecutorUnavailable(message))
+                results, cache = self.verify_twice(executor)
+                self.assertEqual(executor.calls, 2)
+                self.assertEqual(cache.entries, {})
+                self.assertEqual(results[1]["error"], f"Code execution failed: {message}")
+                self.assertFalse(results[1]["cached"])
+
+    def test_missing_toolchain_raises(self):
+        with mock.patch("pipeline.live_coding._resolve_tool", return_value=None):
+            with self.assertRaises(ExecutorUnavailable):
+                LocalExecutor().run(CASE, CASE.starter_code, "hi", "hi")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Çıktı karşılaştırıcı testleri: normalizasyonlar, ilk farkın satır/sütunu,
+parça sınırları ve LIVE_CODING'in live_coding.normalize_output ile
+eşdeğerliği (scripts/pipeline/output_compare.py).
+"""
+
+import io
+import os
+import random
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.live_coding import normalize_output  # noqa: E402
+from pipeline.output_compare import EXACT, LIVE_CODING, CompareOptions, compare  # noqa: E402
+
+
+def chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def matches(expected, actual, options=CompareOptions(), **kwargs):
+    return compare(expected, actual, options, **kwargs) is None
+
+
+class NormalizationTest(unittest.TestCase):
+    def test_line_endings(self):
+        self.assertTrue(matches("a\nb\n", "a\r\nb\r\n"))
+        self.assertTrue(matches("a\nb", "a\rb"))
+        self.assertFalse(matches("a\nb", "a\r\nb", EXACT))
+
+    def test_trailing_and_edge_spaces(self):
+        self.assertTrue(matches("a\nb", "a  \nb\t"))
+        self.assertFalse(matches("a\nb", "  a\nb"))
+        self.assertTrue(matches("a\nb", "  a\nb", CompareOptions(strip=True)))
+        self.assertFalse(matches("a", "a ", EXACT))
+
+    def test_collapse_spaces(self):
+        options = CompareOptions(collapse_spaces=True)
+        self.assertTrue(matches("a b c", "a \t b    c", options))
+        self.assertFalse(matches("a b c", "a \t b    c"))
+        self.assertFalse(matches("ab", "a b", options))
+
+    def test_blank_lines(self):
+        keep = CompareOptions()
+        squeeze = CompareOptions(blank_lines="squeeze")
+        ignore = CompareOptions(blank_lines="ignore")
+        self.assertFalse(matches("a\n\nb", "a\n\n\nb", keep))
+        self.assertTrue(matches("a\n\nb", "a\n\n\nb", squeeze))
+        self.assertFalse(matches("a\nb", "a\n\nb", squeeze))
+        self.assertTrue(matches("a\nb", "a\n\n\nb", ignore))
+        # squeeze yalnızca ham boş satırları birleştirir; boşluklu satır ayrı sayılır
+        self.assertTrue(matches("a\n\n\t\n\nb", "a\n\n  \n\n\n\nb", squeeze))
+        self.assertFalse(matches("a\n\n\n\nb", "a\n\n  \n\nb", squeeze))
+        self.assertFalse(matches("a\n\nb", "a\n\n  \n\nb", squeeze))
+
+    def test_blank_edges(self):
+        self.assertTrue(matches("a\nb", "\n\n  \na\nb\n\n"))
+        self.assertFalse(matches("a\nb", "\na\nb", CompareOptions(trim_blank_edges=False)))
+        self.assertTrue(matches("a\n", "a", CompareOptions(trim_blank_edges=False)))
+
+    def test_float_tolerance(self):
+        options = CompareOptions(float_tolerance=1e-6)
+        self.assertTrue(matches("x = 0.3333333", "x = 0.33333331", options))
+        self.assertFalse(matches("x = 0.3333", "x = 0.3334", options))
+        self.assertFalse(matches("x = 0.3333333", "x = 0.33333331"))
+
+    def test_unordered(self):
+        options = CompareOptions(unordered=True)
+        self.assertTrue(matches("a\nb\nb\nc", "b\nc\nb\na", options))
+        self.assertFalse(matches("a\nb\nb", "a\nb", options))
+        with self.assertRaises(ValueError):
+            compare("a", "a", CompareOptions(unordered=True, float_tolerance=0.1))
+
+    def test_unknown_blank_line_mode(self):
+        with self.assertRaises(ValueError):
+            compare("a", "a", CompareOptions(blank_lines="drop"))
+
+
+class MismatchPositionTest(unittest.TestCase):
+    def test_first_difference(self):
+        m = compare("satır 1\nsatır 2\nsatır 3\n", "satır 1\nsatır 2\nsatır X\n")
+        self.assertEqual((m.line, m.actual_line, m.column), (3, 3, 7))
+        self.assertEqual((m.expected, m.actual), ("satır 3", "satır X"))
+        self.assertIn("- satır 3", m.diff)
+        self.assertIn("+ satır X", m.diff)
+        self.assertIn("  satır 2", m.diff)
+
+    def test_raw_line_numbers(self):
+        # satır numaraları ham satırlardır; boş satırlar ve CRLF sayımı bozmaz
+        m = compare("\n\na\n\nb\nc", "a\r\n\r\n\r\nb\r\nd", CompareOptions(blank_lines="squeeze"))
+        self.assertEqual((m.line, m.actual_line, m.column), (6, 5, 1))
+        self.assertEqual((m.expected, m.actual), ("c", "d"))
+
+    def test_column_after_normalization(self):
+        m = compare("a  b  c", "a b d", CompareOptions(collapse_spaces=True))
+        self.assertEqual(m.column, 5)
+        m = compare("x 1.0 y", "x 1.0000001 z", CompareOptions(float_tolerance=1e-3))
+        self.assertEqual(m.column, 7)
+
+    def test_missing_and_extra_lines(self):
+        m = compare("a\nb\nc", "a\nb")
+        self.assertEqual((m.line, m.actual_line, m.expected, m.actual), (3, None, "c", None))
+        self.assertIn("+ <EOF>", m.diff)
+        m = compare("a", "a\nb")
+        self.assertEqual((m.line, m.actual_line, m.expected, m.actual), (None, 2, None, "b"))
+
+    def test_unordered_reports_first_unmatched_line(self):
+        m = compare("a\nb\nc", "c\na\nx", CompareOptions(unordered=True))
+        self.assertIsNone(m.column)
+        self.assertEqual((m.line, m.expected), (2, "b"))
+        self.assertIn("+ x  (satır 3, ×1)", m.diff)
+
+
+class ChunkBoundaryTest(unittest.TestCase):
+    EXPECTED = "başlık\n\n  değer: 1  \n" + "".join(f"satır {i}\tğüş\n" for i in range(40)) + "son\n"
+
+    def test_chunked_sources_match_strings(self):
+        actual = self.EXPECTED.replace("\n", "\r\n").replace("satır 31", "satır 3l")
+        whole = compare(self.EXPECTED, actual)
+        self.assertEqual((whole.line, whole.column), (35, 8))
+        for size in (1, 2, 3, 7, 64):
+            with self.subTest(size=size):
+                self.assertEqual(compare(chunks(self.EXPECTED, size), chunks(actual, size)), whole)
+                data = actual.encode("utf-8")
+                self.assertEqual(compare(io.StringIO(self.EXPECTED), io.BytesIO(data), block_size=size), whole)
+                # UTF-8 karakterleri ve \r\n parça sınırında bölünür
+                self.assertEqual(compare(self.EXPECTED, chunks(data, size)), whole)
+
+    def test_fast_path_block_sizes(self):
+        actual = self.EXPECTED.replace("\n", "  \n")
+        for options in (CompareOptions(), LIVE_CODING, CompareOptions(unordered=True)):
+            for block_size in (1, 5, 16, 100, 1 << 20):
+                with self.subTest(options=options, block_size=block_size):
+                    self.assertIsNone(compare(self.EXPECTED, actual, options, block_size=block_size))
+                    self.assertIsNone(compare(self.EXPECTED, self.EXPECTED, options, block_size=block_size))
+                    changed = actual.replace("satır 39", "satır 93")
+                    m = compare(self.EXPECTED, changed, options, block_size=block_size)
+                    self.assertEqual(m.line if options.unordered else (m.line, m.column),
+                                     43 if options.unordered else (43, 7))
+
+    def test_blank_run_across_chunks(self):
+        expected = "a\n\n\n\n\t\n\n\nb"
+        actual = "a\n\n  \n\nb"
+        for size in range(1, len(actual) + 1):
+            with self.subTest(size=size):
+                self.assertIsNone(compare(chunks(expected, size), chunks(actual, size), LIVE_CODING))
+
+
+class LiveCodingEquivalenceTest(unittest.TestCase):
+    CASES = [
+        ("a\n\n\nb", "a\n\nb"),
+        ("a\n\n  \n\nb", "a\n\nb"),
+        ("a\n\n  \n\nb", "a\n\n\n\nb"),
+        ("a\n \n\n\n \nb", "a\n\n\n\nb"),
+        ("  a  \t b \r\n\r\n\r\n\r\nc", "a b\n\nc"),
+        ("\n\n \t\n x\n\n", "x"),
+        ("x\r\r\ny", "x\n\ny"),
+        ("a\t\n\t\nb", "a\n\nb"),
+    ]
+
+    def assertAgrees(self, expected, actual):
+        same = normalize_output(expected) == normalize_output(actual)
+        self.assertEqual(compare(expected, actual, LIVE_CODING) is None, same, (expected, actual))
+
+    def test_cases(self):
+        for expected, actual in self.CASES:
+            with self.subTest(expected=expected, actual=actual):
+                self.assertAgrees(expected, actual)
+                self.assertAgrees(actual, expected)
+
+    def test_random_whitespace(self):
+        rng = random.Random(7)
+        pieces = ["a", "b", " ", "\t", "\n", "\n", "\r\n", "\r"]
+        for _ in range(3000):
+            expected = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            # aynı metnin boşlukları değiştirilmiş hali: çoğu zaman eşit normalize olur
+            actual = "".join(c if c in "ab" or rng.random() < 0.5 else rng.choice(pieces[2:])
+                             for c in expected)
+            self.assertAgrees(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+COPY yükleyici testleri: satırlar batch'ler halinde tek transaction içinde
+akar, upsert updatedAt'i yeniler ve dry-run dosyası NULL ile boş string'i
+ayırarak geri okunur (scripts/pipeline/pg_copy.py). Veritabanı yerine
+gönderilen deyimleri kaydeden bir psycopg taklidi kullanılır.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.pg_copy import (  # noqa: E402
+    QUIZ_COLUMNS, CopyLoader, encode_csv_row, iter_copy_rows, write_copy_script,
+)
+
+ROWS = [
+    ("quiz-1", "dotnet", "Test 1", "", "LINQ", "TEST", "Başlangıç",
+     [{"q": 'Çift "tırnak", virgül'}], 60, None),
+    ("quiz-2", "dotnet", "Satır\nsonu", None, "", "TEST", None, [], 70, "ders-2"),
+    ("quiz-3", None, "Test 3", '""', "\\.", "TEST", "İleri", {"a": None}, 80, ""),
+]
+
+
+class FakeCopy:
+    def __init__(self, sink):
+        self.sink = sink
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, text):
+        self.sink.append(text)
+
+
+class FakeCursor2:
+    """psycopg2 imleci gibi: COPY copy_expert ile gönderilir."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql):
+        self.conn.log.append(("execute", sql))
+
+    def copy_expert(self, statement, stream):
+        self.conn.log.append(("copy", statement, [stream.read()]))
+
+    def close(self):
+        self.conn.log.append(("close",))
+
+
+class FakeCursor(FakeCursor2):
+    """psycopg 3 imleci gibi: COPY cursor.copy() bağlamına yazılır."""
+
+    copy_expert = None
+
+    def copy(self, statement):
+        text = []
+        self.conn.log.append(("copy", statement, text))
+        return FakeCopy(text)
+
+
+class FakeConnection:
+    def __init__(self, psycopg2=False):
+        self.psycopg2 = psycopg2
+        self.log = []
+
+    def cursor(self):
+        return FakeCursor2(self) if self.psycopg2 else FakeCursor(self)
+
+    def commit(self):
+        self.log.append(("commit",))
+
+    def rollback(self):
+        self.log.append(("rollback",))
+
+    def copies(self):
+        return [(entry[1], "".join(entry[2])) for entry in self.log if entry[0] == "copy"]
+
+    def kinds(self):
+        return [entry[0] for entry in self.log]
+
+
+class CopyLoaderTest(unittest.TestCase):
+    def test_batches_in_one_transaction(self):
+        for psycopg2 in (False, True):
+            with self.subTest(psycopg2=psycopg2):
+                conn = FakeConnection(psycopg2)
+                total = CopyLoader(conn, "quizzes", QUIZ_COLUMNS, batch_size=2).load(iter(ROWS))
+                self.assertEqual(total, 3)
+                self.assertEqual(conn.kinds(), ["copy", "copy", "commit", "close"])
+                copies = conn.copies()
+                self.assertEqual({statement for statement, _ in copies},
+                                 {'COPY "quizzes" ("id", "courseId", "title", "description", "topic", "type", '
+                                  '"level", "questions", "passingScore", "lessonSlug") FROM STDIN WITH (FORMAT csv)'})
+                self.assertEqual([text for _, text in copies],
+                                 ["".join(map(encode_csv_row, ROWS[:2])), encode_csv_row(ROWS[2])])
+
+    def test_error_rolls_back(self):
+        def rows():
+            yield ROWS[0]
+            raise ValueError("bozuk satır")
+
+        conn = FakeConnection()
+        with self.assertRaises(ValueError):
+            CopyLoader(conn, "quizzes", QUIZ_COLUMNS, batch_size=1).load(rows())
+        self.assertEqual(conn.kinds(), ["copy", "rollback", "close"])
+
+    def test_upsert_stages_and_touches_updated_at(self):
+        conn = FakeConnection()
+        CopyLoader(conn, "quizzes", QUIZ_COLUMNS, upsert=True).load(ROWS)
+        self.assertEqual(conn.kinds(), ["execute", "copy", "execute", "commit", "close"])
+        create, merge = [entry[1] for entry in conn.log if entry[0] == "execute"]
+        self.assertIn('CREATE TEMP TABLE "_stage_quizzes" (LIKE "quizzes" INCLUDING DEFAULTS)', create)
+        self.assertTrue(conn.copies()[0][0].startswith('COPY "_stage_quizzes" '))
+        self.assertIn('ON CONFLICT ("id") DO UPDATE SET "courseId" = EXCLUDED."courseId", ', merge)
+        self.assertTrue(merge.endswith('"lessonSlug" = EXCLUDED."lessonSlug", "updatedAt" = CURRENT_TIMESTAMP'))
+        self.assertNotIn('"id" = EXCLUDED', merge)
+
+    def test_merge_without_touch_column(self):
+        merge = CopyLoader(None, "t", ("id", "updatedAt"), upsert=True)._merge_sql("s")
+        self.assertTrue(merge.endswith('DO UPDATE SET "updatedAt" = EXCLUDED."updatedAt"'))
+        merge = CopyLoader(None, "t", ("id",), upsert=True, touch=None)._merge_sql("s")
+        self.assertTrue(merge.endswith('ON CONFLICT ("id") DO NOTHING'))
+
+
+class CopyScriptRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "quizzes.copy.sql")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_null_and_empty_string_survive(self):
+        self.assertEqual(write_copy_script(self.path, "quizzes", QUIZ_COLUMNS, ROWS, batch_size=2), 3)
+        rows = [row for _, row in iter_copy_rows(self.path)]
+        self.assertEqual([row["description"] for row in rows], ["", None, '""'])
+        self.assertEqual([row["topic"] for row in rows], ["LINQ", "", "\\."])
+        self.assertEqual([row["lessonSlug"] for row in rows], [None, "ders-2", ""])
+        self.assertEqual([row["courseId"] for row in rows], ["dotnet", "dotnet", None])
+        self.assertEqual(rows[1]["title"], "Satır\nsonu")
+        self.assertEqual(rows[0]["questions"], '[{"q":"Çift \\"tırnak\\", virgül"}]')
+        self.assertEqual(rows[2]["passingScore"], "80")
+
+    def test_column_filter(self):
+        write_copy_script(self.path, "quizzes", QUIZ_COLUMNS, ROWS)
+        rows = list(iter_copy_rows(self.path, ["quizzes"], {"quizzes": ("id", "level")}))
+        self.assertEqual(rows, [
+            ("quizzes", {"id": "quiz-1", "level": "Başlangıç"}),
+            ("quizzes", {"id": "quiz-2", "level": None}),
+            ("quizzes", {"id": "quiz-3", "level": "İleri"}),
+        ])
+        self.assertEqual(list(iter_copy_rows(self.path, ["courses"])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Sentetik popülasyon testleri: COPY betiği ve seed JSON'u aynı popülasyonu
+anlatır, sütunsal JSON kodlaması json modülünün çıktısıyla aynıdır
+(scripts/pipeline/population.py).
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.pg_copy import iter_copy_rows  # noqa: E402
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+NOW_MS = 1_760_000_000_000
+
+# seed JSON anahtarı -> COPY tablosu
+SECTIONS = {
+    "users": "app_users",
+    "userBadges": "user_badges",
+    "quizAttempts": "quiz_attempts",
+    "userBalances": "user_balances",
+    "userStreaks": "user_streaks",
+}
+JSON_COLUMNS = ("answers", "aiAnalysis")
+
+
+def copy_value(column, value):
+    """COPY alanını JSON'daki karşılığına çevirir (metin -> tip)."""
+    if value is None or column in JSON_COLUMNS:
+        return value if value is None else json.loads(value)
+    if value in ("true", "false"):
+        return value == "true"
+    if value.isdigit():
+        return int(value)
+    if len(value) == 23 and value[10] == "T":
+        return value + "Z"
+    return value
+
+
+@unittest.skipIf(numpy is None, "NumPy gerekli")
+class PopulationOutputTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from pipeline.population import Population, load_badges, load_profile_images, load_quizzes
+
+        cls.population = Population(150, load_quizzes(), load_badges(), seed=5, now_ms=NOW_MS,
+                                    images=load_profile_images())
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.copy_path = os.path.join(cls.tmp.name, "profile-seed.copy.sql")
+        with open(cls.copy_path, "w", encoding="utf-8", newline="") as f:
+            f.writelines(cls.population.iter_copy_script(chunk_rows=37))
+        cls.seed_text = "".join(cls.population.iter_seed_json({"generatedAt": "test"}, chunk_rows=37))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_json_matches_json_module(self):
+        document = json.loads(self.seed_text)
+        self.assertEqual(self.seed_text, json.dumps(document, ensure_ascii=False, indent=2))
+        compact = "".join(self.population.iter_seed_json({"generatedAt": "test"}, chunk_rows=37, indent=None))
+        self.assertEqual(compact, json.dumps(document, ensure_ascii=False, separators=(",", ":")))
+
+    def test_copy_and_json_describe_same_population(self):
+        document = json.loads(self.seed_text)
+        tables = {table: [] for table in SECTIONS.values()}
+        for table, row in iter_copy_rows(self.copy_path):
+            tables[table].append(row)
+        counts = self.population.counts()
+        for key, table in SECTIONS.items():
+            with self.subTest(table=table):
+                records = document[key]
+                self.assertEqual(len(records), counts[table])
+                self.assertEqual(len(tables[table]), counts[table])
+                for record, row in zip(records, tables[table]):
+                    # JSON'da parola yok (json-to-sql-seed.ts varsayılanı yazar)
+                    expected = {k: v for k, v in record.items() if k != "password"}
+                    self.assertEqual({k: copy_value(k, row[k]) for k in expected}, expected)
+
+    def test_chunking_does_not_change_output(self):
+        self.assertEqual(
+            "".join(self.population.iter_seed_json({"generatedAt": "test"}, chunk_rows=10_000)),
+            self.seed_text,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Soru bankası testleri: Türkçe normalizasyon, yakın kopyaların kümelenmesi,
+near_duplicates ve kümeye göre soru çekme (scripts/pipeline/question_bank.py).
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.question_bank import (  # noqa: E402
+    MCQ, MinHasher, QuestionBank, build_bank, normalize_text, similarity,
+)
+
+# Aynı sorunun yazım farklı kopyaları aynı kümeye düşer, diğerleri ayrı kalır
+QUESTIONS = [
+    "For döngüsünde koşul ifadesi false olduğunda ne olur?",       # 0
+    "While ve do-while döngüleri arasındaki temel fark nedir?",    # 1
+    "For döngüsünde koşul ifadesi false olduğundane olur?",        # 2 (0'ın kopyası)
+    "Dependency Injection yaşam döngüleri nelerdir?",              # 3
+    "FOR DÖNGÜSÜNDE KOŞUL İFADESİ FALSE OLDUĞUNDA NE OLUR",        # 4 (0 ile aynı imza)
+    "While ve do-while döngüleri arasındaki temel fark nedir ?",   # 5 (1 ile aynı imza)
+    "Middleware sırası neden önemlidir?",                          # 6
+]
+
+
+def record(n, text):
+    return {
+        "uid": f"quiz-{n}#1", "quiz": f"quiz-{n}", "course": "course-test", "lesson": "",
+        "text": text, "explanation": "", "options": ["a", "b"], "answer": 0, "kind": MCQ,
+    }
+
+
+def make_bank(texts=QUESTIONS):
+    bank = QuestionBank()
+    bank.add_source("test.sql", (record(n, text) for n, text in enumerate(texts)))
+    bank.build_clusters()
+    return bank
+
+
+class NormalizeTest(unittest.TestCase):
+    def test_turkish_case_and_punctuation(self):
+        self.assertEqual(normalize_text("KODLAMA IŞIĞI: İyi mi?"), "kodlama ışığı iyi mi")
+        self.assertEqual(normalize_text("  a_b\t--c  "), "a b c")
+
+    def test_signature_similarity(self):
+        hasher = MinHasher()
+        sig = hasher.signature(normalize_text(QUESTIONS[0]))
+        self.assertEqual(similarity(sig, hasher.signature(normalize_text(QUESTIONS[4]))), 1.0)
+        self.assertGreaterEqual(similarity(sig, hasher.signature(normalize_text(QUESTIONS[2]))), 0.8)
+        self.assertLess(similarity(sig, hasher.signature(normalize_text(QUESTIONS[1]))), 0.5)
+
+
+class ClusterTest(unittest.TestCase):
+    def setUp(self):
+        self.bank = make_bank()
+
+    def test_near_duplicates_share_cluster(self):
+        self.assertEqual(list(self.bank.cluster), [0, 1, 0, 3, 0, 1, 6])
+        self.assertEqual(self.bank.clusters(), {0: [0, 2, 4], 1: [1, 5]})
+
+    def test_threshold(self):
+        # eşik 1.0'da yalnızca aynı imzalı sorular birleşir
+        self.bank.build_clusters(threshold=1.0)
+        self.assertEqual(self.bank.clusters(), {0: [0, 4], 1: [1, 5]})
+
+    def test_clusters_do_not_depend_on_order(self):
+        order = [6, 4, 3, 2, 5, 1, 0]
+        shuffled = make_bank([QUESTIONS[i] for i in order])
+        groups = {frozenset(order[i] for i in members) for members in shuffled.clusters().values()}
+        self.assertEqual(groups, {frozenset([0, 2, 4]), frozenset([1, 5])})
+
+    def test_near_duplicates(self):
+        found = self.bank.near_duplicates("for döngüsünde koşul ifadesi FALSE olduğunda ne olur")
+        self.assertEqual([i for _, i in found], [0, 4, 2])
+        self.assertEqual([score for score, _ in found][:2], [1.0, 1.0])
+        self.assertGreaterEqual(found[2][0], 0.8)
+        self.assertEqual(self.bank.near_duplicates("Middleware sırası neden önemlidir"), [(1.0, 6)])
+        self.assertEqual(self.bank.near_duplicates("Entity Framework migration nasıl oluşturulur?"), [])
+
+    def test_draw_skips_used_clusters(self):
+        used = set()
+        candidates = iter(range(len(QUESTIONS)))
+        self.assertEqual(self.bank.draw(candidates, 2, used), [0, 1])
+        self.assertEqual(self.bank.draw(candidates, 5, used), [3, 6])
+        self.assertEqual(used, {0, 1, 3, 6})
+        self.assertEqual(self.bank.draw(iter([2, 4, 5]), 1, used), [])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bank.json")
+            self.bank.save(path)
+            loaded = QuestionBank.load(path)
+        self.assertEqual(loaded.cluster, self.bank.cluster)
+        self.assertEqual(loaded.signatures, self.bank.signatures)
+        self.assertEqual(loaded.record(2), self.bank.record(2))
+        self.assertEqual(loaded.near_duplicates(QUESTIONS[0]), self.bank.near_duplicates(QUESTIONS[0]))
+
+
+class RepositoryBankTest(unittest.TestCase):
+    def test_docstring_example(self):
+        bank = build_bank()
+        found = bank.near_duplicates("FOR döngüsünde koşul ifadesi false olduğunda ne olur")
+        self.assertGreaterEqual(len(found), 2)
+        self.assertEqual(found[0][0], 1.0)
+        texts = {bank.text[i] for _, i in found}
+        self.assertIn("For döngüsünde koşul ifadesi false olduğunda ne olur?", texts)
+        self.assertEqual(len({bank.cluster[i] for _, i in found}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
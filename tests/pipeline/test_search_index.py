@@ -0,0 +1,66 @@
+"""
+Arama index'i testleri: tırnaklı ifadeler, analizörün atladığı stopword'ler
+de sayılarak konuma göre eşleşir (scripts/pipeline/search_index.py).
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.search_index import (  # noqa: E402
+    Analyzer, SearchIndex, analyze_source, build_index_bytes, query_terms,
+)
+
+COURSE = {
+    "courseTitle": "ASP.NET Core",
+    "modules": [
+        {"title": "Middleware ve Pipeline Yönetimi", "href": "/m/1"},
+        {"title": "Middleware Pipeline Nedir?", "href": "/m/2"},
+        {"title": "Pipeline ve Middleware", "href": "/m/3"},
+    ],
+}
+
+
+class QueryTermsTest(unittest.TestCase):
+    def test_phrase_keeps_stopword_gaps(self):
+        groups = query_terms(Analyzer(), '"middleware ve pipeline" routing')
+        self.assertEqual([[offset for offset, _ in group] for group in groups], [[0, 2], [0]])
+
+
+class PhraseSearchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        source = os.path.join(cls.tmp.name, "course.json")
+        with open(source, "w", encoding="utf-8") as f:
+            json.dump(COURSE, f, ensure_ascii=False)
+        data, _, _ = build_index_bytes([analyze_source(source)])
+        cls.index_path = os.path.join(cls.tmp.name, "search.idx")
+        with open(cls.index_path, "wb") as f:
+            f.write(data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def hrefs(self, query):
+        with SearchIndex(self.index_path) as index:
+            return sorted(meta["href"] for _, meta in index.search(query))
+
+    def test_phrase_with_stopword(self):
+        self.assertEqual(self.hrefs('"Middleware ve Pipeline"'), ["/m/1"])
+
+    def test_phrase_without_stopword(self):
+        self.assertEqual(self.hrefs('"Middleware Pipeline"'), ["/m/2"])
+
+    def test_unquoted_words_match_any_order(self):
+        self.assertEqual(self.hrefs("middleware pipeline"), ["/m/1", "/m/2", "/m/3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
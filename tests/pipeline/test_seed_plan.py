@@ -0,0 +1,72 @@
+"""
+Seed planı testleri: yükleme katmanları foreign key sırasına uyar ve
+TRUNCATE yalnızca seed'in kendi listesini (FK kapanışıyla) kapsar
+(scripts/pipeline/seed_plan.py).
+"""
+
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.seed_plan import SeedPlan, referencing_closure  # noqa: E402
+
+SCHEMA = os.path.join(REPO_ROOT, "database-schema.sql")
+DATABASE_SEED = os.path.join(REPO_ROOT, "database-seed.sql")
+PROFILE_SEED = os.path.join(REPO_ROOT, "profile-seed-data.sql")
+
+
+def plan_for(*seeds):
+    return SeedPlan.from_files(seeds, SCHEMA)
+
+
+class SeedPlanOrderMixin:
+    def test_levels_follow_foreign_keys(self):
+        seen = set()
+        for level in self.plan.levels:
+            for table in level:
+                self.assertLessEqual(self.plan.deps[table], seen, table)
+            seen.update(level)
+        self.assertEqual(seen, set(self.plan.groups))
+
+    def test_truncate_puts_children_first(self):
+        order = self.plan.truncate_order()
+        self.assertEqual(len(order), len(set(order)))
+        position = {table: i for i, table in enumerate(order)}
+        for table in order:
+            for parent in self.plan.schema_deps.get(table, ()):
+                if parent in position:
+                    self.assertLess(position[table], position[parent], f"{table} -> {parent}")
+
+
+class DatabaseSeedTest(SeedPlanOrderMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.plan = plan_for(DATABASE_SEED)
+
+    def test_truncate_is_seed_list_closure(self):
+        self.assertTrue(self.plan.truncate)
+        self.assertEqual(set(self.plan.truncate_order()),
+                         referencing_closure(self.plan.truncate, self.plan.schema_deps))
+
+
+class ProfileSeedTest(SeedPlanOrderMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.plan = plan_for(PROFILE_SEED)
+
+    def test_upsert_seed_truncates_nothing(self):
+        # ON CONFLICT upsert'leri; yüklenen tablolar TRUNCATE listesine girmemeli
+        self.assertEqual(self.plan.truncate, [])
+        self.assertEqual(self.plan.truncate_order(), [])
+        self.assertEqual(self.plan.levels[0], ["app_users"])
+
+    def test_combined_seeds_truncate_only_database_seed_list(self):
+        combined = plan_for(DATABASE_SEED, PROFILE_SEED)
+        self.assertEqual(combined.truncate_order(), plan_for(DATABASE_SEED).truncate_order())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+SQL tokenizer ve satır okuyucu testleri: yorumlar, escape'li string'ler,
+dollar quote'lar ve parça sınırına denk gelen token'lar
+(scripts/pipeline/sql_rows.py).
+"""
+
+import io
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+
+from pipeline.sql_rows import SqlParseError, iter_rows, iter_tokens  # noqa: E402
+
+SAMPLE = """-- Başlık: kullanıcı'ların verisi
+INSERT INTO "t" ("a", "b", "c") VALUES
+    ('it''s', E'satır\\nsonu \\'x\\'', 1.5e+2), /* blok 'yorum' */
+    ($$dolar $ 'quote'$$, $body$iç $$ içe$body$, -3),
+    ('{"k": "v"}'::jsonb, NULL, TRUE);
+-- dosya sonu yorumu, sonunda satır sonu yok: it's"""
+
+
+def tokens(text, **kwargs):
+    return [(t.kind, t.text) for t in iter_tokens(io.StringIO(text), **kwargs)]
+
+
+def rows(text, **kwargs):
+    return list(iter_rows(io.StringIO(text), **kwargs))
+
+
+class IterTokensTest(unittest.TestCase):
+    def test_comment_at_end_of_input(self):
+        self.assertEqual(tokens("SELECT 1; -- yorum'lu son"), [
+            ("word", "SELECT"), ("number", "1"), ("punct", ";"),
+        ])
+        self.assertEqual(tokens("-- yalnızca yorum: it's\n-- ikinci satır'"), [])
+
+    def test_test_inserts_placeholder(self):
+        with open(os.path.join(REPO_ROOT, "test-inserts.sql"), encoding="utf-8-sig") as f:
+            self.assertEqual(list(iter_tokens(f)), [])
+
+    def test_comment_markers_inside_strings(self):
+        self.assertEqual(tokens("'a -- b' /* c */ 'd /* e */'"), [
+            ("string", "'a -- b'"), ("string", "'d /* e */'"),
+        ])
+
+    def test_unexpected_character_reports_line(self):
+        with self.assertRaisesRegex(SqlParseError, "satır 2"):
+            tokens("SELECT 1;\n  @")
+
+    def test_chunk_boundaries_do_not_change_tokens(self):
+        expected = tokens(SAMPLE)
+        for chunk_size in range(1, 12):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(tokens(SAMPLE, chunk_size=chunk_size), expected)
+
+    def test_line_numbers(self):
+        lines = [t.line for t in iter_tokens(io.StringIO(SAMPLE), chunk_size=5) if t.text == "("]
+        self.assertEqual(lines, [2, 3, 4, 5])
+
+
+class IterRowsTest(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(rows(SAMPLE), [
+            ("t", {"a": "it's", "b": "satır\nsonu 'x'", "c": 150.0}),
+            ("t", {"a": "dolar $ 'quote'", "b": "iç $$ içe", "c": -3}),
+            ("t", {"a": {"k": "v"}, "b": None, "c": True}),
+        ])
+
+    def test_backslash_escapes(self):
+        text = "INSERT INTO t (a) VALUES ('c:\\\\temp ''x'' \\' y');"
+        self.assertEqual(rows(text, standard_strings=False), [("t", {"a": "c:\\temp 'x' ' y"})])
+        self.assertEqual(rows("INSERT INTO t (a) VALUES ('c:\\temp');"), [("t", {"a": "c:\\temp"})])
+
+    def test_split_escaped_quote(self):
+        # '' escape'i parça sınırında bölünse de tek string kalır
+        text = "INSERT INTO t (a) VALUES ('ab''cd');"
+        for chunk_size in range(1, len(text)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(rows(text, chunk_size=chunk_size), [("t", {"a": "ab'cd"})])
+
+
+if __name__ == "__main__":
+    unittest.main()